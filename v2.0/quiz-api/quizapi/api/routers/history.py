@@ -2,83 +2,89 @@
 
 from typing import Iterable
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from pydantic import UUID4
 
 from quizapi.infrastructure.utils import consts
 from quizapi.container import Container
-from quizapi.core.domain.history import History, HistoryIn, HistoryBroker
+from quizapi.api.utils.auth import get_current_player
+from quizapi.api.utils.responses import json_response, ndjson_response
+from quizapi.core.domain.history import History, SubmissionIn
 from quizapi.infrastructure.dto.historydto import HistoryDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 from quizapi.infrastructure.services.ihistory import IHistoryService
 
-bearer_scheme = HTTPBearer()
 router = APIRouter()
 
-@router.post("/create", tags=["History"], response_model=History, status_code=201)
+@router.post("/grade", tags=["History"], response_model=History, status_code=201)
 @inject
-async def create_history(
-    history: HistoryIn,
-    service: IHistoryService = Depends(Provide[Container.history_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+async def grade_submission(
+        submission: SubmissionIn,
+        service: IHistoryService = Depends(Provide[Container.history_service]),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
-    """An endpoint for creating a new history.
+    """An endpoint for grading submitted answers and storing the result.
 
     Args:
-        history (HistoryIn): The history data.
+        submission (SubmissionIn): The quiz ID with the chosen options.
         service (IHistoryService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
-        HTTPException: 404 if history creation fails.
+        HTTPException: 404 if the quiz has no questions.
 
     Returns:
-        dict: The new created history attributes.
+        dict: The graded history attributes.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
-    extended_history_data = HistoryBroker(
-        player_id=player_uuid,
-        **history.model_dump()
-    )
-    new_history = await service.add_history(extended_history_data)
-    if not new_history:
-        raise HTTPException(status_code=404, detail="Failed to create history")
-    return new_history.model_dump() if new_history else {}
-
-@router.get("/all", tags=["History"], response_model=Iterable[HistoryDTO], status_code=200)
+    history = await service.grade_submission(player_uuid, submission)
+    if not history:
+        raise HTTPException(status_code=404, detail="Quiz has no questions")
+    return history.model_dump()
+
+@router.get("/all", tags=["History"], response_model=PageDTO[HistoryDTO], status_code=200)
 @inject
 async def get_all_histories(
+        limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+        after: int = Query(0, ge=0),
         service: IHistoryService = Depends(Provide[Container.history_service]),
-) -> Iterable:
-    """An endpoint for getting all histories.
+) -> Response:
+    """An endpoint for getting a page of histories ordered by ID.
 
     Args:
+        limit (int, optional): The page size. Defaults to `DEFAULT_PAGE_SIZE`.
+        after (int, optional): The `next_cursor` of the previous page. Defaults to 0.
         service (IHistoryService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The history attributes collection.
+        Response: The serialized page of histories with the cursor of the next one.
     """
-    histories = await service.get_all_histories()
-    return histories
+    page = await service.get_all_histories(limit=limit, after=after)
+    return json_response(page)
+
+@router.get("/export", tags=["History"], response_class=StreamingResponse, status_code=200)
+@inject
+async def export_histories(
+        service: IHistoryService = Depends(Provide[Container.history_service]),
+) -> StreamingResponse:
+    """An endpoint streaming all histories as newline-delimited JSON.
+
+    Args:
+        service (IHistoryService, optional): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The NDJSON stream of histories ordered by ID.
+    """
+    return ndjson_response(service.export_histories())
 
 @router.get("/{history_id}", tags=["History"], response_model=HistoryDTO, status_code=200)
 @inject
 async def get_history_by_id(
         history_id: int,
         service: IHistoryService = Depends(Provide[Container.history_service]),
-) -> dict:
+) -> Response:
     """An endpoint for getting a history by ID.
 
     Args:
@@ -89,10 +95,10 @@ async def get_history_by_id(
         HTTPException: 404 if history is not found.
 
     Returns:
-        dict: The history details.
+        Response: The serialized history details.
     """
     if history := await service.get_history_by_id(history_id):
-        return history.model_dump()
+        return json_response(history)
     raise HTTPException(status_code=404, detail="History not found")
 
 @router.get("/player/{player_id}", tags=["History"], response_model=Iterable[History], status_code=200)
@@ -117,50 +123,37 @@ async def get_history_by_player(
 @inject
 async def update_history(
     history_id: int,
-    updated_history: HistoryIn,
+    submission: SubmissionIn,
     service: IHistoryService = Depends(Provide[Container.history_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
-    """An endpoint for updating a history.
+    """An endpoint for replacing a history with newly graded answers.
 
     Args:
         history_id (int): The history ID.
-        updated_history (HistoryIn): The updated history details.
+        submission (SubmissionIn): The quiz ID with the chosen options.
         service (IHistoryService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
-        HTTPException: 404 if history is not found.
+        HTTPException: 404 if history is not found or the quiz has no questions.
 
     Returns:
         dict: The updated history details.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if history_data := await service.get_history_by_id(history_id=history_id):
-        if str(history_data.player_id) != player_uuid:
+        if history_data.player_id != player_uuid:
             raise HTTPException(status_code=403, detail="Unauthorized")
 
-        extended_history_data = HistoryBroker(
-            player_id=player_uuid,
-            **updated_history.model_dump()
-        )
         updated_history_data = await service.update_history(
             history_id=history_id,
-            data=extended_history_data,
+            player_id=player_uuid,
+            data=submission,
         )
         if not updated_history_data:
             raise HTTPException(status_code=404, detail="Failed to update history")
-        return updated_history_data.model_dump() if updated_history_data else {}
+        return updated_history_data.model_dump()
     raise HTTPException(status_code=404, detail="History not found")
 
 
@@ -169,14 +162,14 @@ async def update_history(
 async def delete_history(
     history_id: int,
     service: IHistoryService = Depends(Provide[Container.history_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> None:
     """An endpoint for deleting history.
 
     Args:
         history_id (int): The history ID.
         service (IHistoryService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 404 if history is not found.
@@ -185,18 +178,8 @@ async def delete_history(
     Returns:
         dict: Empty if operation finished.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if history_data := await service.get_history_by_id(history_id=history_id):
-        if str(history_data.player_id) != player_uuid:
+        if history_data.player_id != player_uuid:
             raise HTTPException(status_code=403, detail="Unauthorized")
         await service.delete_history(history_id)
         return
@@ -0,0 +1,48 @@
+"""A module containing the metrics endpoint."""
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from quizapi.container import Container
+from quizapi.db import get_pool_stats
+from quizapi.infrastructure.cache.icache import ICacheBackend
+from quizapi.infrastructure.utils.metrics import Sample, metrics
+from quizapi.infrastructure.utils.password import password_hasher
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4"
+
+router = APIRouter()
+
+@router.get("", tags=["Metrics"], response_class=PlainTextResponse, status_code=200)
+@inject
+async def get_metrics(
+        cache: ICacheBackend = Depends(Provide[Container.cache_backend]),
+) -> PlainTextResponse:
+    """An endpoint for getting the metrics of the worker in the Prometheus format.
+
+    Args:
+        cache (ICacheBackend, optional): The injected cache backend dependency.
+
+    Returns:
+        PlainTextResponse: The rendered metrics.
+    """
+    pool = get_pool_stats()
+    cache_stats = cache.stats()
+    samples = (
+        Sample("quizapi_db_pool_size", "Open connections of the pool.", "gauge", pool.size),
+        Sample("quizapi_db_pool_in_use", "Connections borrowed from the pool.", "gauge", pool.in_use),
+        Sample("quizapi_db_pool_max_size", "Maximum connections of the pool.", "gauge", pool.max_size),
+        Sample("quizapi_cache_hits_total", "Cache lookups finding an entry.", "counter", cache_stats.hits),
+        Sample("quizapi_cache_misses_total", "Cache lookups missing an entry.", "counter", cache_stats.misses),
+        Sample("quizapi_cache_evictions_total", "Cache entries evicted or expired.", "counter", cache_stats.evictions),
+        Sample("quizapi_cache_entries", "Entries stored in the cache.", "gauge", cache_stats.entries),
+        Sample("quizapi_cache_bytes", "Approximate size of the cached values.", "gauge", cache_stats.bytes),
+        Sample(
+            "quizapi_password_hash_pending",
+            "Password hashing calls running or queued.",
+            "gauge",
+            password_hasher.pending,
+        ),
+    )
+    return PlainTextResponse(metrics.render(samples), media_type=PROMETHEUS_MEDIA_TYPE)
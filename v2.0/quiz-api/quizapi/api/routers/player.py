@@ -1,18 +1,20 @@
 """A module containing player-related routers."""
 
+from pydantic import UUID4
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
-from quizapi.infrastructure.utils import consts
 
 from quizapi.container import Container
-from quizapi.core.domain.player import Player, PlayerIn
+from quizapi.api.utils.auth import get_current_player
+from quizapi.core.domain.player import Player, PlayerIn, RefreshIn
 from quizapi.infrastructure.dto.tokendto import TokenDTO
 from quizapi.infrastructure.dto.playerdto import PlayerDTO
 from quizapi.infrastructure.services.iplayer import IPlayerService
+from quizapi.infrastructure.utils.password import (
+    PasswordHasherSaturatedError,
+    PasswordHasherUnavailableError,
+)
 
-bearer_scheme = HTTPBearer()
 router = APIRouter()
 
 @router.post("/register", tags=["Player"], response_model=PlayerDTO, status_code=201)
@@ -29,11 +31,27 @@ async def register_player(
 
     Raises:
         HTTPException: 400 if player already exist.
+        HTTPException: 503 if the password hashing queue is full or its worker died.
 
     Returns:
         dict: The player DTO details.
     """
-    if new_player := await service.register_player(player):
+    try:
+        new_player = await service.register_player(player)
+    except PasswordHasherSaturatedError as error:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many concurrent registrations, try again later",
+            headers={"Retry-After": "1"},
+        ) from error
+    except PasswordHasherUnavailableError as error:
+        raise HTTPException(
+            status_code=503,
+            detail="Password hashing is temporarily unavailable, try again later",
+            headers={"Retry-After": "1"},
+        ) from error
+
+    if new_player:
         return PlayerDTO(**dict(new_player)).model_dump()
 
     raise HTTPException(status_code=400, detail="The player with provided email already exists")
@@ -52,38 +70,88 @@ async def authenticate_player(
 
     Raises:
         HTTPException: 401 if provided incorrect credentials.
+        HTTPException: 503 if the password hashing queue is full or its worker died.
 
     Returns:
         dict: The token DTO details.
     """
-    if token_details := await service.authenticate_player(player):
-        print("Player confirmed")
+    try:
+        token_details = await service.authenticate_player(player)
+    except PasswordHasherSaturatedError as error:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many concurrent logins, try again later",
+            headers={"Retry-After": "1"},
+        ) from error
+    except PasswordHasherUnavailableError as error:
+        raise HTTPException(
+            status_code=503,
+            detail="Password hashing is temporarily unavailable, try again later",
+            headers={"Retry-After": "1"},
+        ) from error
+
+    if token_details:
         return token_details.model_dump()
 
     raise HTTPException(status_code=401, detail="Provided incorrect credentials")
 
+@router.post("/refresh", tags=["Player"], response_model=TokenDTO, status_code=200)
+@inject
+async def refresh_player_token(
+        refresh: RefreshIn,
+        service: IPlayerService = Depends(Provide[Container.player_service]),
+) -> dict:
+    """A router coroutine for exchanging a refresh token for new tokens.
+
+    Args:
+        refresh (RefreshIn): The refresh token of the player.
+        service (IPlayerService, optional): The injected player service.
+
+    Raises:
+        HTTPException: 401 if the refresh token is invalid, expired or revoked.
+
+    Returns:
+        dict: The token DTO details.
+    """
+    if token_details := await service.refresh_player_token(refresh.refresh_token):
+        return token_details.model_dump()
+
+    raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+@router.post("/logout", tags=["Player"], status_code=204)
+@inject
+async def logout_player(
+        refresh: RefreshIn,
+        service: IPlayerService = Depends(Provide[Container.player_service]),
+) -> None:
+    """A router coroutine for revoking a refresh token.
+
+    Args:
+        refresh (RefreshIn): The refresh token of the player.
+        service (IPlayerService, optional): The injected player service.
+
+    Raises:
+        HTTPException: 401 if the refresh token is unknown.
+    """
+    if await service.revoke_refresh_token(refresh.refresh_token):
+        return
+
+    raise HTTPException(status_code=401, detail="Invalid refresh token")
+
 @router.get("/balance", tags=["Player"], response_model=int)
 @inject
 async def show_balance(
         service: IPlayerService = Depends(Provide[Container.player_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> int:
     """An endpoint for getting the player's balance.
 
     Args:
         service (IPlayerService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Returns:
         int: The player's balance.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
     balance = await service.show_balance(player_uuid)
     return balance
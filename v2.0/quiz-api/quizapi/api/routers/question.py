@@ -1,19 +1,21 @@
 """A module containing question endpoints."""
 
 from typing import Iterable
+from pydantic import UUID4
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from quizapi.infrastructure.utils import consts
 from quizapi.container import Container
-from quizapi.core.domain.question import Question, QuestionIn
+from quizapi.api.utils.auth import get_current_player
+from quizapi.api.utils.responses import json_response, ndjson_response
+from quizapi.core.domain.question import PublicQuestion, Question, QuestionIn
 from quizapi.infrastructure.dto.questiondto import QuestionDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 from quizapi.infrastructure.services.iquestion import IQuestionService
 from quizapi.infrastructure.services.iquiz import IQuizService
 
-bearer_scheme = HTTPBearer()
 router = APIRouter()
 
 @router.post("/create", tags=["Question"], response_model=Question, status_code=201)
@@ -22,7 +24,7 @@ async def create_question(
     question: QuestionIn,
     service: IQuestionService = Depends(Provide[Container.question_service]),
     quiz_service: IQuizService = Depends(Provide[Container.quiz_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
     """An endpoint for creating a new question.
 
@@ -30,7 +32,7 @@ async def create_question(
         question (QuestionIn): The question data.
         service (IQuestionService, optional): The injected service dependency.
         quiz_service (IQuizService, optional): The injected quiz service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
@@ -39,49 +41,57 @@ async def create_question(
     Returns:
         dict: The new created question attributes.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     quiz = await quiz_service.get_quiz_by_id(question.quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
 
-    if str(quiz.player_id) != player_uuid:
+    if quiz.player_id != player_uuid:
         raise HTTPException(status_code=403, detail="Unauthorized")
 
     new_question = await service.add_question(question)
     return new_question.model_dump() if new_question else {}
 
-@router.get("/all", tags=["Question"], response_model=Iterable[QuestionDTO], status_code=200)
+@router.get("/all", tags=["Question"], response_model=PageDTO[QuestionDTO], status_code=200)
 @inject
 async def get_all_questions(
+        limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+        after: int = Query(0, ge=0),
         service: IQuestionService = Depends(Provide[Container.question_service]),
-) -> Iterable:
-    """An endpoint for getting all questions.
+) -> Response:
+    """An endpoint for getting a page of questions ordered by ID.
 
     Args:
+        limit (int, optional): The page size. Defaults to `DEFAULT_PAGE_SIZE`.
+        after (int, optional): The `next_cursor` of the previous page. Defaults to 0.
         service (IQuestionService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The question attributes collection.
+        Response: The serialized page of questions with the cursor of the next one.
     """
-    questions = await service.get_all_questions()
-    return questions
+    page = await service.get_all_questions(limit=limit, after=after)
+    return json_response(page)
+
+@router.get("/export", tags=["Question"], response_class=StreamingResponse, status_code=200)
+@inject
+async def export_questions(
+        service: IQuestionService = Depends(Provide[Container.question_service]),
+) -> StreamingResponse:
+    """An endpoint streaming all questions as newline-delimited JSON.
+
+    Args:
+        service (IQuestionService, optional): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The NDJSON stream of questions ordered by ID.
+    """
+    return ndjson_response(service.export_questions())
 
 @router.get("/{question_id}", tags=["Question"], response_model=QuestionDTO, status_code=200)
 @inject
 async def get_question_by_id(
         question_id: int,
         service: IQuestionService = Depends(Provide[Container.question_service]),
-) -> dict:
+) -> Response:
     """An endpoint for getting a question by ID.
 
     Args:
@@ -92,19 +102,19 @@ async def get_question_by_id(
         HTTPException: 404 if question is not found.
 
     Returns:
-        dict: The question details.
+        Response: The serialized question details.
     """
     if question := await service.get_question_by_id(question_id):
-        return question.model_dump()
+        return json_response(question)
     raise HTTPException(status_code=404, detail="Question not found")
 
-@router.get("/quiz/{quiz_id}", tags=["Question"], response_model=Iterable[Question], status_code=200)
+@router.get("/quiz/{quiz_id}", tags=["Question"], response_model=Iterable[PublicQuestion], status_code=200)
 @inject
 async def get_questions_by_quiz(
         quiz_id: int,
         service: IQuestionService = Depends(Provide[Container.question_service]),
 ) -> Iterable:
-    """An endpoint for getting questions by quiz ID.
+    """An endpoint for getting questions by quiz ID without the correct options.
 
     Args:
         quiz_id (int): The quiz ID.
@@ -116,29 +126,54 @@ async def get_questions_by_quiz(
     questions = await service.get_questions_by_quiz(quiz_id)
     return questions
 
+@router.get("/quiz/{quiz_id}/full", tags=["Question"], response_model=Iterable[Question], status_code=200)
+@inject
+async def get_full_questions_by_quiz(
+        quiz_id: int,
+        service: IQuestionService = Depends(Provide[Container.question_service]),
+        quiz_service: IQuizService = Depends(Provide[Container.quiz_service]),
+        player_uuid: UUID4 = Depends(get_current_player),
+) -> Iterable:
+    """An endpoint for getting questions by quiz ID with the correct options.
+
+    Args:
+        quiz_id (int): The quiz ID.
+        service (IQuestionService, optional): The injected service dependency.
+        quiz_service (IQuizService, optional): The injected quiz service dependency.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
+
+    Raises:
+        HTTPException: 403 if the player does not own the quiz.
+        HTTPException: 404 if quiz is not found.
+
+    Returns:
+        Iterable: A collection of questions for the given quiz.
+    """
+    quiz = await quiz_service.get_quiz_by_id(quiz_id)
+    if not quiz:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+
+    if quiz.player_id != player_uuid:
+        raise HTTPException(status_code=403, detail="Unauthorized")
+
+    questions = await service.get_questions_by_quiz(quiz_id)
+    return questions
+
 @router.put("/{question_id}", tags=["Question"], response_model=Question, status_code=201)
 @inject
 async def update_question(
     question_id: int,
     updated_question: QuestionIn,
     service: IQuestionService = Depends(Provide[Container.question_service]),
-    quiz_service: IQuizService = Depends(Provide[Container.quiz_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
     """An endpoint for updating a question.
 
     Args:
         question_id (int): The question ID.
         updated_question (QuestionIn): The updated question details.
         service (IQuestionService, optional): The injected service dependency.
-        quiz_service (IQuizService, optional): The injected quiz service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
@@ -147,24 +182,18 @@ async def update_question(
     Returns:
         dict: The updated question details.
     """
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if question_data := await service.get_question_by_id(question_id=question_id):
         if updated_question.quiz_id != question_data.quiz.id:
             raise HTTPException(status_code=403, detail="Cannot change quiz ownership of the question")
 
-        if quiz_data := await quiz_service.get_quiz_by_id(quiz_id=question_data.quiz.id):
-            if str(quiz_data.player_id) != player_uuid:
-                raise HTTPException(status_code=403, detail="Unauthorized")
+        if question_data.quiz.player_id != player_uuid:
+            raise HTTPException(status_code=403, detail="Unauthorized")
 
-            updated_question_data = await service.update_question(
-                question_id=question_id,
-                data=updated_question,
-            )
-            return updated_question_data.model_dump() if updated_question_data else {}
+        updated_question_data = await service.update_question(
+            question_id=question_id,
+            data=updated_question,
+        )
+        return updated_question_data.model_dump() if updated_question_data else {}
 
     raise HTTPException(status_code=404, detail="Question not found")
 
@@ -173,37 +202,23 @@ async def update_question(
 async def delete_question(
     question_id: int,
     service: IQuestionService = Depends(Provide[Container.question_service]),
-    quiz_service: IQuizService = Depends(Provide[Container.quiz_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    player_uuid: UUID4 = Depends(get_current_player),
 ) -> None:
     """An endpoint for deleting a question.
 
     Args:
         question_id (int): The question ID.
         service (IQuestionService, optional): The injected service dependency.
-        quiz_service (IQuizService, optional): The injected quiz service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
         HTTPException: 404 if question is not found.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if question_data := await service.get_question_by_id(question_id=question_id):
-        if quiz_data := await quiz_service.get_quiz_by_id(quiz_id=question_data.quiz.id):
-            if str(quiz_data.player_id) != player_uuid:
-                raise HTTPException(status_code=403, detail="Unauthorized")
+        if question_data.quiz.player_id != player_uuid:
+            raise HTTPException(status_code=403, detail="Unauthorized")
 
-            await service.delete_question(question_id)
-            return
+        await service.delete_question(question_id)
+        return
     raise HTTPException(status_code=404, detail="Question not found")
\ No newline at end of file
@@ -1,18 +1,24 @@
 """A module containing quiz endpoints."""
 
-from typing import Iterable
+from typing import Optional
+
+from pydantic import UUID4
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
 from quizapi.infrastructure.utils import consts
 from quizapi.container import Container
+from quizapi.api.utils.auth import get_current_player
+from quizapi.api.utils.responses import bundle_response, json_response
 from quizapi.core.domain.quiz import Quiz, QuizIn, QuizBroker
+from quizapi.infrastructure.dto.bundledto import QuizBundleDTO
 from quizapi.infrastructure.dto.quizdto import QuizDTO
+from quizapi.infrastructure.dto.leaderboarddto import LeaderboardDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
+from quizapi.infrastructure.services.ihistory import IHistoryService
+from quizapi.infrastructure.services.iquestion import IQuestionService
 from quizapi.infrastructure.services.iquiz import IQuizService
 
-bearer_scheme = HTTPBearer()
 router = APIRouter()
 
 @router.post("/create", tags=["Quiz"], response_model=Quiz, status_code=201)
@@ -20,14 +26,14 @@ router = APIRouter()
 async def create_quiz(
     quiz: QuizIn,
     service: IQuizService = Depends(Provide[Container.quiz_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
     """An endpoint for creating a new quiz.
 
     Args:
         quiz (QuizIn): The quiz data.
         service (IQuizService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
@@ -36,17 +42,6 @@ async def create_quiz(
     Returns:
         dict: The new created quiz attributes.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     extended_quiz_data = QuizBroker(
         player_id=player_uuid,
         **quiz.model_dump(),
@@ -56,28 +51,32 @@ async def create_quiz(
         raise HTTPException(status_code=404, detail="Reward name is already taken")
     return new_quiz.model_dump() if new_quiz else {}
 
-@router.get("/all", tags=["Quiz"], response_model=Iterable[QuizDTO], status_code=200)
+@router.get("/all", tags=["Quiz"], response_model=PageDTO[QuizDTO], status_code=200)
 @inject
 async def get_all_quizzes(
+        limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+        after: int = Query(0, ge=0),
         service: IQuizService = Depends(Provide[Container.quiz_service]),
-) -> Iterable:
-    """An endpoint for getting all quizzes.
+) -> Response:
+    """An endpoint for getting a page of quizzes ordered by ID.
 
     Args:
+        limit (int, optional): The page size. Defaults to `DEFAULT_PAGE_SIZE`.
+        after (int, optional): The `next_cursor` of the previous page. Defaults to 0.
         service (IQuizService, optional): The injected service dependency.
 
     Returns:
-        Iterable: A collection of all quizzes.
+        Response: The serialized page of quizzes with the cursor of the next one.
     """
-    quizzes = await service.get_all_quizzes()
-    return quizzes
+    page = await service.get_all_quizzes(limit=limit, after=after)
+    return json_response(page)
 
 @router.get("/{quiz_id}", tags=["Quiz"], response_model=QuizDTO, status_code=200)
 @inject
 async def get_quiz_by_id(
         quiz_id: int,
         service: IQuizService = Depends(Provide[Container.quiz_service]),
-) -> dict:
+) -> Response:
     """An endpoint for getting a quiz by ID.
 
     Args:
@@ -88,10 +87,74 @@ async def get_quiz_by_id(
         HTTPException: 404 if quiz is not found.
 
     Returns:
-        dict: The quiz details.
+        Response: The serialized quiz details.
     """
     if quiz := await service.get_quiz_by_id(quiz_id):
-        return quiz.model_dump()
+        return json_response(quiz)
+    raise HTTPException(status_code=404, detail="Quiz not found")
+
+@router.get("/{quiz_id}/leaderboard", tags=["Quiz"], response_model=LeaderboardDTO, status_code=200)
+@inject
+async def get_quiz_leaderboard(
+        quiz_id: int,
+        limit: int = Query(consts.DEFAULT_LEADERBOARD_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+        service: IQuizService = Depends(Provide[Container.quiz_service]),
+        history_service: IHistoryService = Depends(Provide[Container.history_service]),
+        player_uuid: UUID4 = Depends(get_current_player),
+) -> Response:
+    """An endpoint for getting the best players of a quiz.
+
+    Players are ranked by the effectiveness of their best attempt, ties
+    going to the earlier attempt.
+
+    Args:
+        quiz_id (int): The quiz ID.
+        limit (int, optional): The number of top players. Defaults to `DEFAULT_LEADERBOARD_SIZE`.
+        service (IQuizService, optional): The injected service dependency.
+        history_service (IHistoryService, optional): The injected history service dependency.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
+
+    Raises:
+        HTTPException: 404 if quiz is not found.
+
+    Returns:
+        Response: The serialized top players with the rank of the caller.
+    """
+    leaderboard = await history_service.get_leaderboard(
+        quiz_id=quiz_id,
+        limit=limit,
+        player_id=player_uuid,
+    )
+    if not leaderboard.entries and not await service.get_quiz_by_id(quiz_id):
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    return json_response(leaderboard)
+
+@router.get("/{quiz_id}/bundle", tags=["Quiz"], response_model=QuizBundleDTO, status_code=200)
+@inject
+async def get_quiz_bundle(
+        quiz_id: int,
+        if_none_match: Optional[str] = Header(None),
+        service: IQuestionService = Depends(Provide[Container.question_service]),
+) -> Response:
+    """An endpoint for getting a quiz with its questions in a single response.
+
+    The correct options are left out, so the bundle is safe to hand out
+    to the players taking the quiz.
+
+    Args:
+        quiz_id (int): The quiz ID.
+        if_none_match (Optional[str], optional): The entity tags held by the client.
+            Defaults to None.
+        service (IQuestionService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if quiz is not found.
+
+    Returns:
+        Response: The serialized bundle, or 304 if the client holds it already.
+    """
+    if bundle := await service.get_quiz_bundle(quiz_id):
+        return bundle_response(bundle, if_none_match)
     raise HTTPException(status_code=404, detail="Quiz not found")
 
 @router.put("/{quiz_id}", tags=["Quiz"], response_model=Quiz, status_code=201)
@@ -100,7 +163,7 @@ async def update_quiz(
     quiz_id: int,
     updated_quiz: QuizIn,
     service: IQuizService = Depends(Provide[Container.quiz_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
     """An endpoint for updating a quiz.
 
@@ -108,7 +171,7 @@ async def update_quiz(
         quiz_id (int): The quiz ID.
         updated_quiz (QuizIn): The updated quiz details.
         service (IQuizService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
@@ -117,19 +180,8 @@ async def update_quiz(
     Returns:
         dict: The updated quiz details.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if quiz_data := await service.get_quiz_by_id(quiz_id=quiz_id):
-        if str(quiz_data.player_id) != player_uuid:
+        if quiz_data.player_id != player_uuid:
             raise HTTPException(status_code=403, detail="Unauthorized")
 
         extended_quiz_data = QuizBroker(
@@ -150,14 +202,14 @@ async def update_quiz(
 async def share_quiz(
     quiz_id: int,
     service: IQuizService = Depends(Provide[Container.quiz_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
     """An endpoint for sharing a quiz.
 
         Args:
             quiz_id (int): The quiz ID.
             service (IQuizService, optional): The injected service dependency.
-            credentials (HTTPAuthorizationCredentials, optional): The credentials.
+            player_uuid (UUID4, optional): The authenticated player's UUID.
 
         Raises:
             HTTPException: 403 if unauthorized.
@@ -166,19 +218,8 @@ async def share_quiz(
         Returns:
             dict: The shared quiz details.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if quiz_data := await service.get_quiz_by_id(quiz_id=quiz_id):
-        if str(quiz_data.player_id) != player_uuid:
+        if quiz_data.player_id != player_uuid:
             raise HTTPException(status_code=403, detail="Unauthorized")
         shared_quiz = await service.share_quiz(quiz_id)
         return shared_quiz.model_dump()
@@ -190,14 +231,14 @@ async def share_quiz(
 async def delete_quiz(
     quiz_id: int,
     service: IQuizService = Depends(Provide[Container.quiz_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> None:
     """An endpoint for deleting quiz.
 
     Args:
         quiz_id (int): The quiz ID.
         service (IQuizService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 404 if quiz is not found.
@@ -206,19 +247,8 @@ async def delete_quiz(
     Returns:
         dict: Empty if operation finished.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if quiz_data := await service.get_quiz_by_id(quiz_id=quiz_id):
-        if str(quiz_data.player_id) != player_uuid:
+        if quiz_data.player_id != player_uuid:
             raise HTTPException(status_code=403, detail="Unauthorized")
         await service.delete_quiz(quiz_id)
         return
@@ -2,18 +2,18 @@
 
 from typing import Iterable
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import UUID4
 
 from quizapi.infrastructure.utils import consts
 from quizapi.container import Container
+from quizapi.api.utils.auth import get_current_player
+from quizapi.api.utils.responses import json_response
 from quizapi.core.domain.reward import Reward, RewardIn, RewardBroker
 from quizapi.infrastructure.dto.rewarddto import RewardDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 from quizapi.infrastructure.services.ireward import IRewardService
 
-bearer_scheme = HTTPBearer()
 router = APIRouter()
 
 @router.post("/collect", tags=["Reward"], response_model=Reward, status_code=201)
@@ -21,14 +21,14 @@ router = APIRouter()
 async def collect_reward(
     reward: RewardIn,
     service: IRewardService = Depends(Provide[Container.reward_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
     """An endpoint for collecting a reward.
 
         Args:
             reward (RewardIn): The reward data.
             service (IRewardService, optional): The injected service dependency.
-            credentials (HTTPAuthorizationCredentials, optional): The credentials.
+            player_uuid (UUID4, optional): The authenticated player's UUID.
 
         Raises:
             HTTPException: 403 if unauthorized.
@@ -37,17 +37,6 @@ async def collect_reward(
         Returns:
             dict: The collected reward details.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     extended_reward_data = RewardBroker(
         player_id=player_uuid,
         **reward.model_dump(),
@@ -57,28 +46,32 @@ async def collect_reward(
         raise HTTPException(status_code=400, detail="No eligible histories or reward could not be collected.")
     return new_reward.model_dump()
 
-@router.get("/all", tags=["Reward"], response_model=Iterable[RewardDTO], status_code=200)
+@router.get("/all", tags=["Reward"], response_model=PageDTO[RewardDTO], status_code=200)
 @inject
 async def get_all_rewards(
+        limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+        after: int = Query(0, ge=0),
         service: IRewardService = Depends(Provide[Container.reward_service]),
-) -> Iterable:
-    """An endpoint for getting all rewards.
+) -> Response:
+    """An endpoint for getting a page of rewards ordered by ID.
 
     Args:
+        limit (int, optional): The page size. Defaults to `DEFAULT_PAGE_SIZE`.
+        after (int, optional): The `next_cursor` of the previous page. Defaults to 0.
         service (IRewardService, optional): The injected service dependency.
 
     Returns:
-        Iterable: A collection of all rewards.
+        Response: The serialized page of rewards with the cursor of the next one.
     """
-    rewards = await service.get_all_rewards()
-    return rewards
+    page = await service.get_all_rewards(limit=limit, after=after)
+    return json_response(page)
 
 @router.get("/{reward_id}", tags=["Reward"], response_model=RewardDTO, status_code=200)
 @inject
 async def get_reward_by_id(
         reward_id: int,
         service: IRewardService = Depends(Provide[Container.reward_service]),
-) -> dict:
+) -> Response:
     """An endpoint for getting a reward by ID.
 
     Args:
@@ -89,10 +82,10 @@ async def get_reward_by_id(
         HTTPException: 404 if reward is not found.
 
     Returns:
-        dict: The reward details.
+        Response: The serialized reward details.
     """
     if reward := await service.get_reward_by_id(reward_id):
-        return reward.model_dump()
+        return json_response(reward)
     raise HTTPException(status_code=404, detail="Reward not found")
 
 @router.get("/player/{player_id}", tags=["Reward"], response_model=Iterable[Reward], status_code=200)
@@ -118,14 +111,14 @@ async def get_reward_by_player(
 async def delete_reward(
     reward_id: int,
     service: IRewardService = Depends(Provide[Container.reward_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> None:
     """An endpoint for deleting reward.
 
     Args:
         reward_id (int): The reward ID.
         service (IRewardService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 404 if reward is not found.
@@ -134,19 +127,8 @@ async def delete_reward(
     Returns:
         dict: Empty if operation finished.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if reward_data := await service.get_reward_by_id(reward_id=reward_id):
-        if str(reward_data.player_id) != player_uuid:
+        if reward_data.player_id != player_uuid:
             raise HTTPException(status_code=403, detail="Unauthorized")
         await service.delete_reward(reward_id)
         return
@@ -1,50 +1,54 @@
 """A module containing shop endpoints."""
 
-from typing import Iterable
+from pydantic import UUID4
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from quizapi.core.domain.reward import Reward
 from quizapi.infrastructure.utils import consts
 from quizapi.container import Container
+from quizapi.api.utils.auth import get_current_player
+from quizapi.api.utils.responses import json_response
 from quizapi.core.domain.shop import Shop, ShopIn
 from quizapi.infrastructure.dto.shopdto import ShopDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 from quizapi.infrastructure.services.ishop import IShopService
 
-bearer_scheme = HTTPBearer()
 router = APIRouter()
 
-@router.get("/all", tags=["Shop"], response_model=Iterable[ShopDTO], status_code=200)
+@router.get("/all", tags=["Shop"], response_model=PageDTO[ShopDTO], status_code=200)
 @inject
 async def get_all_items(
+        limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+        after: int = Query(0, ge=0),
         service: IShopService = Depends(Provide[Container.shop_service]),
-) -> Iterable:
-    """An endpoint for getting all items available in the shop.
+) -> Response:
+    """An endpoint for getting a page of shop items ordered by ID.
 
     Args:
+        limit (int, optional): The page size. Defaults to `DEFAULT_PAGE_SIZE`.
+        after (int, optional): The `next_cursor` of the previous page. Defaults to 0.
         service (IShopService, optional): The injected service dependency.
 
     Returns:
-        Iterable: A collection of shop items.
+        Response: The serialized page of shop items with the cursor of the next one.
     """
-    shops = await service.get_all_items()
-    return shops
+    page = await service.get_all_items(limit=limit, after=after)
+    return json_response(page)
 
 @router.post("/sell/{reward_id}", tags=["Shop"], response_model=Shop, status_code=200)
 @inject
 async def sell_item(
     reward_id: int,
     service: IShopService = Depends(Provide[Container.shop_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
     """An endpoint for selling an item.
 
     Args:
         reward_id (int): The reward ID of the item being sold.
         service (IShopService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
@@ -53,17 +57,6 @@ async def sell_item(
     Returns:
         dict: The sold item details.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     new_shop = await service.sell_item(reward_id, player_uuid)
 
     if not new_shop:
@@ -76,36 +69,25 @@ async def sell_item(
 async def buy_item(
     reward_id: int,
     service: IShopService = Depends(Provide[Container.shop_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
     """An endpoint for buying an item.
 
     Args:
         reward_id (int): The reward ID of the item being bought.
         service (IShopService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
-        HTTPException: 400 if item does not exist or insufficient funds.
+        HTTPException: 400 if item does not exist, insufficient funds or reward already owned.
 
     Returns:
         dict: The purchased reward details.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     new_reward = await service.buy_item(reward_id, player_uuid)
 
     if not new_reward:
-        raise HTTPException(status_code=400, detail="Item does not exist or insufficient funds.")
+        raise HTTPException(status_code=400, detail="Item does not exist, insufficient funds or reward already owned.")
 
     return new_reward.model_dump() if new_reward else {}
\ No newline at end of file
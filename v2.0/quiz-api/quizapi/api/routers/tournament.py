@@ -1,21 +1,42 @@
 """A module containing tournament endpoints."""
 
-from typing import Iterable
+from typing import Optional
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import UUID4
 
 from quizapi.infrastructure.utils import consts
 from quizapi.container import Container
-from quizapi.core.domain.tournament import Tournament, TournamentIn
-from quizapi.infrastructure.dto.tournamentdto import TournamentDTO
+from quizapi.api.utils.auth import get_current_player
+from quizapi.api.utils.responses import json_response
+from quizapi.core.repositories.itournament import QuizzesNotFoundError
+from quizapi.core.domain.tournament import (
+    StandingsScoring,
+    Tournament,
+    TournamentIn,
+    TournamentParticipant,
+)
+from quizapi.infrastructure.dto.tournamentdto import ParticipantDTO, StandingDTO, TournamentDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 from quizapi.infrastructure.services.itournament import ITournamentService
 
-bearer_scheme = HTTPBearer()
 router = APIRouter()
 
+def _quizzes_not_found(error: QuizzesNotFoundError) -> HTTPException:
+    """A function preparing the response to a tournament with missing quizzes.
+
+    Args:
+        error (QuizzesNotFoundError): The error listing the missing quizzes.
+
+    Returns:
+        HTTPException: 404 listing the IDs of the missing quizzes.
+    """
+    return HTTPException(
+        status_code=404,
+        detail={"message": "Quizzes not found", "quiz_ids": error.quiz_ids},
+    )
+
 @router.post("/create", tags=["Tournament"], response_model=Tournament, status_code=201)
 @inject
 async def create_tournament(
@@ -29,38 +50,46 @@ async def create_tournament(
             service (ITournamentService, optional): The injected service dependency.
 
         Raises:
+            HTTPException: 404 if any of the quizzes is not found.
             HTTPException: 500 if tournament creation fails.
 
         Returns:
             dict: The newly created tournament attributes.
     """
-    new_tournament = await service.add_tournament(tournament)
+    try:
+        new_tournament = await service.add_tournament(tournament)
+    except QuizzesNotFoundError as error:
+        raise _quizzes_not_found(error) from error
     if not new_tournament:
         raise HTTPException(status_code=500, detail="Failed to create tournament.")
     return new_tournament.model_dump() if new_tournament else None
 
-@router.get("/all", tags=["Tournament"], response_model=Iterable[TournamentDTO], status_code=200)
+@router.get("/all", tags=["Tournament"], response_model=PageDTO[TournamentDTO], status_code=200)
 @inject
 async def get_all_tournaments(
+        limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+        after: int = Query(0, ge=0),
         service: ITournamentService = Depends(Provide[Container.tournament_service]),
-) -> Iterable:
-    """An endpoint for getting all tournaments.
+) -> Response:
+    """An endpoint for getting a page of tournaments ordered by ID.
 
     Args:
+        limit (int, optional): The page size. Defaults to `DEFAULT_PAGE_SIZE`.
+        after (int, optional): The `next_cursor` of the previous page. Defaults to 0.
         service (ITournamentService, optional): The injected service dependency.
 
     Returns:
-        Iterable: A collection of all tournaments.
+        Response: The serialized page of tournaments with the cursor of the next one.
     """
-    tournaments = await service.get_all_tournaments()
-    return tournaments
+    page = await service.get_all_tournaments(limit=limit, after=after)
+    return json_response(page)
 
 @router.get("/{tournament_id}", tags=["Tournament"], response_model=TournamentDTO, status_code=200)
 @inject
 async def get_tournament_by_id(
         tournament_id: int,
         service: ITournamentService = Depends(Provide[Container.tournament_service]),
-) -> dict:
+) -> Response:
     """An endpoint for getting a tournament by ID.
 
     Args:
@@ -71,12 +100,82 @@ async def get_tournament_by_id(
         HTTPException: 404 if tournament is not found.
 
     Returns:
-        dict: The tournament details.
+        Response: The serialized tournament details.
     """
     if tournament := await service.get_tournament_by_id(tournament_id):
-        return tournament.model_dump()
+        return json_response(tournament)
     raise HTTPException(status_code=404, detail="Tournament not found")
 
+@router.get("/{tournament_id}/participants", tags=["Tournament"], response_model=PageDTO[ParticipantDTO], status_code=200)
+@inject
+async def get_tournament_participants(
+        tournament_id: int,
+        limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+        after: Optional[UUID4] = Query(None),
+        service: ITournamentService = Depends(Provide[Container.tournament_service]),
+) -> Response:
+    """An endpoint for getting a page of tournament participants ordered by player ID.
+
+    Args:
+        tournament_id (int): The tournament ID.
+        limit (int, optional): The page size. Defaults to `DEFAULT_PAGE_SIZE`.
+        after (Optional[UUID4], optional): The `next_cursor` of the previous page.
+            Defaults to None.
+        service (ITournamentService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if tournament is not found.
+
+    Returns:
+        Response: The serialized page of participants with the cursor of the next one.
+    """
+    page = await service.get_participants(
+        tournament_id=tournament_id,
+        limit=limit,
+        after=after,
+    )
+    if not page.items and not await service.get_tournament_by_id(tournament_id):
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    return json_response(page)
+
+@router.get("/{tournament_id}/standings", tags=["Tournament"], response_model=PageDTO[StandingDTO], status_code=200)
+@inject
+async def get_tournament_standings(
+        tournament_id: int,
+        scoring: StandingsScoring = Query(StandingsScoring.EFFECTIVENESS),
+        limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+        after: int = Query(0, ge=0),
+        service: ITournamentService = Depends(Provide[Container.tournament_service]),
+) -> Response:
+    """An endpoint for getting a page of tournament participants ordered by rank.
+
+    Each participant is scored by their best attempts at the quizzes of
+    the tournament, summing either the effectiveness or the correct answers.
+
+    Args:
+        tournament_id (int): The tournament ID.
+        scoring (StandingsScoring, optional): The scoring of the best attempts.
+            Defaults to `StandingsScoring.EFFECTIVENESS`.
+        limit (int, optional): The page size. Defaults to `DEFAULT_PAGE_SIZE`.
+        after (int, optional): The `next_cursor` of the previous page. Defaults to 0.
+        service (ITournamentService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if tournament is not found.
+
+    Returns:
+        Response: The serialized page of standings with the cursor of the next one.
+    """
+    page = await service.get_standings(
+        tournament_id=tournament_id,
+        scoring=scoring,
+        limit=limit,
+        after=after,
+    )
+    if not page.items and not await service.get_tournament_by_id(tournament_id):
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    return json_response(page)
+
 @router.put("/{tournament_id}", tags=["Tournament"], response_model=Tournament, status_code=201)
 @inject
 async def update_tournament(
@@ -92,17 +191,20 @@ async def update_tournament(
         service (ITournamentService, optional): The injected service dependency.
 
     Raises:
-        HTTPException: 404 if tournament is not found.
+        HTTPException: 404 if tournament or any of the quizzes is not found.
         HTTPException: 403 if tournament update fails.
 
     Returns:
         dict: The updated tournament details.
     """
     if await service.get_tournament_by_id(tournament_id=tournament_id):
-        updated = await service.update_tournament(
-            tournament_id=tournament_id,
-            data=updated_tournament,
-        )
+        try:
+            updated = await service.update_tournament(
+                tournament_id=tournament_id,
+                data=updated_tournament,
+            )
+        except QuizzesNotFoundError as error:
+            raise _quizzes_not_found(error) from error
         if updated:
             return updated.model_dump()
         raise HTTPException(status_code=403, detail="Failed to update tournament")
@@ -129,77 +231,57 @@ async def delete_tournament(
 
     raise HTTPException(status_code=404, detail="Tournament not found")
 
-@router.post("/{tournament_id}/join", tags=["Tournament"], response_model=Tournament, status_code=200)
+@router.post("/{tournament_id}/join", tags=["Tournament"], response_model=TournamentParticipant, status_code=200)
 @inject
 async def join_tournament(
         tournament_id: int,
         service: ITournamentService = Depends(Provide[Container.tournament_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
     """An endpoint for joining a tournament.
 
     Args:
         tournament_id (int): The tournament ID.
         service (ITournamentService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
         HTTPException: 400 if failed to join or already a participant.
 
     Returns:
-        dict: The updated tournament details.
+        dict: The participation details.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
-    updated_tournament = await service.join_tournament(tournament_id, UUID4(player_uuid))
-    if not updated_tournament:
+    participant = await service.join_tournament(tournament_id, player_uuid)
+    if not participant:
         raise HTTPException(status_code=400, detail="Failed to join tournament or already a participant.")
 
-    return updated_tournament.model_dump()
+    return participant.model_dump()
 
 
-@router.post("/{tournament_id}/leave", tags=["Tournament"], response_model=Tournament, status_code=200)
+@router.post("/{tournament_id}/leave", tags=["Tournament"], response_model=TournamentParticipant, status_code=200)
 @inject
 async def leave_tournament(
         tournament_id: int,
         service: ITournamentService = Depends(Provide[Container.tournament_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        player_uuid: UUID4 = Depends(get_current_player),
 ) -> dict:
     """An endpoint for leaving a tournament.
 
     Args:
         tournament_id (int): The tournament ID.
         service (ITournamentService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        player_uuid (UUID4, optional): The authenticated player's UUID.
 
     Raises:
         HTTPException: 403 if unauthorized.
         HTTPException: 400 if failed to leave or not a participant.
 
     Returns:
-        dict: The updated tournament details.
+        dict: The participation details.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    player_uuid = token_payload.get("sub")
-    if not player_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
-    updated_tournament = await service.leave_tournament(tournament_id, UUID4(player_uuid))
-    if not updated_tournament:
+    participant = await service.leave_tournament(tournament_id, player_uuid)
+    if not participant:
         raise HTTPException(status_code=400, detail="Failed to leave tournament or not a participant.")
 
-    return updated_tournament.model_dump()
\ No newline at end of file
+    return participant.model_dump()
\ No newline at end of file
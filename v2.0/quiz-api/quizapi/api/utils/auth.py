@@ -0,0 +1,135 @@
+"""A module containing the authentication dependency for the endpoints."""
+
+import hashlib
+from collections import OrderedDict
+from time import time
+from uuid import UUID
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwt
+from pydantic import UUID4
+
+from quizapi.config import config
+from quizapi.infrastructure.utils import consts
+
+bearer_scheme = HTTPBearer()
+
+
+class VerifiedTokenCache:
+    """A class implementing a bounded LRU of already verified tokens.
+
+    Entries are keyed by the SHA-256 digest of the token, so raw tokens are
+    never kept in memory, and each one expires together with the token.
+    """
+
+    def __init__(self, max_entries: int):
+        """The initializer of the `verified token cache`.
+
+        Args:
+            max_entries (int): The maximum number of stored tokens.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, UUID]] = OrderedDict()
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        """A method preparing the cache key of the token.
+
+        Args:
+            token (str): The raw token.
+
+        Returns:
+            bytes: The digest of the token.
+        """
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes) -> UUID | None:
+        """Getting the player of a verified token.
+
+        Args:
+            key (bytes): The digest of the token.
+
+        Returns:
+            UUID | None: The player's UUID if the token is cached and not expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, player_uuid = entry
+        if expires_at <= time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return player_uuid
+
+    def set(self, key: bytes, expires_at: float, player_uuid: UUID) -> None:
+        """Storing a verified token, evicting the least recently used.
+
+        Args:
+            key (bytes): The digest of the token.
+            expires_at (float): The UNIX timestamp of the token expiration.
+            player_uuid (UUID): The UUID of the token subject.
+        """
+        self._entries[key] = (expires_at, player_uuid)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removing all the stored tokens."""
+        self._entries.clear()
+
+
+verified_tokens = VerifiedTokenCache(max_entries=config.AUTH_TOKEN_CACHE_SIZE)
+
+
+def decode_player_token(token: str) -> tuple[float, UUID]:
+    """A function verifying the token and extracting its subject.
+
+    Args:
+        token (str): The raw token.
+
+    Raises:
+        HTTPException: 403 if the token is invalid, expired or has no subject.
+
+    Returns:
+        tuple[float, UUID]: The expiration timestamp and the player's UUID.
+    """
+    try:
+        token_payload = jwt.decode(
+            token,
+            key=consts.SECRET_KEY,
+            algorithms=[consts.ALGORITHM],
+        )
+        return float(token_payload["exp"]), UUID(token_payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError) as error:
+        raise HTTPException(status_code=403, detail="Unauthorized") from error
+
+
+async def get_current_player(
+        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> UUID4:
+    """A dependency providing the UUID of the authenticated player.
+
+    The signature is verified only on the first use of a token, later
+    requests with the same token are served from `verified_tokens`.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+
+    Raises:
+        HTTPException: 403 if unauthorized.
+
+    Returns:
+        UUID4: The UUID of the player.
+    """
+    key = verified_tokens.digest(credentials.credentials)
+    if player_uuid := verified_tokens.get(key):
+        return player_uuid
+
+    expires_at, player_uuid = decode_player_token(credentials.credentials)
+    verified_tokens.set(key, expires_at, player_uuid)
+    return player_uuid
@@ -0,0 +1,87 @@
+"""A module containing the middleware recording request metrics."""
+
+import logging
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from quizapi.config import config
+from quizapi.infrastructure.utils.metrics import metrics
+from quizapi.infrastructure.utils.queries import QueryAccount, current_account
+
+UNMATCHED_ROUTE = "unmatched"
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsMiddleware:
+    """A class timing requests per route template and accounting their queries.
+
+    It is a plain ASGI middleware, since `BaseHTTPMiddleware` runs every
+    request through an extra task and response stream. Requests matching
+    no route share a single label to keep the number of series bounded.
+
+    The statements run before the response starts are reported in its
+    `Server-Timing` header, and a warning is logged for every request
+    running the same statement more times than the configured threshold.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """The initializer of the `metrics middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+        self.repeat_threshold = config.QUERY_REPEAT_WARNING_THRESHOLD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method serving a request and recording its duration, status and queries.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel receiving the request messages.
+            send (Send): The channel sending the response messages.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        account = QueryAccount(parent=current_account.get())
+        token = current_account.set(account)
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"server-timing", account.server_timing().encode()),
+                ]
+            await send(message)
+
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            current_account.reset(token)
+            route = scope.get("route")
+            route_path = route.path if route is not None else UNMATCHED_ROUTE
+            metrics.observe_request(
+                scope["method"],
+                route_path,
+                status,
+                perf_counter() - started,
+            )
+            if (
+                    account.count > self.repeat_threshold
+                    and (repeated := account.repeated(self.repeat_threshold))
+            ):
+                logger.warning(
+                    "%s %s ran %d statements, repeating %s",
+                    scope["method"],
+                    route_path,
+                    account.count,
+                    repeated,
+                )
@@ -0,0 +1,120 @@
+"""A module containing response helpers for the endpoints."""
+
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterator
+
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+from quizapi.infrastructure.utils.bundle import QuizBundle
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_BATCH_SIZE = 100
+
+
+def json_response(model: BaseModel, status_code: int = 200) -> Response:
+    """A function preparing a JSON response straight from a trusted model.
+
+    Returning a ready response skips the second validation FastAPI runs
+    against `response_model`, which is still used for the OpenAPI schema.
+
+    Args:
+        model (BaseModel): The model to serialize.
+        status_code (int, optional): The status of the response. Defaults to 200.
+
+    Returns:
+        Response: The response with the serialized model.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def bundle_response(bundle: QuizBundle, if_none_match: str | None) -> Response:
+    """A function preparing a conditional response from a serialized bundle.
+
+    Clients are asked to revalidate on every use, which costs a single
+    304 without a body while their copy is still up to date.
+
+    Args:
+        bundle (QuizBundle): The serialized bundle with its entity tag.
+        if_none_match (str | None): The `If-None-Match` request header.
+
+    Returns:
+        Response: The 304 response if the client holds the bundle, otherwise
+            the response with the bundle.
+    """
+    headers = {"ETag": bundle.etag, "Cache-Control": "no-cache"}
+    if bundle.matches(if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=bundle.content,
+        media_type=JSON_MEDIA_TYPE,
+        headers=headers,
+    )
+
+
+async def _ndjson_lines(
+        items: AsyncIterator[BaseModel],
+        batch_size: int,
+) -> AsyncGenerator[str, None]:
+    """A function serializing models to newline-delimited JSON.
+
+    Lines are sent in batches to avoid a separate write for every row.
+    The models are closed together with the lines, which releases the
+    connection of a server-side cursor.
+
+    Args:
+        items (AsyncIterator[BaseModel]): The models to serialize.
+        batch_size (int): The number of lines sent per write.
+
+    Yields:
+        str: The consecutive batches of NDJSON lines.
+    """
+    batch = []
+    async with aclosing(items):
+        async for item in items:
+            batch.append(item.model_dump_json())
+            if len(batch) >= batch_size:
+                yield "\n".join(batch) + "\n"
+                batch.clear()
+    if batch:
+        yield "\n".join(batch) + "\n"
+
+
+async def _close_lines(lines: AsyncGenerator[str, None]) -> None:
+    """A function closing the lines of a streamed response.
+
+    Args:
+        lines (AsyncGenerator[str, None]): The lines to close.
+    """
+    await lines.aclose()
+
+
+def ndjson_response(
+        items: AsyncIterator[BaseModel],
+        batch_size: int = NDJSON_BATCH_SIZE,
+) -> StreamingResponse:
+    """A function preparing a streaming NDJSON response.
+
+    A client going away cancels the stream while it waits to send a
+    batch, so the lines are closed after the response as well.
+
+    Args:
+        items (AsyncIterator[BaseModel]): The models to stream.
+        batch_size (int, optional): The number of lines sent per write.
+            Defaults to `NDJSON_BATCH_SIZE`.
+
+    Returns:
+        StreamingResponse: The response streaming one JSON object per line.
+    """
+    lines = _ndjson_lines(items, batch_size)
+    return StreamingResponse(
+        lines,
+        media_type=NDJSON_MEDIA_TYPE,
+        background=BackgroundTask(_close_lines, lines),
+    )
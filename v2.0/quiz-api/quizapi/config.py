@@ -1,6 +1,6 @@
 """A module providing configuration variables."""
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class BaseConfig(BaseSettings):
@@ -14,4 +14,25 @@ class AppConfig(BaseConfig):
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
 
+    DB_POOL_MIN_SIZE: int = 5
+    DB_POOL_MAX_SIZE: int = 20
+    DB_POOL_MAX_QUERIES: int = 50000
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0
+    DB_CONNECT_TIMEOUT: float = 10.0
+    DB_STATEMENT_CACHE_SIZE: int = 256
+    DB_FORCE_ROLLBACK: bool = False
+
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_TTL_SECONDS: float = 60.0
+
+    HASH_POOL_SIZE: int = 4
+    HASH_QUEUE_DEPTH: int = 64
+
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+
+    QUERY_REPEAT_WARNING_THRESHOLD: int = 10
+
+    REPOSITORY_BACKEND: Literal["postgres", "memory"] = "postgres"
+
 config = AppConfig()
\ No newline at end of file
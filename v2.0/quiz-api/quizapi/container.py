@@ -1,22 +1,47 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Factory, Object, Selector, Singleton
 
+from quizapi.config import config
+from quizapi.infrastructure.cache.memory import MemoryCacheBackend
 from quizapi.infrastructure.repositories.quizdb import \
     QuizRepository
+from quizapi.infrastructure.repositories.quizcache import \
+    CachedQuizRepository
 from quizapi.infrastructure.repositories.questiondb import \
     QuestionRepository
+from quizapi.infrastructure.repositories.questioncache import \
+    CachedQuestionRepository
 from quizapi.infrastructure.repositories.playerdb import \
     PlayerRepository
 from quizapi.infrastructure.repositories.historydb import \
     HistoryRepository
+from quizapi.infrastructure.repositories.historycache import \
+    CachedHistoryRepository
 from quizapi.infrastructure.repositories.tournamentdb import \
     TournamentRepository
+from quizapi.infrastructure.repositories.tournamentcache import \
+    CachedTournamentRepository
 from quizapi.infrastructure.repositories.rewarddb import \
     RewardRepository
 from quizapi.infrastructure.repositories.shopdb import \
     ShopRepository
+from quizapi.infrastructure.repositories.memory.store import MemoryStore
+from quizapi.infrastructure.repositories.memory.quiz import \
+    MemoryQuizRepository
+from quizapi.infrastructure.repositories.memory.question import \
+    MemoryQuestionRepository
+from quizapi.infrastructure.repositories.memory.player import \
+    MemoryPlayerRepository
+from quizapi.infrastructure.repositories.memory.history import \
+    MemoryHistoryRepository
+from quizapi.infrastructure.repositories.memory.tournament import \
+    MemoryTournamentRepository
+from quizapi.infrastructure.repositories.memory.reward import \
+    MemoryRewardRepository
+from quizapi.infrastructure.repositories.memory.shop import \
+    MemoryShopRepository
 
 from quizapi.infrastructure.services.quiz import QuizService
 from quizapi.infrastructure.services.question import QuestionService
@@ -28,13 +53,68 @@ from quizapi.infrastructure.services.shop import ShopService
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
-    quiz_repository = Singleton(QuizRepository)
-    question_repository = Singleton(QuestionRepository)
-    player_repository = Singleton(PlayerRepository)
-    history_repository = Singleton(HistoryRepository)
-    tournament_repository = Singleton(TournamentRepository)
-    reward_repository = Singleton(RewardRepository)
-    shop_repository = Singleton(ShopRepository)
+    cache_backend = Singleton(
+        MemoryCacheBackend,
+        max_entries=config.CACHE_MAX_ENTRIES,
+        max_bytes=config.CACHE_MAX_BYTES,
+        ttl_seconds=config.CACHE_TTL_SECONDS,
+    )
+
+    repository_backend = Object(config.REPOSITORY_BACKEND)
+    memory_store = Singleton(MemoryStore)
+
+    quiz_repository = Singleton(
+        CachedQuizRepository,
+        repository=Selector(
+            repository_backend,
+            postgres=Singleton(QuizRepository),
+            memory=Singleton(MemoryQuizRepository, store=memory_store),
+        ),
+        cache=cache_backend,
+    )
+    question_repository = Singleton(
+        CachedQuestionRepository,
+        repository=Selector(
+            repository_backend,
+            postgres=Singleton(QuestionRepository),
+            memory=Singleton(MemoryQuestionRepository, store=memory_store),
+        ),
+        cache=cache_backend,
+    )
+    player_repository = Selector(
+        repository_backend,
+        postgres=Singleton(PlayerRepository),
+        memory=Singleton(MemoryPlayerRepository, store=memory_store),
+    )
+    tournament_repository = Singleton(
+        CachedTournamentRepository,
+        repository=Selector(
+            repository_backend,
+            postgres=Singleton(TournamentRepository),
+            memory=Singleton(MemoryTournamentRepository, store=memory_store),
+        ),
+        cache=cache_backend,
+    )
+    history_repository = Singleton(
+        CachedHistoryRepository,
+        repository=Selector(
+            repository_backend,
+            postgres=Singleton(HistoryRepository),
+            memory=Singleton(MemoryHistoryRepository, store=memory_store),
+        ),
+        tournament_repository=tournament_repository,
+        cache=cache_backend,
+    )
+    reward_repository = Selector(
+        repository_backend,
+        postgres=Singleton(RewardRepository),
+        memory=Singleton(MemoryRewardRepository, store=memory_store),
+    )
+    shop_repository = Selector(
+        repository_backend,
+        postgres=Singleton(ShopRepository),
+        memory=Singleton(MemoryShopRepository, store=memory_store),
+    )
 
     quiz_service = Factory(
         QuizService,
@@ -51,6 +131,7 @@ class Container(DeclarativeContainer):
     history_service = Factory(
         HistoryService,
         repository=history_repository,
+        question_repository=question_repository,
     )
     tournament_service = Factory(
         TournamentService,
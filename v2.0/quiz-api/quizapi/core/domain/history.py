@@ -1,5 +1,6 @@
 """Module containing history-related domain models"""
 from datetime import datetime
+from typing import List
 from pydantic import BaseModel, ConfigDict, UUID4
 
 class HistoryIn(BaseModel):
@@ -18,4 +19,19 @@ class History(HistoryBroker):
     total_questions: int
     effectiveness: float
 
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+class UpdatedHistory(History):
+    """Model representing an updated history with its previous quiz and player."""
+    previous_quiz_id: int | None
+    previous_player_id: UUID4
+
+class AnswerIn(BaseModel):
+    """Model representing a single answer of a submission."""
+    question_id: int
+    chosen_option: str
+
+class SubmissionIn(BaseModel):
+    """Model representing the answers submitted for a quiz."""
+    quiz_id: int
+    answers: List[AnswerIn]
@@ -15,4 +15,9 @@ class Player(PlayerIn):
     id: UUID1
     balance: int
 
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+class RefreshIn(BaseModel):
+    """Model representing a refresh token sent by the player."""
+
+    refresh_token: str
@@ -2,13 +2,16 @@
 
 from pydantic import BaseModel, ConfigDict
 
-class QuestionIn(BaseModel):
-    """Model representing question's DTO attributes."""
+class QuestionOptions(BaseModel):
+    """Model representing the question attributes shown to every player."""
     question_text: str
     option_one: str
     option_two: str
     option_three: str
     option_four: str
+
+class QuestionIn(QuestionOptions):
+    """Model representing question's DTO attributes."""
     correct_option: str
     quiz_id: int
 
@@ -16,4 +19,15 @@ class Question(QuestionIn):
     """Model representing question attributes in the database."""
     id: int
 
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+class PublicQuestion(QuestionOptions):
+    """Model representing question attributes without the correct option."""
+    id: int
+    quiz_id: int
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+class UpdatedQuestion(Question):
+    """Model representing an updated question with the quiz it belonged to."""
+    previous_quiz_id: int
@@ -1,5 +1,7 @@
 """Module containing tournament-related domain models"""
 
+from datetime import datetime
+from enum import Enum
 from pydantic import BaseModel, ConfigDict, UUID4
 from typing import List
 
@@ -12,5 +14,20 @@ class TournamentIn(BaseModel):
 class Tournament(TournamentIn):
     """Model representing tournament attributes in the database."""
     id: int
-    participants: List[UUID4]
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+class UpdatedTournament(Tournament):
+    """Model representing an updated tournament with its previous quizzes."""
+    previous_quizzes_id: List[int]
+
+class TournamentParticipant(BaseModel):
+    """Model representing a player's participation in a tournament."""
+    tournament_id: int
+    player_id: UUID4
+    joined_at: datetime
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+class StandingsScoring(str, Enum):
+    """Enum representing the ways of scoring tournament participants."""
+    EFFECTIVENESS = "effectiveness"
+    CORRECT_ANSWERS = "correct_answers"
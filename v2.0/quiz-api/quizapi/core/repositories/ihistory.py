@@ -1,6 +1,6 @@
 """Module containing history repository abstractions."""
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 from pydantic import UUID4
 from quizapi.core.domain.history import HistoryIn
 
@@ -8,13 +8,28 @@ class IHistoryRepository(ABC):
     """An abstract class representing protocol of history repository."""
 
     @abstractmethod
-    async def get_all_histories(self) -> Iterable[Any]:
+    async def get_all_histories(self, limit: int, after: int = 0) -> Iterable[Any]:
         """The abstract getting all histories from the data storage.
 
+        Args:
+            limit (int): The maximum number of history records to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: The collection of all histories.
         """
 
+    @abstractmethod
+    def iterate_histories(self, chunk_size: int) -> AsyncIterator[Any]:
+        """The abstract iterating all history records in the data storage in chunks.
+
+        Args:
+            chunk_size (int): The number of rows fetched per round trip.
+
+        Returns:
+            AsyncIterator[Any]: The consecutive history records ordered by ID.
+        """
+
     @abstractmethod
     async def get_history_by_id(self, history_id: int) -> Any | None:
         """The abstract getting a history by ID from the data storage.
@@ -67,27 +82,29 @@ class IHistoryRepository(ABC):
             effectiveness (float): The calculated effectiveness percentage.
 
         Returns:
-            Any | None: The updated history.
+            Any | None: The updated history with its previous quiz and player.
         """
 
     @abstractmethod
-    async def delete_history(self, history_id: int) -> bool:
+    async def delete_history(self, history_id: int) -> Any | None:
         """The abstract removing a history from the data storage.
 
         Args:
             history_id (int): The ID of the history.
 
         Returns:
-            bool: Success of the operation.
+            Any | None: The removed history if successful.
         """
 
     @abstractmethod
-    async def get_total_questions_by_quiz(self, quiz_id: int) -> Iterable[Any] | None:
-        """The abstract getting total questions by quiz from the data storage.
+    async def get_leaderboard(self, quiz_id: int, limit: int, player_id: UUID4) -> Any:
+        """The abstract getting the top attempts of a quiz from the data storage.
 
         Args:
             quiz_id (int): The ID of the quiz.
+            limit (int): The number of top attempts to get.
+            player_id (UUID4): The UUID of the player to rank.
 
         Returns:
-            Iterable[Any] | None: The collection of total questions related to the quiz.
-        """
\ No newline at end of file
+            Any: The top attempts and the attempt of the player.
+        """
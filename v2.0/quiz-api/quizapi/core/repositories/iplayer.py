@@ -1,8 +1,9 @@
 """Module containing player repository abstractions."""
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any
 from quizapi.core.domain.player import PlayerIn
-from pydantic import UUID5
+from pydantic import UUID4, UUID5
 
 class IPlayerRepository(ABC):
     """An abstract class representing protocol of player repository."""
@@ -60,4 +61,48 @@ class IPlayerRepository(ABC):
 
         Returns:
             Any | None: The player's balance if exists.
-        """
\ No newline at end of file
+        """
+
+    @abstractmethod
+    async def create_session(
+            self,
+            player_id: UUID4,
+            token_hash: str,
+            expires_at: datetime,
+    ) -> None:
+        """The abstract storing a refresh token session in the data storage.
+
+        Args:
+            player_id (UUID4): The UUID of the player.
+            token_hash (str): The digest of the refresh token.
+            expires_at (datetime): The expiration time of the session.
+        """
+
+    @abstractmethod
+    async def rotate_session(
+            self,
+            token_hash: str,
+            new_token_hash: str,
+            expires_at: datetime,
+    ) -> UUID4 | None:
+        """The abstract replacing an active session in the data storage.
+
+        Args:
+            token_hash (str): The digest of the used refresh token.
+            new_token_hash (str): The digest of the new refresh token.
+            expires_at (datetime): The expiration time of the new session.
+
+        Returns:
+            UUID4 | None: The UUID of the session owner if the old session was active.
+        """
+
+    @abstractmethod
+    async def delete_session(self, token_hash: str) -> bool:
+        """The abstract revoking a refresh token session in the data storage.
+
+        Args:
+            token_hash (str): The digest of the refresh token.
+
+        Returns:
+            bool: Success of the operation.
+        """
@@ -1,21 +1,38 @@
 """Module containing question repository abstractions."""
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 
 from quizapi.core.domain.question import QuestionIn
+from quizapi.infrastructure.utils.bundle import QuizBundle
+from quizapi.infrastructure.utils.grading import AnswerKey
 
 
 class IQuestionRepository(ABC):
     """An abstract class representing protocol of question repository."""
 
     @abstractmethod
-    async def get_all_questions(self) -> Iterable[Any]:
+    async def get_all_questions(self, limit: int, after: int = 0) -> Iterable[Any]:
         """The abstract getting all questions from the data storage.
 
+        Args:
+            limit (int): The maximum number of questions to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: The collection of all questions.
         """
 
+    @abstractmethod
+    def iterate_questions(self, chunk_size: int) -> AsyncIterator[Any]:
+        """The abstract iterating all questions in the data storage in chunks.
+
+        Args:
+            chunk_size (int): The number of rows fetched per round trip.
+
+        Returns:
+            AsyncIterator[Any]: The consecutive questions ordered by ID.
+        """
+
     @abstractmethod
     async def get_question_by_id(self, question_id: int) -> Any | None:
         """The abstract getting a question by ID from the data storage.
@@ -38,6 +55,28 @@ class IQuestionRepository(ABC):
             Iterable[Any] | None: The collection of questions for the given quiz.
         """
 
+    @abstractmethod
+    async def get_answer_key(self, quiz_id: int) -> AnswerKey:
+        """The abstract getting the answer key of a quiz from the data storage.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            AnswerKey: The correct options of the quiz questions.
+        """
+
+    @abstractmethod
+    async def get_quiz_bundle(self, quiz_id: int) -> QuizBundle | None:
+        """The abstract getting a serialized quiz with its questions from the data storage.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            QuizBundle | None: The serialized quiz bundle if the quiz exists.
+        """
+
     @abstractmethod
     async def add_question(self, data: QuestionIn) -> Any | None:
         """The abstract adding a new question to the data storage.
@@ -62,16 +101,17 @@ class IQuestionRepository(ABC):
             data (QuestionIn): The updated attributes of the question.
 
         Returns:
-            Any | None: The updated question.
+            Any | None: The updated question with the ID of the quiz it
+                belonged to before.
         """
 
     @abstractmethod
-    async def delete_question(self, question_id: int) -> bool:
+    async def delete_question(self, question_id: int) -> Any | None:
         """The abstract removing a question from the data storage.
 
         Args:
             question_id (int): The ID of the question.
 
         Returns:
-            bool: Success of the operation.
+            Any | None: The removed question.
         """
\ No newline at end of file
@@ -7,9 +7,13 @@ class IQuizRepository(ABC):
     """An abstract class representing protocol of quiz repository."""
 
     @abstractmethod
-    async def get_all_quizzes(self) -> Iterable[Any]:
+    async def get_all_quizzes(self, limit: int, after: int = 0) -> Iterable[Any]:
         """The abstract getting all quizzes from the data storage.
 
+        Args:
+            limit (int): The maximum number of quizzes to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: The collection of all quizzes.
         """
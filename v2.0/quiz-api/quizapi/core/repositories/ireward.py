@@ -1,7 +1,7 @@
 """Module containing reward repository abstractions."""
 from abc import ABC, abstractmethod
 from typing import Any, Iterable
-from quizapi.core.domain.reward import RewardIn
+from quizapi.core.domain.reward import RewardBroker
 
 from pydantic import UUID4
 
@@ -9,9 +9,13 @@ class IRewardRepository(ABC):
     """An abstract class representing protocol of reward repository."""
 
     @abstractmethod
-    async def get_all_rewards(self) -> Iterable[Any]:
+    async def get_all_rewards(self, limit: int, after: int = 0) -> Iterable[Any]:
         """The abstract getting all rewards from the data storage.
 
+        Args:
+            limit (int): The maximum number of rewards to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: The collection of all rewards.
         """
@@ -38,13 +42,18 @@ class IRewardRepository(ABC):
         """
 
     @abstractmethod
-    async def collect_reward(self, data: RewardIn, reward: str, value: int) -> Any | None:
+    async def collect_reward(
+            self,
+            data: RewardBroker,
+            min_effectiveness: float,
+            value_per_question: int,
+    ) -> Any | None:
         """The abstract collecting a reward from the data storage.
 
         Args:
-            data (RewardIn): The attributes of the reward.
-            reward (str): The reward name.
-            value (int): The value associated with the reward.
+            data (RewardBroker): The attributes of the reward.
+            min_effectiveness (float): The effectiveness required to collect the reward.
+            value_per_question (int): The value of the reward per question of the attempt.
 
         Returns:
             Any | None: The collected reward if successful.
@@ -60,24 +69,3 @@ class IRewardRepository(ABC):
         Returns:
             bool: Success of the operation.
         """
-
-    async def get_histories_by_quiz(self, quiz_id: int, player_id: UUID4) -> Iterable[Any] | None:
-        """The abstract getting histories by quiz and player from the data storage.
-
-        Args:
-            quiz_id (int): The ID of the quiz.
-            player_id (UUID4): The ID of the player.
-
-        Returns:
-            Iterable[Any] | None: The collection of histories associated with the quiz and player.
-        """
-
-    async def get_reward_by_quiz(self, quiz_id: int) -> Any | None:
-        """The abstract getting a reward by quiz from the data storage.
-
-        Args:
-            quiz_id (int): The ID of the quiz.
-
-        Returns:
-            Any | None: The reward data if exists.
-        """
\ No newline at end of file
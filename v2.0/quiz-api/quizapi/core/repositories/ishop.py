@@ -8,9 +8,13 @@ class IShopRepository(ABC):
     """An abstract class representing protocol of shop repository."""
 
     @abstractmethod
-    async def get_all_items(self) -> Iterable[Any]:
+    async def get_all_items(self, limit: int, after: int = 0) -> Iterable[Any]:
         """The abstract getting all items from the data storage.
 
+        Args:
+            limit (int): The maximum number of shop items to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: The collection of all items.
         """
@@ -1,16 +1,35 @@
 """Module containing tournament repository abstractions."""
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
-from quizapi.core.domain.tournament import TournamentIn
+from typing import Any, Iterable, Sequence
+from uuid import UUID
+from quizapi.core.domain.tournament import StandingsScoring, TournamentIn
 from pydantic import UUID4
 
+
+class QuizzesNotFoundError(Exception):
+    """An exception raised when a tournament refers to quizzes which do not exist."""
+
+    def __init__(self, quiz_ids: list[int]):
+        """The initializer of the `quizzes not found error`.
+
+        Args:
+            quiz_ids (list[int]): The IDs of the missing quizzes.
+        """
+        super().__init__(f"Quizzes not found: {quiz_ids}")
+        self.quiz_ids = quiz_ids
+
+
 class ITournamentRepository(ABC):
     """An abstract class representing protocol of tournament repository."""
 
     @abstractmethod
-    async def get_all_tournaments(self) -> Iterable[Any]:
+    async def get_all_tournaments(self, limit: int, after: int = 0) -> Iterable[Any]:
         """The abstract getting all tournaments from the data storage.
 
+        Args:
+            limit (int): The maximum number of tournaments to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: The collection of all tournaments.
         """
@@ -33,6 +52,9 @@ class ITournamentRepository(ABC):
         Args:
             data (TournamentIn): The attributes of the tournament.
 
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
         Returns:
             Any | None: The newly created tournament.
         """
@@ -49,19 +71,22 @@ class ITournamentRepository(ABC):
             tournament_id (int): The ID of the tournament.
             data (TournamentIn): The updated attributes of the tournament.
 
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
         Returns:
-            Any | None: The updated tournament.
+            Any | None: The updated tournament with its previous quizzes.
         """
 
     @abstractmethod
-    async def delete_tournament(self, tournament_id: int) -> bool:
+    async def delete_tournament(self, tournament_id: int) -> Any | None:
         """The abstract removing a tournament from the data storage.
 
         Args:
             tournament_id (int): The ID of the tournament.
 
         Returns:
-            bool: Success of the operation.
+            Any | None: The removed tournament if successful.
         """
 
     @abstractmethod
@@ -73,7 +98,7 @@ class ITournamentRepository(ABC):
             player_uuid (UUID4): The UUID of the player joining.
 
         Returns:
-            Any | None: The updated tournament data if successful.
+            Any | None: The new participation if successful.
         """
 
     @abstractmethod
@@ -85,5 +110,51 @@ class ITournamentRepository(ABC):
             player_uuid (UUID4): The UUID of the player leaving.
 
         Returns:
-            Any | None: The updated tournament data if successful.
+            Any | None: The removed participation if successful.
+        """
+
+    @abstractmethod
+    async def get_participants(
+            self,
+            tournament_id: int,
+            limit: int,
+            after: UUID | None = None,
+    ) -> Iterable[Any]:
+        """The abstract getting participants of a tournament from the data storage.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            limit (int): The maximum number of participants to get.
+            after (UUID | None, optional): The player ID after which the page starts.
+                Defaults to None.
+
+        Returns:
+            Iterable[Any]: The collection of participants ordered by player ID.
+        """
+
+    @abstractmethod
+    async def get_standings(
+            self,
+            tournament_id: int,
+            scoring: StandingsScoring,
+    ) -> Sequence[Any]:
+        """The abstract getting the ranked participants of a tournament from the data storage.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            scoring (StandingsScoring): The scoring of the best attempts.
+
+        Returns:
+            Sequence[Any]: The collection of standings ordered by rank.
+        """
+
+    @abstractmethod
+    async def get_tournaments_by_quiz(self, quiz_id: int) -> Iterable[int]:
+        """The abstract getting the tournaments including a quiz from the data storage.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            Iterable[int]: The collection of tournament IDs.
         """
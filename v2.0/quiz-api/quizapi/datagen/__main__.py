@@ -0,0 +1,62 @@
+"""A module running the dataset generator from the command line.
+
+Example:
+    python -m quizapi.datagen --preset medium --seed 42 --truncate
+"""
+
+import argparse
+import asyncio
+import sys
+from time import perf_counter
+
+from quizapi.datagen.generator import DatasetNotEmptyError, load_dataset
+from quizapi.datagen.presets import PRESETS
+from quizapi.db import database, init_db
+from quizapi.migrations import migrate
+
+
+async def main(preset: str, seed: int, truncate: bool) -> int:
+    """Function migrating the database and loading the dataset into it.
+
+    Args:
+        preset (str): The name of the dataset size.
+        seed (int): The seed of the dataset.
+        truncate (bool): Whether to remove all data first.
+
+    Returns:
+        int: The exit status of the command.
+    """
+    await init_db()
+    try:
+        await migrate()
+        started = perf_counter()
+        async with database.connection() as connection:
+            rows = await load_dataset(
+                connection.raw_connection,
+                PRESETS[preset],
+                seed=seed,
+                truncate=truncate,
+            )
+    except DatasetNotEmptyError as error:
+        print(error, file=sys.stderr)
+        return 1
+    finally:
+        await database.disconnect()
+
+    for table, count in rows.items():
+        print(f"{table}: {count}")
+    print(f"Loaded {preset} dataset in {perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load a synthetic dataset with COPY.")
+    parser.add_argument("--preset", choices=PRESETS, default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="remove all data before loading",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.preset, args.seed, args.truncate)))
@@ -0,0 +1,456 @@
+"""A module bulk-loading synthetic datasets with COPY.
+
+Every table is generated from its own random generator seeded with the
+dataset seed and the table name, so the same seed and size always give
+the same rows. Rows are streamed to COPY in batches, so only the IDs
+referenced by other tables are kept in memory.
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Iterator, Sequence
+
+from asyncpg import Connection  # type: ignore
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from quizapi.datagen.presets import DatasetSize
+from quizapi.infrastructure.utils import consts
+from quizapi.migrations import (
+    best_attempt_history_index,
+    best_attempt_player_index,
+    best_attempt_ranking_index,
+    fill_best_attempts,
+    foreign_key_indexes,
+)
+
+DEFAULT_PASSWORD = "password"
+DEFAULT_PASSWORD_HASH = "$2b$12$0qJRyAi13HuwiMx7QRdkhe7OhEhsNxrnGThUSw2QmHZRFQDvWnlB6"
+
+BATCH_SIZE = 10_000
+QUIZ_POPULARITY_EXPONENT = 1.1
+PLAYER_ACTIVITY_EXPONENT = 0.8
+SHARED_QUIZ_RATIO = 0.8
+HISTORY_END = datetime(2025, 1, 1, tzinfo=timezone.utc)
+HISTORY_PERIOD_SECONDS = 365 * 24 * 60 * 60
+
+TABLES = (
+    "players",
+    "player_sessions",
+    "quizzes",
+    "questions",
+    "history",
+    "best_attempts",
+    "tournaments",
+    "tournament_participants",
+    "rewards",
+    "shops",
+)
+
+PLAYER_COLUMNS = ("id", "username", "email", "password", "balance")
+QUIZ_COLUMNS = ("id", "title", "player_id", "description", "shared", "reward", "question_count")
+QUESTION_COLUMNS = (
+    "question_text",
+    "option_one",
+    "option_two",
+    "option_three",
+    "option_four",
+    "correct_option",
+    "quiz_id",
+)
+HISTORY_COLUMNS = (
+    "player_id",
+    "quiz_id",
+    "total_questions",
+    "correct_answers",
+    "effectiveness",
+    "timestamp",
+)
+TOURNAMENT_COLUMNS = ("id", "name", "description", "quizzes_id")
+PARTICIPANT_COLUMNS = ("tournament_id", "player_id", "joined_at")
+
+BULK_LOADED_INDEXES = [
+    *(index for index in foreign_key_indexes if index.table.name in ("questions", "history")),
+    best_attempt_ranking_index,
+    best_attempt_history_index,
+    best_attempt_player_index,
+]
+
+ELIGIBLE_REWARDS = """
+    WITH eligible AS (
+        SELECT
+            best_attempts.player_id,
+            best_attempts.quiz_id,
+            quizzes.reward,
+            history.total_questions * $2 AS value,
+            row_number() OVER (
+                ORDER BY best_attempts.quiz_id, best_attempts.player_id
+            ) AS number
+        FROM best_attempts
+        JOIN quizzes ON quizzes.id = best_attempts.quiz_id
+        JOIN history ON history.id = best_attempts.history_id
+        WHERE best_attempts.effectiveness >= $1
+    )
+"""
+
+LIST_SHOP_ITEMS = ELIGIBLE_REWARDS + """
+    INSERT INTO shops (name, value, quiz_id)
+    SELECT reward, value, quiz_id FROM eligible
+    WHERE number % $3 = 0
+"""
+
+COLLECT_REWARDS = ELIGIBLE_REWARDS + """
+    INSERT INTO rewards (player_id, quiz_id, reward, value)
+    SELECT player_id, quiz_id, reward, value FROM eligible
+    WHERE number % $3 <> 0
+"""
+
+RESTART_SEQUENCE = """
+    SELECT setval(pg_get_serial_sequence('{table}', 'id'), coalesce(max(id), 0) + 1, false)
+    FROM {table}
+"""
+
+
+class DatasetNotEmptyError(Exception):
+    """An exception raised when loading a dataset into a database holding players."""
+
+
+def player_credentials(number: int) -> tuple[str, str, str]:
+    """A function getting the credentials of a generated player.
+
+    Args:
+        number (int): The number of the player, counted from 0.
+
+    Returns:
+        tuple[str, str, str]: The username, email and password of the player.
+    """
+    return f"player{number}", f"player{number}@example.com", DEFAULT_PASSWORD
+
+
+def _random(seed: int, table: str) -> random.Random:
+    """A function creating the random generator of a table.
+
+    Args:
+        seed (int): The seed of the dataset.
+        table (str): The name of the table.
+
+    Returns:
+        random.Random: The generator seeded for the table.
+    """
+    return random.Random(f"{seed}:{table}")
+
+
+def zipf_weights(count: int, exponent: float) -> list[float]:
+    """A function preparing cumulative weights of a Zipf distribution.
+
+    Args:
+        count (int): The number of ranked elements.
+        exponent (float): The skew of the distribution.
+
+    Returns:
+        list[float]: The cumulative weights of the consecutive ranks.
+    """
+    return list(accumulate(1 / rank ** exponent for rank in range(1, count + 1)))
+
+
+def _ddl(statement: CreateIndex | DropIndex) -> str:
+    """A function compiling an index statement for PostgreSQL.
+
+    Args:
+        statement (CreateIndex | DropIndex): The index statement.
+
+    Returns:
+        str: The SQL text of the statement.
+    """
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _row_count(status: str) -> int:
+    """A function reading the number of rows from a command status.
+
+    Args:
+        status (str): The status, e.g. `COPY 1000` or `INSERT 0 1000`.
+
+    Returns:
+        int: The number of affected rows.
+    """
+    return int(status.rsplit(" ", 1)[-1])
+
+
+def _player_rows(player_ids: Sequence[uuid.UUID], rng: random.Random) -> Iterator[tuple]:
+    """A function generating players sharing a single password.
+
+    The password hash is precomputed, so loading does not run bcrypt.
+
+    Args:
+        player_ids (Sequence[uuid.UUID]): The IDs of the players.
+        rng (random.Random): The random generator of the table.
+
+    Yields:
+        tuple: The consecutive player rows.
+    """
+    for number, player_id in enumerate(player_ids):
+        username, email, _ = player_credentials(number)
+        yield player_id, username, email, DEFAULT_PASSWORD_HASH, rng.randrange(1001)
+
+
+def _quiz_rows(
+        question_counts: Sequence[int],
+        player_ids: Sequence[uuid.UUID],
+        rng: random.Random,
+) -> Iterator[tuple]:
+    """A function generating quizzes with IDs counted from 1.
+
+    Args:
+        question_counts (Sequence[int]): The number of questions of every quiz.
+        player_ids (Sequence[uuid.UUID]): The IDs of the authors.
+        rng (random.Random): The random generator of the table.
+
+    Yields:
+        tuple: The consecutive quiz rows.
+    """
+    for quiz_id, question_count in enumerate(question_counts, start=1):
+        yield (
+            quiz_id,
+            f"Quiz {quiz_id}",
+            rng.choice(player_ids),
+            f"Description of quiz {quiz_id}",
+            rng.random() < SHARED_QUIZ_RATIO,
+            f"Reward {quiz_id}",
+            question_count,
+        )
+
+
+def _question_rows(question_counts: Sequence[int], rng: random.Random) -> Iterator[tuple]:
+    """A function generating the questions of the quizzes.
+
+    Args:
+        question_counts (Sequence[int]): The number of questions of every quiz.
+        rng (random.Random): The random generator of the table.
+
+    Yields:
+        tuple: The consecutive question rows.
+    """
+    for quiz_id, question_count in enumerate(question_counts, start=1):
+        for number in range(1, question_count + 1):
+            options = [f"Answer {option} to {number}" for option in "ABCD"]
+            yield (
+                f"Question {number} of quiz {quiz_id}",
+                *options,
+                rng.choice(options),
+                quiz_id,
+            )
+
+
+def _history_rows(
+        size: DatasetSize,
+        question_counts: Sequence[int],
+        player_ids: Sequence[uuid.UUID],
+        rng: random.Random,
+) -> Iterator[tuple]:
+    """A function generating attempts with skewed quiz popularity and player activity.
+
+    Both quizzes and players are drawn from Zipf distributions over
+    shuffled ranks, so a few quizzes and players get most attempts
+    without the popularity following the IDs.
+
+    Args:
+        size (DatasetSize): The size of the dataset.
+        question_counts (Sequence[int]): The number of questions of every quiz.
+        player_ids (Sequence[uuid.UUID]): The IDs of the players.
+        rng (random.Random): The random generator of the table.
+
+    Yields:
+        tuple: The consecutive history rows.
+    """
+    quiz_ranks = rng.sample(range(1, size.quizzes + 1), size.quizzes)
+    quiz_weights = zipf_weights(size.quizzes, QUIZ_POPULARITY_EXPONENT)
+    player_ranks = rng.sample(player_ids, len(player_ids))
+    player_weights = zipf_weights(len(player_ids), PLAYER_ACTIVITY_EXPONENT)
+
+    remaining = size.histories
+    while remaining:
+        batch = min(remaining, BATCH_SIZE)
+        remaining -= batch
+        quiz_ids = rng.choices(quiz_ranks, cum_weights=quiz_weights, k=batch)
+        players = rng.choices(player_ranks, cum_weights=player_weights, k=batch)
+        for quiz_id, player_id in zip(quiz_ids, players):
+            total_questions = question_counts[quiz_id - 1]
+            correct_answers = min(
+                total_questions,
+                int(total_questions * rng.random() ** 0.5 + 0.5),
+            )
+            yield (
+                player_id,
+                quiz_id,
+                total_questions,
+                correct_answers,
+                correct_answers / total_questions,
+                HISTORY_END - timedelta(seconds=rng.randrange(HISTORY_PERIOD_SECONDS)),
+            )
+
+
+def _tournament_rows(
+        size: DatasetSize,
+        player_ids: Sequence[uuid.UUID],
+        rng: random.Random,
+        participants: list[tuple],
+) -> Iterator[tuple]:
+    """A function generating tournaments and collecting their participants.
+
+    Args:
+        size (DatasetSize): The size of the dataset.
+        player_ids (Sequence[uuid.UUID]): The IDs of the players.
+        rng (random.Random): The random generator of the table.
+        participants (list[tuple]): The list collecting the participant rows.
+
+    Yields:
+        tuple: The consecutive tournament rows.
+    """
+    quizzes_per_tournament = min(size.quizzes, size.quizzes_per_tournament)
+    participants_per_tournament = min(len(player_ids), size.participants_per_tournament)
+    for tournament_id in range(1, size.tournaments + 1):
+        quizzes_id = sorted(rng.sample(range(1, size.quizzes + 1), quizzes_per_tournament))
+        participants.extend(
+            (
+                tournament_id,
+                player_id,
+                HISTORY_END - timedelta(seconds=rng.randrange(HISTORY_PERIOD_SECONDS)),
+            )
+            for player_id in rng.sample(player_ids, participants_per_tournament)
+        )
+        yield (
+            tournament_id,
+            f"Tournament {tournament_id}",
+            f"Description of tournament {tournament_id}",
+            quizzes_id,
+        )
+
+
+async def _copy(
+        connection: Connection,
+        table: str,
+        columns: Sequence[str],
+        records: Iterator[tuple],
+) -> int:
+    """A function streaming rows into a table with COPY.
+
+    Args:
+        connection (Connection): The asyncpg connection.
+        table (str): The name of the table.
+        columns (Sequence[str]): The names of the copied columns.
+        records (Iterator[tuple]): The rows to copy.
+
+    Returns:
+        int: The number of copied rows.
+    """
+    status = await connection.copy_records_to_table(
+        table,
+        records=records,
+        columns=columns,
+    )
+    return _row_count(status)
+
+
+async def load_dataset(
+        connection: Connection,
+        size: DatasetSize,
+        seed: int,
+        truncate: bool = False,
+) -> dict[str, int]:
+    """A function loading a synthetic dataset in a single transaction.
+
+    The schema has to be migrated already. Question counts are copied
+    along with the quizzes, so the counting trigger is disabled for the
+    load, and best attempts are filled the same way the migration does.
+    Rewards are collected for the eligible best attempts, every
+    `shop_listing_every`-th of them is listed in the shop instead.
+
+    The secondary indexes of the largest tables are rebuilt once after
+    the load instead of being updated row by row. The generated rows
+    are consistent, so for a superuser the foreign keys are not checked
+    row by row either.
+
+    Args:
+        connection (Connection): The asyncpg connection.
+        size (DatasetSize): The size of the dataset.
+        seed (int): The seed of the dataset.
+        truncate (bool, optional): Whether to remove all data first.
+            Defaults to False.
+
+    Raises:
+        DatasetNotEmptyError: If the database holds players and is not truncated.
+
+    Returns:
+        dict[str, int]: The number of loaded rows of every table.
+    """
+    rows: dict[str, int] = {}
+    async with connection.transaction():
+        if truncate:
+            await connection.execute(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE")
+        elif await connection.fetchval("SELECT EXISTS (SELECT 1 FROM players)"):
+            raise DatasetNotEmptyError("The database already holds players, use truncate")
+
+        if await connection.fetchval("SELECT rolsuper FROM pg_roles WHERE rolname = current_user"):
+            await connection.execute("SET LOCAL session_replication_role = replica")
+        for index in BULK_LOADED_INDEXES:
+            await connection.execute(_ddl(DropIndex(index, if_exists=True)))
+
+        rng = _random(seed, "players")
+        player_ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(size.players)]
+        rows["players"] = await _copy(
+            connection, "players", PLAYER_COLUMNS, _player_rows(player_ids, rng),
+        )
+
+        rng = _random(seed, "quizzes")
+        low, high = max(1, size.questions_per_quiz // 2), size.questions_per_quiz * 3 // 2
+        question_counts = [rng.randint(low, high) for _ in range(size.quizzes)]
+        rows["quizzes"] = await _copy(
+            connection, "quizzes", QUIZ_COLUMNS, _quiz_rows(question_counts, player_ids, rng),
+        )
+
+        await connection.execute("ALTER TABLE questions DISABLE TRIGGER questions_count_on_write")
+        rows["questions"] = await _copy(
+            connection,
+            "questions",
+            QUESTION_COLUMNS,
+            _question_rows(question_counts, _random(seed, "questions")),
+        )
+        await connection.execute("ALTER TABLE questions ENABLE TRIGGER questions_count_on_write")
+
+        rows["history"] = await _copy(
+            connection,
+            "history",
+            HISTORY_COLUMNS,
+            _history_rows(size, question_counts, player_ids, _random(seed, "history")),
+        )
+        rows["best_attempts"] = _row_count(await connection.execute(fill_best_attempts.text))
+        for index in BULK_LOADED_INDEXES:
+            await connection.execute(_ddl(CreateIndex(index, if_not_exists=True)))
+
+        participants: list[tuple] = []
+        rows["tournaments"] = await _copy(
+            connection,
+            "tournaments",
+            TOURNAMENT_COLUMNS,
+            _tournament_rows(size, player_ids, _random(seed, "tournaments"), participants),
+        )
+        rows["tournament_participants"] = await _copy(
+            connection, "tournament_participants", PARTICIPANT_COLUMNS, iter(participants),
+        )
+
+        reward_args = (
+            consts.REWARD_MIN_EFFECTIVENESS,
+            consts.REWARD_VALUE_PER_QUESTION,
+            size.shop_listing_every,
+        )
+        rows["shops"] = _row_count(await connection.execute(LIST_SHOP_ITEMS, *reward_args))
+        rows["rewards"] = _row_count(await connection.execute(COLLECT_REWARDS, *reward_args))
+
+        for table in ("quizzes", "tournaments"):
+            await connection.execute(RESTART_SEQUENCE.format(table=table))
+
+    await connection.execute("ANALYZE")
+    return rows
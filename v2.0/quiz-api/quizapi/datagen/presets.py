@@ -0,0 +1,49 @@
+"""A module containing the sizes of generated datasets."""
+
+from typing import NamedTuple
+
+
+class DatasetSize(NamedTuple):
+    """A class representing the number of rows of a generated dataset."""
+    players: int
+    quizzes: int
+    questions_per_quiz: int
+    histories: int
+    tournaments: int
+    quizzes_per_tournament: int
+    participants_per_tournament: int
+    shop_listing_every: int
+
+
+PRESETS: dict[str, DatasetSize] = {
+    "small": DatasetSize(
+        players=100,
+        quizzes=20,
+        questions_per_quiz=10,
+        histories=1_000,
+        tournaments=5,
+        quizzes_per_tournament=5,
+        participants_per_tournament=20,
+        shop_listing_every=10,
+    ),
+    "medium": DatasetSize(
+        players=50_000,
+        quizzes=5_000,
+        questions_per_quiz=10,
+        histories=1_000_000,
+        tournaments=500,
+        quizzes_per_tournament=10,
+        participants_per_tournament=200,
+        shop_listing_every=20,
+    ),
+    "large": DatasetSize(
+        players=1_000_000,
+        quizzes=100_000,
+        questions_per_quiz=10,
+        histories=50_000_000,
+        tournaments=10_000,
+        quizzes_per_tournament=10,
+        participants_per_tournament=500,
+        shop_listing_every=50,
+    ),
+}
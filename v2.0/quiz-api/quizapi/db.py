@@ -1,11 +1,12 @@
 """A module providing database access."""
 
 import asyncio
+from typing import NamedTuple
+
+import asyncpg    # type: ignore
 import databases
 import sqlalchemy
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
 from asyncpg.exceptions import (    # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
@@ -29,6 +30,30 @@ player_table = sqlalchemy.Table(
     sqlalchemy.Column("balance", sqlalchemy.Integer, default=0),
 )
 
+player_session_table = sqlalchemy.Table(
+    "player_sessions",
+    metadata,
+    sqlalchemy.Column(
+        "id",
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=sqlalchemy.text("gen_random_uuid()")
+    ),
+    sqlalchemy.Column(
+        "player_id",
+        sqlalchemy.ForeignKey("players.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    sqlalchemy.Column("token_hash", sqlalchemy.String, nullable=False, unique=True),
+    sqlalchemy.Column(
+        "created_at",
+        sqlalchemy.DateTime(timezone=True),
+        server_default=sqlalchemy.func.now(),
+        nullable=False,
+    ),
+    sqlalchemy.Column("expires_at", sqlalchemy.DateTime(timezone=True), nullable=False),
+)
+
 quiz_table = sqlalchemy.Table(
     "quizzes",
     metadata,
@@ -42,6 +67,12 @@ quiz_table = sqlalchemy.Table(
     sqlalchemy.Column("description", sqlalchemy.String),
     sqlalchemy.Column("shared", sqlalchemy.Boolean),
     sqlalchemy.Column("reward", sqlalchemy.String, nullable=False, unique=True),
+    sqlalchemy.Column(
+        "question_count",
+        sqlalchemy.Integer,
+        nullable=False,
+        server_default=sqlalchemy.text("0"),
+    ),
 )
 
 question_table = sqlalchemy.Table(
@@ -80,6 +111,28 @@ history_table = sqlalchemy.Table(
     sqlalchemy.Column("timestamp", sqlalchemy.DateTime(timezone=True)),
 )
 
+best_attempt_table = sqlalchemy.Table(
+    "best_attempts",
+    metadata,
+    sqlalchemy.Column(
+        "quiz_id",
+        sqlalchemy.ForeignKey("quizzes.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column(
+        "player_id",
+        sqlalchemy.ForeignKey("players.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column(
+        "history_id",
+        sqlalchemy.ForeignKey("history.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    sqlalchemy.Column("effectiveness", sqlalchemy.Float, nullable=False),
+    sqlalchemy.Column("timestamp", sqlalchemy.DateTime(timezone=True), nullable=False),
+)
+
 tournament_table = sqlalchemy.Table(
     "tournaments",
     metadata,
@@ -87,7 +140,27 @@ tournament_table = sqlalchemy.Table(
     sqlalchemy.Column("name", sqlalchemy.String),
     sqlalchemy.Column("description", sqlalchemy.String),
     sqlalchemy.Column("quizzes_id", sqlalchemy.ARRAY(sqlalchemy.Integer), nullable=False),
-    sqlalchemy.Column("participants", sqlalchemy.ARRAY(UUID(as_uuid=True)), nullable=False),
+)
+
+tournament_participant_table = sqlalchemy.Table(
+    "tournament_participants",
+    metadata,
+    sqlalchemy.Column(
+        "tournament_id",
+        sqlalchemy.ForeignKey("tournaments.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column(
+        "player_id",
+        sqlalchemy.ForeignKey("players.id"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column(
+        "joined_at",
+        sqlalchemy.DateTime(timezone=True),
+        server_default=sqlalchemy.func.now(),
+        nullable=False,
+    ),
 )
 
 reward_table = sqlalchemy.Table(
@@ -110,6 +183,32 @@ reward_table = sqlalchemy.Table(
         nullable=False,
     ),
     sqlalchemy.Column("value", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.UniqueConstraint(
+        "player_id",
+        "quiz_id",
+        name="uq_rewards_player_id_quiz_id",
+    ),
+)
+
+reward_collection_table = sqlalchemy.Table(
+    "reward_collections",
+    metadata,
+    sqlalchemy.Column(
+        "player_id",
+        sqlalchemy.ForeignKey("players.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column(
+        "quiz_id",
+        sqlalchemy.ForeignKey("quizzes.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column(
+        "collected_at",
+        sqlalchemy.DateTime(timezone=True),
+        server_default=sqlalchemy.func.now(),
+        nullable=False,
+    ),
 )
 
 shop_table = sqlalchemy.Table(
@@ -130,39 +229,65 @@ db_uri = (
     f"@{config.DB_HOST}/{config.DB_NAME}"
 )
 
-engine = create_async_engine(
-    db_uri,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
-)
-
 database = databases.Database(
     db_uri,
-    force_rollback=True,
+    force_rollback=config.DB_FORCE_ROLLBACK,
+    min_size=config.DB_POOL_MIN_SIZE,
+    max_size=config.DB_POOL_MAX_SIZE,
+    max_queries=config.DB_POOL_MAX_QUERIES,
+    max_inactive_connection_lifetime=config.DB_POOL_MAX_INACTIVE_LIFETIME,
+    timeout=config.DB_CONNECT_TIMEOUT,
+    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
 )
 
 
+class PoolStats(NamedTuple):
+    """A class representing the state of the connection pool."""
+    size: int
+    in_use: int
+    max_size: int
+
+
+def get_pool_stats() -> PoolStats:
+    """Function reading the state of the shared connection pool.
+
+    `databases` does not expose its asyncpg pool, so it is read from the
+    private attribute of the backend. When the pool is not connected or
+    the attribute is missing in another `databases` version, an empty pool
+    of the configured size is reported instead of failing `/metrics`.
+
+    Returns:
+        PoolStats: The open, borrowed and maximum number of connections.
+    """
+    pool = getattr(getattr(database, "_backend", None), "_pool", None)
+    if not isinstance(pool, asyncpg.Pool):
+        return PoolStats(size=0, in_use=0, max_size=config.DB_POOL_MAX_SIZE)
+    size = pool.get_size()
+    return PoolStats(
+        size=size,
+        in_use=size - pool.get_idle_size(),
+        max_size=pool.get_max_size(),
+    )
+
+
 async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+    """Function connecting the shared connection pool to the DB.
 
     Args:
         retries (int, optional): Number of retries of connect to DB.
             Defaults to 5.
-        delay (int, optional): Delay of connect do DB. Defaults to 2.
+        delay (int, optional): Delay of connect do DB. Defaults to 5.
     """
     for attempt in range(retries):
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
+            await database.connect()
             return
         except (
-            OperationalError,
-            DatabaseError,
+            OSError,
             CannotConnectNowError,
             ConnectionDoesNotExistError,
         ) as e:
-            print(f"Attempt {attempt + 1} fai led: {e}")
+            print(f"Attempt {attempt + 1} failed: {e}")
             await asyncio.sleep(delay)
 
     raise ConnectionError("Could not connect to DB after several retries.")
\ No newline at end of file
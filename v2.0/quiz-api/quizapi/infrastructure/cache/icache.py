@@ -0,0 +1,75 @@
+"""Module containing cache backend abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any, NamedTuple
+
+
+class CacheStats(NamedTuple):
+    """A class representing the counters of a cache backend."""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    max_entries: int
+    bytes: int
+    max_bytes: int
+
+
+class ICacheBackend(ABC):
+    """An abstract class representing protocol of cache backend.
+
+    Cached values are shared between callers and must be treated as
+    immutable.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """The abstract getting a value from the cache.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            Any | None: The cached value if exists and not expired.
+        """
+
+    @abstractmethod
+    async def generation(self, key: str) -> int:
+        """The abstract getting the generation of a key.
+
+        The generation changes whenever the key is deleted, so a value
+        loaded after reading it can be stored only if it is still current.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            int: The current generation of the key.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, generation: int | None = None) -> None:
+        """The abstract storing a value in the cache.
+
+        Args:
+            key (str): The key of the entry.
+            value (Any): The value to store.
+            generation (int | None, optional): The generation of the key read
+                before loading the value. Defaults to storing unconditionally.
+        """
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """The abstract removing entries from the cache.
+
+        Args:
+            *keys (str): The keys of the entries.
+        """
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """The abstract getting the counters of the cache.
+
+        Returns:
+            CacheStats: The current counters.
+        """
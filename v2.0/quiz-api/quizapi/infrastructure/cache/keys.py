@@ -0,0 +1,74 @@
+"""Module containing the keys of cached entries."""
+
+
+def quiz_key(quiz_id: int) -> str:
+    """A function building the key of a single quiz.
+
+    Args:
+        quiz_id (int): The ID of the quiz.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"quiz:{quiz_id}"
+
+
+def questions_key(quiz_id: int) -> str:
+    """A function building the key of the questions of a quiz.
+
+    Args:
+        quiz_id (int): The ID of the quiz.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"questions:{quiz_id}"
+
+
+def answer_key_key(quiz_id: int) -> str:
+    """A function building the key of the answer key of a quiz.
+
+    Args:
+        quiz_id (int): The ID of the quiz.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"answers:{quiz_id}"
+
+
+def bundle_key(quiz_id: int) -> str:
+    """A function building the key of the serialized bundle of a quiz.
+
+    Args:
+        quiz_id (int): The ID of the quiz.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"bundle:{quiz_id}"
+
+
+def standings_key(tournament_id: int, scoring: str) -> str:
+    """A function building the key of the standings of a tournament.
+
+    Args:
+        tournament_id (int): The ID of the tournament.
+        scoring (str): The name of the scoring.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"standings:{tournament_id}:{scoring}"
+
+
+def quiz_tournaments_key(quiz_id: int) -> str:
+    """A function building the key of the tournaments including a quiz.
+
+    Args:
+        quiz_id (int): The ID of the quiz.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"tournaments:{quiz_id}"
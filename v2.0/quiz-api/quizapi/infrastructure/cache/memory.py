@@ -0,0 +1,161 @@
+"""Module containing in-process cache backend implementation."""
+
+import pickle
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, NamedTuple
+
+from quizapi.infrastructure.cache.icache import CacheStats, ICacheBackend
+
+GENERATION_SLOTS = 4096
+
+
+class _Entry(NamedTuple):
+    """A class representing a stored value with its expiry and size."""
+    expires_at: float
+    size: int
+    value: Any
+
+
+def approximate_size(value: Any) -> int:
+    """A function approximating the memory taken by a cached value.
+
+    The length of the pickled value counts the payload of the nested
+    objects, which is what grows with the size of a quiz.
+
+    Args:
+        value (Any): The value to measure.
+
+    Returns:
+        int: The approximate size in bytes.
+    """
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class MemoryCacheBackend(ICacheBackend):
+    """A class implementing a bounded LRU cache with per-entry TTL.
+
+    The backend lives in the worker process, so each worker keeps its own
+    entries. All operations are synchronous under the hood and never yield
+    to the event loop, so no locking is needed.
+
+    Entries are bounded both by their number and by their approximate size
+    in bytes, so a few large quizzes cannot take an unbounded amount of
+    memory. Every key hashes to one of `GENERATION_SLOTS` generation
+    counters bumped on deletes, which keeps their memory fixed at the cost
+    of sometimes skipping a store for an unrelated key.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        """The initializer of the `memory cache backend`.
+
+        Args:
+            max_entries (int): The maximum number of stored entries.
+            max_bytes (int): The maximum approximate size of stored values.
+            ttl_seconds (float): The lifetime of a single entry.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._generations = [0] * GENERATION_SLOTS
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    async def get(self, key: str) -> Any | None:
+        """Getting a value from the cache.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            Any | None: The cached value if exists and not expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.expires_at <= monotonic():
+            self._remove(key)
+            self._evictions += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    async def generation(self, key: str) -> int:
+        """Getting the generation of a key.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            int: The current generation of the key.
+        """
+        return self._generations[hash(key) % GENERATION_SLOTS]
+
+    async def set(self, key: str, value: Any, generation: int | None = None) -> None:
+        """Storing a value in the cache, evicting the least recently used.
+
+        Values larger than the whole cache are not stored at all.
+
+        Args:
+            key (str): The key of the entry.
+            value (Any): The value to store.
+            generation (int | None, optional): The generation of the key read
+                before loading the value. The value is dropped if the key was
+                invalidated since. Defaults to storing unconditionally.
+        """
+        if generation is not None and generation != await self.generation(key):
+            return
+
+        size = approximate_size(value)
+        if size > self._max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = _Entry(monotonic() + self._ttl_seconds, size, value)
+        self._bytes += size
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    async def delete(self, *keys: str) -> None:
+        """Removing entries from the cache and bumping their generations.
+
+        Args:
+            *keys (str): The keys of the entries.
+        """
+        for key in keys:
+            self._generations[hash(key) % GENERATION_SLOTS] += 1
+            self._remove(key)
+
+    def stats(self) -> CacheStats:
+        """Getting the counters of the cache.
+
+        Returns:
+            CacheStats: The current counters.
+        """
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            max_entries=self._max_entries,
+            bytes=self._bytes,
+            max_bytes=self._max_bytes,
+        )
+
+    def _remove(self, key: str) -> None:
+        """Removing an entry and releasing its size.
+
+        Args:
+            key (str): The key of the entry.
+        """
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._bytes -= entry.size
@@ -0,0 +1,77 @@
+"""Module containing DTO models for output quiz bundles."""
+
+from typing import List, Optional, Sequence
+
+from asyncpg import Record  # type: ignore
+from pydantic import BaseModel, ConfigDict
+
+from quizapi.infrastructure.dto.quizdto import QuizDTO
+from quizapi.infrastructure.dto.trusted import construct_trusted
+
+class BundleQuestionDTO(BaseModel):
+    """A model representing DTO for question data without the correct option."""
+    id: int
+    question_text: Optional[str]
+    option_one: Optional[str]
+    option_two: Optional[str]
+    option_three: Optional[str]
+    option_four: Optional[str]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        arbitrary_types_allowed=True,
+    )
+
+    @classmethod
+    def from_record(cls, record: Record) -> "BundleQuestionDTO":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            BundleQuestionDTO: The final DTO instance.
+        """
+        return construct_trusted(cls, {
+            "id": record["question_id"],
+            "question_text": record["question_text"],
+            "option_one": record["option_one"],
+            "option_two": record["option_two"],
+            "option_three": record["option_three"],
+            "option_four": record["option_four"],
+        })
+
+
+class QuizBundleDTO(BaseModel):
+    """A model representing DTO for a quiz with all of its questions."""
+    quiz: QuizDTO
+    questions: List[BundleQuestionDTO]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        arbitrary_types_allowed=True,
+    )
+
+    @classmethod
+    def from_records(cls, records: Sequence[Record]) -> "QuizBundleDTO":
+        """A method for preparing DTO instance based on DB records.
+
+        Every record holds the quiz columns, the question columns are
+        empty for a quiz without questions.
+
+        Args:
+            records (Sequence[Record]): The non-empty DB records.
+
+        Returns:
+            QuizBundleDTO: The final DTO instance.
+        """
+        return construct_trusted(cls, {
+            "quiz": QuizDTO.from_record(records[0]),
+            "questions": [
+                BundleQuestionDTO.from_record(record)
+                for record in records
+                if record["question_id"] is not None
+            ],
+        })
@@ -6,16 +6,17 @@ from pydantic import BaseModel, ConfigDict, UUID4
 from typing import Optional
 
 from quizapi.infrastructure.dto.quizdto import QuizDTO
+from quizapi.infrastructure.dto.trusted import construct_trusted
 
 class HistoryDTO(BaseModel):
     """A model representing DTO for history data."""
     id: int
     player_id: UUID4
     quiz: QuizDTO
-    total_questions: int
+    total_questions: Optional[int]
     correct_answers: Optional[int]
     effectiveness: Optional[float]
-    timestamp: datetime
+    timestamp: Optional[datetime]
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -27,26 +28,29 @@ class HistoryDTO(BaseModel):
     def from_record(cls, record: Record) -> "HistoryDTO":
         """A method for preparing DTO instance based on DB record.
 
+        The record comes from our own schema and is already typed by the
+        driver, so the instance is constructed without validation.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             HistoryDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-        return cls(
-            id=record_dict.get("id"), # type: ignore
-            player_id=record_dict.get("player_id"), # type: ignore
-            quiz=QuizDTO(
-                id=record_dict.get("quiz_id"), # type: ignore
-                title=record_dict.get("title"), # type: ignore
-                player_id=record_dict.get("player_id_2"), # type: ignore
-                description=record_dict.get("description"), # type: ignore
-                shared=record_dict.get("shared"), # type: ignore
-                reward=record_dict.get("reward"), # type: ignore
-            ),
-            total_questions=record_dict.get("total_questions"), # type: ignore
-            correct_answers=record_dict.get("correct_answers"), # type: ignore
-            effectiveness=record_dict.get("effectiveness"), # type: ignore
-            timestamp=record_dict.get("timestamp"), # type: ignore
-        )
+        return construct_trusted(cls, {
+            "id": record["id"],
+            "player_id": record["player_id"],
+            "quiz": construct_trusted(QuizDTO, {
+                "id": record["quiz_id"],
+                "title": record["title"],
+                "player_id": record["player_id_2"],
+                "description": record["description"],
+                "shared": record["shared"],
+                "reward": record["reward"],
+                "question_count": record["question_count"],
+            }),
+            "total_questions": record["total_questions"],
+            "correct_answers": record["correct_answers"],
+            "effectiveness": record["effectiveness"],
+            "timestamp": record["timestamp"],
+        })
@@ -0,0 +1,73 @@
+"""Module containing DTO models for output quiz leaderboards."""
+
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+from asyncpg import Record  # type: ignore
+from pydantic import BaseModel, ConfigDict, UUID4
+
+from quizapi.infrastructure.dto.trusted import construct_trusted
+
+class LeaderboardEntryDTO(BaseModel):
+    """A model representing DTO for the best attempt of a player."""
+    rank: int
+    player_id: UUID4
+    username: Optional[str]
+    effectiveness: float
+    timestamp: datetime
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+    @classmethod
+    def from_record(cls, record: Record, rank: int) -> "LeaderboardEntryDTO":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+            rank (int): The position of the attempt on the leaderboard.
+
+        Returns:
+            LeaderboardEntryDTO: The final DTO instance.
+        """
+        return construct_trusted(cls, {
+            "rank": rank,
+            "player_id": record["player_id"],
+            "username": record["username"],
+            "effectiveness": record["effectiveness"],
+            "timestamp": record["timestamp"],
+        })
+
+
+class LeaderboardDTO(BaseModel):
+    """A model representing DTO for the leaderboard of a quiz."""
+    entries: List[LeaderboardEntryDTO]
+    player: Optional[LeaderboardEntryDTO] = None
+
+    @classmethod
+    def from_records(
+            cls,
+            records: Sequence[Record],
+            own_record: Record | None,
+    ) -> "LeaderboardDTO":
+        """A method for preparing DTO instance based on DB records.
+
+        Args:
+            records (Sequence[Record]): The top attempts in leaderboard order.
+            own_record (Record | None): The attempt of the player with its rank.
+
+        Returns:
+            LeaderboardDTO: The final DTO instance.
+        """
+        return construct_trusted(cls, {
+            "entries": [
+                LeaderboardEntryDTO.from_record(record, rank)
+                for rank, record in enumerate(records, start=1)
+            ],
+            "player": (
+                LeaderboardEntryDTO.from_record(own_record, own_record["rank"])
+                if own_record else None
+            ),
+        })
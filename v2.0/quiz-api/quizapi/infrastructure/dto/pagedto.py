@@ -0,0 +1,41 @@
+"""Module containing DTO models for paginated output collections."""
+
+from typing import Generic, List, Optional, Sequence, TypeVar
+from pydantic import BaseModel, UUID4
+
+from quizapi.infrastructure.dto.trusted import construct_trusted
+
+ItemT = TypeVar("ItemT")
+
+class PageDTO(BaseModel, Generic[ItemT]):
+    """A model representing DTO for a single keyset page of items."""
+    items: List[ItemT]
+    next_cursor: Optional[int | UUID4] = None
+
+    @classmethod
+    def from_items(
+            cls,
+            items: Sequence[ItemT],
+            limit: int,
+            cursor_field: str = "id",
+    ) -> "PageDTO[ItemT]":
+        """A method for preparing the page based on an over-fetched collection.
+
+        The repository is asked for one item more than the page size, so
+        the presence of that extra item tells whether a next page exists.
+        The items are already DTOs, so the page is constructed without
+        validating them again.
+
+        Args:
+            items (Sequence[ItemT]): Up to `limit + 1` items ordered by the
+                cursor field, which is either an integer or a player's UUID.
+            limit (int): The size of the page.
+            cursor_field (str, optional): The attribute of the items used
+                as the cursor. Defaults to "id".
+
+        Returns:
+            PageDTO[ItemT]: The final page with the cursor of the next one.
+        """
+        page = list(items[:limit])
+        next_cursor = getattr(page[-1], cursor_field) if len(items) > limit else None
+        return construct_trusted(cls, {"items": page, "next_cursor": next_cursor})
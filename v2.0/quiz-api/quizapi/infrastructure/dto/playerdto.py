@@ -1,13 +1,17 @@
 """Module containing DTO models for output players."""
 
+from typing import Optional
+
 from asyncpg import Record  # type: ignore
 from pydantic import BaseModel, ConfigDict, UUID4
 
+from quizapi.infrastructure.dto.trusted import construct_trusted
+
 class PlayerDTO(BaseModel):
     """A model representing DTO for player data."""
     id: UUID4
-    username: str
-    email: str
+    username: Optional[str]
+    email: Optional[str]
     balance: int = 0
 
 
@@ -20,16 +24,18 @@ class PlayerDTO(BaseModel):
     def from_record(cls, record: Record) -> "PlayerDTO":
         """A method for preparing DTO instance based on DB record.
 
+        The record comes from our own schema and is already typed by the
+        driver, so the instance is constructed without validation.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             PlayerDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-        return cls(
-            id=record_dict.get("quiz_id"),  # type: ignore
-            username=record_dict.get("username"), # type: ignore
-            email=record_dict.get("email"), # type: ignore
-            balance=record_dict.get("balance") or 0, # type: ignore
-        )
\ No newline at end of file
+        return construct_trusted(cls, {
+            "id": record["id"],
+            "username": record["username"],
+            "email": record["email"],
+            "balance": record["balance"] or 0,
+        })
@@ -1,19 +1,21 @@
 """Module containing DTO models for output questions."""
 
+from typing import Optional
+
 from asyncpg import Record  # type: ignore
 from pydantic import BaseModel, ConfigDict
 
 from quizapi.infrastructure.dto.quizdto import QuizDTO
+from quizapi.infrastructure.dto.trusted import construct_trusted
 
 class QuestionDTO(BaseModel):
-    """A model representing DTO for question data."""
+    """A model representing DTO for question data without the correct option."""
     id: int
-    question_text: str
-    option_one: str
-    option_two: str
-    option_three: str
-    option_four: str
-    correct_option: str
+    question_text: Optional[str]
+    option_one: Optional[str]
+    option_two: Optional[str]
+    option_three: Optional[str]
+    option_four: Optional[str]
     quiz: QuizDTO
 
     model_config = ConfigDict(
@@ -26,27 +28,29 @@ class QuestionDTO(BaseModel):
     def from_record(cls, record: Record) -> "QuestionDTO":
         """A method for preparing DTO instance based on DB record.
 
+        The record comes from our own schema and is already typed by the
+        driver, so the instance is constructed without validation.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             QuestionDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-        return cls(
-            id=record_dict.get("id"), # type ignore
-            question_text=record_dict.get("question_text"), # type: ignore
-            option_one=record_dict.get("option_one"), # type: ignore
-            option_two=record_dict.get("option_two"), # type: ignore
-            option_three=record_dict.get("option_three"), # type: ignore
-            option_four=record_dict.get("option_four"), # type: ignore
-            correct_option=record_dict.get("correct_option"), # type: ignore
-            quiz=QuizDTO(
-                id=record_dict.get("quiz_id"), # type: ignore
-                title=record_dict.get("title"), # type: ignore
-                player_id=record_dict.get("player_id"), # type: ignore
-                description=record_dict.get("description"), # type: ignore
-                shared=record_dict.get("shared"), # type: ignore
-                reward=record_dict.get("reward") # type: ignore
-            )
-        )
\ No newline at end of file
+        return construct_trusted(cls, {
+            "id": record["id"],
+            "question_text": record["question_text"],
+            "option_one": record["option_one"],
+            "option_two": record["option_two"],
+            "option_three": record["option_three"],
+            "option_four": record["option_four"],
+            "quiz": construct_trusted(QuizDTO, {
+                "id": record["quiz_id"],
+                "title": record["title"],
+                "player_id": record["player_id"],
+                "description": record["description"],
+                "shared": record["shared"],
+                "reward": record["reward"],
+                "question_count": record["question_count"],
+            }),
+        })
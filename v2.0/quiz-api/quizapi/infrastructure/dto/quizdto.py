@@ -1,16 +1,21 @@
 """Module containing DTO models for output quizzes."""
 
+from typing import Optional
+
 from asyncpg import Record  # type: ignore
 from pydantic import BaseModel, ConfigDict, UUID4
 
+from quizapi.infrastructure.dto.trusted import construct_trusted
+
 class QuizDTO(BaseModel):
     """A model representing DTO for quiz data."""
     id: int
-    title: str
+    title: Optional[str]
     player_id: UUID4
-    description: str
-    shared: bool
+    description: Optional[str]
+    shared: Optional[bool]
     reward: str
+    question_count: int
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -22,20 +27,21 @@ class QuizDTO(BaseModel):
     def from_record(cls, record: Record) -> "QuizDTO":
         """A method for preparing DTO instance based on DB record.
 
+        The record comes from our own schema and is already typed by the
+        driver, so the instance is constructed without validation.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             QuizDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-        return cls(
-            id=record_dict.get("quiz_id"),  # type: ignore
-            title=record_dict.get("quiz_title"), # type: ignore
-            description=record_dict.get("quiz_description"), # type: ignore
-            player_id=record_dict.get("player_id"), # type: ignore
-            shared=record_dict.get("quiz_shared"), # type: ignore
-            reward=record_dict.get("quiz_reward"), # type: ignore
-        )
-
-
+        return construct_trusted(cls, {
+            "id": record["quiz_id"],
+            "title": record["quiz_title"],
+            "description": record["quiz_description"],
+            "player_id": record["player_id"],
+            "shared": record["quiz_shared"],
+            "reward": record["quiz_reward"],
+            "question_count": record["quiz_question_count"],
+        })
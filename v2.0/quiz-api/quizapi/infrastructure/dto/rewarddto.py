@@ -3,6 +3,8 @@
 from asyncpg import Record  # type: ignore
 from pydantic import BaseModel, ConfigDict, UUID4
 
+from quizapi.infrastructure.dto.trusted import construct_trusted
+
 class RewardDTO(BaseModel):
     """A model representing DTO for reward data."""
     id: int
@@ -21,19 +23,19 @@ class RewardDTO(BaseModel):
     def from_record(cls, record: Record) -> "RewardDTO":
         """A method for preparing DTO instance based on DB record.
 
+        The record comes from our own schema and is already typed by the
+        driver, so the instance is constructed without validation.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             RewardDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            quiz_id=record_dict.get("quiz_id"), # type: ignore
-            player_id=record_dict.get("player_id"), # type: ignore
-            reward=record_dict.get("reward"), # type: ignore
-            value=record_dict.get("value") # type: ignore
-        )
-
-
+        return construct_trusted(cls, {
+            "id": record["id"],
+            "quiz_id": record["quiz_id"],
+            "player_id": record["player_id"],
+            "reward": record["reward"],
+            "value": record["value"],
+        })
@@ -3,6 +3,8 @@
 from asyncpg import Record  # type: ignore
 from pydantic import BaseModel, ConfigDict
 
+from quizapi.infrastructure.dto.trusted import construct_trusted
+
 class ShopDTO(BaseModel):
     """A model representing DTO for shop item data."""
     id: int
@@ -20,18 +22,18 @@ class ShopDTO(BaseModel):
     def from_record(cls, record: Record) -> "ShopDTO":
         """A method for preparing DTO instance based on DB record.
 
+        The record comes from our own schema and is already typed by the
+        driver, so the instance is constructed without validation.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             ShopDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-        return cls(
-            id=record_dict.get("id"), # type: ignore
-            name=record_dict.get("name"), # type: ignore
-            value=record_dict.get("value"), # type: ignore
-            quiz_id=record_dict.get("quiz_id") # type: ignore
-        )
-
-
+        return construct_trusted(cls, {
+            "id": record["id"],
+            "name": record["name"],
+            "value": record["value"],
+            "quiz_id": record["quiz_id"],
+        })
@@ -8,6 +8,8 @@ class TokenDTO(BaseModel):
     token_type: str
     player_token: str
     expires: datetime
+    refresh_token: str
+    refresh_expires: datetime
 
     model_config = ConfigDict(
         from_attributes=True,
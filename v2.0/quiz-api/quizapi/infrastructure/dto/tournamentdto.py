@@ -1,17 +1,19 @@
 """Module containing DTO models for output tournaments."""
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 from asyncpg import Record  # type: ignore
 from pydantic import BaseModel, ConfigDict, UUID4
 
+from quizapi.infrastructure.dto.trusted import construct_trusted
+
 class TournamentDTO(BaseModel):
     """A model representing DTO for tournament data."""
     id: int
-    name: str
-    description: str
+    name: Optional[str]
+    description: Optional[str]
     quizzes_id: List[int]
-    participants: List[UUID4]
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -23,17 +25,78 @@ class TournamentDTO(BaseModel):
     def from_record(cls, record: Record) -> "TournamentDTO":
         """A method for preparing DTO instance based on DB record.
 
+        The record comes from our own schema and is already typed by the
+        driver, so the instance is constructed without validation.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             TournamentDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-        return cls(
-            id=record_dict.get("id"), # type: ignore
-            name=record_dict.get("name"), # type: ignore
-            description=record_dict.get("description"), # type: ignore
-            participants=record_dict.get("participants"), # type: ignore
-            quizzes_id=record_dict.get("quizzes_id"), # type: ignore
-        )
\ No newline at end of file
+        return construct_trusted(cls, {
+            "id": record["id"],
+            "name": record["name"],
+            "description": record["description"],
+            "quizzes_id": record["quizzes_id"],
+        })
+
+
+class ParticipantDTO(BaseModel):
+    """A model representing DTO for tournament participant data."""
+    id: UUID4
+    username: Optional[str]
+    joined_at: datetime
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+    @classmethod
+    def from_record(cls, record: Record) -> "ParticipantDTO":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            ParticipantDTO: The final DTO instance.
+        """
+        return construct_trusted(cls, {
+            "id": record["id"],
+            "username": record["username"],
+            "joined_at": record["joined_at"],
+        })
+
+
+class StandingDTO(BaseModel):
+    """A model representing DTO for the standing of a tournament participant."""
+    rank: int
+    id: UUID4
+    username: Optional[str]
+    score: float
+    quizzes_played: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+    @classmethod
+    def from_record(cls, record: Record) -> "StandingDTO":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            StandingDTO: The final DTO instance.
+        """
+        return construct_trusted(cls, {
+            "rank": record["rank"],
+            "id": record["id"],
+            "username": record["username"],
+            "score": record["score"],
+            "quizzes_played": record["quizzes_played"],
+        })
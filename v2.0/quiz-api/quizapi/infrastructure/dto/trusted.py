@@ -0,0 +1,32 @@
+"""Module containing the trusted construction path for DTO models."""
+
+from typing import Any, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_new_instance = object.__new__
+_set_attribute = object.__setattr__
+
+
+def construct_trusted(model: Type[ModelT], values: dict[str, Any]) -> ModelT:
+    """A function building a model instance from already typed values.
+
+    Unlike `model_construct`, it does not walk the model fields to fill in
+    defaults or aliases, so every field of the model has to be provided.
+    It is meant for rows coming from our own schema only.
+
+    Args:
+        model (Type[ModelT]): The model class.
+        values (dict[str, Any]): The values of all model fields.
+
+    Returns:
+        ModelT: The model instance.
+    """
+    instance = _new_instance(model)
+    _set_attribute(instance, "__dict__", values)
+    _set_attribute(instance, "__pydantic_fields_set__", set(values))
+    _set_attribute(instance, "__pydantic_extra__", None)
+    _set_attribute(instance, "__pydantic_private__", None)
+    return instance
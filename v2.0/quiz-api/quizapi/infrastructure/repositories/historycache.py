@@ -0,0 +1,184 @@
+"""Module containing the cache invalidation of the history repository."""
+
+from typing import Any, AsyncIterator, Iterable
+
+from pydantic import UUID4
+
+from quizapi.core.domain.history import HistoryIn
+from quizapi.core.repositories.ihistory import IHistoryRepository
+from quizapi.core.repositories.itournament import ITournamentRepository
+from quizapi.infrastructure.cache.icache import ICacheBackend
+from quizapi.infrastructure.repositories.tournamentcache import standings_keys
+
+
+class CachedHistoryRepository(IHistoryRepository):
+    """A class invalidating tournament standings on writes of history.
+
+    A history record only changes the standings of the tournaments which
+    include its quiz, so only these are invalidated after every write to
+    the wrapped repository. The writes return the quiz and the player they
+    changed, and the tournaments of a quiz come from the cache of the
+    tournament repository, so no write adds a read of its own.
+    """
+
+    _repository: IHistoryRepository
+    _tournament_repository: ITournamentRepository
+    _cache: ICacheBackend
+
+    def __init__(
+            self,
+            repository: IHistoryRepository,
+            tournament_repository: ITournamentRepository,
+            cache: ICacheBackend,
+    ):
+        """The initializer of the `cached history repository`.
+
+        Args:
+            repository (IHistoryRepository): The reference to the wrapped repository.
+            tournament_repository (ITournamentRepository): The reference to the
+                repository resolving the tournaments of a quiz.
+            cache (ICacheBackend): The reference to the cache backend.
+        """
+        self._repository = repository
+        self._tournament_repository = tournament_repository
+        self._cache = cache
+
+    async def _invalidate_standings(self, *quiz_ids: int | None) -> None:
+        """Invalidating the standings affected by history records.
+
+        Args:
+            *quiz_ids (int | None): The IDs of the quizzes of the records.
+        """
+        tournament_ids: set[int] = set()
+        for quiz_id in set(quiz_ids) - {None}:
+            tournament_ids.update(
+                await self._tournament_repository.get_tournaments_by_quiz(quiz_id),
+            )
+
+        keys = [key for tournament_id in tournament_ids for key in standings_keys(tournament_id)]
+        if keys:
+            await self._cache.delete(*keys)
+
+    async def get_all_histories(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting a page of histories from the wrapped repository.
+
+        Args:
+            limit (int): The maximum number of history records to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            Iterable[Any]: A collection of history records.
+        """
+        return await self._repository.get_all_histories(limit=limit, after=after)
+
+    def iterate_histories(self, chunk_size: int) -> AsyncIterator[Any]:
+        """Iterating all histories of the wrapped repository.
+
+        Args:
+            chunk_size (int): The number of rows fetched per round trip.
+
+        Returns:
+            AsyncIterator[Any]: The consecutive history records ordered by ID.
+        """
+        return self._repository.iterate_histories(chunk_size)
+
+    async def get_history_by_id(self, history_id: int) -> Any | None:
+        """Getting a history record by ID from the wrapped repository.
+
+        Args:
+            history_id (int): The ID of the history record.
+
+        Returns:
+            Any | None: The history record if found, otherwise None.
+        """
+        return await self._repository.get_history_by_id(history_id)
+
+    async def get_history_by_player(self, player_id: UUID4) -> Iterable[Any] | None:
+        """Getting history records of a player from the wrapped repository.
+
+        Args:
+            player_id (UUID4): The UUID of the player.
+
+        Returns:
+            Iterable[Any] | None: A collection of history records for the player.
+        """
+        return await self._repository.get_history_by_player(player_id)
+
+    async def add_history(self, data: HistoryIn, total_questions: int, effectiveness: float) -> Any | None:
+        """Adding a new history record and invalidating the affected standings.
+
+        Args:
+            data (HistoryIn): The history data.
+            total_questions (int): The total number of questions.
+            effectiveness (float): The effectiveness score.
+
+        Returns:
+            Any | None: The newly created history record.
+        """
+        history = await self._repository.add_history(
+            data=data,
+            total_questions=total_questions,
+            effectiveness=effectiveness,
+        )
+        if history is not None:
+            await self._invalidate_standings(history.quiz_id)
+        return history
+
+    async def update_history(
+            self,
+            history_id: int,
+            data: HistoryIn,
+            total_questions: int,
+            effectiveness: float,
+    ) -> Any | None:
+        """Updating a history record and invalidating the affected standings.
+
+        Args:
+            history_id (int): The ID of the history record.
+            data (HistoryIn): The updated history data.
+            total_questions (int): The total number of questions.
+            effectiveness (float): The effectiveness score.
+
+        Returns:
+            Any | None: The updated history record if successful, otherwise None.
+        """
+        history = await self._repository.update_history(
+            history_id=history_id,
+            data=data,
+            total_questions=total_questions,
+            effectiveness=effectiveness,
+        )
+        if history is not None:
+            await self._invalidate_standings(history.previous_quiz_id, history.quiz_id)
+        return history
+
+    async def delete_history(self, history_id: int) -> Any | None:
+        """Removing a history record and invalidating the affected standings.
+
+        Args:
+            history_id (int): The ID of the history record.
+
+        Returns:
+            Any | None: The removed history record if successful, otherwise None.
+        """
+        history = await self._repository.delete_history(history_id)
+        if history is not None:
+            await self._invalidate_standings(history.quiz_id)
+        return history
+
+    async def get_leaderboard(self, quiz_id: int, limit: int, player_id: UUID4) -> Any:
+        """Getting the leaderboard of a quiz from the wrapped repository.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+            limit (int): The number of top attempts to get.
+            player_id (UUID4): The UUID of the player to rank.
+
+        Returns:
+            Any: The top attempts and the attempt of the player.
+        """
+        return await self._repository.get_leaderboard(
+            quiz_id=quiz_id,
+            limit=limit,
+            player_id=player_id,
+        )
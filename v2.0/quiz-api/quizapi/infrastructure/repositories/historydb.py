@@ -1,63 +1,326 @@
 """Module containing history database repository implementation."""
 
-from typing import Any, Iterable
-from asyncpg import Record # type: ignore
-from sqlalchemy import select, join
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Iterable
+import sqlalchemy
+from sqlalchemy import bindparam, select, join
+from sqlalchemy.dialects.postgresql import insert
 from pydantic import UUID4
 
-from quizapi.core.domain.question import Question
 from quizapi.core.repositories.ihistory import IHistoryRepository
-from quizapi.core.domain.history import History, HistoryIn
+from quizapi.core.domain.history import History, HistoryIn, UpdatedHistory
 from quizapi.db import (
+    database,
+    best_attempt_table,
     quiz_table,
     player_table,
     history_table,
-    question_table,
-    database,
 )
 from quizapi.infrastructure.dto.historydto import HistoryDTO
+from quizapi.infrastructure.dto.leaderboarddto import LeaderboardDTO
+from quizapi.infrastructure.repositories.statements import Statement
+
+history_with_quiz_query = (
+    select(
+        history_table.c.id.label("id"),
+        history_table.c.total_questions.label("total_questions"),
+        history_table.c.correct_answers.label("correct_answers"),
+        history_table.c.effectiveness.label("effectiveness"),
+        history_table.c.timestamp.label("timestamp"),
+        quiz_table.c.id.label("quiz_id"),
+        quiz_table.c.title.label("title"),
+        quiz_table.c.description.label("description"),
+        quiz_table.c.shared.label("shared"),
+        quiz_table.c.reward.label("reward"),
+        quiz_table.c.question_count.label("question_count"),
+        history_table.c.player_id.label("player_id"),
+        quiz_table.c.player_id.label("player_id_2"),
+    )
+    .select_from(
+        join(
+            history_table,
+            join(
+                quiz_table,
+                player_table,
+                quiz_table.c.player_id == player_table.c.id
+            ),
+            history_table.c.quiz_id == quiz_table.c.id
+        )
+    )
+)
+
+get_all_histories_statement = Statement(
+    "HistoryRepository.get_all_histories",
+    history_with_quiz_query
+    .where(history_table.c.id > bindparam("after"))
+    .order_by(history_table.c.id.asc())
+    .limit(bindparam("limit")),
+)
+
+iterate_histories_statement = Statement(
+    "HistoryRepository.iterate_histories",
+    history_with_quiz_query.order_by(history_table.c.id.asc()),
+)
+
+get_history_by_id_statement = Statement(
+    "HistoryRepository.get_history_by_id",
+    history_with_quiz_query.where(history_table.c.id == bindparam("history_id")),
+)
+
+get_history_by_player_statement = Statement(
+    "HistoryRepository.get_history_by_player",
+    history_table.select()
+    .where(history_table.c.player_id == bindparam("player_id")),
+)
+
+new_history = (
+    history_table.insert()
+    .values(
+        player_id=bindparam("player_id"),
+        quiz_id=bindparam("quiz_id"),
+        correct_answers=bindparam("correct_answers"),
+        timestamp=bindparam("timestamp"),
+        total_questions=bindparam("total_questions"),
+        effectiveness=bindparam("effectiveness"),
+    )
+    .returning(history_table)
+    .cte("new_history")
+)
+
+best_attempt_insert = insert(best_attempt_table)
+
+recorded_best_attempt = (
+    best_attempt_insert
+    .from_select(
+        ["quiz_id", "player_id", "history_id", "effectiveness", "timestamp"],
+        select(
+            new_history.c.quiz_id,
+            new_history.c.player_id,
+            new_history.c.id,
+            new_history.c.effectiveness,
+            new_history.c.timestamp,
+        )
+        .where(new_history.c.quiz_id.isnot(None)),
+    )
+    .on_conflict_do_update(
+        index_elements=[best_attempt_table.c.quiz_id, best_attempt_table.c.player_id],
+        set_={
+            "history_id": best_attempt_insert.excluded.history_id,
+            "effectiveness": best_attempt_insert.excluded.effectiveness,
+            "timestamp": best_attempt_insert.excluded.timestamp,
+        },
+        where=sqlalchemy.or_(
+            best_attempt_insert.excluded.effectiveness > best_attempt_table.c.effectiveness,
+            sqlalchemy.and_(
+                best_attempt_insert.excluded.effectiveness == best_attempt_table.c.effectiveness,
+                best_attempt_insert.excluded.timestamp < best_attempt_table.c.timestamp,
+            ),
+        ),
+    )
+    .returning(best_attempt_table.c.history_id)
+    .cte("recorded_best_attempt")
+)
+
+add_history_statement = Statement(
+    "HistoryRepository.add_history",
+    select(new_history).add_cte(recorded_best_attempt),
+)
+
+previous_history = (
+    select(history_table.c.id, history_table.c.quiz_id, history_table.c.player_id)
+    .where(history_table.c.id == bindparam("history_id"))
+    .with_for_update()
+    .cte("previous_history")
+)
+
+update_history_statement = Statement(
+    "HistoryRepository.update_history",
+    history_table.update()
+    .where(history_table.c.id == previous_history.c.id)
+    .values(
+        player_id=bindparam("player_id"),
+        quiz_id=bindparam("quiz_id"),
+        correct_answers=bindparam("correct_answers"),
+        timestamp=bindparam("timestamp"),
+        total_questions=bindparam("total_questions"),
+        effectiveness=bindparam("effectiveness"),
+    )
+    .returning(
+        history_table,
+        previous_history.c.quiz_id.label("previous_quiz_id"),
+        previous_history.c.player_id.label("previous_player_id"),
+    ),
+)
+
+delete_history_statement = Statement(
+    "HistoryRepository.delete_history",
+    history_table.delete()
+    .where(history_table.c.id == bindparam("history_id"))
+    .returning(history_table),
+)
+
+attempt_quiz_param = bindparam("quiz_id", type_=best_attempt_table.c.quiz_id.type)
+attempt_player_param = bindparam("player_id", type_=best_attempt_table.c.player_id.type)
+
+best_history = (
+    select(
+        history_table.c.quiz_id,
+        history_table.c.player_id,
+        history_table.c.id,
+        history_table.c.effectiveness,
+        history_table.c.timestamp,
+    )
+    .where(
+        (history_table.c.quiz_id == attempt_quiz_param)
+        & (history_table.c.player_id == attempt_player_param)
+        & history_table.c.effectiveness.isnot(None)
+        & history_table.c.timestamp.isnot(None)
+    )
+    .order_by(
+        history_table.c.effectiveness.desc(),
+        history_table.c.timestamp.asc(),
+        history_table.c.id.asc(),
+    )
+    .limit(1)
+    .cte("best_history")
+)
+
+dropped_best_attempt = (
+    best_attempt_table.delete()
+    .where(
+        (best_attempt_table.c.quiz_id == attempt_quiz_param)
+        & (best_attempt_table.c.player_id == attempt_player_param)
+    )
+    .where(~sqlalchemy.exists(select(best_history.c.id)))
+    .returning(best_attempt_table.c.history_id)
+    .cte("dropped_best_attempt")
+)
+
+refresh_best_attempt_statement = Statement(
+    "HistoryRepository.refresh_best_attempt",
+    best_attempt_insert
+    .from_select(
+        ["quiz_id", "player_id", "history_id", "effectiveness", "timestamp"],
+        select(best_history),
+    )
+    .on_conflict_do_update(
+        index_elements=[best_attempt_table.c.quiz_id, best_attempt_table.c.player_id],
+        set_={
+            "history_id": best_attempt_insert.excluded.history_id,
+            "effectiveness": best_attempt_insert.excluded.effectiveness,
+            "timestamp": best_attempt_insert.excluded.timestamp,
+        },
+    )
+    .add_cte(dropped_best_attempt),
+)
+
+ranked_attempt_order = (
+    best_attempt_table.c.effectiveness.desc(),
+    best_attempt_table.c.timestamp.asc(),
+    best_attempt_table.c.player_id.asc(),
+)
+
+get_leaderboard_statement = Statement(
+    "HistoryRepository.get_leaderboard",
+    select(
+        best_attempt_table.c.player_id,
+        player_table.c.username,
+        best_attempt_table.c.effectiveness,
+        best_attempt_table.c.timestamp,
+    )
+    .select_from(
+        join(
+            best_attempt_table,
+            player_table,
+            best_attempt_table.c.player_id == player_table.c.id,
+        )
+    )
+    .where(best_attempt_table.c.quiz_id == bindparam("quiz_id"))
+    .order_by(*ranked_attempt_order)
+    .limit(bindparam("limit")),
+)
+
+own_attempt = best_attempt_table.alias("own_attempt")
+better_attempt = best_attempt_table.alias("better_attempt")
+
+attempts_with_higher_score = (
+    select(sqlalchemy.func.count())
+    .select_from(better_attempt)
+    .where(
+        (better_attempt.c.quiz_id == own_attempt.c.quiz_id)
+        & (better_attempt.c.effectiveness > own_attempt.c.effectiveness)
+    )
+    .scalar_subquery()
+)
+
+earlier_attempts_with_same_score = (
+    select(sqlalchemy.func.count())
+    .select_from(better_attempt)
+    .where(
+        (better_attempt.c.quiz_id == own_attempt.c.quiz_id)
+        & (better_attempt.c.effectiveness == own_attempt.c.effectiveness)
+        & (
+            sqlalchemy.tuple_(better_attempt.c.timestamp, better_attempt.c.player_id)
+            < sqlalchemy.tuple_(own_attempt.c.timestamp, own_attempt.c.player_id)
+        )
+    )
+    .scalar_subquery()
+)
+
+get_player_rank_statement = Statement(
+    "HistoryRepository.get_player_rank",
+    select(
+        own_attempt.c.player_id,
+        player_table.c.username,
+        own_attempt.c.effectiveness,
+        own_attempt.c.timestamp,
+        (attempts_with_higher_score + earlier_attempts_with_same_score + 1).label("rank"),
+    )
+    .select_from(
+        join(
+            own_attempt,
+            player_table,
+            own_attempt.c.player_id == player_table.c.id,
+        )
+    )
+    .where(
+        (own_attempt.c.quiz_id == bindparam("quiz_id"))
+        & (own_attempt.c.player_id == bindparam("player_id"))
+    ),
+)
 
 class HistoryRepository(IHistoryRepository):
     """A class implementing the history repository."""
 
-    async def get_all_histories(self) -> Iterable[Any]:
+    async def get_all_histories(self, limit: int, after: int = 0) -> Iterable[Any]:
         """Getting all history records from the database.
 
+            Args:
+                limit (int): The maximum number of history records to get.
+                after (int, optional): The ID after which the page starts. Defaults to 0.
+
             Returns:
                 Iterable[Any]: A collection of all history records.
         """
-        query = (
-            select(
-                history_table.c.id.label("id"),
-                history_table.c.total_questions.label("total_questions"),
-                history_table.c.correct_answers.label("correct_answers"),
-                history_table.c.effectiveness.label("effectiveness"),
-                history_table.c.timestamp.label("timestamp"),
-                quiz_table.c.id.label("quiz_id"),
-                quiz_table.c.title.label("title"),
-                quiz_table.c.description.label("description"),
-                quiz_table.c.shared.label("shared"),
-                quiz_table.c.reward.label("reward"),
-                history_table.c.player_id.label("player_id"),
-                quiz_table.c.player_id.label("player_id_2"),
-            )
-            .select_from(
-                join(
-                    history_table,
-                    join(
-                        quiz_table,
-                        player_table,
-                        quiz_table.c.player_id == player_table.c.id
-                    ),
-                    history_table.c.quiz_id == quiz_table.c.id
-                )
-            )
-            .order_by(history_table.c.id.asc())
+        histories = await get_all_histories_statement.fetch_all(
+            limit=limit,
+            after=after,
         )
-
-        histories = await database.fetch_all(query)
         return [HistoryDTO.from_record(history) for history in histories]
 
+    async def iterate_histories(self, chunk_size: int) -> AsyncIterator[Any]:
+        """Iterating all history records with a server-side cursor.
+
+        Args:
+            chunk_size (int): The number of rows fetched per round trip.
+
+        Yields:
+            Any: The consecutive history records ordered by ID.
+        """
+        async with aclosing(iterate_histories_statement.iterate(chunk_size)) as histories:
+            async for history in histories:
+                yield HistoryDTO.from_record(history)
+
     async def get_history_by_id(self, history_id: int) -> Any | None:
         """Getting a specific history record by ID.
 
@@ -67,37 +330,7 @@ class HistoryRepository(IHistoryRepository):
         Returns:
             Any | None: The history record if found, otherwise None.
         """
-        query = (
-            select(
-                history_table.c.id.label("id"),
-                history_table.c.total_questions.label("total_questions"),
-                history_table.c.correct_answers.label("correct_answers"),
-                history_table.c.effectiveness.label("effectiveness"),
-                history_table.c.timestamp.label("timestamp"),
-                quiz_table.c.id.label("quiz_id"),
-                quiz_table.c.title.label("title"),
-                quiz_table.c.description.label("description"),
-                quiz_table.c.shared.label("shared"),
-                quiz_table.c.reward.label("reward"),
-                history_table.c.player_id.label("player_id"),
-                quiz_table.c.player_id.label("player_id_2"),
-            )
-            .select_from(
-                join(
-                    history_table,
-                    join(
-                        quiz_table,
-                        player_table,
-                        quiz_table.c.player_id == player_table.c.id
-                    ),
-                    history_table.c.quiz_id == quiz_table.c.id
-                )
-            )
-            .where(history_table.c.id == history_id)
-            .order_by(history_table.c.id.asc())
-        )
-
-        history = await database.fetch_one(query)
+        history = await get_history_by_id_statement.fetch_one(history_id=history_id)
         return HistoryDTO.from_record(history) if history else None
 
     async def get_history_by_player(self, player_id: UUID4) -> Iterable[Any] | None:
@@ -109,16 +342,15 @@ class HistoryRepository(IHistoryRepository):
         Returns:
             Iterable[Any] | None: A collection of history records for the player.
         """
-        query = (
-            history_table.select()
-            .where(history_table.c.player_id == player_id)
-        )
-        histories = await database.fetch_all(query)
+        histories = await get_history_by_player_statement.fetch_all(player_id=player_id)
         return [History(**dict(history)) for history in histories]
 
     async def add_history(self, data: HistoryIn, total_questions: int, effectiveness: float) -> Any | None:
         """Adding a new history record to the database.
 
+        The best attempt of the player is replaced in the same statement
+        when the new record scores higher, or equally high but earlier.
+
         Args:
             data (HistoryIn): The history data.
             total_questions (int): The total number of questions.
@@ -127,16 +359,14 @@ class HistoryRepository(IHistoryRepository):
         Returns:
             Any | None: The newly created history record.
         """
-        query = history_table.insert().values(
+        new_history = await add_history_statement.fetch_one(
             player_id=data.player_id,
             quiz_id=data.quiz_id,
             correct_answers=data.correct_answers,
             timestamp=data.timestamp,
             total_questions=total_questions,
-            effectiveness=effectiveness
+            effectiveness=effectiveness,
         )
-        new_history_id = await database.execute(query)
-        new_history = await self._get_by_id(new_history_id)
         return History(**dict(new_history)) if new_history else None
 
     async def update_history(
@@ -145,9 +375,14 @@ class HistoryRepository(IHistoryRepository):
             data: HistoryIn,
             total_questions: int,
             effectiveness: float
-    ) -> History | None:
+    ) -> UpdatedHistory | None:
         """Updating an existing history record in the database.
 
+        The update may lower the score of the current best attempt, so the
+        best attempts of the player are recomputed from their own records
+        of the previous and the new quiz within the same transaction. The
+        previous row is locked and read by the update statement itself.
+
         Args:
             history_id (int): The ID of the history record.
             data (HistoryIn): The updated history data.
@@ -155,16 +390,12 @@ class HistoryRepository(IHistoryRepository):
             effectiveness (float): The effectiveness score.
 
         Returns:
-            History | None: The updated history record if successful, otherwise None.
+            UpdatedHistory | None: The updated history record with its previous
+                quiz and player if successful, otherwise None.
         """
-        existing_history = await self._get_by_id(history_id)
-        if not existing_history:
-            return None
-
-        query = (
-            history_table.update()
-            .where(history_table.c.id == history_id)
-            .values(
+        async with database.transaction():
+            updated_history = await update_history_statement.fetch_one(
+                history_id=history_id,
                 player_id=data.player_id,
                 quiz_id=data.quiz_id,
                 correct_answers=data.correct_answers,
@@ -172,54 +403,72 @@ class HistoryRepository(IHistoryRepository):
                 total_questions=total_questions,
                 effectiveness=effectiveness,
             )
-        )
-        await database.execute(query)
-        updated_history = await self._get_by_id(history_id)
-        return History(**dict(updated_history)) if updated_history else None
+            if not updated_history:
+                return None
+
+            await self._refresh_best_attempts({
+                (updated_history["previous_quiz_id"], updated_history["previous_player_id"]),
+                (updated_history["quiz_id"], updated_history["player_id"]),
+            })
+        return UpdatedHistory(**dict(updated_history))
 
-    async def delete_history(self, history_id: int) -> bool:
+    async def delete_history(self, history_id: int) -> History | None:
         """Deleting a history record from the database.
 
         Args:
             history_id (int): The ID of the history record to be deleted.
 
         Returns:
-            bool: True if deleted successfully, otherwise False.
+            History | None: The removed history record if successful, otherwise None.
         """
-        if self._get_by_id(history_id):
-            query = history_table.delete().where(history_table.c.id == history_id)
-            await database.execute(query)
-            return True
-        return False
+        async with database.transaction():
+            deleted = await delete_history_statement.fetch_one(history_id=history_id)
+            if not deleted:
+                return None
 
-    async def _get_by_id(self, history_id: int) -> Record | None:
-        """Getting a history record by ID from the database.
+            await self._refresh_best_attempts({(deleted["quiz_id"], deleted["player_id"])})
+        return History(**dict(deleted))
 
-        Args:
-            history_id (int): The ID of the history record.
+    async def _refresh_best_attempts(self, attempts: set[tuple[int | None, UUID4]]) -> None:
+        """Recomputing the best attempts of players from their history records.
 
-        Returns:
-            Record | None: The history record if found.
+        Args:
+            attempts (set[tuple[int | None, UUID4]]): The pairs of quiz ID
+                and player UUID to recompute.
         """
-        query = (
-            history_table.select()
-            .where(history_table.c.id == history_id)
-            .order_by(history_table.c.id.asc())
-        )
-        return await database.fetch_one(query)
+        for quiz_id, player_id in attempts:
+            if quiz_id is not None:
+                await refresh_best_attempt_statement.execute(
+                    quiz_id=quiz_id,
+                    player_id=player_id,
+                )
 
-    async def get_total_questions_by_quiz(self, quiz_id: int) -> Iterable[Any] | None:
-        """Getting all questions related to a specific quiz.
+    async def get_leaderboard(
+            self,
+            quiz_id: int,
+            limit: int,
+            player_id: UUID4,
+    ) -> LeaderboardDTO:
+        """Getting the top attempts of a quiz and the rank of the player.
 
-            Args:
-                quiz_id (int): The ID of the quiz.
+        Both queries read the ranking index of the best attempts, so the
+        cost depends on the size of the page and the rank of the player
+        rather than on the number of history records.
 
-            Returns:
-                Iterable[Any] | None: A collection of questions associated with the quiz.
+        Args:
+            quiz_id (int): The ID of the quiz.
+            limit (int): The number of top attempts to get.
+            player_id (UUID4): The UUID of the player to rank.
+
+        Returns:
+            LeaderboardDTO: The top attempts and the attempt of the player.
         """
-        query = (
-            question_table.select()
-            .where(question_table.c.quiz_id == quiz_id)
+        attempts = await get_leaderboard_statement.fetch_all(
+            quiz_id=quiz_id,
+            limit=limit,
+        )
+        own_attempt = await get_player_rank_statement.fetch_one(
+            quiz_id=quiz_id,
+            player_id=player_id,
         )
-        questions = await database.fetch_all(query)
-        return [Question(**dict(question)) for question in questions]
\ No newline at end of file
+        return LeaderboardDTO.from_records(attempts, own_attempt)
@@ -0,0 +1,327 @@
+"""Module containing history memory repository implementation."""
+
+import asyncio
+from typing import Any, AsyncIterator, Iterable
+
+from pydantic import UUID4
+
+from quizapi.core.repositories.ihistory import IHistoryRepository
+from quizapi.core.domain.history import History, HistoryIn, UpdatedHistory
+from quizapi.infrastructure.dto.historydto import HistoryDTO
+from quizapi.infrastructure.dto.leaderboarddto import LeaderboardDTO
+from quizapi.infrastructure.repositories.memory.store import (
+    MemoryStore,
+    Row,
+    as_timestamptz,
+)
+
+
+def attempt_order(attempt: Row) -> tuple:
+    """Function getting the leaderboard position key of a best attempt.
+
+    Args:
+        attempt (Row): The best attempt row.
+
+    Returns:
+        tuple: The key sorting higher effectiveness first, then earlier
+            attempts, then lower player UUIDs.
+    """
+    return -attempt["effectiveness"], attempt["timestamp"], attempt["player_id"]
+
+
+class MemoryHistoryRepository(IHistoryRepository):
+    """A class implementing the history repository in memory.
+
+    The best attempt of every player at every quiz is kept up to date on
+    writes, like the database repository does.
+    """
+
+    def __init__(self, store: MemoryStore):
+        """The initializer of the `memory history repository`.
+
+        Args:
+            store (MemoryStore): The shared in-memory tables.
+        """
+        self._store = store
+
+    def _history_record(self, history: Row) -> Row | None:
+        """Method joining a history record with its quiz like the history queries.
+
+        Args:
+            history (Row): The history row.
+
+        Returns:
+            Row | None: The record accepted by `HistoryDTO.from_record`, or
+                None if the history has no quiz.
+        """
+        quiz = self._store.quizzes.get(history["quiz_id"])
+        if quiz is None:
+            return None
+        return {
+            **history,
+            "title": quiz["title"],
+            "description": quiz["description"],
+            "shared": quiz["shared"],
+            "reward": quiz["reward"],
+            "question_count": quiz["question_count"],
+            "player_id_2": quiz["player_id"],
+        }
+
+    def _history_dtos(self, histories: Iterable[Row]) -> list[HistoryDTO]:
+        """Method building the DTOs of the history records having a quiz.
+
+        Args:
+            histories (Iterable[Row]): The history rows.
+
+        Returns:
+            list[HistoryDTO]: The DTOs of the joined records.
+        """
+        return [
+            HistoryDTO.from_record(record)
+            for history in histories
+            if (record := self._history_record(history)) is not None
+        ]
+
+    async def get_all_histories(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting all history records from the memory store.
+
+            Args:
+                limit (int): The maximum number of history records to get.
+                after (int, optional): The ID after which the page starts. Defaults to 0.
+
+            Returns:
+                Iterable[Any]: A collection of all history records.
+        """
+        histories = []
+        while len(histories) < limit:
+            page = self._store.history.page(after, limit - len(histories))
+            if not page:
+                break
+            histories.extend(self._history_dtos(page))
+            after = page[-1]["id"]
+        return histories
+
+    async def iterate_histories(self, chunk_size: int) -> AsyncIterator[Any]:
+        """Iterating all history records, yielding to the event loop between chunks.
+
+        Args:
+            chunk_size (int): The number of history records read at once.
+
+        Yields:
+            Any: The consecutive history records ordered by ID.
+        """
+        for number, history in enumerate(self._store.history.scan(), start=1):
+            if (record := self._history_record(history)) is not None:
+                yield HistoryDTO.from_record(record)
+            if number % chunk_size == 0:
+                await asyncio.sleep(0)
+
+    async def get_history_by_id(self, history_id: int) -> Any | None:
+        """Getting a specific history record by ID.
+
+        Args:
+            history_id (int): The ID of the history record.
+
+        Returns:
+            Any | None: The history record if found, otherwise None.
+        """
+        history = self._store.history.get(history_id)
+        record = self._history_record(history) if history else None
+        return HistoryDTO.from_record(record) if record else None
+
+    async def get_history_by_player(self, player_id: UUID4) -> Iterable[Any] | None:
+        """Getting all history records for a given player.
+
+        Args:
+            player_id (UUID4): The ID of the player.
+
+        Returns:
+            Iterable[Any] | None: A collection of history records for the player.
+        """
+        return [History(**history) for history in self._store.history.find("player_id", player_id)]
+
+    def _history_row(self, data: HistoryIn, total_questions: int, effectiveness: float) -> Row | None:
+        """Method preparing the columns of a history record.
+
+        Args:
+            data (HistoryIn): The history data.
+            total_questions (int): The total number of questions.
+            effectiveness (float): The effectiveness score.
+
+        Returns:
+            Row | None: The columns, or None if the player or the quiz does not exist.
+        """
+        history = data.model_dump()
+        if self._store.players.get(history["player_id"]) is None:
+            return None
+        if self._store.quizzes.get(history["quiz_id"]) is None:
+            return None
+        history["timestamp"] = as_timestamptz(history["timestamp"])
+        history["total_questions"] = total_questions
+        history["effectiveness"] = effectiveness
+        return history
+
+    async def add_history(self, data: HistoryIn, total_questions: int, effectiveness: float) -> Any | None:
+        """Adding a new history record to the memory store.
+
+        The best attempt of the player is replaced when the new record
+        scores higher, or equally high but earlier.
+
+        Args:
+            data (HistoryIn): The history data.
+            total_questions (int): The total number of questions.
+            effectiveness (float): The effectiveness score.
+
+        Returns:
+            Any | None: The newly created history record.
+        """
+        history = self._history_row(data, total_questions, effectiveness)
+        if history is None:
+            return None
+        history = self._store.history.insert({**history, "id": self._store.history.next_id()})
+
+        key = (history["quiz_id"], history["player_id"])
+        best = self._store.best_attempts.get(key)
+        if best is None or history["effectiveness"] > best["effectiveness"] or (
+            history["effectiveness"] == best["effectiveness"]
+            and history["timestamp"] < best["timestamp"]
+        ):
+            self._store.best_attempts.delete(key)
+            self._store.best_attempts.insert(self._best_attempt(history))
+        return History(**history)
+
+    async def update_history(
+            self,
+            history_id: int,
+            data: HistoryIn,
+            total_questions: int,
+            effectiveness: float
+    ) -> UpdatedHistory | None:
+        """Updating an existing history record in the memory store.
+
+        The update may lower the score of the current best attempt, so the
+        best attempts of the player are recomputed from their own records
+        of the previous and the new quiz.
+
+        Args:
+            history_id (int): The ID of the history record.
+            data (HistoryIn): The updated history data.
+            total_questions (int): The total number of questions.
+            effectiveness (float): The effectiveness score.
+
+        Returns:
+            UpdatedHistory | None: The updated history record with its previous
+                quiz and player if successful, otherwise None.
+        """
+        previous = self._store.history.get(history_id)
+        values = self._history_row(data, total_questions, effectiveness)
+        if previous is None or values is None:
+            return None
+
+        attempts = {(previous["quiz_id"], previous["player_id"])}
+        history = self._store.history.update(history_id, values)
+        attempts.add((history["quiz_id"], history["player_id"]))
+        self._refresh_best_attempts(attempts)
+        return UpdatedHistory(
+            **history,
+            previous_quiz_id=previous["quiz_id"],
+            previous_player_id=previous["player_id"],
+        )
+
+    async def delete_history(self, history_id: int) -> History | None:
+        """Deleting a history record from the memory store.
+
+        Args:
+            history_id (int): The ID of the history record to be deleted.
+
+        Returns:
+            History | None: The removed history record if successful, otherwise None.
+        """
+        deleted = self._store.history.delete(history_id)
+        if deleted is None:
+            return None
+
+        self._refresh_best_attempts({(deleted["quiz_id"], deleted["player_id"])})
+        return History(**deleted)
+
+    @staticmethod
+    def _best_attempt(history: Row) -> Row:
+        """Method preparing the best attempt row of a history record.
+
+        Args:
+            history (Row): The history row.
+
+        Returns:
+            Row: The best attempt row.
+        """
+        return {
+            "quiz_id": history["quiz_id"],
+            "player_id": history["player_id"],
+            "history_id": history["id"],
+            "effectiveness": history["effectiveness"],
+            "timestamp": history["timestamp"],
+        }
+
+    def _refresh_best_attempts(self, attempts: set[tuple[int, UUID4]]) -> None:
+        """Method recomputing the best attempts of players from their history records.
+
+        Args:
+            attempts (set[tuple[int, UUID4]]): The pairs of quiz ID and
+                player UUID to recompute.
+        """
+        for key in attempts:
+            histories = [
+                history
+                for history in self._store.history.find(("quiz_id", "player_id"), key)
+                if history["effectiveness"] is not None and history["timestamp"] is not None
+            ]
+            self._store.best_attempts.delete(key)
+            if histories:
+                best = min(
+                    histories,
+                    key=lambda history: (-history["effectiveness"], history["timestamp"], history["id"]),
+                )
+                self._store.best_attempts.insert(self._best_attempt(best))
+
+    def _leaderboard_record(self, attempt: Row, rank: int | None = None) -> Row:
+        """Method joining a best attempt with its player like the leaderboard queries.
+
+        Args:
+            attempt (Row): The best attempt row.
+            rank (int | None, optional): The position of the attempt. Defaults to None.
+
+        Returns:
+            Row: The record accepted by `LeaderboardEntryDTO.from_record`.
+        """
+        return {
+            **attempt,
+            "username": self._store.players.get(attempt["player_id"])["username"],
+            "rank": rank,
+        }
+
+    async def get_leaderboard(
+            self,
+            quiz_id: int,
+            limit: int,
+            player_id: UUID4,
+    ) -> LeaderboardDTO:
+        """Getting the top attempts of a quiz and the rank of the player.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+            limit (int): The number of top attempts to get.
+            player_id (UUID4): The UUID of the player to rank.
+
+        Returns:
+            LeaderboardDTO: The top attempts and the attempt of the player.
+        """
+        attempts = sorted(self._store.best_attempts.find("quiz_id", quiz_id), key=attempt_order)
+        own_attempt = self._store.best_attempts.get((quiz_id, player_id))
+        own_record = None
+        if own_attempt is not None:
+            rank = attempts.index(own_attempt) + 1
+            own_record = self._leaderboard_record(own_attempt, rank)
+        return LeaderboardDTO.from_records(
+            [self._leaderboard_record(attempt) for attempt in attempts[:limit]],
+            own_record,
+        )
@@ -0,0 +1,167 @@
+"""Module containing player memory repository implementation."""
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic import UUID4, UUID5
+
+from quizapi.core.repositories.iplayer import IPlayerRepository
+from quizapi.core.domain.player import PlayerIn
+from quizapi.infrastructure.repositories.memory.store import MemoryStore, now
+from quizapi.infrastructure.utils.password import hash_password
+
+
+class MemoryPlayerRepository(IPlayerRepository):
+    """A class implementing the player repository in memory.
+
+    Players are returned as mappings, like the records of the database
+    repository.
+    """
+
+    def __init__(self, store: MemoryStore):
+        """The initializer of the `memory player repository`.
+
+        Args:
+            store (MemoryStore): The shared in-memory tables.
+        """
+        self._store = store
+
+    async def register_player(self, player: PlayerIn) -> Any | None:
+        """Adding a new player to the memory store.
+
+        Args:
+            player (PlayerIn): The player data.
+
+        Returns:
+            Any | None: The newly created player if successful, otherwise
+                None when the email or username is already taken.
+        """
+        player.password = await hash_password(player.password)
+
+        new_player = self._store.players.insert({
+            "id": uuid.uuid4(),
+            **player.model_dump(),
+            "balance": 0,
+        })
+        return dict(new_player) if new_player else None
+
+    async def get_player_by_uuid(self, uuid: UUID5) -> Any | None:
+        """Getting a player by UUID.
+
+        Args:
+            uuid (UUID5): The UUID of the player.
+
+        Returns:
+            Any | None: The player if found, otherwise None.
+        """
+        player = self._store.players.get(uuid)
+        return dict(player) if player else None
+
+    async def get_player_by_email(self, email: str) -> Any | None:
+        """Getting a player by email.
+
+        Args:
+            email (str): The email of the player.
+
+        Returns:
+            Any | None: The player if found, otherwise None.
+        """
+        player = self._store.players.get_unique("email", email)
+        return dict(player) if player else None
+
+    async def get_player_by_username(self, username: str) -> Any | None:
+        """Getting a player by username.
+
+        Args:
+            username (str): The username of the player.
+
+        Returns:
+            Any | None: The player if found, otherwise None.
+        """
+        player = self._store.players.get_unique("username", username)
+        return dict(player) if player else None
+
+    async def show_balance(self, player_id: UUID5) -> Any | None:
+        """Getting a player's balance.
+
+        Args:
+            player_id (UUID5): The UUID of the player.
+
+        Returns:
+            Any | None: The player's balance if found, otherwise None.
+        """
+        player = self._store.players.get(player_id)
+        return player["balance"] if player else None
+
+    async def create_session(
+            self,
+            player_id: UUID4,
+            token_hash: str,
+            expires_at: datetime,
+    ) -> None:
+        """Storing a new refresh token session of the player.
+
+        The player's expired sessions are pruned at the same time.
+
+        Args:
+            player_id (UUID4): The UUID of the player.
+            token_hash (str): The digest of the refresh token.
+            expires_at (datetime): The expiration time of the session.
+        """
+        sessions = self._store.player_sessions
+        current_time = now()
+        for session in sessions.find("player_id", player_id):
+            if session["expires_at"] <= current_time:
+                sessions.delete(session["id"])
+        sessions.insert({
+            "id": uuid.uuid4(),
+            "player_id": player_id,
+            "token_hash": token_hash,
+            "created_at": current_time,
+            "expires_at": expires_at,
+        })
+
+    async def rotate_session(
+            self,
+            token_hash: str,
+            new_token_hash: str,
+            expires_at: datetime,
+    ) -> UUID4 | None:
+        """Replacing an active session with a new one.
+
+        Args:
+            token_hash (str): The digest of the used refresh token.
+            new_token_hash (str): The digest of the new refresh token.
+            expires_at (datetime): The expiration time of the new session.
+
+        Returns:
+            UUID4 | None: The UUID of the session owner if the old session was active.
+        """
+        sessions = self._store.player_sessions
+        current_time = now()
+        session = sessions.get_unique("token_hash", token_hash)
+        if session is None or session["expires_at"] <= current_time:
+            return None
+
+        sessions.delete(session["id"])
+        sessions.insert({
+            "id": uuid.uuid4(),
+            "player_id": session["player_id"],
+            "token_hash": new_token_hash,
+            "created_at": current_time,
+            "expires_at": expires_at,
+        })
+        return session["player_id"]
+
+    async def delete_session(self, token_hash: str) -> bool:
+        """Revoking a refresh token session.
+
+        Args:
+            token_hash (str): The digest of the refresh token.
+
+        Returns:
+            bool: Success of the operation.
+        """
+        session = self._store.player_sessions.get_unique("token_hash", token_hash)
+        return session is not None and self._store.player_sessions.delete(session["id"]) is not None
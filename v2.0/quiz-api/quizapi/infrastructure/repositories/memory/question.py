@@ -0,0 +1,209 @@
+"""Module containing question memory repository implementation."""
+
+import asyncio
+from typing import Any, AsyncIterator, Iterable
+
+from quizapi.core.repositories.iquestion import IQuestionRepository
+from quizapi.core.domain.question import Question, QuestionIn, UpdatedQuestion
+from quizapi.infrastructure.dto.bundledto import QuizBundleDTO
+from quizapi.infrastructure.dto.questiondto import QuestionDTO
+from quizapi.infrastructure.repositories.memory.quiz import quiz_record
+from quizapi.infrastructure.repositories.memory.store import MemoryStore, Row
+from quizapi.infrastructure.utils.bundle import QuizBundle
+from quizapi.infrastructure.utils.grading import AnswerKey
+
+
+class MemoryQuestionRepository(IQuestionRepository):
+    """A class implementing the question repository in memory.
+
+    The question count of every quiz is kept up to date on writes, like
+    the trigger of the database does.
+    """
+
+    def __init__(self, store: MemoryStore):
+        """The initializer of the `memory question repository`.
+
+        Args:
+            store (MemoryStore): The shared in-memory tables.
+        """
+        self._store = store
+
+    def _question_record(self, question: Row) -> Row:
+        """Method joining a question with its quiz like the question queries.
+
+        Args:
+            question (Row): The question row.
+
+        Returns:
+            Row: The record accepted by `QuestionDTO.from_record`.
+        """
+        quiz = self._store.quizzes.get(question["quiz_id"])
+        return {
+            **question,
+            "title": quiz["title"],
+            "description": quiz["description"],
+            "shared": quiz["shared"],
+            "reward": quiz["reward"],
+            "question_count": quiz["question_count"],
+            "player_id": quiz["player_id"],
+        }
+
+    def _count_questions(self, quiz_id: int, delta: int) -> None:
+        """Method changing the question count of a quiz.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+            delta (int): The number of added or removed questions.
+        """
+        quiz = self._store.quizzes.get(quiz_id)
+        self._store.quizzes.update(quiz_id, {"question_count": quiz["question_count"] + delta})
+
+    async def get_all_questions(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting all questions from the memory store.
+
+        Args:
+            limit (int): The maximum number of questions to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            Iterable[Any]: A collection of all questions.
+        """
+        return [
+            QuestionDTO.from_record(self._question_record(question))
+            for question in self._store.questions.page(after, limit)
+        ]
+
+    async def iterate_questions(self, chunk_size: int) -> AsyncIterator[Any]:
+        """Iterating all questions, yielding to the event loop between chunks.
+
+        Args:
+            chunk_size (int): The number of questions read at once.
+
+        Yields:
+            Any: The consecutive questions ordered by ID.
+        """
+        for number, question in enumerate(self._store.questions.scan(), start=1):
+            yield QuestionDTO.from_record(self._question_record(question))
+            if number % chunk_size == 0:
+                await asyncio.sleep(0)
+
+    async def get_question_by_id(self, question_id: int) -> Any | None:
+        """Getting a question by ID.
+
+        Args:
+            question_id (int): The ID of the question.
+
+        Returns:
+            Any | None: The question data if found, otherwise None.
+        """
+        question = self._store.questions.get(question_id)
+        return QuestionDTO.from_record(self._question_record(question)) if question else None
+
+    async def get_questions_by_quiz(self, quiz_id: int) -> Iterable[Any] | None:
+        """Getting questions by quiz ID.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            Iterable[Any] | None: A collection of questions for the quiz.
+        """
+        return [Question(**question) for question in self._store.questions.find("quiz_id", quiz_id)]
+
+    async def get_answer_key(self, quiz_id: int) -> AnswerKey:
+        """Getting the correct options of the questions of a quiz.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            AnswerKey: The answer key, empty if the quiz has no questions.
+        """
+        return AnswerKey({
+            question["id"]: question["correct_option"]
+            for question in self._store.questions.find("quiz_id", quiz_id)
+        })
+
+    async def get_quiz_bundle(self, quiz_id: int) -> QuizBundle | None:
+        """Getting a quiz with its questions serialized.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            QuizBundle | None: The serialized quiz bundle if the quiz exists,
+                otherwise None.
+        """
+        quiz = self._store.quizzes.get(quiz_id)
+        if quiz is None:
+            return None
+
+        questions = sorted(
+            self._store.questions.find("quiz_id", quiz_id),
+            key=lambda question: question["id"],
+        )
+        records = [
+            {**quiz_record(quiz), **question, "question_id": question["id"]}
+            for question in questions
+        ] or [{**quiz_record(quiz), "question_id": None}]
+        return QuizBundle.from_model(QuizBundleDTO.from_records(records))
+
+    async def add_question(self, data: QuestionIn) -> Any | None:
+        """Adding a new question to the memory store.
+
+        Args:
+            data (QuestionIn): The question data.
+
+        Returns:
+            Any | None: The newly created question if successful, otherwise
+                None when the quiz does not exist.
+        """
+        if self._store.quizzes.get(data.quiz_id) is None:
+            return None
+        new_question = self._store.questions.insert({
+            **data.model_dump(),
+            "id": self._store.questions.next_id(),
+        })
+        self._count_questions(data.quiz_id, 1)
+        return Question(**new_question)
+
+    async def update_question(
+            self,
+            question_id: int,
+            data: QuestionIn,
+    ) -> Any | None:
+        """Updating a question in the memory store.
+
+        Args:
+            question_id (int): The ID of the question.
+            data (QuestionIn): The updated question data.
+
+        Returns:
+            Any | None: The updated question with the ID of its previous quiz
+                if successful, otherwise None.
+        """
+        question = self._store.questions.get(question_id)
+        if question is None or self._store.quizzes.get(data.quiz_id) is None:
+            return None
+
+        previous_quiz_id = question["quiz_id"]
+        question = self._store.questions.update(question_id, data.model_dump())
+        if previous_quiz_id != data.quiz_id:
+            self._count_questions(previous_quiz_id, -1)
+            self._count_questions(data.quiz_id, 1)
+        return UpdatedQuestion(**question, previous_quiz_id=previous_quiz_id)
+
+    async def delete_question(self, question_id: int) -> Any | None:
+        """Removing a question from the memory store.
+
+        Args:
+            question_id (int): The ID of the question.
+
+        Returns:
+            Any | None: The removed question if successful, otherwise None.
+        """
+        deleted = self._store.questions.delete(question_id)
+        if deleted is None:
+            return None
+        self._count_questions(deleted["quiz_id"], -1)
+        return Question(**deleted)
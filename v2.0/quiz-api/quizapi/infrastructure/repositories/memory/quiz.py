@@ -0,0 +1,158 @@
+"""Module containing quiz memory repository implementation."""
+
+from typing import Any, Iterable
+
+from quizapi.core.repositories.iquiz import IQuizRepository
+from quizapi.core.domain.quiz import Quiz, QuizIn
+from quizapi.infrastructure.dto.quizdto import QuizDTO
+from quizapi.infrastructure.repositories.memory.store import MemoryStore, Row
+
+
+def quiz_record(quiz: Row) -> Row:
+    """Function labelling the columns of a quiz like the joined quiz queries.
+
+    Args:
+        quiz (Row): The quiz row.
+
+    Returns:
+        Row: The record accepted by `QuizDTO.from_record`.
+    """
+    return {
+        "quiz_id": quiz["id"],
+        "quiz_title": quiz["title"],
+        "quiz_description": quiz["description"],
+        "quiz_shared": quiz["shared"],
+        "quiz_reward": quiz["reward"],
+        "quiz_question_count": quiz["question_count"],
+        "player_id": quiz["player_id"],
+    }
+
+
+class MemoryQuizRepository(IQuizRepository):
+    """A class implementing the quiz repository in memory."""
+
+    def __init__(self, store: MemoryStore):
+        """The initializer of the `memory quiz repository`.
+
+        Args:
+            store (MemoryStore): The shared in-memory tables.
+        """
+        self._store = store
+
+    async def get_all_quizzes(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting all quizzes from the memory store.
+
+        Args:
+            limit (int): The maximum number of quizzes to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            Iterable[Any]: A collection of all quizzes.
+        """
+        return [
+            QuizDTO.from_record(quiz_record(quiz))
+            for quiz in self._store.quizzes.page(after, limit)
+        ]
+
+    async def get_quiz_by_id(self, quiz_id: int) -> Any | None:
+        """Getting a quiz by ID.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            Any | None: The quiz data if found, otherwise None.
+        """
+        quiz = self._store.quizzes.get(quiz_id)
+        return QuizDTO.from_record(quiz_record(quiz)) if quiz else None
+
+    async def add_quiz(self, data: QuizIn) -> Any | None:
+        """Adding a new quiz to the memory store.
+
+        Args:
+            data (QuizIn): The quiz data.
+
+        Returns:
+            Any | None: The newly created quiz if successful, otherwise None
+                when the reward name is already taken or the player does not exist.
+        """
+        quiz = data.model_dump()
+        if self._store.players.get(quiz["player_id"]) is None:
+            return None
+        new_quiz = self._store.quizzes.insert({
+            **quiz,
+            "id": self._store.quizzes.next_id(),
+            "question_count": 0,
+        })
+        return Quiz(**new_quiz) if new_quiz else None
+
+    async def update_quiz(
+            self,
+            quiz_id: int,
+            data: QuizIn,
+    ) -> Any | None:
+        """Updating a quiz in the memory store.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+            data (QuizIn): The updated quiz data.
+
+        Returns:
+            Any | None: The updated quiz if successful, otherwise None when
+                the quiz does not exist or the reward name is already taken.
+        """
+        quiz = self._store.quizzes.update(quiz_id, {
+            "title": data.title,
+            "description": data.description,
+            "shared": data.shared,
+            "reward": data.reward,
+        })
+        return Quiz(**quiz) if quiz else None
+
+    async def delete_quiz(self, quiz_id: int) -> bool:
+        """Removing a quiz from the memory store.
+
+        A quiz still referenced by questions, histories, rewards or shop
+        items is kept, like the foreign keys of the database require.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            bool: Success of the operation.
+        """
+        store = self._store
+        if any(
+            table.find("quiz_id", quiz_id)
+            for table in (store.questions, store.history, store.rewards, store.shops)
+        ):
+            return False
+        for attempt in store.best_attempts.find("quiz_id", quiz_id):
+            store.best_attempts.delete((attempt["quiz_id"], attempt["player_id"]))
+        for collection in store.reward_collections.find("quiz_id", quiz_id):
+            store.reward_collections.delete((collection["player_id"], collection["quiz_id"]))
+        return store.quizzes.delete(quiz_id) is not None
+
+    async def share_quiz(self, quiz_id: int) -> Any | None:
+        """Sharing a quiz by setting its shared attribute to True.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            Any | None: The updated quiz if successful, otherwise None.
+        """
+        quiz = self._store.quizzes.update(quiz_id, {"shared": True})
+        return Quiz(**quiz) if quiz else None
+
+    async def get_quiz_by_reward(self, reward: str) -> Any | None:
+        """Getting a quiz by its reward name.
+
+        Args:
+            reward (str): The reward associated with the quiz.
+
+        Returns:
+            Any | None: The quiz data if found, otherwise None.
+        """
+        quiz = self._store.quizzes.get_unique("reward", reward)
+        return QuizDTO.from_record(quiz_record(quiz)) if quiz else None
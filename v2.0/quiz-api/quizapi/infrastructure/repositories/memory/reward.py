@@ -0,0 +1,113 @@
+"""Module containing reward memory repository implementation."""
+
+from typing import Any, Iterable
+
+from pydantic import UUID4
+
+from quizapi.core.repositories.ireward import IRewardRepository
+from quizapi.core.domain.reward import Reward, RewardBroker
+from quizapi.infrastructure.dto.rewarddto import RewardDTO
+from quizapi.infrastructure.repositories.memory.store import MemoryStore, now
+
+
+class MemoryRewardRepository(IRewardRepository):
+    """A class implementing the reward repository in memory."""
+
+    def __init__(self, store: MemoryStore):
+        """The initializer of the `memory reward repository`.
+
+        Args:
+            store (MemoryStore): The shared in-memory tables.
+        """
+        self._store = store
+
+    async def get_all_rewards(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting all rewards from the memory store.
+
+        Args:
+            limit (int): The maximum number of rewards to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            Iterable[Any]: A collection of all rewards.
+        """
+        return [RewardDTO.from_record(reward) for reward in self._store.rewards.page(after, limit)]
+
+    async def get_reward_by_id(self, reward_id: int) -> Any | None:
+        """Getting a reward by ID.
+
+        Args:
+            reward_id (int): The ID of the reward.
+
+        Returns:
+            Any | None: The reward data if found, otherwise None.
+        """
+        reward = self._store.rewards.get(reward_id)
+        return RewardDTO.from_record(reward) if reward else None
+
+    async def get_rewards_by_player(self, player_id: UUID4) -> Iterable[Any] | None:
+        """Getting rewards by player ID.
+
+        Args:
+            player_id (UUID4): The UUID of the player.
+
+        Returns:
+            Iterable[Any] | None: A collection of rewards belonging to the player.
+        """
+        return [Reward(**reward) for reward in self._store.rewards.find("player_id", player_id)]
+
+    async def collect_reward(
+            self,
+            data: RewardBroker,
+            min_effectiveness: float,
+            value_per_question: int,
+    ) -> Any | None:
+        """Collecting a reward and storing it in the memory store.
+
+        The eligibility is checked against the best attempt of the player,
+        and every collection is recorded in `reward_collections`, so a
+        reward collected before is not collected again, even after it was
+        sold.
+
+        Args:
+            data (RewardBroker): The reward data.
+            min_effectiveness (float): The effectiveness required to collect the reward.
+            value_per_question (int): The value of the reward per question of the attempt.
+
+        Returns:
+            Any | None: The collected reward if successful, otherwise None.
+        """
+        store = self._store
+        attempt = store.best_attempts.get((data.quiz_id, data.player_id))
+        if attempt is None or attempt["effectiveness"] < min_effectiveness:
+            return None
+        if store.rewards.get_unique(("player_id", "quiz_id"), (data.player_id, data.quiz_id)):
+            return None
+        if not store.reward_collections.insert({
+            "player_id": data.player_id,
+            "quiz_id": data.quiz_id,
+            "collected_at": now(),
+        }):
+            return None
+
+        quiz = store.quizzes.get(data.quiz_id)
+        history = store.history.get(attempt["history_id"])
+        new_reward = store.rewards.insert({
+            "id": store.rewards.next_id(),
+            "player_id": data.player_id,
+            "quiz_id": quiz["id"],
+            "reward": quiz["reward"],
+            "value": history["total_questions"] * value_per_question,
+        })
+        return Reward(**new_reward) if new_reward else None
+
+    async def delete_reward(self, reward_id: int) -> bool:
+        """Removing a reward from the memory store.
+
+        Args:
+            reward_id (int): The ID of the reward.
+
+        Returns:
+            bool: Success of the operation.
+        """
+        return self._store.rewards.delete(reward_id) is not None
@@ -0,0 +1,101 @@
+"""Module containing shop memory repository implementation."""
+
+from typing import Any, Iterable
+
+from pydantic import UUID4
+
+from quizapi.core.domain.reward import Reward
+from quizapi.core.repositories.ishop import IShopRepository
+from quizapi.core.domain.shop import Shop
+from quizapi.infrastructure.dto.shopdto import ShopDTO
+from quizapi.infrastructure.repositories.memory.store import MemoryStore
+
+
+class MemoryShopRepository(IShopRepository):
+    """A class implementing the shop repository in memory.
+
+    Every trade changes the rewards, the balances and the listings
+    without yielding to the event loop, so it is applied either fully or
+    not at all.
+    """
+
+    def __init__(self, store: MemoryStore):
+        """The initializer of the `memory shop repository`.
+
+        Args:
+            store (MemoryStore): The shared in-memory tables.
+        """
+        self._store = store
+
+    async def get_all_items(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting all shop items from the memory store.
+
+        Args:
+            limit (int): The maximum number of shop items to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            Iterable[Any]: A collection of all shop items.
+        """
+        return [ShopDTO.from_record(shop) for shop in self._store.shops.page(after, limit)]
+
+    async def sell_item(self, reward_id: int, player_id: UUID4) -> Any | None:
+        """Selling a reward item and adding it to the shop.
+
+        Args:
+            reward_id (int): The ID of the reward.
+            player_id (UUID4): The UUID of the player.
+
+        Returns:
+            Any | None: The newly created shop item if successful, otherwise None.
+        """
+        store = self._store
+        reward = store.rewards.get(reward_id)
+        seller = store.players.get(player_id)
+        if reward is None or seller is None or reward["player_id"] != player_id:
+            return None
+
+        store.rewards.delete(reward_id)
+        store.players.update(player_id, {"balance": seller["balance"] + reward["value"]})
+        new_shop = store.shops.insert({
+            "id": store.shops.next_id(),
+            "name": reward["reward"],
+            "value": reward["value"],
+            "quiz_id": reward["quiz_id"],
+        })
+        return Shop(**new_shop)
+
+    async def buy_item(self, shop_item_id: int, player_id: UUID4) -> Any | None:
+        """Buying an item from the shop and adding it to the player's rewards.
+
+        A buyer without enough funds or already holding the reward of the
+        quiz is not charged.
+
+        Args:
+            shop_item_id (int): The ID of the shop item.
+            player_id (UUID4): The UUID of the player.
+
+        Returns:
+            Any | None: The newly acquired reward if successful, otherwise None.
+        """
+        store = self._store
+        item = store.shops.get(shop_item_id)
+        buyer = store.players.get(player_id)
+        if (
+            item is None
+            or buyer is None
+            or buyer["balance"] < item["value"]
+            or store.rewards.get_unique(("player_id", "quiz_id"), (player_id, item["quiz_id"]))
+        ):
+            return None
+
+        store.players.update(player_id, {"balance": buyer["balance"] - item["value"]})
+        store.shops.delete(shop_item_id)
+        new_reward = store.rewards.insert({
+            "id": store.rewards.next_id(),
+            "player_id": player_id,
+            "quiz_id": item["quiz_id"],
+            "reward": item["name"],
+            "value": item["value"],
+        })
+        return Reward(**new_reward)
@@ -0,0 +1,284 @@
+"""Module containing the in-process storage of the memory repositories."""
+
+from bisect import bisect_right, insort
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Hashable, Iterator
+
+Row = dict[str, Any]
+Columns = str | tuple[str, ...]
+
+
+def now() -> datetime:
+    """Function getting the current time like the database `now()`.
+
+    Returns:
+        datetime: The current time in UTC.
+    """
+    return datetime.now(timezone.utc)
+
+
+def as_timestamptz(value: datetime) -> datetime:
+    """Function storing a time like a `timestamp with time zone` column.
+
+    Naive times are taken as UTC, the time zone of the database session.
+
+    Args:
+        value (datetime): The stored time.
+
+    Returns:
+        datetime: The time with a time zone.
+    """
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class Table:
+    """A class storing rows by primary key with hash indexes on other columns.
+
+    An index is declared with a column name or a tuple of names, and is
+    looked up with a value or a tuple of values respectively. Unique
+    indexes map a value to a single key, the other ones keep the keys of
+    all matching rows in insertion order.
+    """
+
+    def __init__(
+            self,
+            key: Columns = "id",
+            indexes: tuple[Columns, ...] = (),
+            unique: tuple[Columns, ...] = (),
+    ):
+        """The initializer of the `table`.
+
+        Args:
+            key (Columns, optional): The primary key columns. Defaults to "id".
+            indexes (tuple[Columns, ...], optional): The indexed columns.
+                Defaults to no indexes.
+            unique (tuple[Columns, ...], optional): The uniquely indexed columns.
+                Defaults to no indexes.
+        """
+        self._key = key
+        self._rows: dict[Hashable, Row] = {}
+        self._ordered_keys: list[Hashable] = []
+        self._indexes: dict[Columns, dict[Hashable, dict[Hashable, None]]] = {
+            columns: {} for columns in indexes
+        }
+        self._unique: dict[Columns, dict[Hashable, Hashable]] = {
+            columns: {} for columns in unique
+        }
+        self._last_id = 0
+
+    @staticmethod
+    def _value(row: Row, columns: Columns) -> Hashable:
+        """Method reading the indexed value of a row.
+
+        Args:
+            row (Row): The row.
+            columns (Columns): The indexed columns.
+
+        Returns:
+            Hashable: The value of the column or the tuple of values.
+        """
+        if isinstance(columns, str):
+            return row[columns]
+        return tuple(row[column] for column in columns)
+
+    def next_id(self) -> int:
+        """Method drawing the next value of the ID sequence.
+
+        Returns:
+            int: The new ID.
+        """
+        self._last_id += 1
+        return self._last_id
+
+    def get(self, key: Hashable) -> Row | None:
+        """Method getting a row by primary key.
+
+        Args:
+            key (Hashable): The primary key.
+
+        Returns:
+            Row | None: The stored row if exists.
+        """
+        return self._rows.get(key)
+
+    def get_unique(self, columns: Columns, value: Hashable) -> Row | None:
+        """Method getting a row by a uniquely indexed value.
+
+        Args:
+            columns (Columns): The indexed columns.
+            value (Hashable): The value of the columns.
+
+        Returns:
+            Row | None: The stored row if exists.
+        """
+        key = self._unique[columns].get(value)
+        return None if key is None else self._rows[key]
+
+    def find(self, columns: Columns, value: Hashable) -> list[Row]:
+        """Method getting the rows matching an indexed value.
+
+        Args:
+            columns (Columns): The indexed columns.
+            value (Hashable): The value of the columns.
+
+        Returns:
+            list[Row]: The stored rows in insertion order.
+        """
+        keys = self._indexes[columns].get(value, {})
+        return [self._rows[key] for key in keys]
+
+    def page(self, after: Hashable, limit: int) -> list[Row]:
+        """Method getting the rows with a primary key greater than a cursor.
+
+        Args:
+            after (Hashable): The key after which the page starts.
+            limit (int): The maximum number of rows.
+
+        Returns:
+            list[Row]: The stored rows ordered by primary key.
+        """
+        start = bisect_right(self._ordered_keys, after)
+        return [
+            self._rows[key]
+            for key in islice(self._ordered_keys, start, start + limit)
+        ]
+
+    def scan(self) -> Iterator[Row]:
+        """Method iterating a snapshot of all rows ordered by primary key.
+
+        Yields:
+            Row: The consecutive stored rows.
+        """
+        for key in list(self._ordered_keys):
+            if (row := self._rows.get(key)) is not None:
+                yield row
+
+    def _conflicts(self, row: Row, key: Hashable) -> bool:
+        """Method checking whether a row violates a unique index.
+
+        Args:
+            row (Row): The new state of the row.
+            key (Hashable): The primary key of the row.
+
+        Returns:
+            bool: Whether another row holds any of the unique values.
+        """
+        return any(
+            index.get(self._value(row, columns), key) != key
+            for columns, index in self._unique.items()
+        )
+
+    def _link(self, row: Row, key: Hashable) -> None:
+        """Method adding a row to the indexes.
+
+        Args:
+            row (Row): The row.
+            key (Hashable): The primary key of the row.
+        """
+        for columns, index in self._indexes.items():
+            index.setdefault(self._value(row, columns), {})[key] = None
+        for columns, unique in self._unique.items():
+            unique[self._value(row, columns)] = key
+
+    def _unlink(self, row: Row, key: Hashable) -> None:
+        """Method removing a row from the indexes.
+
+        Args:
+            row (Row): The row.
+            key (Hashable): The primary key of the row.
+        """
+        for columns, index in self._indexes.items():
+            value = self._value(row, columns)
+            keys = index[value]
+            del keys[key]
+            if not keys:
+                del index[value]
+        for columns, unique in self._unique.items():
+            del unique[self._value(row, columns)]
+
+    def insert(self, row: Row) -> Row | None:
+        """Method storing a new row, like `INSERT ... ON CONFLICT DO NOTHING`.
+
+        Args:
+            row (Row): The new row.
+
+        Returns:
+            Row | None: The stored row, or None if the key or a unique value is taken.
+        """
+        key = self._value(row, self._key)
+        if key in self._rows or self._conflicts(row, key):
+            return None
+        self._rows[key] = row
+        if not self._ordered_keys or key > self._ordered_keys[-1]:
+            self._ordered_keys.append(key)
+        else:
+            insort(self._ordered_keys, key)
+        self._link(row, key)
+        return row
+
+    def update(self, key: Hashable, values: Row) -> Row | None:
+        """Method changing the columns of a stored row.
+
+        Args:
+            key (Hashable): The primary key of the row.
+            values (Row): The new values of the columns, without the key.
+
+        Returns:
+            Row | None: The updated row, or None if it does not exist or
+                a unique value is taken.
+        """
+        row = self._rows.get(key)
+        if row is None or self._conflicts({**row, **values}, key):
+            return None
+        self._unlink(row, key)
+        row.update(values)
+        self._link(row, key)
+        return row
+
+    def delete(self, key: Hashable) -> Row | None:
+        """Method removing a row.
+
+        Args:
+            key (Hashable): The primary key of the row.
+
+        Returns:
+            Row | None: The removed row if existed.
+        """
+        row = self._rows.pop(key, None)
+        if row is None:
+            return None
+        del self._ordered_keys[bisect_right(self._ordered_keys, key) - 1]
+        self._unlink(row, key)
+        return row
+
+
+class MemoryStore:
+    """A class holding the tables of the memory repositories.
+
+    The tables mirror the database schema, with hash indexes on the
+    foreign keys and on the columns looked up by the repositories. All
+    operations are synchronous and never yield to the event loop, so a
+    repository method changing several tables is applied atomically
+    without locking.
+    """
+
+    def __init__(self):
+        """The initializer of the `memory store`."""
+        self.players = Table(unique=("username", "email"))
+        self.player_sessions = Table(indexes=("player_id",), unique=("token_hash",))
+        self.quizzes = Table(indexes=("player_id",), unique=("reward",))
+        self.questions = Table(indexes=("quiz_id",))
+        self.history = Table(indexes=("player_id", "quiz_id", ("quiz_id", "player_id")))
+        self.best_attempts = Table(key=("quiz_id", "player_id"), indexes=("quiz_id",))
+        self.tournaments = Table()
+        self.tournament_participants = Table(
+            key=("tournament_id", "player_id"),
+            indexes=("tournament_id", "player_id"),
+        )
+        self.rewards = Table(
+            indexes=("player_id", "quiz_id"),
+            unique=(("player_id", "quiz_id"),),
+        )
+        self.reward_collections = Table(key=("player_id", "quiz_id"), indexes=("quiz_id",))
+        self.shops = Table(indexes=("quiz_id",))
@@ -0,0 +1,303 @@
+"""Module containing tournament memory repository implementation."""
+
+from typing import Any, Iterable, Sequence
+from uuid import UUID
+
+from pydantic import UUID4
+
+from quizapi.core.repositories.itournament import (
+    ITournamentRepository,
+    QuizzesNotFoundError,
+)
+from quizapi.core.domain.tournament import (
+    Tournament,
+    TournamentIn,
+    TournamentParticipant,
+    StandingsScoring,
+    UpdatedTournament,
+)
+from quizapi.infrastructure.dto.tournamentdto import ParticipantDTO, StandingDTO, TournamentDTO
+from quizapi.infrastructure.repositories.memory.store import MemoryStore, Row, now
+
+
+class MemoryTournamentRepository(ITournamentRepository):
+    """A class implementing the tournament repository in memory."""
+
+    def __init__(self, store: MemoryStore):
+        """The initializer of the `memory tournament repository`.
+
+        Args:
+            store (MemoryStore): The shared in-memory tables.
+        """
+        self._store = store
+
+    def _check_quizzes(self, quizzes_id: list[int]) -> None:
+        """Method checking that the quizzes of a tournament exist.
+
+        Args:
+            quizzes_id (list[int]): The IDs of the quizzes.
+
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+        """
+        missing = [
+            quiz_id for quiz_id in dict.fromkeys(quizzes_id)
+            if self._store.quizzes.get(quiz_id) is None
+        ]
+        if missing:
+            raise QuizzesNotFoundError(missing)
+
+    @staticmethod
+    def _tournament_row(data: TournamentIn) -> Row:
+        """Method preparing the columns of a tournament.
+
+        Args:
+            data (TournamentIn): The tournament data.
+
+        Returns:
+            Row: The columns, with a copy of the quiz IDs.
+        """
+        return {
+            "name": data.name,
+            "description": data.description,
+            "quizzes_id": list(data.quizzes_id),
+        }
+
+    async def get_all_tournaments(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting all tournaments from the memory store.
+
+        Args:
+            limit (int): The maximum number of tournaments to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            Iterable[Any]: A collection of all tournaments.
+        """
+        return [
+            TournamentDTO.from_record(tournament)
+            for tournament in self._store.tournaments.page(after, limit)
+        ]
+
+    async def get_tournament_by_id(self, tournament_id: int) -> Any | None:
+        """Getting a tournament by ID.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+
+        Returns:
+            Any | None: The tournament data if found, otherwise None.
+        """
+        tournament = self._store.tournaments.get(tournament_id)
+        return TournamentDTO.from_record(tournament) if tournament else None
+
+    async def add_tournament(self, data: TournamentIn) -> Tournament | None:
+        """Adding a new tournament to the memory store.
+
+        Args:
+            data (TournamentIn): The tournament data.
+
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
+        Returns:
+            Tournament | None: The newly created tournament if successful, otherwise None.
+        """
+        self._check_quizzes(data.quizzes_id)
+        new_tournament = self._store.tournaments.insert({
+            **self._tournament_row(data),
+            "id": self._store.tournaments.next_id(),
+        })
+        return Tournament(**new_tournament)
+
+    async def update_tournament(
+            self,
+            tournament_id: int,
+            data: TournamentIn,
+    ) -> UpdatedTournament | None:
+        """Updating an existing tournament in the memory store.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            data (TournamentIn): The new tournament data.
+
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
+        Returns:
+            UpdatedTournament | None: The updated tournament with its previous
+                quizzes if successful, otherwise None.
+        """
+        self._check_quizzes(data.quizzes_id)
+        previous = self._store.tournaments.get(tournament_id)
+        if previous is None:
+            return None
+
+        tournament = self._store.tournaments.update(tournament_id, self._tournament_row(data))
+        return UpdatedTournament(**tournament, previous_quizzes_id=previous["quizzes_id"])
+
+    async def delete_tournament(self, tournament_id: int) -> Tournament | None:
+        """Removing a tournament and its participations from the memory store.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+
+        Returns:
+            Tournament | None: The removed tournament if successful, otherwise None.
+        """
+        participants = self._store.tournament_participants
+        for participant in participants.find("tournament_id", tournament_id):
+            participants.delete((tournament_id, participant["player_id"]))
+        deleted = self._store.tournaments.delete(tournament_id)
+        return Tournament(**deleted) if deleted else None
+
+    async def join_tournament(
+            self,
+            tournament_id: int,
+            player_uuid: UUID4,
+    ) -> TournamentParticipant | None:
+        """Adding a player to a tournament.
+
+        A repeated join returns nothing instead of overwriting the
+        participation.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            player_uuid (UUID4): The UUID of the player.
+
+        Returns:
+            TournamentParticipant | None: The new participation if successful, otherwise None.
+        """
+        if (
+            self._store.tournaments.get(tournament_id) is None
+            or self._store.players.get(player_uuid) is None
+        ):
+            return None
+        participant = self._store.tournament_participants.insert({
+            "tournament_id": tournament_id,
+            "player_id": player_uuid,
+            "joined_at": now(),
+        })
+        return TournamentParticipant(**participant) if participant else None
+
+    async def leave_tournament(
+            self,
+            tournament_id: int,
+            player_uuid: UUID4,
+    ) -> TournamentParticipant | None:
+        """Removing a player from a tournament.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            player_uuid (UUID4): The UUID of the player.
+
+        Returns:
+            TournamentParticipant | None: The removed participation if successful, otherwise None.
+        """
+        participant = self._store.tournament_participants.delete((tournament_id, player_uuid))
+        return TournamentParticipant(**participant) if participant else None
+
+    async def get_participants(
+            self,
+            tournament_id: int,
+            limit: int,
+            after: UUID | None = None,
+    ) -> Iterable[Any]:
+        """Getting participants of a tournament ordered by player ID.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            limit (int): The maximum number of participants to get.
+            after (UUID | None, optional): The player ID after which the page starts.
+                Defaults to None.
+
+        Returns:
+            Iterable[Any]: A collection of the tournament participants.
+        """
+        participants = sorted(
+            (
+                participant
+                for participant in self._store.tournament_participants.find(
+                    "tournament_id", tournament_id,
+                )
+                if after is None or participant["player_id"] > after
+            ),
+            key=lambda participant: participant["player_id"],
+        )
+        return [
+            ParticipantDTO.from_record({
+                "id": participant["player_id"],
+                "username": self._store.players.get(participant["player_id"])["username"],
+                "joined_at": participant["joined_at"],
+            })
+            for participant in participants[:limit]
+        ]
+
+    async def get_standings(
+            self,
+            tournament_id: int,
+            scoring: StandingsScoring,
+    ) -> Sequence[Any]:
+        """Getting the ranked participants of a tournament.
+
+        The best attempts of every participant are looked up by the
+        primary key, one per distinct quiz of the tournament.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            scoring (StandingsScoring): The scoring of the best attempts.
+
+        Returns:
+            Sequence[Any]: A collection of the standings ordered by rank.
+        """
+        store = self._store
+        tournament = store.tournaments.get(tournament_id)
+        if tournament is None:
+            return []
+
+        quiz_ids = dict.fromkeys(tournament["quizzes_id"])
+        standings = []
+        for participant in store.tournament_participants.find("tournament_id", tournament_id):
+            player_id = participant["player_id"]
+            attempts = [
+                attempt
+                for quiz_id in quiz_ids
+                if (attempt := store.best_attempts.get((quiz_id, player_id))) is not None
+            ]
+            if scoring is StandingsScoring.EFFECTIVENESS:
+                scores = [attempt["effectiveness"] for attempt in attempts]
+            else:
+                scores = [
+                    store.history.get(attempt["history_id"])["correct_answers"]
+                    for attempt in attempts
+                ]
+            standings.append({
+                "id": player_id,
+                "username": store.players.get(player_id)["username"],
+                "score": float(sum(score for score in scores if score is not None)),
+                "quizzes_played": len(attempts),
+            })
+
+        standings.sort(key=lambda standing: (
+            -standing["score"],
+            -standing["quizzes_played"],
+            standing["id"],
+        ))
+        return [
+            StandingDTO.from_record({**standing, "rank": rank})
+            for rank, standing in enumerate(standings, start=1)
+        ]
+
+    async def get_tournaments_by_quiz(self, quiz_id: int) -> Iterable[int]:
+        """Getting the tournaments which include a quiz.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            Iterable[int]: A collection of the tournament IDs.
+        """
+        return [
+            tournament["id"]
+            for tournament in self._store.tournaments.scan()
+            if quiz_id in tournament["quizzes_id"]
+        ]
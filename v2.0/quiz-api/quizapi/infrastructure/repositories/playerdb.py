@@ -1,43 +1,133 @@
 """Module containing player database repository implementation."""
 
+from datetime import datetime
 from typing import Any
 from asyncpg import Record # type: ignore
 
-from pydantic import UUID5
+from pydantic import UUID4, UUID5
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert
 from quizapi.core.repositories.iplayer import IPlayerRepository
 from quizapi.core.domain.player import Player, PlayerIn
-from quizapi.db import player_table, database
+from quizapi.db import player_table, player_session_table
+from quizapi.infrastructure.repositories.statements import Statement
 from quizapi.infrastructure.utils.password import hash_password
 
+register_player_statement = Statement(
+    "PlayerRepository.register_player",
+    insert(player_table)
+    .values(
+        username=bindparam("username"),
+        email=bindparam("email"),
+        password=bindparam("password"),
+        balance=0,
+    )
+    .on_conflict_do_nothing()
+    .returning(player_table),
+)
+
+get_player_by_uuid_statement = Statement(
+    "PlayerRepository.get_player_by_uuid",
+    player_table.select()
+    .where(player_table.c.id == bindparam("uuid")),
+)
+
+get_player_by_email_statement = Statement(
+    "PlayerRepository.get_player_by_email",
+    player_table.select()
+    .where(player_table.c.email == bindparam("email")),
+)
+
+get_player_by_username_statement = Statement(
+    "PlayerRepository.get_player_by_username",
+    player_table.select()
+    .where(player_table.c.username == bindparam("username")),
+)
+
+show_balance_statement = Statement(
+    "PlayerRepository.show_balance",
+    select(player_table.c.balance)
+    .where(player_table.c.id == bindparam("player_id")),
+)
+
+expires_at_param = bindparam(
+    "expires_at",
+    type_=player_session_table.c.expires_at.type,
+)
+
+expired_sessions = (
+    player_session_table.delete()
+    .where(
+        (player_session_table.c.player_id == bindparam("player_id"))
+        & (player_session_table.c.expires_at <= func.now())
+    )
+    .cte("expired_sessions")
+)
+
+create_session_statement = Statement(
+    "PlayerRepository.create_session",
+    player_session_table.insert()
+    .values(
+        player_id=bindparam("player_id"),
+        token_hash=bindparam("token_hash"),
+        expires_at=expires_at_param,
+    )
+    .add_cte(expired_sessions)
+    .returning(player_session_table.c.id),
+)
+
+used_session = (
+    player_session_table.delete()
+    .where(
+        (player_session_table.c.token_hash == bindparam("token_hash"))
+        & (player_session_table.c.expires_at > func.now())
+    )
+    .returning(player_session_table.c.player_id)
+    .cte("used_session")
+)
+
+rotate_session_statement = Statement(
+    "PlayerRepository.rotate_session",
+    player_session_table.insert()
+    .from_select(
+        ["player_id", "token_hash", "expires_at"],
+        select(
+            used_session.c.player_id,
+            bindparam("new_token_hash", type_=player_session_table.c.token_hash.type),
+            expires_at_param,
+        ),
+    )
+    .add_cte(used_session)
+    .returning(player_session_table.c.player_id),
+)
+
+delete_session_statement = Statement(
+    "PlayerRepository.delete_session",
+    player_session_table.delete()
+    .where(player_session_table.c.token_hash == bindparam("token_hash"))
+    .returning(player_session_table.c.id),
+)
+
 class PlayerRepository(IPlayerRepository):
     """A class implementing the player repository."""
 
     async def register_player(self, player: PlayerIn) -> Any | None:
         """Adding a new player to the database.
 
+        Taken credentials are detected by the unique constraints of the
+        insert, so a registration costs a single round trip.
+
         Args:
             player (PlayerIn): The player data.
 
         Returns:
-            Any | None: The newly created player record if successful, otherwise None.
+            Any | None: The newly created player record if successful, otherwise
+                None when the email or username is already taken.
         """
-        if await self.get_player_by_email(player.email):
-            return None
-
-        if await self.get_player_by_username(player.username):
-            return None
-
-        player.password = hash_password(player.password)
-
-        query = player_table.insert().values(
-            **player.model_dump(),
-            balance = 0,
-        )
-        new_player_uuid = await database.execute(query)
+        player.password = await hash_password(player.password)
 
-        return  await self.get_player_by_uuid(new_player_uuid)
+        return await register_player_statement.fetch_one(**player.model_dump())
 
     async def get_player_by_uuid(self, uuid: UUID5) -> Any | None:
         """Getting a player by UUID.
@@ -48,11 +138,7 @@ class PlayerRepository(IPlayerRepository):
         Returns:
             Any | None: The player record if found, otherwise None.
         """
-        query = (player_table
-                 .select()
-                 .where(player_table.c.id == uuid)
-                 )
-        player = await database.fetch_one(query)
+        player = await get_player_by_uuid_statement.fetch_one(uuid=uuid)
         return player
 
     async def get_player_by_email(self, email: str) -> Any | None:
@@ -64,11 +150,7 @@ class PlayerRepository(IPlayerRepository):
         Returns:
             Any | None: The player record if found, otherwise None.
         """
-        query = (player_table
-                 .select()
-                 .where(player_table.c.email == email)
-                 )
-        player = await database.fetch_one(query)
+        player = await get_player_by_email_statement.fetch_one(email=email)
         return player
 
     async def get_player_by_username(self, username: str) -> Any | None:
@@ -80,11 +162,7 @@ class PlayerRepository(IPlayerRepository):
         Returns:
             Any | None: The player record if found, otherwise None.
         """
-        query = (player_table
-                 .select()
-                 .where(player_table.c.username == username)
-                 )
-        player = await database.fetch_one(query)
+        player = await get_player_by_username_statement.fetch_one(username=username)
         return player
 
     async def show_balance(self, player_id: UUID5) -> Any | None:
@@ -96,14 +174,66 @@ class PlayerRepository(IPlayerRepository):
         Returns:
             Any | None: The player's balance if found, otherwise None.
         """
-        query = (
-            select(
-                player_table.c.balance,
-            ).where(
-                player_table.c.id == player_id
-            )
-        )
-        balance = await database.fetch_one(query)
+        balance = await show_balance_statement.fetch_one(player_id=player_id)
         if not balance:
             return None
-        return balance["balance"]
\ No newline at end of file
+        return balance["balance"]
+
+    async def create_session(
+            self,
+            player_id: UUID4,
+            token_hash: str,
+            expires_at: datetime,
+    ) -> None:
+        """Storing a new refresh token session of the player.
+
+        The player's expired sessions are pruned in the same statement.
+
+        Args:
+            player_id (UUID4): The UUID of the player.
+            token_hash (str): The digest of the refresh token.
+            expires_at (datetime): The expiration time of the session.
+        """
+        await create_session_statement.execute(
+            player_id=player_id,
+            token_hash=token_hash,
+            expires_at=expires_at,
+        )
+
+    async def rotate_session(
+            self,
+            token_hash: str,
+            new_token_hash: str,
+            expires_at: datetime,
+    ) -> UUID4 | None:
+        """Replacing an active session with a new one.
+
+        The old session is deleted and the new one inserted in a single
+        statement, so a refresh token can be used only once even by
+        concurrent requests.
+
+        Args:
+            token_hash (str): The digest of the used refresh token.
+            new_token_hash (str): The digest of the new refresh token.
+            expires_at (datetime): The expiration time of the new session.
+
+        Returns:
+            UUID4 | None: The UUID of the session owner if the old session was active.
+        """
+        return await rotate_session_statement.fetch_val(
+            token_hash=token_hash,
+            new_token_hash=new_token_hash,
+            expires_at=expires_at,
+        )
+
+    async def delete_session(self, token_hash: str) -> bool:
+        """Revoking a refresh token session.
+
+        Args:
+            token_hash (str): The digest of the refresh token.
+
+        Returns:
+            bool: Success of the operation.
+        """
+        deleted_id = await delete_session_statement.fetch_val(token_hash=token_hash)
+        return deleted_id is not None
@@ -0,0 +1,203 @@
+"""Module containing the read-through cache of the question repository."""
+
+from typing import Any, AsyncIterator, Iterable
+
+from quizapi.core.domain.question import QuestionIn
+from quizapi.core.repositories.iquestion import IQuestionRepository
+from quizapi.infrastructure.cache.icache import ICacheBackend
+from quizapi.infrastructure.cache.keys import (
+    answer_key_key,
+    bundle_key,
+    questions_key,
+    quiz_key,
+)
+from quizapi.infrastructure.utils.bundle import QuizBundle
+from quizapi.infrastructure.utils.grading import AnswerKey
+
+
+def quiz_entry_keys(quiz_id: int) -> tuple[str, ...]:
+    """A function listing the cached entries depending on the questions of a quiz.
+
+    Args:
+        quiz_id (int): The ID of the quiz.
+
+    Returns:
+        tuple[str, ...]: The cache keys.
+    """
+    return (
+        quiz_key(quiz_id),
+        questions_key(quiz_id),
+        answer_key_key(quiz_id),
+        bundle_key(quiz_id),
+    )
+
+
+class CachedQuestionRepository(IQuestionRepository):
+    """A class caching question lists of quizzes in front of another repository.
+
+    Every write goes to the wrapped repository first and invalidates the
+    question lists, answer keys, bundles and question counts of the quizzes it
+    touched afterwards. Reads skip storing the values loaded while their
+    keys were invalidated, and empty results, which is all a missing quiz
+    has.
+    """
+
+    _repository: IQuestionRepository
+    _cache: ICacheBackend
+
+    def __init__(self, repository: IQuestionRepository, cache: ICacheBackend):
+        """The initializer of the `cached question repository`.
+
+        Args:
+            repository (IQuestionRepository): The reference to the wrapped repository.
+            cache (ICacheBackend): The reference to the cache backend.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def get_all_questions(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting a page of questions from the wrapped repository.
+
+        Args:
+            limit (int): The maximum number of questions to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            Iterable[Any]: A collection of questions.
+        """
+        return await self._repository.get_all_questions(limit=limit, after=after)
+
+    def iterate_questions(self, chunk_size: int) -> AsyncIterator[Any]:
+        """Iterating all questions of the wrapped repository.
+
+        Args:
+            chunk_size (int): The number of rows fetched per round trip.
+
+        Returns:
+            AsyncIterator[Any]: The consecutive questions ordered by ID.
+        """
+        return self._repository.iterate_questions(chunk_size)
+
+    async def get_question_by_id(self, question_id: int) -> Any | None:
+        """Getting a question by ID from the wrapped repository.
+
+        Args:
+            question_id (int): The ID of the question.
+
+        Returns:
+            Any | None: The question data if found, otherwise None.
+        """
+        return await self._repository.get_question_by_id(question_id)
+
+    async def get_questions_by_quiz(self, quiz_id: int) -> Iterable[Any] | None:
+        """Getting questions of a quiz, reading the cache first.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            Iterable[Any] | None: A collection of questions for the quiz.
+        """
+        key = questions_key(quiz_id)
+        if (questions := await self._cache.get(key)) is not None:
+            return questions
+
+        generation = await self._cache.generation(key)
+        questions = await self._repository.get_questions_by_quiz(quiz_id)
+        if questions:
+            await self._cache.set(key, questions, generation)
+        return questions
+
+    async def get_answer_key(self, quiz_id: int) -> AnswerKey:
+        """Getting the answer key of a quiz, reading the cache first.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            AnswerKey: The correct options of the quiz questions.
+        """
+        key = answer_key_key(quiz_id)
+        if (answer_key := await self._cache.get(key)) is not None:
+            return answer_key
+
+        generation = await self._cache.generation(key)
+        answer_key = await self._repository.get_answer_key(quiz_id)
+        if answer_key.total_questions:
+            await self._cache.set(key, answer_key, generation)
+        return answer_key
+
+    async def get_quiz_bundle(self, quiz_id: int) -> QuizBundle | None:
+        """Getting the serialized bundle of a quiz, reading the cache first.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            QuizBundle | None: The serialized quiz bundle if the quiz exists.
+        """
+        key = bundle_key(quiz_id)
+        if (bundle := await self._cache.get(key)) is not None:
+            return bundle
+
+        generation = await self._cache.generation(key)
+        bundle = await self._repository.get_quiz_bundle(quiz_id)
+        if bundle is not None:
+            await self._cache.set(key, bundle, generation)
+        return bundle
+
+    async def add_question(self, data: QuestionIn) -> Any | None:
+        """Adding a question and invalidating the cached entries of its quiz.
+
+        Args:
+            data (QuestionIn): The question data.
+
+        Returns:
+            Any | None: The newly created question if successful, otherwise None.
+        """
+        question = await self._repository.add_question(data)
+        await self._cache.delete(*quiz_entry_keys(data.quiz_id))
+        return question
+
+    async def update_question(
+            self,
+            question_id: int,
+            data: QuestionIn,
+    ) -> Any | None:
+        """Updating a question and invalidating the cached entries of its quizzes.
+
+        The question may be moved to another quiz, so both the previous one,
+        returned by the write, and the new quiz are invalidated.
+
+        Args:
+            question_id (int): The ID of the question.
+            data (QuestionIn): The updated question data.
+
+        Returns:
+            Any | None: The updated question if successful, otherwise None.
+        """
+        question = await self._repository.update_question(
+            question_id=question_id,
+            data=data,
+        )
+        if question is not None:
+            await self._cache.delete(*(
+                key
+                for quiz_id in {question.quiz_id, question.previous_quiz_id}
+                for key in quiz_entry_keys(quiz_id)
+            ))
+        return question
+
+    async def delete_question(self, question_id: int) -> Any | None:
+        """Removing a question and invalidating the cached entries of its quiz.
+
+        Args:
+            question_id (int): The ID of the question.
+
+        Returns:
+            Any | None: The removed question if successful, otherwise None.
+        """
+        deleted = await self._repository.delete_question(question_id)
+        if deleted is not None:
+            await self._cache.delete(*quiz_entry_keys(deleted.quiz_id))
+        return deleted
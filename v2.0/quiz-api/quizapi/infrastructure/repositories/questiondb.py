@@ -1,55 +1,182 @@
 """Module containing question database repository implementation."""
 
-from typing import Any, Iterable
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Iterable
 from asyncpg import Record # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import bindparam, select, join, outerjoin
 
 from quizapi.core.repositories.iquestion import IQuestionRepository
-from quizapi.core.domain.question import Question, QuestionIn
-from quizapi.db import question_table, database, quiz_table, player_table
+from quizapi.core.domain.question import Question, QuestionIn, UpdatedQuestion
+from quizapi.db import question_table, quiz_table, player_table
+from quizapi.infrastructure.dto.bundledto import QuizBundleDTO
 from quizapi.infrastructure.dto.questiondto import QuestionDTO
+from quizapi.infrastructure.repositories.quizdb import quiz_columns
+from quizapi.infrastructure.repositories.statements import Statement
+from quizapi.infrastructure.utils.bundle import QuizBundle
+from quizapi.infrastructure.utils.grading import AnswerKey
+
+question_with_quiz_query = (
+    select(
+        question_table.c.id.label("id"),
+        question_table.c.question_text.label("question_text"),
+        question_table.c.option_one.label("option_one"),
+        question_table.c.option_two.label("option_two"),
+        question_table.c.option_three.label("option_three"),
+        question_table.c.option_four.label("option_four"),
+        quiz_table.c.id.label("quiz_id"),
+        quiz_table.c.title.label("title"),
+        quiz_table.c.description.label("description"),
+        quiz_table.c.shared.label("shared"),
+        quiz_table.c.reward.label("reward"),
+        quiz_table.c.question_count.label("question_count"),
+        player_table.c.id.label("player_id"),
+    )
+    .select_from(
+        join(
+            question_table,
+            join(
+                quiz_table,
+                player_table,
+                quiz_table.c.player_id == player_table.c.id
+            ),
+            question_table.c.quiz_id == quiz_table.c.id
+        )
+    )
+)
+
+get_all_questions_statement = Statement(
+    "QuestionRepository.get_all_questions",
+    question_with_quiz_query
+    .where(question_table.c.id > bindparam("after"))
+    .order_by(question_table.c.id.asc())
+    .limit(bindparam("limit")),
+)
+
+iterate_questions_statement = Statement(
+    "QuestionRepository.iterate_questions",
+    question_with_quiz_query.order_by(question_table.c.id.asc()),
+)
+
+get_question_by_id_statement = Statement(
+    "QuestionRepository.get_question_by_id",
+    question_with_quiz_query.where(question_table.c.id == bindparam("question_id")),
+)
+
+get_questions_by_quiz_statement = Statement(
+    "QuestionRepository.get_questions_by_quiz",
+    question_table.select()
+    .where(question_table.c.quiz_id == bindparam("quiz_id")),
+)
+
+get_answer_key_statement = Statement(
+    "QuestionRepository.get_answer_key",
+    select(question_table.c.id, question_table.c.correct_option)
+    .where(question_table.c.quiz_id == bindparam("quiz_id")),
+)
+
+get_quiz_bundle_statement = Statement(
+    "QuestionRepository.get_quiz_bundle",
+    select(
+        *quiz_columns,
+        question_table.c.id.label("question_id"),
+        question_table.c.question_text,
+        question_table.c.option_one,
+        question_table.c.option_two,
+        question_table.c.option_three,
+        question_table.c.option_four,
+    )
+    .select_from(
+        outerjoin(
+            join(
+                quiz_table,
+                player_table,
+                quiz_table.c.player_id == player_table.c.id
+            ),
+            question_table,
+            question_table.c.quiz_id == quiz_table.c.id
+        )
+    )
+    .where(quiz_table.c.id == bindparam("quiz_id"))
+    .order_by(question_table.c.id.asc()),
+)
+
+add_question_statement = Statement(
+    "QuestionRepository.add_question",
+    question_table.insert()
+    .values(
+        question_text=bindparam("question_text"),
+        option_one=bindparam("option_one"),
+        option_two=bindparam("option_two"),
+        option_three=bindparam("option_three"),
+        option_four=bindparam("option_four"),
+        correct_option=bindparam("correct_option"),
+        quiz_id=bindparam("quiz_id"),
+    )
+    .returning(question_table),
+)
+
+previous_question = (
+    select(question_table.c.id, question_table.c.quiz_id)
+    .where(question_table.c.id == bindparam("question_id"))
+    .with_for_update()
+    .cte("previous_question")
+)
+
+update_question_statement = Statement(
+    "QuestionRepository.update_question",
+    question_table.update()
+    .where(question_table.c.id == previous_question.c.id)
+    .values(
+        question_text=bindparam("question_text"),
+        option_one=bindparam("option_one"),
+        option_two=bindparam("option_two"),
+        option_three=bindparam("option_three"),
+        option_four=bindparam("option_four"),
+        correct_option=bindparam("correct_option"),
+        quiz_id=bindparam("quiz_id"),
+    )
+    .returning(question_table, previous_question.c.quiz_id.label("previous_quiz_id")),
+)
+
+delete_question_statement = Statement(
+    "QuestionRepository.delete_question",
+    question_table.delete()
+    .where(question_table.c.id == bindparam("question_id"))
+    .returning(question_table),
+)
 
 class QuestionRepository(IQuestionRepository):
     """A class implementing the question repository."""
 
-    async def get_all_questions(self) -> Iterable[Any]:
+    async def get_all_questions(self, limit: int, after: int = 0) -> Iterable[Any]:
         """Getting all questions from the database.
 
+        Args:
+            limit (int): The maximum number of questions to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: A collection of all questions.
         """
-        query = (
-            select(
-                question_table.c.id.label("id"),
-                question_table.c.question_text.label("question_text"),
-                question_table.c.option_one.label("option_one"),
-                question_table.c.option_two.label("option_two"),
-                question_table.c.option_three.label("option_three"),
-                question_table.c.option_four.label("option_four"),
-                question_table.c.correct_option.label("correct_option"),
-                quiz_table.c.id.label("quiz_id"),
-                quiz_table.c.title.label("title"),
-                quiz_table.c.description.label("description"),
-                quiz_table.c.shared.label("shared"),
-                quiz_table.c.reward.label("reward"),
-                player_table.c.id.label("player_id"),
-            )
-            .select_from(
-                join(
-                    question_table,
-                    join(
-                        quiz_table,
-                        player_table,
-                        quiz_table.c.player_id == player_table.c.id
-                    ),
-                    question_table.c.quiz_id == quiz_table.c.id
-                )
-            )
-            .order_by(question_table.c.id.asc())
+        questions = await get_all_questions_statement.fetch_all(
+            limit=limit,
+            after=after,
         )
-        questions = await database.fetch_all(query)
         return [QuestionDTO.from_record(question) for question in questions]
 
+    async def iterate_questions(self, chunk_size: int) -> AsyncIterator[Any]:
+        """Iterating all questions with a server-side cursor.
+
+        Args:
+            chunk_size (int): The number of rows fetched per round trip.
+
+        Yields:
+            Any: The consecutive questions ordered by ID.
+        """
+        async with aclosing(iterate_questions_statement.iterate(chunk_size)) as questions:
+            async for question in questions:
+                yield QuestionDTO.from_record(question)
+
     async def get_question_by_id(self, question_id: int) -> Record | None:
         """Getting a question by ID.
 
@@ -59,37 +186,7 @@ class QuestionRepository(IQuestionRepository):
         Returns:
             Record | None: The question record if found, otherwise None.
         """
-        query = (
-            select(
-                question_table.c.id.label("id"),
-                question_table.c.question_text.label("question_text"),
-                question_table.c.option_one.label("option_one"),
-                question_table.c.option_two.label("option_two"),
-                question_table.c.option_three.label("option_three"),
-                question_table.c.option_four.label("option_four"),
-                question_table.c.correct_option.label("correct_option"),
-                quiz_table.c.id.label("quiz_id"),
-                quiz_table.c.title.label("title"),
-                quiz_table.c.description.label("description"),
-                quiz_table.c.shared.label("shared"),
-                quiz_table.c.reward.label("reward"),
-                player_table.c.id.label("player_id"),
-            )
-            .select_from(
-                join(
-                    question_table,
-                    join(
-                        quiz_table,
-                        player_table,
-                        quiz_table.c.player_id == player_table.c.id
-                    ),
-                    question_table.c.quiz_id == quiz_table.c.id
-                )
-            )
-            .where(question_table.c.id == question_id)
-            .order_by(question_table.c.id.asc())
-        )
-        question = await database.fetch_one(query)
+        question = await get_question_by_id_statement.fetch_one(question_id=question_id)
         return QuestionDTO.from_record(question) if question else None
 
     async def get_questions_by_quiz(self, quiz_id: int) -> Iterable[Any] | None:
@@ -101,13 +198,38 @@ class QuestionRepository(IQuestionRepository):
         Returns:
             Iterable[Any] | None: A collection of questions for the quiz.
         """
-        query = (
-            question_table.select()
-            .where(question_table.c.quiz_id == quiz_id)
-        )
-        questions = await database.fetch_all(query)
+        questions = await get_questions_by_quiz_statement.fetch_all(quiz_id=quiz_id)
         return [Question(**dict(question)) for question in questions]
 
+    async def get_answer_key(self, quiz_id: int) -> AnswerKey:
+        """Getting the correct options of the questions of a quiz.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            AnswerKey: The answer key, empty if the quiz has no questions.
+        """
+        questions = await get_answer_key_statement.fetch_all(quiz_id=quiz_id)
+        return AnswerKey({
+            question["id"]: question["correct_option"] for question in questions
+        })
+
+    async def get_quiz_bundle(self, quiz_id: int) -> QuizBundle | None:
+        """Getting a quiz with its questions serialized in a single query.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            QuizBundle | None: The serialized quiz bundle if the quiz exists,
+                otherwise None.
+        """
+        records = await get_quiz_bundle_statement.fetch_all(quiz_id=quiz_id)
+        if not records:
+            return None
+        return QuizBundle.from_model(QuizBundleDTO.from_records(records))
+
     async def add_question(self, data: QuestionIn) -> Any | None:
         """Adding a new question to the database.
 
@@ -117,9 +239,7 @@ class QuestionRepository(IQuestionRepository):
         Returns:
             Any | None: The newly created question if successful, otherwise None.
         """
-        query = question_table.insert().values(**data.model_dump())
-        new_question_id = await database.execute(query)
-        new_question = await self._get_by_id(new_question_id)
+        new_question = await add_question_statement.fetch_one(**data.model_dump())
         return Question(**dict(new_question)) if new_question else None
 
     async def update_question(
@@ -129,51 +249,31 @@ class QuestionRepository(IQuestionRepository):
     ) -> Any | None:
         """Updating a question in the database.
 
-        Args:
-            question_id (int): The ID of the question.
-            data (QuestionIn): The updated question data.
-
-        Returns:
-            Any | None: The updated question if successful, otherwise None.
-        """
-        if self._get_by_id(question_id):
-            query = (
-                question_table.update()
-                .where(question_table.c.id == question_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-            question = await self._get_by_id(question_id)
-            return Question(**dict(question)) if question else None
-        return None
-
-    async def delete_question(self, question_id: int) -> bool:
-        """Removing a question from the database.
+        The previous row is locked and read by the same statement, so the
+        quiz the question belonged to comes back without another query.
 
         Args:
             question_id (int): The ID of the question.
+            data (QuestionIn): The updated question data.
 
         Returns:
-            bool: Success of the operation.
+            Any | None: The updated question with the ID of its previous quiz
+                if successful, otherwise None.
         """
-        if self._get_by_id(question_id):
-            query = question_table.delete().where(question_table.c.id == question_id)
-            await database.execute(query)
-            return True
-        return False
+        question = await update_question_statement.fetch_one(
+            question_id=question_id,
+            **data.model_dump(),
+        )
+        return UpdatedQuestion(**dict(question)) if question else None
 
-    async def _get_by_id(self, question_id: int) -> Record | None:
-        """A private method getting a question from the database based on its ID.
+    async def delete_question(self, question_id: int) -> Any | None:
+        """Removing a question from the database.
 
         Args:
             question_id (int): The ID of the question.
 
         Returns:
-            Record | None: The question record if exists.
+            Any | None: The removed question if successful, otherwise None.
         """
-        query = (
-            question_table.select()
-            .where(question_table.c.id == question_id)
-            .order_by(question_table.c.id.asc())
-        )
-        return await database.fetch_one(query)
\ No newline at end of file
+        deleted = await delete_question_statement.fetch_one(question_id=question_id)
+        return Question(**dict(deleted)) if deleted else None
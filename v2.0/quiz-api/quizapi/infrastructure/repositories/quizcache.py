@@ -0,0 +1,132 @@
+"""Module containing the read-through cache of the quiz repository."""
+
+from typing import Any, Iterable
+
+from quizapi.core.domain.quiz import QuizIn
+from quizapi.core.repositories.iquiz import IQuizRepository
+from quizapi.infrastructure.cache.icache import ICacheBackend
+from quizapi.infrastructure.cache.keys import (
+    answer_key_key,
+    bundle_key,
+    questions_key,
+    quiz_key,
+)
+
+
+class CachedQuizRepository(IQuizRepository):
+    """A class caching single quizzes in front of another quiz repository.
+
+    Every write goes to the wrapped repository first and invalidates the
+    affected entries afterwards.
+    """
+
+    _repository: IQuizRepository
+    _cache: ICacheBackend
+
+    def __init__(self, repository: IQuizRepository, cache: ICacheBackend):
+        """The initializer of the `cached quiz repository`.
+
+        Args:
+            repository (IQuizRepository): The reference to the wrapped repository.
+            cache (ICacheBackend): The reference to the cache backend.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def get_all_quizzes(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting a page of quizzes from the wrapped repository.
+
+        Args:
+            limit (int): The maximum number of quizzes to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            Iterable[Any]: A collection of quizzes.
+        """
+        return await self._repository.get_all_quizzes(limit=limit, after=after)
+
+    async def get_quiz_by_id(self, quiz_id: int) -> Any | None:
+        """Getting a quiz by ID, reading the cache first.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            Any | None: The quiz data if found, otherwise None.
+        """
+        key = quiz_key(quiz_id)
+        if (quiz := await self._cache.get(key)) is not None:
+            return quiz
+
+        generation = await self._cache.generation(key)
+        quiz = await self._repository.get_quiz_by_id(quiz_id)
+        if quiz is not None:
+            await self._cache.set(key, quiz, generation)
+        return quiz
+
+    async def add_quiz(self, data: QuizIn) -> Any | None:
+        """Adding a new quiz to the wrapped repository.
+
+        Args:
+            data (QuizIn): The quiz data.
+
+        Returns:
+            Any | None: The newly created quiz if successful, otherwise None.
+        """
+        return await self._repository.add_quiz(data)
+
+    async def update_quiz(self, quiz_id: int, data: QuizIn) -> Any | None:
+        """Updating a quiz and invalidating its cached entries.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+            data (QuizIn): The updated quiz data.
+
+        Returns:
+            Any | None: The updated quiz if successful, otherwise None.
+        """
+        quiz = await self._repository.update_quiz(quiz_id=quiz_id, data=data)
+        await self._cache.delete(quiz_key(quiz_id), bundle_key(quiz_id))
+        return quiz
+
+    async def delete_quiz(self, quiz_id: int) -> bool:
+        """Removing a quiz and invalidating its cached entries.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            bool: Success of the operation.
+        """
+        deleted = await self._repository.delete_quiz(quiz_id)
+        await self._cache.delete(
+            quiz_key(quiz_id),
+            questions_key(quiz_id),
+            answer_key_key(quiz_id),
+            bundle_key(quiz_id),
+        )
+        return deleted
+
+    async def share_quiz(self, quiz_id: int) -> Any | None:
+        """Sharing a quiz and invalidating its cached entries.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            Any | None: The shared quiz if successful, otherwise None.
+        """
+        quiz = await self._repository.share_quiz(quiz_id)
+        await self._cache.delete(quiz_key(quiz_id), bundle_key(quiz_id))
+        return quiz
+
+    async def get_quiz_by_reward(self, reward: str) -> Any | None:
+        """Getting a quiz by reward from the wrapped repository.
+
+        Args:
+            reward (str): The reward name.
+
+        Returns:
+            Any | None: The quiz data if found, otherwise None.
+        """
+        return await self._repository.get_quiz_by_reward(reward)
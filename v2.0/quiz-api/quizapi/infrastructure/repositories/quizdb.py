@@ -2,47 +2,129 @@
 
 from typing import Any, Iterable
 
-from asyncpg import Record # type: ignore
-from sqlalchemy import select, join
+from asyncpg.exceptions import UniqueViolationError # type: ignore
+from sqlalchemy import bindparam, select, join
+from sqlalchemy.dialects.postgresql import insert
 
 from quizapi.core.repositories.iquiz import IQuizRepository
 from quizapi.core.domain.quiz import Quiz, QuizIn
 from quizapi.db import (
     quiz_table,
     player_table,
-    database,
 )
 from quizapi.infrastructure.dto.quizdto import QuizDTO
+from quizapi.infrastructure.repositories.statements import Statement
+
+quiz_columns = (
+    quiz_table.c.id.label("quiz_id"),
+    quiz_table.c.title.label("quiz_title"),
+    quiz_table.c.description.label("quiz_description"),
+    quiz_table.c.shared.label("quiz_shared"),
+    quiz_table.c.reward.label("quiz_reward"),
+    quiz_table.c.question_count.label("quiz_question_count"),
+    player_table.c.id.label("player_id"),
+)
+
+get_all_quizzes_statement = Statement(
+    "QuizRepository.get_all_quizzes",
+    select(*quiz_columns)
+    .select_from(
+        join(
+            player_table,
+            quiz_table,
+            quiz_table.c.player_id == player_table.c.id
+        )
+    )
+    .where(quiz_table.c.id > bindparam("after"))
+    .order_by(quiz_table.c.id.asc())
+    .limit(bindparam("limit")),
+)
+
+get_quiz_by_id_statement = Statement(
+    "QuizRepository.get_quiz_by_id",
+    select(*quiz_columns)
+    .select_from(
+        join(
+            player_table,
+            quiz_table,
+            quiz_table.c.player_id == player_table.c.id
+        )
+    )
+    .where(quiz_table.c.id == bindparam("quiz_id")),
+)
+
+get_quiz_by_reward_statement = Statement(
+    "QuizRepository.get_quiz_by_reward",
+    select(*quiz_columns)
+    .select_from(
+        join(
+            player_table,
+            quiz_table,
+            quiz_table.c.player_id == player_table.c.id
+        )
+    )
+    .where(quiz_table.c.reward == bindparam("reward")),
+)
+
+add_quiz_statement = Statement(
+    "QuizRepository.add_quiz",
+    insert(quiz_table)
+    .values(
+        title=bindparam("title"),
+        player_id=bindparam("player_id"),
+        description=bindparam("description"),
+        shared=bindparam("shared"),
+        reward=bindparam("reward"),
+    )
+    .on_conflict_do_nothing(index_elements=[quiz_table.c.reward])
+    .returning(quiz_table),
+)
+
+update_quiz_statement = Statement(
+    "QuizRepository.update_quiz",
+    quiz_table.update()
+    .where(quiz_table.c.id == bindparam("quiz_id"))
+    .values(
+        title=bindparam("title"),
+        description=bindparam("description"),
+        shared=bindparam("shared"),
+        reward=bindparam("reward"),
+    )
+    .returning(quiz_table),
+)
+
+delete_quiz_statement = Statement(
+    "QuizRepository.delete_quiz",
+    quiz_table.delete()
+    .where(quiz_table.c.id == bindparam("quiz_id"))
+    .returning(quiz_table.c.id),
+)
+
+share_quiz_statement = Statement(
+    "QuizRepository.share_quiz",
+    quiz_table.update()
+    .where(quiz_table.c.id == bindparam("quiz_id"))
+    .values(shared=True)
+    .returning(quiz_table),
+)
 
 class QuizRepository(IQuizRepository):
     """A class implementing the quiz repository."""
 
-    async def get_all_quizzes(self) -> Iterable[Any]:
+    async def get_all_quizzes(self, limit: int, after: int = 0) -> Iterable[Any]:
         """Getting all quizzes from the database.
 
+        Args:
+            limit (int): The maximum number of quizzes to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: A collection of all quizzes.
         """
-        query = (
-            select(
-                quiz_table.c.id.label("quiz_id"),
-                quiz_table.c.title.label("quiz_title"),
-                quiz_table.c.description.label("quiz_description"),
-                quiz_table.c.shared.label("quiz_shared"),
-                quiz_table.c.reward.label("quiz_reward"),
-                player_table.c.id.label("player_id"),
-            )
-            .select_from(
-                join(
-                    player_table,
-                    quiz_table,
-                    quiz_table.c.player_id == player_table.c.id
-                )
-            )
-            .order_by(quiz_table.c.id.asc())
+        quizzes = await get_all_quizzes_statement.fetch_all(
+            limit=limit,
+            after=after,
         )
-
-        quizzes = await database.fetch_all(query)
         return [QuizDTO.from_record(quiz) for quiz in quizzes]
 
     async def get_quiz_by_id(self, quiz_id: int) -> Any | None:
@@ -54,26 +136,7 @@ class QuizRepository(IQuizRepository):
         Returns:
             Any | None: The quiz data if found, otherwise None.
         """
-        query = (
-            select(
-                quiz_table.c.id.label("quiz_id"),
-                quiz_table.c.title.label("quiz_title"),
-                quiz_table.c.description.label("quiz_description"),
-                quiz_table.c.shared.label("quiz_shared"),
-                quiz_table.c.reward.label("quiz_reward"),
-                player_table.c.id.label("player_id"),
-            )
-            .select_from(
-                join(
-                    player_table,
-                    quiz_table,
-                    quiz_table.c.player_id == player_table.c.id
-                )
-            )
-            .where(quiz_table.c.id == quiz_id)
-        )
-
-        quiz = await database.fetch_one(query)
+        quiz = await get_quiz_by_id_statement.fetch_one(quiz_id=quiz_id)
         return QuizDTO.from_record(quiz) if quiz else None
 
     async def add_quiz(self, data: QuizIn) -> Any | None:
@@ -83,14 +146,10 @@ class QuizRepository(IQuizRepository):
             data (QuizIn): The quiz data.
 
         Returns:
-            Any | None: The newly created quiz if successful, otherwise None.
+            Any | None: The newly created quiz if successful, otherwise None
+                when the reward name is already taken.
         """
-        reward = await self.get_quiz_by_reward(data.reward)
-        if reward:
-            return None
-        query = quiz_table.insert().values(**data.model_dump())
-        new_quiz_id = await database.execute(query)
-        new_quiz = await self._get_by_id(new_quiz_id)
+        new_quiz = await add_quiz_statement.fetch_one(**data.model_dump())
         return Quiz(**dict(new_quiz)) if new_quiz else None
 
     async def update_quiz(
@@ -105,22 +164,20 @@ class QuizRepository(IQuizRepository):
             data (QuizIn): The updated quiz data.
 
         Returns:
-            Any | None: The updated quiz if successful, otherwise None.
+            Any | None: The updated quiz if successful, otherwise None when
+                the quiz does not exist or the reward name is already taken.
         """
-        reward = await self.get_quiz_by_reward(data.reward)
-        if reward and reward.id != quiz_id:
-            return None
-
-        if self._get_by_id(quiz_id):
-            query = (
-                quiz_table.update()
-                .where(quiz_table.c.id == quiz_id)
-                .values(**data.model_dump())
+        try:
+            quiz = await update_quiz_statement.fetch_one(
+                quiz_id=quiz_id,
+                title=data.title,
+                description=data.description,
+                shared=data.shared,
+                reward=data.reward,
             )
-            await database.execute(query)
-            quiz = await self._get_by_id(quiz_id)
-            return Quiz(**dict(quiz)) if quiz else None
-        return None
+        except UniqueViolationError:
+            return None
+        return Quiz(**dict(quiz)) if quiz else None
 
     async def delete_quiz(self, quiz_id: int) -> bool:
         """Removing a quiz from the database.
@@ -131,11 +188,7 @@ class QuizRepository(IQuizRepository):
         Returns:
             bool: Success of the operation.
         """
-        if self._get_by_id(quiz_id):
-            query = quiz_table.delete().where(quiz_table.c.id == quiz_id)
-            await database.execute(query)
-            return True
-        return False
+        return await delete_quiz_statement.fetch_val(quiz_id=quiz_id) is not None
 
     async def share_quiz(self, quiz_id: int) -> Any | None:
         """Sharing a quiz by setting its shared attribute to True.
@@ -146,13 +199,8 @@ class QuizRepository(IQuizRepository):
         Returns:
             Any | None: The updated quiz if successful, otherwise None.
         """
-        query = (
-            quiz_table.update()
-            .where(quiz_table.c.id == quiz_id)
-            .values(shared=True)
-        )
-        await database.execute(query)
-        return await self._get_by_id(quiz_id)
+        quiz = await share_quiz_statement.fetch_one(quiz_id=quiz_id)
+        return Quiz(**dict(quiz)) if quiz else None
 
     async def get_quiz_by_reward(self, reward: str) -> Any | None:
         """Getting a quiz by its reward name.
@@ -163,33 +211,5 @@ class QuizRepository(IQuizRepository):
         Returns:
             Any | None: The quiz data if found, otherwise None.
         """
-        query = (
-            select(
-                quiz_table.c.id.label("quiz_id"),
-                quiz_table.c.title.label("quiz_title"),
-                quiz_table.c.description.label("quiz_description"),
-                quiz_table.c.shared.label("quiz_shared"),
-                quiz_table.c.reward.label("quiz_reward"),
-                player_table.c.id.label("player_id"),
-            )
-            .where(quiz_table.c.reward == reward)
-        )
-        quiz = await database.fetch_one(query)
+        quiz = await get_quiz_by_reward_statement.fetch_one(reward=reward)
         return QuizDTO.from_record(quiz) if quiz else None
-
-    async def _get_by_id(self, quiz_id: int) -> Record | None:
-        """A private method getting a quiz from the database based on its ID.
-
-        Args:
-            quiz_id (int): The ID of the quiz.
-
-        Returns:
-            Record | None: The quiz record if exists.
-        """
-        query = (
-            quiz_table.select()
-            .where(quiz_table.c.id == quiz_id)
-            .order_by(quiz_table.c.id.asc())
-        )
-        return await database.fetch_one(query)
-
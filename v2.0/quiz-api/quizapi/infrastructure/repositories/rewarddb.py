@@ -1,40 +1,126 @@
 """Module containing reward database repository implementation."""
 
 from typing import Any, Iterable
-from asyncpg import Record # type: ignore
-from sqlalchemy import select
+import sqlalchemy
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert
 from pydantic import UUID4
 
 from quizapi.core.repositories.ireward import IRewardRepository
-from quizapi.core.domain.reward import Reward, RewardIn
-from quizapi.core.domain.history import History
+from quizapi.core.domain.reward import Reward, RewardBroker
 from quizapi.db import (
+    best_attempt_table,
     reward_table,
     history_table,
     quiz_table,
-    database,
+    reward_collection_table,
 )
 from quizapi.infrastructure.dto.rewarddto import RewardDTO
-from sqlalchemy import and_
+from quizapi.infrastructure.repositories.statements import Statement
+
+get_all_rewards_statement = Statement(
+    "RewardRepository.get_all_rewards",
+    select(reward_table)
+    .where(reward_table.c.id > bindparam("after"))
+    .order_by(reward_table.c.id.asc())
+    .limit(bindparam("limit")),
+)
+
+get_reward_by_id_statement = Statement(
+    "RewardRepository.get_reward_by_id",
+    select(reward_table)
+    .where(reward_table.c.id == bindparam("reward_id")),
+)
+
+get_rewards_by_player_statement = Statement(
+    "RewardRepository.get_rewards_by_player",
+    reward_table.select()
+    .where(reward_table.c.player_id == bindparam("player_id")),
+)
+
+eligible_reward = (
+    select(
+        best_attempt_table.c.player_id,
+        quiz_table.c.id.label("quiz_id"),
+        quiz_table.c.reward,
+        (history_table.c.total_questions * bindparam("value_per_question")).label("value"),
+    )
+    .select_from(
+        best_attempt_table
+        .join(quiz_table, quiz_table.c.id == best_attempt_table.c.quiz_id)
+        .join(history_table, history_table.c.id == best_attempt_table.c.history_id)
+    )
+    .where(
+        (best_attempt_table.c.quiz_id == bindparam("quiz_id"))
+        & (best_attempt_table.c.player_id == bindparam("player_id"))
+        & (best_attempt_table.c.effectiveness >= bindparam("min_effectiveness"))
+        & ~sqlalchemy.exists(
+            select(reward_table.c.id)
+            .where(
+                (reward_table.c.player_id == best_attempt_table.c.player_id)
+                & (reward_table.c.quiz_id == best_attempt_table.c.quiz_id)
+            )
+        )
+    )
+    .cte("eligible_reward")
+)
+
+recorded_collection = (
+    insert(reward_collection_table)
+    .from_select(
+        ["player_id", "quiz_id"],
+        select(eligible_reward.c.player_id, eligible_reward.c.quiz_id),
+    )
+    .on_conflict_do_nothing(
+        index_elements=[reward_collection_table.c.player_id, reward_collection_table.c.quiz_id],
+    )
+    .returning(reward_collection_table.c.player_id)
+    .cte("recorded_collection")
+)
+
+collect_reward_statement = Statement(
+    "RewardRepository.collect_reward",
+    insert(reward_table)
+    .from_select(
+        ["player_id", "quiz_id", "reward", "value"],
+        select(
+            eligible_reward.c.player_id,
+            eligible_reward.c.quiz_id,
+            eligible_reward.c.reward,
+            eligible_reward.c.value,
+        )
+        .where(sqlalchemy.exists(select(recorded_collection.c.player_id))),
+    )
+    .on_conflict_do_nothing(
+        index_elements=[reward_table.c.player_id, reward_table.c.quiz_id],
+    )
+    .returning(reward_table)
+    .add_cte(recorded_collection),
+)
+
+delete_reward_statement = Statement(
+    "RewardRepository.delete_reward",
+    reward_table.delete()
+    .where(reward_table.c.id == bindparam("reward_id"))
+    .returning(reward_table.c.id),
+)
 
 class RewardRepository(IRewardRepository):
     """A class implementing the reward repository."""
-    async def get_all_rewards(self) -> Iterable[Any]:
+    async def get_all_rewards(self, limit: int, after: int = 0) -> Iterable[Any]:
         """Getting all rewards from the database.
 
+        Args:
+            limit (int): The maximum number of rewards to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: A collection of all rewards.
         """
-        query = (
-            select(
-                reward_table
-            )
-            .order_by(
-                reward_table.c.id.asc()
-            )
+        rewards = await get_all_rewards_statement.fetch_all(
+            limit=limit,
+            after=after,
         )
-
-        rewards = await database.fetch_all(query)
         return [RewardDTO.from_record(reward) for reward in rewards]
 
     async def get_reward_by_id(self, reward_id: int) -> Any | None:
@@ -46,14 +132,7 @@ class RewardRepository(IRewardRepository):
         Returns:
             Any | None: The reward data if found, otherwise None.
         """
-        query = select(
-            reward_table
-        ).where(
-            reward_table.c.id == reward_id
-        ).order_by(
-            reward_table.c.id.asc()
-        )
-        reward = await database.fetch_one(query)
+        reward = await get_reward_by_id_statement.fetch_one(reward_id=reward_id)
         return RewardDTO.from_record(reward) if reward else None
 
     async def get_rewards_by_player(self, player_id: UUID4) -> Iterable[Any] | None:
@@ -65,32 +144,37 @@ class RewardRepository(IRewardRepository):
         Returns:
             Iterable[Any] | None: A collection of rewards belonging to the player.
         """
-        query = (
-            reward_table.select()
-            .where(reward_table.c.player_id == player_id)
-        )
-        rewards = await database.fetch_all(query)
+        rewards = await get_rewards_by_player_statement.fetch_all(player_id=player_id)
         return [Reward(**dict(reward)) for reward in rewards]
 
-    async def collect_reward(self, data: RewardIn, reward: str, value: int) -> Any | None:
+    async def collect_reward(
+            self,
+            data: RewardBroker,
+            min_effectiveness: float,
+            value_per_question: int,
+    ) -> Any | None:
         """Collecting a reward and storing it in the database.
 
+        The eligibility is checked against the best attempt of the player,
+        and the collection is recorded in `reward_collections` with
+        `ON CONFLICT DO NOTHING` in the same statement. The reward is only
+        inserted when the collection was recorded, so it is collected at
+        most once, even by concurrent calls or after it was sold.
+
         Args:
-            data (RewardIn): The reward data.
-            reward (str): The reward name.
-            value (int): The reward value.
+            data (RewardBroker): The reward data.
+            min_effectiveness (float): The effectiveness required to collect the reward.
+            value_per_question (int): The value of the reward per question of the attempt.
 
         Returns:
             Any | None: The collected reward if successful, otherwise None.
         """
-        query = reward_table.insert().values(
+        new_reward = await collect_reward_statement.fetch_one(
             player_id=data.player_id,
             quiz_id=data.quiz_id,
-            reward=reward,
-            value=value,
+            min_effectiveness=min_effectiveness,
+            value_per_question=value_per_question,
         )
-        new_reward_id = await database.execute(query)
-        new_reward = await self._get_by_id(new_reward_id)
         return Reward(**dict(new_reward)) if new_reward else None
 
     async def delete_reward(self, reward_id: int) -> bool:
@@ -102,63 +186,5 @@ class RewardRepository(IRewardRepository):
         Returns:
             bool: Success of the operation.
         """
-        if self._get_by_id(reward_id):
-            query = reward_table.delete().where(reward_table.c.id == reward_id)
-            await database.execute(query)
-            return True
-        return False
-
-    async def get_histories_by_quiz(self, quiz_id: int, player_id: UUID4) -> Iterable[Any] | None:
-        """Getting histories by quiz ID and player ID.
-
-        Args:
-            quiz_id (int): The ID of the quiz.
-            player_id (UUID4): The UUID of the player.
-
-        Returns:
-            Iterable[Any] | None: A collection of histories related to the quiz and player.
-        """
-        query = (
-            history_table.select()
-            .where(and_
-                (
-                history_table.c.quiz_id == quiz_id,
-                history_table.c.player_id == player_id,
-            )
-            )
-        )
-        histories = await database.fetch_all(query)
-        return [History(**dict(history)) for history in histories]
-
-    async def get_reward_by_quiz(self, quiz_id: int) -> Any | None:
-        """Getting a reward by quiz ID.
-
-        Args:
-            quiz_id (int): The ID of the quiz.
-
-        Returns:
-            Any | None: The reward data if found, otherwise None.
-        """
-        query = (
-            select(quiz_table.c.reward)
-            .where(quiz_table.c.id == quiz_id)
-        )
-        reward = await database.fetch_one(query)
-        return reward["reward"] if reward else None
-
-    async def _get_by_id(self, reward_id: int) -> Record | None:
-        """A private method getting a reward from the database based on its ID.
-
-        Args:
-            reward_id (int): The ID of the reward.
-
-        Returns:
-            Record | None: The reward record if exists.
-        """
-        query = (
-            reward_table.select()
-            .where(reward_table.c.id == reward_id)
-            .order_by(reward_table.c.id.asc())
-        )
-        return await database.fetch_one(query)
-
+        deleted_id = await delete_reward_statement.fetch_val(reward_id=reward_id)
+        return deleted_id is not None
@@ -1,8 +1,9 @@
 """Module containing shop database repository implementation."""
 
 from typing import Any, Iterable
-from asyncpg import Record # type: ignore
-from sqlalchemy import select
+import sqlalchemy
+from asyncpg.exceptions import UniqueViolationError # type: ignore
+from sqlalchemy import bindparam, select
 from pydantic import UUID4
 
 from quizapi.core.domain.reward import Reward
@@ -12,33 +13,121 @@ from quizapi.db import (
     reward_table,
     player_table,
     shop_table,
-    database,
 )
 from quizapi.infrastructure.dto.shopdto import ShopDTO
+from quizapi.infrastructure.repositories.statements import Statement
+
+get_all_items_statement = Statement(
+    "ShopRepository.get_all_items",
+    select(shop_table)
+    .where(shop_table.c.id > bindparam("after"))
+    .order_by(shop_table.c.id.asc())
+    .limit(bindparam("limit")),
+)
+
+player_param = bindparam("player_id", type_=player_table.c.id.type)
+
+sold_reward = (
+    reward_table.delete()
+    .where(
+        (reward_table.c.id == bindparam("reward_id"))
+        & (reward_table.c.player_id == player_param)
+    )
+    .returning(reward_table.c.reward, reward_table.c.value, reward_table.c.quiz_id)
+    .cte("sold_reward")
+)
+
+credited_seller = (
+    player_table.update()
+    .where(player_table.c.id == player_param)
+    .values(balance=player_table.c.balance + sold_reward.c.value)
+    .returning(player_table.c.id)
+    .cte("credited_seller")
+)
+
+sell_item_statement = Statement(
+    "ShopRepository.sell_item",
+    shop_table.insert()
+    .from_select(
+        ["name", "value", "quiz_id"],
+        select(sold_reward.c.reward, sold_reward.c.value, sold_reward.c.quiz_id)
+        .select_from(sold_reward.join(credited_seller, sqlalchemy.true())),
+    )
+    .add_cte(sold_reward, credited_seller)
+    .returning(shop_table),
+)
+
+locked_item = (
+    select(shop_table.c.id, shop_table.c.name, shop_table.c.value, shop_table.c.quiz_id)
+    .where(shop_table.c.id == bindparam("shop_id"))
+    .with_for_update(skip_locked=True)
+    .cte("locked_item")
+)
+
+debited_buyer = (
+    player_table.update()
+    .where(
+        (player_table.c.id == player_param)
+        & (player_table.c.balance >= locked_item.c.value)
+    )
+    .where(
+        ~sqlalchemy.exists(
+            select(reward_table.c.id)
+            .where(
+                (reward_table.c.player_id == player_param)
+                & (reward_table.c.quiz_id == locked_item.c.quiz_id)
+            )
+        )
+    )
+    .values(balance=player_table.c.balance - locked_item.c.value)
+    .returning(player_table.c.id)
+    .cte("debited_buyer")
+)
+
+sold_item = (
+    shop_table.delete()
+    .where(shop_table.c.id == locked_item.c.id)
+    .where(sqlalchemy.exists(select(debited_buyer.c.id)))
+    .returning(shop_table.c.name, shop_table.c.value, shop_table.c.quiz_id)
+    .cte("sold_item")
+)
+
+buy_item_statement = Statement(
+    "ShopRepository.buy_item",
+    reward_table.insert()
+    .from_select(
+        ["player_id", "quiz_id", "reward", "value"],
+        select(player_param, sold_item.c.quiz_id, sold_item.c.name, sold_item.c.value),
+    )
+    .add_cte(locked_item, debited_buyer, sold_item)
+    .returning(reward_table),
+)
 
 class ShopRepository(IShopRepository):
     """A class implementing the shop repository."""
-    async def get_all_items(self) -> Iterable[Any]:
+    async def get_all_items(self, limit: int, after: int = 0) -> Iterable[Any]:
         """Getting all shop items from the database.
 
+        Args:
+            limit (int): The maximum number of shop items to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: A collection of all shop items.
         """
-        query = (
-            select(
-                shop_table
-            )
-            .order_by(
-                shop_table.c.id.asc()
-            )
+        shops = await get_all_items_statement.fetch_all(
+            limit=limit,
+            after=after,
         )
-
-        shops = await database.fetch_all(query)
         return [ShopDTO.from_record(shop) for shop in shops]
 
     async def sell_item(self, reward_id, player_id: UUID4) -> Any | None:
         """Selling a reward item and adding it to the shop.
 
+        Removing the reward, crediting the seller and listing the item run
+        as a single statement, so the trade is applied either fully or not
+        at all.
+
         Args:
             reward_id (int): The ID of the reward.
             player_id (UUID4): The UUID of the player.
@@ -46,48 +135,21 @@ class ShopRepository(IShopRepository):
         Returns:
             Any | None: The newly created shop item if successful, otherwise None.
         """
-        reward_query = (
-            select(reward_table)
-            .where(
-                (reward_table.c.id == reward_id) & (reward_table.c.player_id == player_id)
-            )
-        )
-        reward = await database.fetch_one(reward_query)
-        if not reward:
-            return None
-
-        reward_value = reward["value"]
-        reward_quiz = reward["quiz_id"]
-        reward_name = reward["reward"]
-
-        update_balance_query = (
-            player_table.update()
-            .where(player_table.c.id == player_id)
-            .values(balance=player_table.c.balance + reward_value)
-        )
-        await database.execute(update_balance_query)
-
-        delete_reward_query = (
-            reward_table.delete()
-            .where(reward_table.c.id == reward_id)
-        )
-        await database.execute(delete_reward_query)
-
-        insert_shop_query = (
-            shop_table.insert()
-            .values(
-                name=reward_name,
-                value=reward_value,
-                quiz_id=reward_quiz,
-            )
+        new_shop = await sell_item_statement.fetch_one(
+            reward_id=reward_id,
+            player_id=player_id,
         )
-        new_shop_id = await database.execute(insert_shop_query)
-        new_shop = await self._get_by_id(new_shop_id)
         return Shop(**dict(new_shop)) if new_shop else None
 
     async def buy_item(self, shop_item_id: int, player_id: UUID4) -> Any | None:
         """Buying an item from the shop and adding it to the player's rewards.
 
+        The shop row is locked with `FOR UPDATE SKIP LOCKED` and the balance
+        check, the debit, the removal of the listing and the new reward run
+        as a single statement. A listing locked by a concurrent buyer is
+        treated as unavailable instead of waiting for it, and a buyer
+        already holding the reward of the quiz is not charged.
+
         Args:
             shop_item_id (int): The ID of the shop item.
             player_id (UUID4): The UUID of the player.
@@ -95,83 +157,11 @@ class ShopRepository(IShopRepository):
         Returns:
             Any | None: The newly acquired reward if successful, otherwise None.
         """
-        shop_item_query = (
-            shop_table.select()
-            .where(
-                shop_table.c.id == shop_item_id
+        try:
+            new_reward = await buy_item_statement.fetch_one(
+                shop_id=shop_item_id,
+                player_id=player_id,
             )
-        )
-        shop_item = await database.fetch_one(shop_item_query)
-
-        if not shop_item:
+        except UniqueViolationError:
             return None
-
-        item_name = shop_item["name"]
-        item_value = shop_item["value"]
-        item_quiz_id = shop_item["quiz_id"]
-
-        player_query = player_table.select().where(player_table.c.id == player_id)
-        player = await database.fetch_one(player_query)
-
-        if not player or player["balance"] < item_value:
-            return None
-
-        update_balance_query = (
-            player_table.update()
-            .where(player_table.c.id == player_id)
-            .values(balance=player_table.c.balance - item_value)
-        )
-        await database.execute(update_balance_query)
-
-        delete_shop_item_query = (
-            shop_table.delete()
-            .where(
-                shop_table.c.id == shop_item_id
-            )
-        )
-        await database.execute(delete_shop_item_query)
-
-        insert_reward_query = reward_table.insert().values(
-            player_id=player_id,
-            quiz_id=item_quiz_id,
-            reward=item_name,
-            value=item_value,
-        )
-
-        new_reward_id = await database.execute(insert_reward_query)
-        new_reward = await self._get_reward_by_id(new_reward_id)
         return Reward(**dict(new_reward)) if new_reward else None
-
-
-    async def _get_by_id(self, shop_id: int) -> Record | None:
-        """A private method getting a shop item from the database based on its ID.
-
-        Args:
-            shop_id (int): The ID of the shop item.
-
-        Returns:
-            Record | None: The shop item record if exists.
-        """
-        query = (
-            shop_table.select()
-            .where(shop_table.c.id == shop_id)
-            .order_by(shop_table.c.id.asc())
-        )
-        return await database.fetch_one(query)
-
-    async def _get_reward_by_id(self, reward_id: int) -> Record | None:
-        """A private method getting a reward from the database based on its ID.
-
-        Args:
-            reward_id (int): The ID of the reward.
-
-        Returns:
-            Record | None: The reward record if exists.
-        """
-        query = (
-            reward_table.select()
-            .where(reward_table.c.id == reward_id)
-            .order_by(reward_table.c.id.asc())
-        )
-        return await database.fetch_one(query)
-
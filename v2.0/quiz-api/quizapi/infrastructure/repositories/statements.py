@@ -0,0 +1,195 @@
+"""Module containing the registry of precompiled repository statements."""
+
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, NamedTuple
+
+from asyncpg import Record  # type: ignore
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.sql import ClauseElement
+
+from quizapi.db import database
+from quizapi.infrastructure.utils.metrics import metrics
+from quizapi.infrastructure.utils.queries import record_statement
+
+default_dialect = asyncpg.dialect()
+
+
+class CompiledStatement(NamedTuple):
+    """A class representing SQL compiled for a single dialect."""
+    sql: str
+    param_names: tuple[str, ...]
+    defaults: dict[str, Any]
+    processors: dict[str, Callable[[Any], Any]]
+
+
+registry: dict[str, "Statement"] = {}
+
+
+class Statement:
+    """A class representing a repository query compiled once per dialect.
+
+    The query is declared once with bind parameters and compiled lazily on
+    the first call. The resulting SQL text is executed directly on the
+    asyncpg connection, which keeps it as a server-side prepared statement
+    in the per-connection statement cache.
+    """
+
+    def __init__(self, name: str, query: ClauseElement):
+        """The initializer of the `statement`.
+
+        Args:
+            name (str): The unique name of the statement.
+            query (ClauseElement): The SQLAlchemy Core query with bind parameters.
+
+        Raises:
+            ValueError: If a statement with the same name is already registered.
+        """
+        if name in registry:
+            raise ValueError(f"Statement {name} is already registered")
+
+        self.name = name
+        self.query = query
+        self._compiled: dict[str, CompiledStatement] = {}
+        registry[name] = self
+
+    def compile(self, dialect: Dialect = default_dialect) -> CompiledStatement:
+        """A method getting the statement compiled for the dialect.
+
+        Args:
+            dialect (Dialect, optional): The target dialect.
+                Defaults to the asyncpg dialect.
+
+        Returns:
+            CompiledStatement: The cached compiled statement.
+        """
+        compiled = self._compiled.get(dialect.name)
+        if compiled is None:
+            sql_compiler = self.query.compile(dialect=dialect)
+            compiled = CompiledStatement(
+                sql=sql_compiler.string,
+                param_names=tuple(sql_compiler.positiontup or ()),
+                defaults={
+                    name: bind.value
+                    for name, bind in sql_compiler.binds.items()
+                    if not bind.required
+                },
+                processors=dict(sql_compiler._bind_processors),
+            )
+            self._compiled[dialect.name] = compiled
+        return compiled
+
+    def arguments(self, params: dict[str, Any]) -> tuple[str, list[Any]]:
+        """A method preparing the SQL text and positional arguments.
+
+        Args:
+            params (dict[str, Any]): The values of the bind parameters.
+
+        Returns:
+            tuple[str, list[Any]]: The SQL text and its arguments.
+        """
+        compiled = self.compile()
+        processors = compiled.processors
+        args = []
+        for name in compiled.param_names:
+            value = params[name] if name in params else compiled.defaults[name]
+            args.append(processors[name](value) if name in processors else value)
+        return compiled.sql, args
+
+    def _observe(self, started: float, acquired: float) -> None:
+        """A method recording a finished run in the metrics and the request account.
+
+        Args:
+            started (float): The time the connection was requested at.
+            acquired (float): The time the connection was acquired at.
+        """
+        duration = perf_counter() - acquired
+        metrics.observe_statement(self.name, acquired - started, duration)
+        record_statement(self.name, duration)
+
+    async def _run(self, method: str, params: dict[str, Any]) -> Any:
+        """A method running the statement with a method of the asyncpg connection.
+
+        The time spent waiting for the connection and running the statement
+        is recorded under the name of the statement.
+
+        Args:
+            method (str): The name of the connection method.
+            params (dict[str, Any]): The values of the bind parameters.
+
+        Returns:
+            Any: The result of the connection method.
+        """
+        sql, args = self.arguments(params)
+        started = perf_counter()
+        async with database.connection() as connection:
+            acquired = perf_counter()
+            try:
+                return await getattr(connection.raw_connection, method)(sql, *args)
+            finally:
+                self._observe(started, acquired)
+
+    async def fetch_all(self, **params: Any) -> list[Record]:
+        """A method fetching all rows of the statement.
+
+        Returns:
+            list[Record]: The collection of fetched rows.
+        """
+        return await self._run("fetch", params)
+
+    async def fetch_one(self, **params: Any) -> Record | None:
+        """A method fetching the first row of the statement.
+
+        Returns:
+            Record | None: The fetched row if exists.
+        """
+        return await self._run("fetchrow", params)
+
+    async def fetch_val(self, **params: Any) -> Any:
+        """A method fetching the first column of the first row.
+
+        Returns:
+            Any: The fetched value if exists.
+        """
+        return await self._run("fetchval", params)
+
+    async def execute(self, **params: Any) -> str:
+        """A method executing the statement without fetching rows.
+
+        Returns:
+            str: The status of the executed command.
+        """
+        return await self._run("execute", params)
+
+    async def iterate(self, chunk_size: int, **params: Any) -> AsyncIterator[Record]:
+        """A method iterating the rows of the statement with a server-side cursor.
+
+        The cursor lives in its own transaction on a dedicated connection and
+        prefetches `chunk_size` rows at a time, so only a single chunk is held
+        in memory regardless of the size of the result.
+
+        The transaction is the one of the asyncpg connection, since the ones
+        of `databases` are bound to the task starting them, while a streamed
+        response may be closed from another task.
+
+        Args:
+            chunk_size (int): The number of rows fetched per round trip.
+
+        Yields:
+            Record: The consecutive rows of the result.
+        """
+        sql, args = self.arguments(params)
+        started = perf_counter()
+        async with database.connection() as connection:
+            acquired = perf_counter()
+            try:
+                async with connection.raw_connection.transaction():
+                    cursor = connection.raw_connection.cursor(
+                        sql,
+                        *args,
+                        prefetch=chunk_size,
+                    )
+                    async for record in cursor:
+                        yield record
+            finally:
+                self._observe(started, acquired)
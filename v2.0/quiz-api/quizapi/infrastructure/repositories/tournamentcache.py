@@ -0,0 +1,235 @@
+"""Module containing the read-through cache of the tournament repository."""
+
+from typing import Any, Iterable, Sequence
+from uuid import UUID
+
+from pydantic import UUID4
+
+from quizapi.core.domain.tournament import StandingsScoring, TournamentIn
+from quizapi.core.repositories.itournament import ITournamentRepository
+from quizapi.infrastructure.cache.icache import ICacheBackend
+from quizapi.infrastructure.cache.keys import quiz_tournaments_key, standings_key
+
+
+def standings_keys(tournament_id: int) -> tuple[str, ...]:
+    """A function listing the cached standings of a tournament for every scoring.
+
+    Args:
+        tournament_id (int): The ID of the tournament.
+
+    Returns:
+        tuple[str, ...]: The cache keys.
+    """
+    return tuple(standings_key(tournament_id, scoring.value) for scoring in StandingsScoring)
+
+
+class CachedTournamentRepository(ITournamentRepository):
+    """A class caching tournament standings in front of another repository.
+
+    Every write changing the quizzes or the participants of a tournament
+    goes to the wrapped repository first and invalidates its standings
+    afterwards. Empty standings, which is all a missing tournament has,
+    are not stored.
+
+    The tournaments including a quiz are cached per quiz as well, since
+    every history write looks them up. The writes changing the quizzes of
+    a tournament invalidate them for its previous and its new quizzes.
+    """
+
+    _repository: ITournamentRepository
+    _cache: ICacheBackend
+
+    def __init__(self, repository: ITournamentRepository, cache: ICacheBackend):
+        """The initializer of the `cached tournament repository`.
+
+        Args:
+            repository (ITournamentRepository): The reference to the wrapped repository.
+            cache (ICacheBackend): The reference to the cache backend.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def get_all_tournaments(self, limit: int, after: int = 0) -> Iterable[Any]:
+        """Getting a page of tournaments from the wrapped repository.
+
+        Args:
+            limit (int): The maximum number of tournaments to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            Iterable[Any]: A collection of tournaments.
+        """
+        return await self._repository.get_all_tournaments(limit=limit, after=after)
+
+    async def get_tournament_by_id(self, tournament_id: int) -> Any | None:
+        """Getting a tournament by ID from the wrapped repository.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+
+        Returns:
+            Any | None: The tournament data if found, otherwise None.
+        """
+        return await self._repository.get_tournament_by_id(tournament_id)
+
+    async def _invalidate_quiz_tournaments(self, *quiz_ids: Iterable[int]) -> None:
+        """Invalidating the cached tournaments of quizzes.
+
+        Args:
+            *quiz_ids (Iterable[int]): The collections of the quiz IDs.
+        """
+        keys = {quiz_tournaments_key(quiz_id) for ids in quiz_ids for quiz_id in ids}
+        if keys:
+            await self._cache.delete(*keys)
+
+    async def add_tournament(self, data: TournamentIn) -> Any | None:
+        """Adding a new tournament and invalidating the tournaments of its quizzes.
+
+        Args:
+            data (TournamentIn): The tournament data.
+
+        Returns:
+            Any | None: The newly created tournament if successful, otherwise None.
+        """
+        tournament = await self._repository.add_tournament(data)
+        if tournament is not None:
+            await self._invalidate_quiz_tournaments(tournament.quizzes_id)
+        return tournament
+
+    async def update_tournament(self, tournament_id: int, data: TournamentIn) -> Any | None:
+        """Updating a tournament and invalidating its standings and quizzes.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            data (TournamentIn): The updated tournament data.
+
+        Returns:
+            Any | None: The updated tournament if successful, otherwise None.
+        """
+        tournament = await self._repository.update_tournament(
+            tournament_id=tournament_id,
+            data=data,
+        )
+        if tournament is not None:
+            await self._invalidate_quiz_tournaments(
+                tournament.previous_quizzes_id,
+                tournament.quizzes_id,
+            )
+        await self._cache.delete(*standings_keys(tournament_id))
+        return tournament
+
+    async def delete_tournament(self, tournament_id: int) -> Any | None:
+        """Removing a tournament and invalidating its standings and quizzes.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+
+        Returns:
+            Any | None: The removed tournament if successful, otherwise None.
+        """
+        tournament = await self._repository.delete_tournament(tournament_id)
+        if tournament is not None:
+            await self._invalidate_quiz_tournaments(tournament.quizzes_id)
+        await self._cache.delete(*standings_keys(tournament_id))
+        return tournament
+
+    async def join_tournament(self, tournament_id: int, player_uuid: UUID4) -> Any | None:
+        """Adding a player to a tournament and invalidating its standings.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            player_uuid (UUID4): The UUID of the player.
+
+        Returns:
+            Any | None: The new participation if successful, otherwise None.
+        """
+        participant = await self._repository.join_tournament(tournament_id, player_uuid)
+        if participant is not None:
+            await self._cache.delete(*standings_keys(tournament_id))
+        return participant
+
+    async def leave_tournament(self, tournament_id: int, player_uuid: UUID4) -> Any | None:
+        """Removing a player from a tournament and invalidating its standings.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            player_uuid (UUID4): The UUID of the player.
+
+        Returns:
+            Any | None: The removed participation if successful, otherwise None.
+        """
+        participant = await self._repository.leave_tournament(tournament_id, player_uuid)
+        if participant is not None:
+            await self._cache.delete(*standings_keys(tournament_id))
+        return participant
+
+    async def get_participants(
+            self,
+            tournament_id: int,
+            limit: int,
+            after: UUID | None = None,
+    ) -> Iterable[Any]:
+        """Getting participants of a tournament from the wrapped repository.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            limit (int): The maximum number of participants to get.
+            after (UUID | None, optional): The player ID after which the page starts.
+                Defaults to None.
+
+        Returns:
+            Iterable[Any]: A collection of the tournament participants.
+        """
+        return await self._repository.get_participants(
+            tournament_id=tournament_id,
+            limit=limit,
+            after=after,
+        )
+
+    async def get_standings(
+            self,
+            tournament_id: int,
+            scoring: StandingsScoring,
+    ) -> Sequence[Any]:
+        """Getting the standings of a tournament, reading the cache first.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            scoring (StandingsScoring): The scoring of the best attempts.
+
+        Returns:
+            Sequence[Any]: A collection of the standings ordered by rank.
+        """
+        key = standings_key(tournament_id, scoring.value)
+        if (standings := await self._cache.get(key)) is not None:
+            return standings
+
+        generation = await self._cache.generation(key)
+        standings = await self._repository.get_standings(
+            tournament_id=tournament_id,
+            scoring=scoring,
+        )
+        if standings:
+            await self._cache.set(key, standings, generation)
+        return standings
+
+    async def get_tournaments_by_quiz(self, quiz_id: int) -> Iterable[int]:
+        """Getting the tournaments including a quiz, reading the cache first.
+
+        A quiz outside of any tournament is cached as well, as it is the
+        usual case for the history writes looking it up.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            Iterable[int]: A collection of the tournament IDs.
+        """
+        key = quiz_tournaments_key(quiz_id)
+        if (tournament_ids := await self._cache.get(key)) is not None:
+            return tournament_ids
+
+        generation = await self._cache.generation(key)
+        tournament_ids = tuple(await self._repository.get_tournaments_by_quiz(quiz_id))
+        await self._cache.set(key, tournament_ids, generation)
+        return tournament_ids
@@ -1,31 +1,264 @@
 """Module containing tournament database repository implementation."""
 
-from typing import Any, Iterable
-from asyncpg import Record # type: ignore
+from typing import Any, Iterable, Sequence
+from uuid import UUID
 from pydantic import UUID4
-from sqlalchemy import select, join
+import sqlalchemy
+from sqlalchemy import bindparam, join, select
+from sqlalchemy.dialects.postgresql import array, insert
 
 from quizapi.core.repositories.itournament import ITournamentRepository
-from quizapi.core.domain.tournament import Tournament, TournamentIn
-from quizapi.db import tournament_table, database, quiz_table, player_table
-from quizapi.infrastructure.dto.tournamentdto import TournamentDTO
-
-from quizapi.infrastructure.repositories.quizdb import QuizDTO
+from quizapi.core.domain.tournament import (
+    Tournament,
+    TournamentIn,
+    TournamentParticipant,
+    StandingsScoring,
+    UpdatedTournament,
+)
+from quizapi.core.repositories.itournament import QuizzesNotFoundError
+from quizapi.db import (
+    database,
+    best_attempt_table,
+    history_table,
+    tournament_table,
+    tournament_participant_table,
+    quiz_table,
+    player_table,
+)
+from quizapi.infrastructure.dto.tournamentdto import ParticipantDTO, StandingDTO, TournamentDTO
+from quizapi.infrastructure.repositories.statements import Statement
+
+get_all_tournaments_statement = Statement(
+    "TournamentRepository.get_all_tournaments",
+    select(tournament_table)
+    .where(tournament_table.c.id > bindparam("after"))
+    .order_by(tournament_table.c.id.asc())
+    .limit(bindparam("limit")),
+)
+
+get_tournament_by_id_statement = Statement(
+    "TournamentRepository.get_tournament_by_id",
+    select(tournament_table)
+    .where(tournament_table.c.id == bindparam("tournament_id")),
+)
+
+add_tournament_statement = Statement(
+    "TournamentRepository.add_tournament",
+    tournament_table.insert()
+    .values(
+        name=bindparam("name"),
+        description=bindparam("description"),
+        quizzes_id=bindparam("quizzes_id"),
+    )
+    .returning(tournament_table),
+)
+
+previous_tournament = (
+    select(tournament_table.c.id, tournament_table.c.quizzes_id)
+    .where(tournament_table.c.id == bindparam("tournament_id"))
+    .with_for_update()
+    .cte("previous_tournament")
+)
+
+update_tournament_statement = Statement(
+    "TournamentRepository.update_tournament",
+    tournament_table.update()
+    .where(tournament_table.c.id == previous_tournament.c.id)
+    .values(
+        name=bindparam("name"),
+        description=bindparam("description"),
+        quizzes_id=bindparam("quizzes_id"),
+    )
+    .returning(
+        tournament_table,
+        previous_tournament.c.quizzes_id.label("previous_quizzes_id"),
+    ),
+)
+
+delete_tournament_statement = Statement(
+    "TournamentRepository.delete_tournament",
+    tournament_table.delete()
+    .where(tournament_table.c.id == bindparam("tournament_id"))
+    .returning(tournament_table),
+)
+
+FIRST_PARTICIPANT_CURSOR = UUID(int=0)
+
+participant_param = bindparam(
+    "player_id",
+    type_=tournament_participant_table.c.player_id.type,
+)
+
+join_tournament_statement = Statement(
+    "TournamentRepository.join_tournament",
+    insert(tournament_participant_table)
+    .from_select(
+        ["tournament_id", "player_id"],
+        select(tournament_table.c.id, participant_param)
+        .where(tournament_table.c.id == bindparam("tournament_id")),
+    )
+    .on_conflict_do_nothing()
+    .returning(tournament_participant_table),
+)
+
+leave_tournament_statement = Statement(
+    "TournamentRepository.leave_tournament",
+    tournament_participant_table.delete()
+    .where(
+        (tournament_participant_table.c.tournament_id == bindparam("tournament_id"))
+        & (tournament_participant_table.c.player_id == participant_param)
+    )
+    .returning(tournament_participant_table),
+)
+
+get_participants_statement = Statement(
+    "TournamentRepository.get_participants",
+    select(
+        player_table.c.id,
+        player_table.c.username,
+        tournament_participant_table.c.joined_at,
+    )
+    .select_from(
+        join(
+            tournament_participant_table,
+            player_table,
+            tournament_participant_table.c.player_id == player_table.c.id,
+        )
+    )
+    .where(
+        (tournament_participant_table.c.tournament_id == bindparam("tournament_id"))
+        & (
+            tournament_participant_table.c.player_id
+            > bindparam("after", type_=participant_param.type)
+        )
+    )
+    .order_by(tournament_participant_table.c.player_id.asc())
+    .limit(bindparam("limit")),
+)
+
+def standings_query(score: sqlalchemy.ColumnElement) -> sqlalchemy.Select:
+    """A function building the standings query for a scoring.
+
+    Each participant is joined with their best attempts at the quizzes of
+    the tournament, so the whole ranking is computed in a single pass.
+
+    Args:
+        score (sqlalchemy.ColumnElement): The score of a single best attempt.
+
+    Returns:
+        sqlalchemy.Select: The query ranking the participants.
+    """
+    total_score = sqlalchemy.cast(
+        sqlalchemy.func.coalesce(sqlalchemy.func.sum(score), 0),
+        sqlalchemy.Float,
+    )
+    quizzes_played = sqlalchemy.func.count(best_attempt_table.c.quiz_id)
+    return (
+        select(
+            sqlalchemy.func.row_number().over(
+                order_by=(
+                    total_score.desc(),
+                    quizzes_played.desc(),
+                    tournament_participant_table.c.player_id.asc(),
+                ),
+            ).label("rank"),
+            tournament_participant_table.c.player_id.label("id"),
+            player_table.c.username,
+            total_score.label("score"),
+            quizzes_played.label("quizzes_played"),
+        )
+        .select_from(
+            tournament_participant_table
+            .join(
+                tournament_table,
+                tournament_participant_table.c.tournament_id == tournament_table.c.id,
+            )
+            .join(
+                player_table,
+                tournament_participant_table.c.player_id == player_table.c.id,
+            )
+            .outerjoin(
+                best_attempt_table,
+                (best_attempt_table.c.player_id == tournament_participant_table.c.player_id)
+                & (best_attempt_table.c.quiz_id == sqlalchemy.any_(tournament_table.c.quizzes_id)),
+            )
+            .outerjoin(
+                history_table,
+                history_table.c.id == best_attempt_table.c.history_id,
+            )
+        )
+        .where(tournament_participant_table.c.tournament_id == bindparam("tournament_id"))
+        .group_by(tournament_participant_table.c.player_id, player_table.c.username)
+        .order_by("rank")
+    )
+
+
+get_standings_statements = {
+    StandingsScoring.EFFECTIVENESS: Statement(
+        "TournamentRepository.get_standings.effectiveness",
+        standings_query(best_attempt_table.c.effectiveness),
+    ),
+    StandingsScoring.CORRECT_ANSWERS: Statement(
+        "TournamentRepository.get_standings.correct_answers",
+        standings_query(history_table.c.correct_answers),
+    ),
+}
+
+get_tournaments_by_quiz_statement = Statement(
+    "TournamentRepository.get_tournaments_by_quiz",
+    select(tournament_table.c.id)
+    .where(
+        tournament_table.c.quizzes_id.op("@>")(
+            array([bindparam("quiz_id", type_=quiz_table.c.id.type)]),
+        )
+    ),
+)
+
+lock_quizzes_statement = Statement(
+    "TournamentRepository.lock_quizzes",
+    select(quiz_table.c.id)
+    .where(
+        quiz_table.c.id == sqlalchemy.any_(
+            bindparam("quizzes_id", type_=tournament_table.c.quizzes_id.type)
+        )
+    )
+    .with_for_update(key_share=True),
+)
 
 class TournamentRepository(ITournamentRepository):
     """A class implementing the tournament repository."""
-    async def get_all_tournaments(self) -> Iterable[Any]:
+    async def _lock_quizzes(self, quizzes_id: list[int]) -> None:
+        """Locking the quizzes of a tournament against removal until the transaction ends.
+
+        Args:
+            quizzes_id (list[int]): The IDs of the quizzes.
+
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+        """
+        found = await lock_quizzes_statement.fetch_all(quizzes_id=quizzes_id)
+        found_ids = {quiz["id"] for quiz in found}
+        missing = [
+            quiz_id for quiz_id in dict.fromkeys(quizzes_id)
+            if quiz_id not in found_ids
+        ]
+        if missing:
+            raise QuizzesNotFoundError(missing)
+
+    async def get_all_tournaments(self, limit: int, after: int = 0) -> Iterable[Any]:
         """Getting all tournaments from the database.
 
+        Args:
+            limit (int): The maximum number of tournaments to get.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
             Iterable[Any]: A collection of all tournaments.
         """
-        query = select(
-            tournament_table
-        ).order_by(
-            tournament_table.c.id.asc()
+        tournaments = await get_all_tournaments_statement.fetch_all(
+            limit=limit,
+            after=after,
         )
-        tournaments = await database.fetch_all(query)
         return [TournamentDTO.from_record(tournament) for tournament in tournaments]
 
     async def get_tournament_by_id(self, tournament_id: int) -> Any | None:
@@ -37,128 +270,109 @@ class TournamentRepository(ITournamentRepository):
         Returns:
             Any | None: The tournament data if found, otherwise None.
         """
-        query = select(
-            tournament_table
-        ).where(
-            tournament_table.c.id == tournament_id
-        ).order_by(
-            tournament_table.c.id.asc()
+        tournament = await get_tournament_by_id_statement.fetch_one(
+            tournament_id=tournament_id,
         )
-        tournament = await database.fetch_one(query)
         return TournamentDTO.from_record(tournament) if tournament else None
 
-    async def add_tournament(self, data: TournamentIn) -> None:
+    async def add_tournament(self, data: TournamentIn) -> Tournament | None:
         """Adding a new tournament to the database.
 
+        The quizzes are validated and the tournament inserted in a single
+        transaction.
+
         Args:
             data (TournamentIn): The tournament data.
 
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
         Returns:
-            None
+            Tournament | None: The newly created tournament if successful, otherwise None.
         """
-        for quiz_id in data.quizzes_id:
-            quiz = await self.get_quiz_by_id(quiz_id)
-            if not quiz:
-                return None
-
-        query = tournament_table.insert().values(
-            name= data.name,
-            description= data.description,
-            participants= [],
-            quizzes_id = data.quizzes_id
-        )
-        new_tournament_id = await database.execute(query)
-        new_tournament = await self._get_by_id(new_tournament_id)
+        async with database.transaction():
+            await self._lock_quizzes(data.quizzes_id)
+            new_tournament = await add_tournament_statement.fetch_one(
+                name=data.name,
+                description=data.description,
+                quizzes_id=data.quizzes_id,
+            )
         return Tournament(**dict(new_tournament)) if new_tournament else None
 
     async def update_tournament(
             self,
             tournament_id: int,
             data: TournamentIn,
-    ) -> Tournament | None:
+    ) -> UpdatedTournament | None:
         """Updating an existing tournament in the database.
 
+        The previous row is locked and read by the same statement, so the
+        quizzes the tournament included come back without another query.
+
         Args:
             tournament_id (int): The ID of the tournament.
             data (TournamentIn): The new tournament data.
 
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
         Returns:
-            Tournament | None: The updated tournament if successful, otherwise None.
+            UpdatedTournament | None: The updated tournament with its previous
+                quizzes if successful, otherwise None.
         """
-        for quiz_id in data.quizzes_id:
-            quiz = await self.get_quiz_by_id(quiz_id)
-            if not quiz:
-                return None
-
-        existing_tournament = await self._get_by_id(tournament_id)
-        if not existing_tournament:
-            return None
-        query = (
-            tournament_table.update()
-            .where(tournament_table.c.id == tournament_id)
-            .values(
+        async with database.transaction():
+            await self._lock_quizzes(data.quizzes_id)
+            updated_tournament = await update_tournament_statement.fetch_one(
+                tournament_id=tournament_id,
                 name=data.name,
                 description=data.description,
-                quizzes_id=data.quizzes_id
+                quizzes_id=data.quizzes_id,
             )
-        )
-        await database.execute(query)
-        updated_tournament = await self._get_by_id(tournament_id)
-        return Tournament(**dict(updated_tournament)) if updated_tournament else None
+        return UpdatedTournament(**dict(updated_tournament)) if updated_tournament else None
 
-    async def delete_tournament(self, tournament_id: int) -> bool:
+    async def delete_tournament(self, tournament_id: int) -> Tournament | None:
         """Removing a tournament from the database.
 
         Args:
             tournament_id (int): The ID of the tournament.
 
         Returns:
-            bool: Success of the operation.
+            Tournament | None: The removed tournament if successful, otherwise None.
         """
-        if self._get_by_id(tournament_id):
-            query = tournament_table.delete().where(tournament_table.c.id == tournament_id)
-            await database.execute(query)
-            return True
-        return False
+        deleted = await delete_tournament_statement.fetch_one(
+            tournament_id=tournament_id,
+        )
+        return Tournament(**dict(deleted)) if deleted else None
 
-    async def join_tournament(self, tournament_id: int, player_uuid: UUID4) -> Tournament | None:
+    async def join_tournament(
+            self,
+            tournament_id: int,
+            player_uuid: UUID4,
+    ) -> TournamentParticipant | None:
         """Adding a player to a tournament.
 
+        The participation is inserted with `ON CONFLICT DO NOTHING`, so
+        concurrent joins never overwrite each other and a repeated join
+        returns nothing.
+
         Args:
             tournament_id (int): The ID of the tournament.
             player_uuid (UUID4): The UUID of the player.
 
         Returns:
-            Tournament | None: The updated tournament if successful, otherwise None.
+            TournamentParticipant | None: The new participation if successful, otherwise None.
         """
-        query = (
-            select(
-                tournament_table.c.participants
-            )
-            .where(tournament_table.c.id == tournament_id)
+        participant = await join_tournament_statement.fetch_one(
+            tournament_id=tournament_id,
+            player_id=player_uuid,
         )
-        tournament = await database.fetch_one(query)
-
-        if not tournament:
-            return None
-
-        participants = tournament["participants"] or []
+        return TournamentParticipant(**dict(participant)) if participant else None
 
-        if player_uuid in participants:
-            return None
-
-        participants.append(player_uuid)
-        updated_query = (
-            tournament_table.update()
-            .where(tournament_table.c.id == tournament_id)
-            .values(participants=participants)
-            .returning(tournament_table)
-        )
-        updated_participants = await database.fetch_one(updated_query)
-        return Tournament(**dict(updated_participants)) if updated_participants else None
-
-
-    async def leave_tournament(self, tournament_id: int, player_uuid: UUID4) -> Tournament | None:
+    async def leave_tournament(
+            self,
+            tournament_id: int,
+            player_uuid: UUID4,
+    ) -> TournamentParticipant | None:
         """Removing a player from a tournament.
 
         Args:
@@ -166,77 +380,65 @@ class TournamentRepository(ITournamentRepository):
             player_uuid (UUID4): The UUID of the player.
 
         Returns:
-            Tournament | None: The updated tournament if successful, otherwise None.
+            TournamentParticipant | None: The removed participation if successful, otherwise None.
         """
-        query = (
-            select(
-                tournament_table.c.participants
-            )
-            .where(tournament_table.c.id == tournament_id)
+        participant = await leave_tournament_statement.fetch_one(
+            tournament_id=tournament_id,
+            player_id=player_uuid,
         )
-        tournament = await database.fetch_one(query)
-        if not tournament:
-            return None
+        return TournamentParticipant(**dict(participant)) if participant else None
 
-        participants = tournament["participants"] or []
-        if player_uuid not in participants:
-            return None
+    async def get_participants(
+            self,
+            tournament_id: int,
+            limit: int,
+            after: UUID | None = None,
+    ) -> Iterable[Any]:
+        """Getting participants of a tournament ordered by player ID.
 
-        participants = [p for p in participants if p != player_uuid]
+        Args:
+            tournament_id (int): The ID of the tournament.
+            limit (int): The maximum number of participants to get.
+            after (UUID | None, optional): The player ID after which the page starts.
+                Defaults to None.
 
-        updated_query = (
-            tournament_table.update()
-            .where(tournament_table.c.id == tournament_id)
-            .values(participants=participants)
-            .returning(tournament_table)
+        Returns:
+            Iterable[Any]: A collection of the tournament participants.
+        """
+        participants = await get_participants_statement.fetch_all(
+            tournament_id=tournament_id,
+            limit=limit,
+            after=after or FIRST_PARTICIPANT_CURSOR,
         )
-        updated_participants = await database.fetch_one(updated_query)
-        return Tournament(**updated_participants) if updated_participants else None
+        return [ParticipantDTO.from_record(participant) for participant in participants]
 
-    async def _get_by_id(self, tournament_id: int) -> Record | None:
-        """A private method getting a tournament from the database based on its ID.
+    async def get_standings(
+            self,
+            tournament_id: int,
+            scoring: StandingsScoring,
+    ) -> Sequence[Any]:
+        """Getting the ranked participants of a tournament.
 
         Args:
             tournament_id (int): The ID of the tournament.
+            scoring (StandingsScoring): The scoring of the best attempts.
 
         Returns:
-            Record | None: The tournament record if exists.
+            Sequence[Any]: A collection of the standings ordered by rank.
         """
-        query = (
-            tournament_table.select()
-            .where(tournament_table.c.id == tournament_id)
-            .order_by(tournament_table.c.id.asc())
+        standings = await get_standings_statements[scoring].fetch_all(
+            tournament_id=tournament_id,
         )
-        return await database.fetch_one(query)
+        return [StandingDTO.from_record(standing) for standing in standings]
 
-    async def get_quiz_by_id(self, quiz_id: int) -> Any | None:
-        """Getting a quiz by ID.
+    async def get_tournaments_by_quiz(self, quiz_id: int) -> Iterable[int]:
+        """Getting the tournaments which include a quiz.
 
         Args:
             quiz_id (int): The ID of the quiz.
 
         Returns:
-            Any | None: The quiz data if found, otherwise None.
+            Iterable[int]: A collection of the tournament IDs.
         """
-        query = (
-            select(
-                quiz_table.c.id.label("quiz_id"),
-                quiz_table.c.title.label("quiz_title"),
-                quiz_table.c.description.label("quiz_description"),
-                quiz_table.c.shared.label("quiz_shared"),
-                quiz_table.c.reward.label("quiz_reward"),
-                player_table.c.id.label("player_id"),
-            )
-            .select_from(
-                join(
-                    player_table,
-                    quiz_table,
-                    quiz_table.c.player_id == player_table.c.id
-                )
-            )
-            .where(quiz_table.c.id == quiz_id)
-            .order_by(quiz_table.c.id.asc())
-        )
-
-        quiz = await database.fetch_one(query)
-        return QuizDTO.from_record(quiz) if quiz else None
\ No newline at end of file
+        tournaments = await get_tournaments_by_quiz_statement.fetch_all(quiz_id=quiz_id)
+        return [tournament["id"] for tournament in tournaments]
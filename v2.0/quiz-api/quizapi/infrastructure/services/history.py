@@ -1,10 +1,14 @@
 """Module containing history service implementation."""
 
-from typing import Iterable
-from quizapi.core.domain.history import History, HistoryIn
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterable
+from quizapi.core.domain.history import History, HistoryBroker, SubmissionIn
 from quizapi.core.repositories.ihistory import IHistoryRepository
+from quizapi.core.repositories.iquestion import IQuestionRepository
 from quizapi.infrastructure.dto.historydto import HistoryDTO
-from quizapi.infrastructure.dto.questiondto import QuestionDTO
+from quizapi.infrastructure.dto.leaderboarddto import LeaderboardDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
+from quizapi.infrastructure.utils import consts
 from quizapi.infrastructure.services.ihistory import IHistoryService
 
 from pydantic import UUID4
@@ -13,22 +17,44 @@ class HistoryService(IHistoryService):
     """A class implementing the history service."""
 
     _repository: IHistoryRepository
+    _question_repository: IQuestionRepository
 
-    def __init__(self, repository: IHistoryRepository):
+    def __init__(
+            self,
+            repository: IHistoryRepository,
+            question_repository: IQuestionRepository,
+    ):
         """The initializer of the `history service`.
 
         Args:
             repository (IHistoryRepository): The reference to the repository.
+            question_repository (IQuestionRepository): The reference to the
+                question repository providing answer keys.
         """
         self._repository = repository
+        self._question_repository = question_repository
 
-    async def get_all_histories(self) -> Iterable[HistoryDTO]:
+    async def get_all_histories(self, limit: int, after: int = 0) -> PageDTO[HistoryDTO]:
         """The abstract getting all histories from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            PageDTO[HistoryDTO]: The page of histories with the cursor of the next one.
+        """
+        limit = max(1, min(limit, consts.MAX_PAGE_SIZE))
+        items = await self._repository.get_all_histories(limit=limit + 1, after=after)
+        return PageDTO[HistoryDTO].from_items(list(items), limit)
+
+    def export_histories(self) -> AsyncIterator[HistoryDTO]:
+        """Exporting all histories from the repository in cursor-sized chunks.
+
         Returns:
-            Iterable[HistoryDTO]: A collection of all histories.
+            AsyncIterator[HistoryDTO]: The consecutive histories ordered by ID.
         """
-        return await self._repository.get_all_histories()
+        return self._repository.iterate_histories(consts.EXPORT_CHUNK_SIZE)
 
     async def get_history_by_id(self, history_id: int) -> HistoryDTO | None:
         """The abstract getting a history by ID.
@@ -52,59 +78,61 @@ class HistoryService(IHistoryService):
         """
         return await self._repository.get_history_by_player(player_id)
 
-    async def add_history(self, data: HistoryIn) -> History | None:
-        """The abstract adding a new history entry to the repository.
+    async def grade_submission(
+            self,
+            player_id: UUID4,
+            data: SubmissionIn,
+    ) -> History | None:
+        """The abstract grading submitted answers and storing the result.
+
+        The answers are checked against the cached answer key of the quiz,
+        so the client never decides the number of correct answers.
 
         Args:
-            data (HistoryIn): The history data.
+            player_id (UUID4): The UUID of the player.
+            data (SubmissionIn): The submitted answers.
 
         Returns:
-            History | None: The newly created history entry if successful, otherwise None.
+            History | None: The graded history entry if the quiz has questions, otherwise None.
         """
-        total_questions = await self._repository.get_total_questions_by_quiz(data.quiz_id)
-        total_questions = len(list(total_questions))
-        if total_questions > 0:
-            effectiveness = data.correct_answers / total_questions
-            return await self._repository.add_history(
-                data=data,
-                total_questions=total_questions,
-                effectiveness=effectiveness,
-            )
-        return None
+        graded = await self._grade(player_id, data)
+        if not graded:
+            return None
+
+        history, total_questions = graded
+        return await self._repository.add_history(
+            data=history,
+            total_questions=total_questions,
+            effectiveness=history.correct_answers / total_questions,
+        )
 
     async def update_history(
             self,
             history_id: int,
-            data: HistoryIn
+            player_id: UUID4,
+            data: SubmissionIn,
     ) -> History | None:
-        """The abstract updating an existing history entry in the repository.
+        """The abstract replacing a history entry with newly graded answers.
 
         Args:
             history_id (int): The ID of the history entry.
-            data (HistoryIn): The updated history data.
+            player_id (UUID4): The UUID of the player.
+            data (SubmissionIn): The submitted answers.
 
         Returns:
             History | None: The updated history entry if successful, otherwise None.
         """
-        existing_history = await self._repository.get_history_by_id(history_id)
-        if not existing_history:
+        graded = await self._grade(player_id, data)
+        if not graded:
             return None
 
-        total_questions = await self._repository.get_total_questions_by_quiz(data.quiz_id)
-
-        if not total_questions:
-            return None
-
-        total_questions_count = len(list(total_questions))
-        effectiveness = data.correct_answers / total_questions_count if total_questions_count > 0 else 0.0
-
-        updated = await self._repository.update_history(
+        history, total_questions = graded
+        return await self._repository.update_history(
             history_id=history_id,
-            data=data,
-            total_questions=total_questions_count,
-            effectiveness=effectiveness,
+            data=history,
+            total_questions=total_questions,
+            effectiveness=history.correct_answers / total_questions,
         )
-        return updated
 
     async def delete_history(self, history_id: int) -> bool:
         """The abstract removing a history entry from the repository.
@@ -115,15 +143,49 @@ class HistoryService(IHistoryService):
         Returns:
             bool: Success of the operation.
         """
-        return await self._repository.delete_history(history_id)
+        return await self._repository.delete_history(history_id) is not None
 
-    async def get_total_questions_by_quiz(self, quiz_id: int) -> Iterable[QuestionDTO] | None:
-        """The abstract getting the total number of questions for a given quiz.
+    async def get_leaderboard(self, quiz_id: int, limit: int, player_id: UUID4) -> LeaderboardDTO:
+        """The abstract getting the leaderboard of a quiz from the repository.
 
         Args:
             quiz_id (int): The ID of the quiz.
+            limit (int): The requested number of top attempts, capped at the maximum page size.
+            player_id (UUID4): The UUID of the player to rank.
 
         Returns:
-            Iterable[QuestionDTO] | None: A collection of questions associated with the quiz.
+            LeaderboardDTO: The top attempts and the attempt of the player.
         """
-        return await self._repository.get_total_questions_by_quiz(quiz_id)
\ No newline at end of file
+        limit = max(1, min(limit, consts.MAX_PAGE_SIZE))
+        return await self._repository.get_leaderboard(
+            quiz_id=quiz_id,
+            limit=limit,
+            player_id=player_id,
+        )
+
+    async def _grade(
+            self,
+            player_id: UUID4,
+            data: SubmissionIn,
+    ) -> tuple[HistoryBroker, int] | None:
+        """Grading submitted answers against the answer key of the quiz.
+
+        Args:
+            player_id (UUID4): The UUID of the player.
+            data (SubmissionIn): The submitted answers.
+
+        Returns:
+            tuple[HistoryBroker, int] | None: The graded history with the number
+                of questions of the quiz, or None if the quiz has no questions.
+        """
+        answer_key = await self._question_repository.get_answer_key(data.quiz_id)
+        if answer_key.total_questions == 0:
+            return None
+
+        history = HistoryBroker(
+            player_id=player_id,
+            quiz_id=data.quiz_id,
+            correct_answers=answer_key.grade(data.answers),
+            timestamp=datetime.now(timezone.utc),
+        )
+        return history, answer_key.total_questions
@@ -1,9 +1,11 @@
 """Module containing history service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
-from quizapi.core.domain.history import History, HistoryIn
+from typing import AsyncIterator, Iterable
+from quizapi.core.domain.history import History, SubmissionIn
 from quizapi.infrastructure.dto.historydto import HistoryDTO
+from quizapi.infrastructure.dto.leaderboarddto import LeaderboardDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 from pydantic import UUID4
 
 
@@ -11,11 +13,23 @@ class IHistoryService(ABC):
     """An abstract class representing protocol of history service."""
 
     @abstractmethod
-    async def get_all_histories(self) -> Iterable[HistoryDTO]:
+    async def get_all_histories(self, limit: int, after: int = 0) -> PageDTO[HistoryDTO]:
         """The abstract getting all histories from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            PageDTO[HistoryDTO]: The page of histories with the cursor of the next one.
+        """
+
+    @abstractmethod
+    def export_histories(self) -> AsyncIterator[HistoryDTO]:
+        """The abstract exporting all histories from the repository.
+
         Returns:
-            Iterable[HistoryDTO]: The collection of all histories.
+            AsyncIterator[HistoryDTO]: The consecutive histories ordered by ID.
         """
 
     @abstractmethod
@@ -41,26 +55,34 @@ class IHistoryService(ABC):
         """
 
     @abstractmethod
-    async def add_history(self, data: HistoryIn) -> History | None:
-        """The abstract adding a new history entry to the repository.
+    async def grade_submission(
+            self,
+            player_id: UUID4,
+            data: SubmissionIn,
+    ) -> History | None:
+        """The abstract grading submitted answers and storing the result.
 
         Args:
-            data (HistoryIn): The attributes of the history.
+            player_id (UUID4): The UUID of the player.
+            data (SubmissionIn): The submitted answers.
 
         Returns:
-            History | None: The newly created history entry.
+            History | None: The graded history entry if the quiz has questions.
         """
+
     @abstractmethod
     async def update_history(
             self,
             history_id: int,
-            data: HistoryIn
+            player_id: UUID4,
+            data: SubmissionIn,
     ) -> History | None:
-        """The abstract updating a history entry in the repository.
+        """The abstract replacing a history entry with newly graded answers.
 
         Args:
             history_id (int): The ID of the history.
-            data (HistoryIn): The updated history attributes.
+            player_id (UUID4): The UUID of the player.
+            data (SubmissionIn): The submitted answers.
 
         Returns:
             History | None: The updated history entry if exists.
@@ -78,12 +100,14 @@ class IHistoryService(ABC):
         """
 
     @abstractmethod
-    async def get_total_questions_by_quiz(self, quiz_id: int) -> int | None:
-        """The abstract getting the total number of questions for a quiz.
+    async def get_leaderboard(self, quiz_id: int, limit: int, player_id: UUID4) -> LeaderboardDTO:
+        """The abstract getting the leaderboard of a quiz from the repository.
 
         Args:
             quiz_id (int): The ID of the quiz.
+            limit (int): The requested number of top attempts, capped at the maximum page size.
+            player_id (UUID4): The UUID of the player to rank.
 
         Returns:
-            int | None: The total number of questions if exists.
-        """
\ No newline at end of file
+            LeaderboardDTO: The top attempts and the attempt of the player.
+        """
@@ -31,6 +31,28 @@ class IPlayerService(ABC):
             TokenDTO | None: The authentication token if successful.
         """
 
+    @abstractmethod
+    async def refresh_player_token(self, refresh_token: str) -> TokenDTO | None:
+        """The abstract issuing new tokens in exchange for a refresh token.
+
+        Args:
+            refresh_token (str): The refresh token of the player.
+
+        Returns:
+            TokenDTO | None: The new authentication tokens if the refresh token is active.
+        """
+
+    @abstractmethod
+    async def revoke_refresh_token(self, refresh_token: str) -> bool:
+        """The abstract revoking a refresh token.
+
+        Args:
+            refresh_token (str): The refresh token of the player.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
     @abstractmethod
     async def get_player_by_uuid(self, uuid: UUID5) -> PlayerDTO | None:
         """The abstract getting a player by UUID from the repository.
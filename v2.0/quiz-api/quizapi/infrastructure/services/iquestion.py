@@ -1,20 +1,34 @@
 """Module containing question service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 from quizapi.core.domain.question import Question, QuestionIn
 from quizapi.infrastructure.dto.questiondto import QuestionDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
+from quizapi.infrastructure.utils.bundle import QuizBundle
 
 
 class IQuestionService(ABC):
     """An abstract class representing protocol of question service."""
 
     @abstractmethod
-    async def get_all_questions(self) -> Iterable[QuestionDTO]:
+    async def get_all_questions(self, limit: int, after: int = 0) -> PageDTO[QuestionDTO]:
         """The abstract getting all questions from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
+        Returns:
+            PageDTO[QuestionDTO]: The page of questions with the cursor of the next one.
+        """
+
+    @abstractmethod
+    def export_questions(self) -> AsyncIterator[QuestionDTO]:
+        """The abstract exporting all questions from the repository.
+
         Returns:
-            Iterable[QuestionDTO]: The collection of all questions.
+            AsyncIterator[QuestionDTO]: The consecutive questions ordered by ID.
         """
 
     @abstractmethod
@@ -39,6 +53,17 @@ class IQuestionService(ABC):
             Iterable[QuestionDTO] | None: The collection of questions if exists.
         """
 
+    @abstractmethod
+    async def get_quiz_bundle(self, quiz_id: int) -> QuizBundle | None:
+        """The abstract getting a serialized quiz with its questions from the repository.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            QuizBundle | None: The serialized quiz bundle if exists.
+        """
+
     @abstractmethod
     async def add_question(self, data: QuestionIn) -> Question | None:
         """The abstract adding a new question to the repository.
@@ -1,20 +1,24 @@
 """Module containing quiz service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
 from quizapi.core.domain.quiz import Quiz, QuizIn
 from quizapi.infrastructure.dto.quizdto import QuizDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 
 
 class IQuizService(ABC):
     """An abstract class representing protocol of quiz service."""
 
     @abstractmethod
-    async def get_all_quizzes(self) -> Iterable[QuizDTO]:
+    async def get_all_quizzes(self, limit: int, after: int = 0) -> PageDTO[QuizDTO]:
         """The abstract getting all quizzes from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
-            Iterable[QuizDTO]: The collection of all quizzes.
+            PageDTO[QuizDTO]: The page of quizzes with the cursor of the next one.
         """
 
     @abstractmethod
@@ -3,20 +3,24 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 
-from quizapi.core.domain.history import History
-from quizapi.core.domain.reward import Reward, RewardIn
+from quizapi.core.domain.reward import Reward, RewardBroker
 from quizapi.infrastructure.dto.rewarddto import RewardDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 
 from pydantic import UUID4
 
 class IRewardService(ABC):
     """An abstract class representing protocol of reward service."""
     @abstractmethod
-    async def get_all_rewards(self) -> Iterable[RewardDTO]:
+    async def get_all_rewards(self, limit: int, after: int = 0) -> PageDTO[RewardDTO]:
         """The abstract getting all rewards from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
-            Iterable[RewardDTO]: The collection of all rewards.
+            PageDTO[RewardDTO]: The page of rewards with the cursor of the next one.
         """
     @abstractmethod
     async def get_reward_by_id(self, reward_id: int) -> RewardDTO | None:
@@ -40,11 +44,11 @@ class IRewardService(ABC):
         """
 
     @abstractmethod
-    async def collect_reward(self, data: RewardIn) -> Reward | None:
+    async def collect_reward(self, data: RewardBroker) -> Reward | None:
         """The abstract collecting a reward based on quiz performance.
 
         Args:
-            data (RewardIn): The reward collection request data.
+            data (RewardBroker): The reward collection request data.
 
         Returns:
             Reward | None: The collected reward if successful.
@@ -60,26 +64,3 @@ class IRewardService(ABC):
          Returns:
              bool: Success of the operation.
          """
-
-    @abstractmethod
-    async def get_histories_by_quiz(self, quiz_id: int, player_id: UUID4) -> Iterable[History] | None:
-        """The abstract getting all history records for a player in a given quiz.
-
-        Args:
-            quiz_id (int): The ID of the quiz.
-            player_id (UUID4): The UUID of the player.
-
-        Returns:
-            Iterable[History] | None: A collection of history records for the given quiz and player.
-        """
-
-    @abstractmethod
-    async def get_reward_by_quiz(self, quiz_id: int) -> str | None:
-        """The abstract getting the reward name associated with a quiz.
-
-        Args:
-            quiz_id (int): The ID of the quiz.
-
-        Returns:
-            str | None: The reward name if exists.
-        """
\ No newline at end of file
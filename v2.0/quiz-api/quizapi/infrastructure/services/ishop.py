@@ -1,24 +1,28 @@
 """Module containing shop service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
 
 from pydantic.v1 import UUID4
 
 from quizapi.core.domain.reward import Reward
 from quizapi.core.domain.shop import Shop, ShopIn
 from quizapi.infrastructure.dto.shopdto import ShopDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 
 
 class IShopService(ABC):
     """An abstract class representing protocol of shop service."""
 
     @abstractmethod
-    async def get_all_items(self) -> Iterable[ShopDTO]:
+    async def get_all_items(self, limit: int, after: int = 0) -> PageDTO[ShopDTO]:
         """The abstract getting all items available in the shop.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
-            Iterable[ShopDTO]: The collection of all items in the shop.
+            PageDTO[ShopDTO]: The page of shop items with the cursor of the next one.
         """
 
     @abstractmethod
@@ -1,20 +1,31 @@
 """Module containing tournament service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
-from quizapi.core.domain.tournament import Tournament, TournamentIn
-from quizapi.infrastructure.dto.tournamentdto import TournamentDTO
+from uuid import UUID
+
+from quizapi.core.domain.tournament import (
+    StandingsScoring,
+    Tournament,
+    TournamentIn,
+    TournamentParticipant,
+)
+from quizapi.infrastructure.dto.tournamentdto import ParticipantDTO, StandingDTO, TournamentDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
 from pydantic import UUID4
 
 class ITournamentService(ABC):
     """An abstract class representing protocol of tournament service."""
 
     @abstractmethod
-    async def get_all_tournaments(self) -> Iterable[TournamentDTO]:
+    async def get_all_tournaments(self, limit: int, after: int = 0) -> PageDTO[TournamentDTO]:
         """The abstract getting all tournaments.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
-            Iterable[TournamentDTO]: The collection of all tournaments.
+            PageDTO[TournamentDTO]: The page of tournaments with the cursor of the next one.
         """
 
     @abstractmethod
@@ -35,6 +46,9 @@ class ITournamentService(ABC):
         Args:
             data (TournamentIn): The attributes of the tournament.
 
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
         Returns:
             Tournament | None: The newly created tournament if successful.
         """
@@ -51,6 +65,9 @@ class ITournamentService(ABC):
             tournament_id (int): The ID of the tournament.
             data (TournamentIn): The updated attributes of the tournament.
 
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
         Returns:
             Tournament | None: The updated tournament if successful.
         """
@@ -67,7 +84,7 @@ class ITournamentService(ABC):
         """
 
     @abstractmethod
-    async def join_tournament(self, tournament_id: int, player_uuid: UUID4) -> Tournament | None:
+    async def join_tournament(self, tournament_id: int, player_uuid: UUID4) -> TournamentParticipant | None:
         """The abstract allowing a player to join a tournament.
 
         Args:
@@ -75,11 +92,11 @@ class ITournamentService(ABC):
             player_uuid (UUID4): The UUID of the player joining the tournament.
 
         Returns:
-            Tournament | None: The tournament with the updated participant list if successful.
+            TournamentParticipant | None: The new participation if successful.
         """
 
     @abstractmethod
-    async def leave_tournament(self, tournament_id: int, player_uuid: UUID4) -> Tournament | None:
+    async def leave_tournament(self, tournament_id: int, player_uuid: UUID4) -> TournamentParticipant | None:
         """The abstract allowing a player to leave a tournament.
 
         Args:
@@ -87,6 +104,44 @@ class ITournamentService(ABC):
             player_uuid (UUID4): The UUID of the player leaving the tournament.
 
         Returns:
-            Tournament | None: The tournament with the updated participant list if successful.
+            TournamentParticipant | None: The removed participation if successful.
         """
 
+    @abstractmethod
+    async def get_participants(
+            self,
+            tournament_id: int,
+            limit: int,
+            after: UUID | None = None,
+    ) -> PageDTO[ParticipantDTO]:
+        """The abstract getting a page of tournament participants.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            limit (int): The requested page size, capped at the maximum page size.
+            after (UUID | None, optional): The player ID after which the page starts.
+                Defaults to None.
+
+        Returns:
+            PageDTO[ParticipantDTO]: The page of participants with the cursor of the next one.
+        """
+
+    @abstractmethod
+    async def get_standings(
+            self,
+            tournament_id: int,
+            scoring: StandingsScoring,
+            limit: int,
+            after: int = 0,
+    ) -> PageDTO[StandingDTO]:
+        """The abstract getting a page of tournament standings.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            scoring (StandingsScoring): The scoring of the best attempts.
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The rank after which the page starts. Defaults to 0.
+
+        Returns:
+            PageDTO[StandingDTO]: The page of standings with the cursor of the next one.
+        """
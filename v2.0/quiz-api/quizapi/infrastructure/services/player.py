@@ -7,7 +7,11 @@ from quizapi.infrastructure.dto.tokendto import TokenDTO
 from quizapi.infrastructure.services.iplayer import IPlayerService
 from pydantic import UUID4
 from quizapi.infrastructure.utils.password import verify_password
-from quizapi.infrastructure.utils.token import generate_player_token
+from quizapi.infrastructure.utils.token import (
+    generate_player_token,
+    generate_refresh_token,
+    hash_refresh_token,
+)
 
 class PlayerService(IPlayerService):
     """A class implementing the player service."""
@@ -43,13 +47,55 @@ class PlayerService(IPlayerService):
             TokenDTO | None: The authentication token if successful, otherwise None.
         """
         if player_data := await self._repository.get_player_by_email(player.email):
-            if verify_password(player.password, player_data.password):
-                token_details = generate_player_token(player_data.id)
+            if await verify_password(player.password, player_data["password"]):
+                refresh_details = generate_refresh_token()
+                await self._repository.create_session(
+                    player_id=player_data["id"],
+                    token_hash=hash_refresh_token(refresh_details["refresh_token"]),
+                    expires_at=refresh_details["refresh_expires"],
+                )
+                token_details = generate_player_token(player_data["id"])
                 # trunk-ignore(bandit/B106)
-                return TokenDTO(token_type="Bearer", **token_details)
+                return TokenDTO(token_type="Bearer", **token_details, **refresh_details)
             return None
         return None
 
+    async def refresh_player_token(self, refresh_token: str) -> TokenDTO | None:
+        """The abstract issuing new tokens in exchange for a refresh token.
+
+        The refresh token is rotated, so the used one stops working, and
+        the password hash is not checked again.
+
+        Args:
+            refresh_token (str): The refresh token of the player.
+
+        Returns:
+            TokenDTO | None: The new authentication tokens if the refresh token is active.
+        """
+        refresh_details = generate_refresh_token()
+        player_id = await self._repository.rotate_session(
+            token_hash=hash_refresh_token(refresh_token),
+            new_token_hash=hash_refresh_token(refresh_details["refresh_token"]),
+            expires_at=refresh_details["refresh_expires"],
+        )
+        if not player_id:
+            return None
+
+        token_details = generate_player_token(player_id)
+        # trunk-ignore(bandit/B106)
+        return TokenDTO(token_type="Bearer", **token_details, **refresh_details)
+
+    async def revoke_refresh_token(self, refresh_token: str) -> bool:
+        """The abstract revoking a refresh token.
+
+        Args:
+            refresh_token (str): The refresh token of the player.
+
+        Returns:
+            bool: Success of the operation.
+        """
+        return await self._repository.delete_session(hash_refresh_token(refresh_token))
+
     async def get_player_by_uuid(self, uuid: UUID4) -> PlayerDTO | None:
         """The abstract getting a player by UUID from the repository.
 
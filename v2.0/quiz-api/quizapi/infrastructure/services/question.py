@@ -1,9 +1,12 @@
 """Module containing question service implementation."""
 
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 from quizapi.core.domain.question import Question, QuestionIn
 from quizapi.core.repositories.iquestion import IQuestionRepository
 from quizapi.infrastructure.dto.questiondto import QuestionDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
+from quizapi.infrastructure.utils import consts
+from quizapi.infrastructure.utils.bundle import QuizBundle
 from quizapi.infrastructure.services.iquestion import IQuestionService
 
 class QuestionService(IQuestionService):
@@ -19,13 +22,27 @@ class QuestionService(IQuestionService):
         """
         self._repository = repository
 
-    async def get_all_questions(self) -> Iterable[QuestionDTO]:
+    async def get_all_questions(self, limit: int, after: int = 0) -> PageDTO[QuestionDTO]:
         """The abstract getting all questions from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
-            Iterable[QuestionDTO]: A collection of all questions.
+            PageDTO[QuestionDTO]: The page of questions with the cursor of the next one.
         """
-        return await self._repository.get_all_questions()
+        limit = max(1, min(limit, consts.MAX_PAGE_SIZE))
+        items = await self._repository.get_all_questions(limit=limit + 1, after=after)
+        return PageDTO[QuestionDTO].from_items(list(items), limit)
+
+    def export_questions(self) -> AsyncIterator[QuestionDTO]:
+        """Exporting all questions from the repository in cursor-sized chunks.
+
+        Returns:
+            AsyncIterator[QuestionDTO]: The consecutive questions ordered by ID.
+        """
+        return self._repository.iterate_questions(consts.EXPORT_CHUNK_SIZE)
 
     async def get_question_by_id(self, question_id: int) -> QuestionDTO | None:
         """The abstract getting a question by ID.
@@ -49,6 +66,17 @@ class QuestionService(IQuestionService):
         """
         return await self._repository.get_questions_by_quiz(quiz_id)
 
+    async def get_quiz_bundle(self, quiz_id: int) -> QuizBundle | None:
+        """Getting a serialized quiz with its questions from the repository.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            QuizBundle | None: The serialized quiz bundle if exists.
+        """
+        return await self._repository.get_quiz_bundle(quiz_id)
+
     async def add_question(self, data: QuestionIn) -> None:
         """The abstract adding a new question to the repository.
 
@@ -88,4 +116,4 @@ class QuestionService(IQuestionService):
         Returns:
             bool: Success of the operation.
         """
-        return await self._repository.delete_question(question_id)
\ No newline at end of file
+        return await self._repository.delete_question(question_id) is not None
\ No newline at end of file
@@ -1,9 +1,10 @@
 """Module containing quiz service implementation."""
 
-from typing import Iterable
 from quizapi.core.domain.quiz import Quiz, QuizIn
 from quizapi.core.repositories.iquiz import IQuizRepository
 from quizapi.infrastructure.dto.quizdto import QuizDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
+from quizapi.infrastructure.utils import consts
 from quizapi.infrastructure.services.iquiz import IQuizService
 
 class QuizService(IQuizService):
@@ -19,13 +20,19 @@ class QuizService(IQuizService):
         """
         self._repository = repository
 
-    async def get_all_quizzes(self) -> Iterable[QuizDTO]:
+    async def get_all_quizzes(self, limit: int, after: int = 0) -> PageDTO[QuizDTO]:
         """The abstract getting all quizzes from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
-            Iterable[QuizDTO]: A collection of all quizzes.
+            PageDTO[QuizDTO]: The page of quizzes with the cursor of the next one.
         """
-        return await self._repository.get_all_quizzes()
+        limit = max(1, min(limit, consts.MAX_PAGE_SIZE))
+        items = await self._repository.get_all_quizzes(limit=limit + 1, after=after)
+        return PageDTO[QuizDTO].from_items(list(items), limit)
 
     async def get_quiz_by_id(self, quiz_id: int) -> QuizDTO | None:
         """The abstract getting a quiz by ID.
@@ -88,13 +95,4 @@ class QuizService(IQuizService):
         Returns:
             Quiz | None: The updated quiz entry if successful, otherwise None.
         """
-        quiz = await self.get_quiz_by_id(quiz_id)
-        return await self._repository.update_quiz(
-            quiz_id=quiz_id,
-            data=QuizIn(
-                title=quiz.title,
-                description=quiz.description,
-                shared=True,
-                reward=quiz.reward,
-            )
-        )
\ No newline at end of file
+        return await self._repository.share_quiz(quiz_id)
@@ -1,10 +1,11 @@
 """Module containing reward service implementation."""
 
 from typing import Iterable
-from quizapi.core.domain.history import History
-from quizapi.core.domain.reward import Reward, RewardIn
+from quizapi.core.domain.reward import Reward, RewardBroker
 from quizapi.core.repositories.ireward import IRewardRepository
 from quizapi.infrastructure.dto.rewarddto import RewardDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
+from quizapi.infrastructure.utils import consts
 from quizapi.infrastructure.services.ireward import IRewardService
 
 from pydantic import UUID4
@@ -22,13 +23,19 @@ class RewardService(IRewardService):
         """
         self._repository = repository
 
-    async def get_all_rewards(self) -> Iterable[RewardDTO]:
+    async def get_all_rewards(self, limit: int, after: int = 0) -> PageDTO[RewardDTO]:
         """Getting all rewards from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
-            Iterable[RewardDTO]: A collection of all rewards.
+            PageDTO[RewardDTO]: The page of rewards with the cursor of the next one.
         """
-        return await self._repository.get_all_rewards()
+        limit = max(1, min(limit, consts.MAX_PAGE_SIZE))
+        items = await self._repository.get_all_rewards(limit=limit + 1, after=after)
+        return PageDTO[RewardDTO].from_items(list(items), limit)
 
     async def get_reward_by_id(self, reward_id: int) -> RewardDTO | None:
         """Getting a reward by ID.
@@ -52,29 +59,23 @@ class RewardService(IRewardService):
         """
         return await self._repository.get_rewards_by_player(player_id)
 
-    async def collect_reward(self, data: RewardIn) -> Reward | None:
+    async def collect_reward(self, data: RewardBroker) -> Reward | None:
         """Collecting a reward for a player if they meet the criteria.
 
+        The reward is granted once per player and quiz, when the best
+        attempt of the player reaches `REWARD_MIN_EFFECTIVENESS`.
+
         Args:
-            data (RewardIn): The reward data input.
+            data (RewardBroker): The reward data input.
 
         Returns:
             Reward | None: The collected reward if successful, otherwise None.
         """
-        histories = await self._repository.get_histories_by_quiz(data.quiz_id, data.player_id)
-        if not histories:
-            return None
-
-        for history in histories:
-            if history.effectiveness >= 0.75:
-                name = await self._repository.get_reward_by_quiz(history.quiz_id)
-                value = history.total_questions * 10
-                return await self._repository.collect_reward(
-                    data=data,
-                    reward=name,
-                    value=value,
-                )
-        return None
+        return await self._repository.collect_reward(
+            data=data,
+            min_effectiveness=consts.REWARD_MIN_EFFECTIVENESS,
+            value_per_question=consts.REWARD_VALUE_PER_QUESTION,
+        )
 
     async def delete_reward(self, quiz_id: int) -> bool:
         """Removing a reward associated with a quiz.
@@ -86,26 +87,3 @@ class RewardService(IRewardService):
             bool: Success of the operation.
         """
         return await self._repository.delete_reward(quiz_id)
-
-    async def get_histories_by_quiz(self, quiz_id: int, player_id: UUID4) -> Iterable[History] | None:
-        """Getting the histories of a player for a given quiz.
-
-        Args:
-            quiz_id (int): The ID of the quiz.
-            player_id (UUID4): The UUID of the player.
-
-        Returns:
-            Iterable[History] | None: A collection of histories if found, otherwise None.
-        """
-        return await self._repository.get_histories_by_quiz(quiz_id, player_id)
-
-    async def get_reward_by_quiz(self, quiz_id: int) -> str | None:
-        """Getting the reward name associated with a quiz.
-
-        Args:
-            quiz_id (int): The ID of the quiz.
-
-        Returns:
-            str | None: The name of the reward if found, otherwise None.
-        """
-        return await self._repository.get_reward_by_quiz(quiz_id)
\ No newline at end of file
@@ -1,11 +1,12 @@
 """Module containing shop service implementation."""
 
-from typing import Iterable
 
 from quizapi.core.domain.reward import Reward
 from quizapi.core.domain.shop import Shop, ShopIn
 from quizapi.core.repositories.ishop import IShopRepository
 from quizapi.infrastructure.dto.shopdto import ShopDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
+from quizapi.infrastructure.utils import consts
 from quizapi.infrastructure.services.ishop import IShopService
 
 from pydantic import UUID4
@@ -23,13 +24,19 @@ class ShopService(IShopService):
         """
         self._repository = repository
 
-    async def get_all_items(self) -> Iterable[ShopDTO]:
+    async def get_all_items(self, limit: int, after: int = 0) -> PageDTO[ShopDTO]:
         """Getting all shop items from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
-            Iterable[ShopDTO]: A collection of all shop items.
+            PageDTO[ShopDTO]: The page of shop items with the cursor of the next one.
         """
-        return await self._repository.get_all_items()
+        limit = max(1, min(limit, consts.MAX_PAGE_SIZE))
+        items = await self._repository.get_all_items(limit=limit + 1, after=after)
+        return PageDTO[ShopDTO].from_items(list(items), limit)
 
     async def sell_item(self, reward_id: int, player_id: UUID4) -> Shop | None:
         """Selling an item and adding it to the shop.
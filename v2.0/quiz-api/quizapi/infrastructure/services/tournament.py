@@ -1,9 +1,17 @@
 """Module containing tournament service implementation."""
 
-from typing import Iterable
-from quizapi.core.domain.tournament import Tournament, TournamentIn
+from uuid import UUID
+
+from quizapi.core.domain.tournament import (
+    StandingsScoring,
+    Tournament,
+    TournamentIn,
+    TournamentParticipant,
+)
 from quizapi.core.repositories.itournament import ITournamentRepository
-from quizapi.infrastructure.dto.tournamentdto import TournamentDTO
+from quizapi.infrastructure.dto.tournamentdto import ParticipantDTO, StandingDTO, TournamentDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
+from quizapi.infrastructure.utils import consts
 from quizapi.infrastructure.services.itournament import ITournamentService
 from pydantic import UUID4
 
@@ -20,13 +28,19 @@ class TournamentService(ITournamentService):
         """
         self._repository = repository
 
-    async def get_all_tournaments(self) -> Iterable[TournamentDTO]:
+    async def get_all_tournaments(self, limit: int, after: int = 0) -> PageDTO[TournamentDTO]:
         """The abstract getting all tournaments from the repository.
 
+        Args:
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The ID after which the page starts. Defaults to 0.
+
         Returns:
-            Iterable[TournamentDTO]: A collection of all tournaments.
+            PageDTO[TournamentDTO]: The page of tournaments with the cursor of the next one.
         """
-        return await self._repository.get_all_tournaments()
+        limit = max(1, min(limit, consts.MAX_PAGE_SIZE))
+        items = await self._repository.get_all_tournaments(limit=limit + 1, after=after)
+        return PageDTO[TournamentDTO].from_items(list(items), limit)
 
     async def get_tournament_by_id(self, tournament_id: int) -> TournamentDTO | None:
         """The abstract getting a tournament by ID from the repository.
@@ -45,6 +59,9 @@ class TournamentService(ITournamentService):
         Args:
             data (TournamentIn): The tournament data.
 
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
         Returns:
             Tournament | None: The newly created tournament if successful, otherwise None.
         """
@@ -61,6 +78,9 @@ class TournamentService(ITournamentService):
             tournament_id (int): The ID of the tournament.
             data (TournamentIn): The updated tournament data.
 
+        Raises:
+            QuizzesNotFoundError: If any of the quizzes does not exist.
+
         Returns:
             Tournament | None: The updated tournament if successful, otherwise None.
         """
@@ -78,9 +98,9 @@ class TournamentService(ITournamentService):
         Returns:
             bool: Success of the operation.
         """
-        return await self._repository.delete_tournament(tournament_id)
+        return await self._repository.delete_tournament(tournament_id) is not None
 
-    async def join_tournament(self, tournament_id: int, player_uuid: UUID4) -> Tournament:
+    async def join_tournament(self, tournament_id: int, player_uuid: UUID4) -> TournamentParticipant | None:
         """The abstract adding a player to a tournament in the repository.
 
         Args:
@@ -88,11 +108,11 @@ class TournamentService(ITournamentService):
             player_uuid (UUID4): The UUID of the player.
 
         Returns:
-            Tournament: The updated tournament with the player added.
+            TournamentParticipant | None: The new participation if successful.
         """
         return await self._repository.join_tournament(tournament_id, player_uuid)
 
-    async def leave_tournament(self, tournament_id: int, player_uuid: UUID4) -> Tournament:
+    async def leave_tournament(self, tournament_id: int, player_uuid: UUID4) -> TournamentParticipant | None:
         """The abstract removing a player from a tournament in the repository.
 
         Args:
@@ -100,6 +120,60 @@ class TournamentService(ITournamentService):
             player_uuid (UUID4): The UUID of the player.
 
         Returns:
-            Tournament: The updated tournament with the player removed.
+            TournamentParticipant | None: The removed participation if successful.
+        """
+        return await self._repository.leave_tournament(tournament_id, player_uuid)
+
+    async def get_participants(
+            self,
+            tournament_id: int,
+            limit: int,
+            after: UUID | None = None,
+    ) -> PageDTO[ParticipantDTO]:
+        """The abstract getting a page of tournament participants.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            limit (int): The requested page size, capped at the maximum page size.
+            after (UUID | None, optional): The player ID after which the page starts.
+                Defaults to None.
+
+        Returns:
+            PageDTO[ParticipantDTO]: The page of participants with the cursor of the next one.
         """
-        return await self._repository.leave_tournament(tournament_id, player_uuid)
\ No newline at end of file
+        limit = max(1, min(limit, consts.MAX_PAGE_SIZE))
+        items = await self._repository.get_participants(
+            tournament_id=tournament_id,
+            limit=limit + 1,
+            after=after,
+        )
+        return PageDTO[ParticipantDTO].from_items(list(items), limit)
+
+    async def get_standings(
+            self,
+            tournament_id: int,
+            scoring: StandingsScoring,
+            limit: int,
+            after: int = 0,
+    ) -> PageDTO[StandingDTO]:
+        """The abstract getting a page of tournament standings.
+
+        The whole ranking is computed by the repository at once, so the
+        pages are slices of it and the cursor is the rank of the last item.
+
+        Args:
+            tournament_id (int): The ID of the tournament.
+            scoring (StandingsScoring): The scoring of the best attempts.
+            limit (int): The requested page size, capped at the maximum page size.
+            after (int, optional): The rank after which the page starts. Defaults to 0.
+
+        Returns:
+            PageDTO[StandingDTO]: The page of standings with the cursor of the next one.
+        """
+        limit = max(1, min(limit, consts.MAX_PAGE_SIZE))
+        standings = await self._repository.get_standings(
+            tournament_id=tournament_id,
+            scoring=scoring,
+        )
+        items = standings[after:after + limit + 1]
+        return PageDTO[StandingDTO].from_items(items, limit, cursor_field="rank")
@@ -0,0 +1,49 @@
+"""A module containing pre-serialized quiz bundles."""
+
+import hashlib
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+
+class QuizBundle(NamedTuple):
+    """A class representing a serialized quiz bundle with its entity tag.
+
+    The bundle is cached and served as is, so the tag only has to be
+    computed once per change of the quiz or its questions.
+    """
+    content: bytes
+    etag: str
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "QuizBundle":
+        """A method serializing a model and tagging it with the hash of its bytes.
+
+        Args:
+            model (BaseModel): The model to serialize.
+
+        Returns:
+            QuizBundle: The serialized bundle with its strong entity tag.
+        """
+        content = model.model_dump_json().encode()
+        return cls(content, f'"{hashlib.sha256(content).hexdigest()}"')
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """A method checking if the client already holds the bundle.
+
+        `If-None-Match` uses the weak comparison, so the `W/` prefix of
+        the listed tags is ignored.
+
+        Args:
+            if_none_match (str | None): The `If-None-Match` request header.
+
+        Returns:
+            bool: True if the listed tags include the tag of the bundle.
+        """
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or tag.removeprefix("W/") == self.etag:
+                return True
+        return False
@@ -1,5 +1,14 @@
 """A module containing constant values for infrastructure layer."""
 
 EXPIRATION_MINUTES = 60
+REFRESH_EXPIRATION_DAYS = 30
 SECRET_KEY = "s3cr3t"
-ALGORITHM = "HS256"
\ No newline at end of file
+ALGORITHM = "HS256"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+DEFAULT_LEADERBOARD_SIZE = 10
+
+EXPORT_CHUNK_SIZE = 1000
+
+REWARD_MIN_EFFECTIVENESS = 0.75
+REWARD_VALUE_PER_QUESTION = 10
@@ -0,0 +1,43 @@
+"""A module containing the grading of quiz submissions."""
+
+from typing import Iterable, Mapping, NamedTuple
+
+from quizapi.core.domain.history import AnswerIn
+
+
+class AnswerKey(NamedTuple):
+    """A class representing the correct options of the questions of a quiz.
+
+    The key is cached and shared between requests, so it must not be
+    mutated after it was built.
+    """
+    correct_options: Mapping[int, str]
+
+    @property
+    def total_questions(self) -> int:
+        """The number of questions of the quiz."""
+        return len(self.correct_options)
+
+    def grade(self, answers: Iterable[AnswerIn]) -> int:
+        """A method counting the correct answers of a submission.
+
+        Only the first answer to every question counts and answers to
+        questions from outside of the quiz are ignored.
+
+        Args:
+            answers (Iterable[AnswerIn]): The submitted answers.
+
+        Returns:
+            int: The number of correctly answered questions.
+        """
+        correct_options = self.correct_options
+        graded: set[int] = set()
+        correct_answers = 0
+        for answer in answers:
+            question_id = answer.question_id
+            if question_id in graded:
+                continue
+            graded.add(question_id)
+            if correct_options.get(question_id) == answer.chosen_option:
+                correct_answers += 1
+        return correct_answers
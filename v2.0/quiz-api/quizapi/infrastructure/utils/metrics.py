@@ -0,0 +1,168 @@
+"""A module containing in-process metrics exposed in the Prometheus text format."""
+
+from bisect import bisect_left
+from typing import Iterable, Iterator, NamedTuple
+
+DURATION_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+BUCKET_LABELS = (*(str(bound) for bound in DURATION_BUCKETS), "+Inf")
+
+
+class Sample(NamedTuple):
+    """A class representing a value read when the metrics are scraped."""
+    name: str
+    help: str
+    type: str
+    value: float
+
+
+class Histogram:
+    """A class counting observed durations in fixed buckets.
+
+    Only the bucket of every observation is incremented, the counts are
+    accumulated when the histogram is rendered.
+    """
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self):
+        """The initializer of the `histogram`."""
+        self.counts = [0] * len(BUCKET_LABELS)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """A method recording a single observation.
+
+        Args:
+            value (float): The observed duration in seconds.
+        """
+        self.counts[bisect_left(DURATION_BUCKETS, value)] += 1
+        self.total += value
+
+    def render(self, name: str, labels: str) -> Iterator[str]:
+        """A method rendering the histogram series.
+
+        Args:
+            name (str): The name of the metric.
+            labels (str): The rendered labels of the series.
+
+        Yields:
+            str: The consecutive lines of the series.
+        """
+        bucket_labels = f"{labels}," if labels else ""
+        label_set = f"{{{labels}}}" if labels else ""
+        cumulative = 0
+        for bound, count in zip(BUCKET_LABELS, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{bucket_labels}le="{bound}"}} {cumulative}'
+        yield f"{name}_sum{label_set} {self.total}"
+        yield f"{name}_count{label_set} {cumulative}"
+
+
+class RouteStats:
+    """A class collecting the durations and statuses of a single route."""
+
+    __slots__ = ("durations", "statuses")
+
+    def __init__(self):
+        """The initializer of the `route stats`."""
+        self.durations = Histogram()
+        self.statuses: dict[int, int] = {}
+
+
+class MetricsRegistry:
+    """A class collecting request and database metrics of the worker process.
+
+    Every worker keeps its own registry, so a scrape only reports the
+    worker which served it. Recording never yields to the event loop, so
+    no locking is needed.
+    """
+
+    def __init__(self):
+        """The initializer of the `metrics registry`."""
+        self._routes: dict[tuple[str, str], RouteStats] = {}
+        self._statement_durations: dict[str, Histogram] = {}
+        self._pool_acquire_durations = Histogram()
+
+    def observe_request(self, method: str, route: str, status: int, duration: float) -> None:
+        """A method recording a served request.
+
+        Args:
+            method (str): The HTTP method of the request.
+            route (str): The path template of the matched route.
+            status (int): The status of the response.
+            duration (float): The time spent serving the request in seconds.
+        """
+        key = (method, route)
+        stats = self._routes.get(key)
+        if stats is None:
+            stats = self._routes[key] = RouteStats()
+        stats.durations.observe(duration)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def observe_statement(self, name: str, acquire: float, duration: float) -> None:
+        """A method recording an executed repository statement.
+
+        Args:
+            name (str): The name of the statement.
+            acquire (float): The time spent waiting for a connection in seconds.
+            duration (float): The time spent running the statement in seconds.
+        """
+        histogram = self._statement_durations.get(name)
+        if histogram is None:
+            histogram = self._statement_durations[name] = Histogram()
+        histogram.observe(duration)
+        self._pool_acquire_durations.observe(acquire)
+
+    def render(self, samples: Iterable[Sample] = ()) -> str:
+        """A method rendering all metrics in the Prometheus text format.
+
+        Args:
+            samples (Iterable[Sample], optional): The values read at scrape time.
+                Defaults to no values.
+
+        Returns:
+            str: The rendered metrics.
+        """
+        lines = [
+            "# HELP quizapi_http_request_duration_seconds Time spent serving requests.",
+            "# TYPE quizapi_http_request_duration_seconds histogram",
+        ]
+        for (method, route), stats in self._routes.items():
+            lines.extend(stats.durations.render(
+                "quizapi_http_request_duration_seconds",
+                f'method="{method}",route="{route}"',
+            ))
+
+        lines.append("# HELP quizapi_http_responses_total Responses sent by status.")
+        lines.append("# TYPE quizapi_http_responses_total counter")
+        for (method, route), stats in self._routes.items():
+            for status, count in stats.statuses.items():
+                lines.append(
+                    f'quizapi_http_responses_total{{method="{method}",route="{route}",'
+                    f'status="{status}"}} {count}'
+                )
+
+        lines.append("# HELP quizapi_db_statement_duration_seconds Time spent running statements.")
+        lines.append("# TYPE quizapi_db_statement_duration_seconds histogram")
+        for name, histogram in self._statement_durations.items():
+            lines.extend(histogram.render(
+                "quizapi_db_statement_duration_seconds",
+                f'statement="{name}"',
+            ))
+
+        lines.append("# HELP quizapi_db_pool_acquire_seconds Time spent waiting for a connection.")
+        lines.append("# TYPE quizapi_db_pool_acquire_seconds histogram")
+        lines.extend(self._pool_acquire_durations.render("quizapi_db_pool_acquire_seconds", ""))
+
+        for sample in samples:
+            lines.append(f"# HELP {sample.name} {sample.help}")
+            lines.append(f"# TYPE {sample.name} {sample.type}")
+            lines.append(f"{sample.name} {sample.value}")
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+metrics = MetricsRegistry()
@@ -1,11 +1,117 @@
 """A module containing password helper methods."""
 
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 
+from quizapi.config import config
+
 pwd_context = CryptContext(schemes=["bcrypt"])
 
-def hash_password(password: str) -> str:
-    """A function generating hash password.
+
+class PasswordHasherSaturatedError(Exception):
+    """An exception raised when the password hashing queue is full."""
+
+
+class PasswordHasherUnavailableError(Exception):
+    """An exception raised when a password hashing worker died."""
+
+
+class PasswordHasher:
+    """A class running password hashing off the event loop.
+
+    Bcrypt takes hundreds of milliseconds per call and the passlib backends
+    do not reliably release the GIL, so the calls run in a pool of worker
+    processes. The number of calls either running or waiting for a worker
+    is bounded, and calls above that bound are rejected instead of queued.
+
+    A worker dying breaks the whole pool, so the calls pending on it fail
+    and the next call starts a new pool.
+
+    A pool size of 0 runs the calls on the event loop instead, as they ran
+    before the pool. It only serves as the baseline of load tests.
+    """
+
+    def __init__(self, pool_size: int, queue_depth: int):
+        """The initializer of the `password hasher`.
+
+        Args:
+            pool_size (int): The number of worker processes.
+            queue_depth (int): The number of calls allowed to wait for a worker.
+        """
+        self._pool_size = pool_size
+        self._capacity = pool_size + queue_depth
+        self._pending = 0
+        self._executor: Executor | None = None
+
+    @property
+    def pending(self) -> int:
+        """The number of calls running or waiting for a worker."""
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        """A method getting the worker pool, creating it on first use.
+
+        Returns:
+            Executor: The pool of worker processes.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._pool_size,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """A method running the function in the worker pool.
+
+        Args:
+            func (Callable[..., Any]): The module-level function to run.
+
+        Raises:
+            PasswordHasherSaturatedError: If the queue of pending calls is full.
+            PasswordHasherUnavailableError: If a worker died during the call.
+
+        Returns:
+            Any: The result of the function.
+        """
+        if self._pool_size == 0:
+            return func(*args)
+        if self._pending >= self._capacity:
+            raise PasswordHasherSaturatedError("Password hashing queue is full")
+
+        self._pending += 1
+        executor = self._get_executor()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool as error:
+            if self._executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            raise PasswordHasherUnavailableError("Password hashing worker died") from error
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """A method stopping the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    pool_size=config.HASH_POOL_SIZE,
+    queue_depth=config.HASH_QUEUE_DEPTH,
+)
+
+
+def _hash(password: str) -> str:
+    """A function hashing the password inside a worker process.
 
     Args:
         password (str): A raw form of the password.
@@ -15,14 +121,47 @@ def hash_password(password: str) -> str:
     """
     return pwd_context.hash(password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    """A function verifying the password inside a worker process.
+
+    Args:
+        plain_password (str): The raw password.
+        hashed_password (str): The hashed password.
+
+    Returns:
+        bool: True if the password matches the hash, False otherwise.
+    """
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+async def hash_password(password: str) -> str:
+    """A function generating hash password.
+
+    Args:
+        password (str): A raw form of the password.
+
+    Raises:
+        PasswordHasherSaturatedError: If the hashing queue is full.
+        PasswordHasherUnavailableError: If the hashing worker died.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await password_hasher.run(_hash, password)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """A function verifying a password against its hash.
 
     Args:
         plain_password (str): The raw password.
         hashed_password (str): The hashed password.
 
+    Raises:
+        PasswordHasherSaturatedError: If the hashing queue is full.
+        PasswordHasherUnavailableError: If the hashing worker died.
+
     Returns:
         bool: True if the password matches the hash, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return await password_hasher.run(_verify, plain_password, hashed_password)
@@ -0,0 +1,118 @@
+"""A module containing the accounting of statements run within a request."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+
+class QueryBudgetExceededError(Exception):
+    """An exception raised when a block runs more statements than allowed."""
+
+
+class QueryAccount:
+    """A class counting the statements run on behalf of a single request.
+
+    The account is shared by reference with every task spawned by the
+    request, so statements run in child tasks are counted as well. Every
+    statement is also recorded in the enclosing account, if any.
+    """
+
+    __slots__ = ("count", "duration", "statements", "parent")
+
+    def __init__(self, parent: "QueryAccount | None" = None):
+        """The initializer of the `query account`.
+
+        Args:
+            parent (QueryAccount | None, optional): The enclosing account.
+                Defaults to None.
+        """
+        self.count = 0
+        self.duration = 0.0
+        self.statements: dict[str, int] = {}
+        self.parent = parent
+
+    def record(self, name: str, duration: float) -> None:
+        """A method recording a single statement.
+
+        Args:
+            name (str): The name of the statement.
+            duration (float): The time spent running the statement in seconds.
+        """
+        self.count += 1
+        self.duration += duration
+        self.statements[name] = self.statements.get(name, 0) + 1
+        if self.parent is not None:
+            self.parent.record(name, duration)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """A method listing the statements run more times than the threshold.
+
+        Args:
+            threshold (int): The number of runs allowed per statement.
+
+        Returns:
+            dict[str, int]: The number of runs of every repeated statement.
+        """
+        return {
+            name: count
+            for name, count in self.statements.items()
+            if count > threshold
+        }
+
+    def server_timing(self) -> str:
+        """A method rendering the account as a `Server-Timing` header value.
+
+        Returns:
+            str: The header value with the total DB time in milliseconds.
+        """
+        return f'db;dur={self.duration * 1000:.3f};desc="{self.count} queries"'
+
+
+current_account: ContextVar[QueryAccount | None] = ContextVar(
+    "current_account",
+    default=None,
+)
+
+
+def record_statement(name: str, duration: float) -> None:
+    """A function recording a statement in the account of the current request.
+
+    Statements run outside of a request, like migrations, are not counted.
+
+    Args:
+        name (str): The name of the statement.
+        duration (float): The time spent running the statement in seconds.
+    """
+    account = current_account.get()
+    if account is not None:
+        account.record(name, duration)
+
+
+@contextmanager
+def query_budget(limit: int) -> Iterator[QueryAccount]:
+    """A function asserting the number of statements run within a block.
+
+    It lets tests and scripts pin the number of queries an endpoint or
+    a service method may run, e.g. `with query_budget(2): await ...`.
+    The block gets its own account, so statements run before it in the
+    same request do not count against the budget.
+
+    Args:
+        limit (int): The maximum number of statements.
+
+    Raises:
+        QueryBudgetExceededError: If the block ran more statements.
+
+    Yields:
+        QueryAccount: The account of the block.
+    """
+    account = QueryAccount(parent=current_account.get())
+    token = current_account.set(account)
+    try:
+        yield account
+    finally:
+        current_account.reset(token)
+    if account.count > limit:
+        raise QueryBudgetExceededError(
+            f"Ran {account.count} statements, budget is {limit}: {account.statements}"
+        )
@@ -1,5 +1,7 @@
 """A module containing helper functions for token generation."""
 
+import hashlib
+import secrets
 from datetime import datetime, timedelta, timezone
 
 from jose import jwt
@@ -7,6 +9,7 @@ from pydantic import UUID4
 
 from quizapi.infrastructure.utils.consts import (
     EXPIRATION_MINUTES,
+    REFRESH_EXPIRATION_DAYS,
     ALGORITHM,
     SECRET_KEY,
 )
@@ -25,4 +28,29 @@ def generate_player_token(player_uuid: UUID4) -> dict:
     jwt_data = {"sub": str(player_uuid), "exp": expire, "type": "confirmation"}
     encoded_jwt = jwt.encode(jwt_data, key=SECRET_KEY, algorithm=ALGORITHM)
 
-    return {"player_token": encoded_jwt, "expires": expire}
\ No newline at end of file
+    return {"player_token": encoded_jwt, "expires": expire}
+
+
+def generate_refresh_token() -> dict:
+    """A function returning a random opaque refresh token.
+
+    Returns:
+        dict: The refresh token details.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_EXPIRATION_DAYS)
+    return {"refresh_token": secrets.token_urlsafe(32), "refresh_expires": expire}
+
+
+def hash_refresh_token(refresh_token: str) -> str:
+    """A function preparing the stored form of a refresh token.
+
+    The tokens are long random strings, so a fast digest is enough and
+    a leaked sessions table does not reveal usable tokens.
+
+    Args:
+        refresh_token (str): The raw refresh token.
+
+    Returns:
+        str: The hex digest of the token.
+    """
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
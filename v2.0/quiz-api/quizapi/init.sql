@@ -14,6 +14,10 @@ INSERT INTO questions (question_text, option_one, option_two, option_three, opti
 
 INSERT INTO history (player_id, quiz_id, total_questions, correct_answers, effectiveness, timestamp) VALUES ((SELECT id FROM players WHERE username = 'Bartek'), (SELECT id FROM quizzes WHERE title = 'Matematyka dla początkujących'), 10, 8, 80.0, '2025-01-07T17:51:52.630Z'), ((SELECT id FROM players WHERE username = 'Filip'), (SELECT id FROM quizzes WHERE title = 'Historia Polski'), 12, 9, 75.0, '2025-01-07T18:15:32.125Z'), ((SELECT id FROM players WHERE username = 'Kinga'), (SELECT id FROM quizzes WHERE title = 'Quiz o zwierzętach'), 15, 14, 93.3, '2025-01-07T19:30:45.555Z'), ((SELECT id FROM players WHERE username = 'Bartek'), (SELECT id FROM quizzes WHERE title = 'Historia Polski'), 12, 10, 83.3, '2025-01-07T20:00:10.777Z'), ((SELECT id FROM players WHERE username = 'Filip'), (SELECT id FROM quizzes WHERE title = 'Quiz o zwierzętach'), 15, 12, 80.0, '2025-01-07T21:45:22.999Z'), ((SELECT id FROM players WHERE username = 'Kinga'), (SELECT id FROM quizzes WHERE title = 'Matematyka dla początkujących'), 10, 9, 90.0, '2025-01-07T22:10:05.333Z');
 
-INSERT INTO tournaments (name, description, quizzes_id, participants) VALUES('Turniej Matematyczny', 'Turniej dla fanów matematyki', ARRAY[(SELECT id FROM quizzes WHERE title = 'Matematyka dla początkujących')], ARRAY[(SELECT id FROM players WHERE username = 'Bartek')]), ('Turniej Historyczny', 'Kto zna historię najlepiej?', ARRAY[(SELECT id FROM quizzes WHERE title = 'Historia Polski')], ARRAY[(SELECT id FROM players WHERE username = 'Filip')]), ('Turniej Przyrodniczy', 'Zmagania o tytuł eksperta przyrody', ARRAY[(SELECT id FROM quizzes WHERE title = 'Quiz o zwierzętach')], ARRAY[(SELECT id FROM players WHERE username = 'Kinga')]);
+INSERT INTO best_attempts (quiz_id, player_id, history_id, effectiveness, timestamp) SELECT DISTINCT ON (quiz_id, player_id) quiz_id, player_id, id, effectiveness, timestamp FROM history ORDER BY quiz_id, player_id, effectiveness DESC, timestamp ASC, id ASC;
+
+INSERT INTO tournaments (name, description, quizzes_id) VALUES('Turniej Matematyczny', 'Turniej dla fanów matematyki', ARRAY[(SELECT id FROM quizzes WHERE title = 'Matematyka dla początkujących')]), ('Turniej Historyczny', 'Kto zna historię najlepiej?', ARRAY[(SELECT id FROM quizzes WHERE title = 'Historia Polski')]), ('Turniej Przyrodniczy', 'Zmagania o tytuł eksperta przyrody', ARRAY[(SELECT id FROM quizzes WHERE title = 'Quiz o zwierzętach')]);
+
+INSERT INTO tournament_participants (tournament_id, player_id) VALUES((SELECT id FROM tournaments WHERE name = 'Turniej Matematyczny'), (SELECT id FROM players WHERE username = 'Bartek')), ((SELECT id FROM tournaments WHERE name = 'Turniej Historyczny'), (SELECT id FROM players WHERE username = 'Filip')), ((SELECT id FROM tournaments WHERE name = 'Turniej Przyrodniczy'), (SELECT id FROM players WHERE username = 'Kinga'));
 
 INSERT INTO rewards (quiz_id, player_id, reward, value) VALUES ((SELECT id FROM quizzes WHERE title = 'Matematyka dla początkujących'), (SELECT id FROM players WHERE username = 'Bartek'),(SELECT reward FROM quizzes WHERE title = 'Matematyka dla początkujących'),30), ((SELECT id FROM quizzes WHERE title = 'Historia Polski'), (SELECT id FROM players WHERE username = 'Filip'), (SELECT reward FROM quizzes WHERE title = 'Historia Polski'),30), ((SELECT id FROM quizzes WHERE title = 'Quiz o zwierzętach'), (SELECT id FROM players WHERE username = 'Kinga'), (SELECT reward FROM quizzes WHERE title = 'Quiz o zwierzętach'),30);
\ No newline at end of file
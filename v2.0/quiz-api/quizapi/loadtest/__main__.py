@@ -0,0 +1,121 @@
+"""A module running the load test from the command line.
+
+The app is called in the same process, with its lifespan connecting
+the database and running the migrations. The summary is printed as JSON
+with sorted keys, so runs of two commits can be diffed.
+
+Example:
+    python -m quizapi.loadtest --preset small --sessions 500 --output before.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from quizapi.datagen.generator import DatasetNotEmptyError, load_dataset
+from quizapi.datagen.presets import PRESETS
+from quizapi.db import database
+from quizapi.loadtest.runner import run_load
+from quizapi.loadtest.scenarios import DEFAULT_MIX, SCENARIOS
+from quizapi.main import app
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """A function parsing the weights of the scenarios.
+
+    Args:
+        value (str): The weights, e.g. `player=6,trader=1`.
+
+    Raises:
+        argparse.ArgumentTypeError: If a scenario or a weight is invalid.
+
+    Returns:
+        dict[str, int]: The weights of the scenarios.
+    """
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS or not weight.isdigit():
+            raise argparse.ArgumentTypeError(
+                f"expected scenario=weight with one of {', '.join(SCENARIOS)}, got {item!r}"
+            )
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("at least one scenario needs a positive weight")
+    return mix
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Function optionally loading the dataset and running the load test.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        int: The exit status of the command.
+    """
+    size = PRESETS[args.preset]
+    async with app.router.lifespan_context(app):
+        if args.load_dataset:
+            try:
+                async with database.connection() as connection:
+                    await load_dataset(
+                        connection.raw_connection,
+                        size,
+                        seed=args.dataset_seed,
+                        truncate=args.truncate,
+                    )
+            except DatasetNotEmptyError as error:
+                print(error, file=sys.stderr)
+                return 1
+
+        summary = await run_load(
+            app,
+            size,
+            args.mix,
+            sessions=args.sessions,
+            concurrency=args.concurrency,
+            seed=args.seed,
+        )
+
+    summary["settings"]["preset"] = args.preset
+    report = json.dumps(summary, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(report + "\n")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play scripted player sessions against the app.")
+    parser.add_argument(
+        "--preset",
+        choices=PRESETS,
+        default="small",
+        help="size of the loaded dataset",
+    )
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="weights of the scenarios, e.g. newcomer=1,player=6,collector=2,trader=1 or browser=1,login=1",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--load-dataset",
+        action="store_true",
+        help="load the dataset of the preset before the run",
+    )
+    parser.add_argument("--dataset-seed", type=int, default=0)
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="remove all data before loading the dataset",
+    )
+    parser.add_argument("--output", help="file the JSON summary is written to")
+    sys.exit(asyncio.run(main(parser.parse_args())))
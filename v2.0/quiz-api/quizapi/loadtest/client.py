@@ -0,0 +1,121 @@
+"""A module containing the client calling the ASGI app in the same process."""
+
+import asyncio
+import json
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
+
+from starlette.types import ASGIApp, Message
+
+
+class Response(NamedTuple):
+    """A class representing a response received from the app."""
+    status: int
+    headers: dict[str, str]
+    content: bytes
+
+    def json(self) -> Any:
+        """A method decoding the JSON body of the response.
+
+        Returns:
+            Any: The decoded body.
+        """
+        return json.loads(self.content)
+
+
+class ASGIClient:
+    """A class sending requests straight to an ASGI app.
+
+    Requests skip the network and the HTTP server, so the measured
+    latency is the time spent in the middleware, routers, services
+    and the database.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """The initializer of the `ASGI client`.
+
+        Args:
+            app (ASGIApp): The called application.
+        """
+        self.app = app
+
+    async def request(
+            self,
+            method: str,
+            path: str,
+            body: Any = None,
+            token: str | None = None,
+            query: dict[str, Any] | None = None,
+    ) -> Response:
+        """A method sending a single request to the app.
+
+        Args:
+            method (str): The HTTP method of the request.
+            path (str): The path of the request.
+            body (Any, optional): The JSON body of the request. Defaults to None.
+            token (str | None, optional): The bearer token. Defaults to None.
+            query (dict[str, Any] | None, optional): The query parameters.
+                Defaults to None.
+
+        Raises:
+            Exception: If the app failed before starting the response.
+
+        Returns:
+            Response: The response of the app.
+        """
+        content = json.dumps(body).encode() if body is not None else b""
+        headers = [
+            (b"host", b"loadtest"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(content)).encode()),
+        ]
+        if token:
+            headers.append((b"authorization", f"Bearer {token}".encode()))
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": urlencode(query or {}).encode(),
+            "headers": headers,
+            "client": ("127.0.0.1", 0),
+            "server": ("loadtest", 80),
+        }
+        request_sent = False
+        disconnected = asyncio.Event()
+        messages: list[Message] = []
+
+        async def receive() -> Message:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": content, "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            messages.append(message)
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            if not any(message["type"] == "http.response.start" for message in messages):
+                raise
+        finally:
+            disconnected.set()
+
+        start = next(message for message in messages if message["type"] == "http.response.start")
+        return Response(
+            status=start["status"],
+            headers={key.decode(): value.decode() for key, value in start.get("headers", ())},
+            content=b"".join(
+                message.get("body", b"")
+                for message in messages
+                if message["type"] == "http.response.body"
+            ),
+        )
@@ -0,0 +1,69 @@
+"""A module running scripted player sessions against the app."""
+
+import asyncio
+import random
+from time import perf_counter
+from typing import Any
+
+from starlette.types import ASGIApp
+
+from quizapi.datagen.presets import DatasetSize
+from quizapi.loadtest.client import ASGIClient
+from quizapi.loadtest.scenarios import SCENARIOS, Session, quiz_popularity
+from quizapi.loadtest.stats import LoadStats
+
+
+async def run_load(
+        app: ASGIApp,
+        size: DatasetSize,
+        mix: dict[str, int],
+        sessions: int,
+        concurrency: int,
+        seed: int,
+) -> dict[str, Any]:
+    """A function playing sessions against the app and summarizing them.
+
+    The scenario of every session is drawn up front from the mix, and
+    every session gets its own random generator, so the same seed plays
+    the same sessions regardless of their interleaving.
+
+    Args:
+        app (ASGIApp): The application, with its database connected.
+        size (DatasetSize): The size of the loaded dataset.
+        mix (dict[str, int]): The weights of the scenarios.
+        sessions (int): The number of sessions to play.
+        concurrency (int): The number of sessions played at once.
+        seed (int): The seed of the run.
+
+    Returns:
+        dict[str, Any]: The summary of the run.
+    """
+    rng = random.Random(seed)
+    quiz_ranks, quiz_weights = quiz_popularity(size, rng)
+    scenarios = rng.choices(list(mix), weights=list(mix.values()), k=sessions)
+    queue = [
+        (name, random.Random(rng.getrandbits(64)))
+        for name in scenarios
+    ]
+    queue.reverse()
+
+    client = ASGIClient(app)
+    stats = LoadStats()
+
+    async def worker() -> None:
+        while queue:
+            name, session_rng = queue.pop()
+            session = Session(client, stats, size, quiz_ranks, quiz_weights, session_rng)
+            await SCENARIOS[name](session)
+            stats.record_session(name)
+
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - started
+
+    return stats.summary(elapsed, {
+        "sessions": sessions,
+        "concurrency": concurrency,
+        "mix": mix,
+        "seed": seed,
+    })
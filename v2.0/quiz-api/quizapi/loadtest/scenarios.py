@@ -0,0 +1,298 @@
+"""A module containing the scripted sessions of players.
+
+Every scenario is a coroutine playing a single session with its own
+random generator. The generated players and quizzes are the ones of the
+dataset loaded by `quizapi.datagen` with the same size.
+"""
+
+import random
+import uuid
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterable
+
+from quizapi.datagen.generator import (
+    QUIZ_POPULARITY_EXPONENT,
+    player_credentials,
+    zipf_weights,
+)
+from quizapi.datagen.presets import DatasetSize
+from quizapi.loadtest.client import ASGIClient, Response
+from quizapi.loadtest.stats import LoadStats
+
+OPTION_FIELDS = ("option_one", "option_two", "option_three", "option_four")
+
+
+class Session:
+    """A class sending the requests of a single player session.
+
+    Every request is recorded under its path template, and counted as an
+    error unless its status is one the scenario expects.
+    """
+
+    def __init__(
+            self,
+            client: ASGIClient,
+            stats: LoadStats,
+            size: DatasetSize,
+            quiz_ranks: list[int],
+            quiz_weights: list[float],
+            rng: random.Random,
+    ):
+        """The initializer of the `session`.
+
+        Args:
+            client (ASGIClient): The client calling the app.
+            stats (LoadStats): The statistics of the run.
+            size (DatasetSize): The size of the loaded dataset.
+            quiz_ranks (list[int]): The quiz IDs ordered by popularity.
+            quiz_weights (list[float]): The cumulative weights of the ranks.
+            rng (random.Random): The random generator of the session.
+        """
+        self.client = client
+        self.stats = stats
+        self.size = size
+        self.quiz_ranks = quiz_ranks
+        self.quiz_weights = quiz_weights
+        self.rng = rng
+        self.token: str | None = None
+
+    async def request(
+            self,
+            method: str,
+            template: str,
+            body: Any = None,
+            query: dict[str, Any] | None = None,
+            expected: Iterable[int] = (200,),
+            **params: Any,
+    ) -> Response:
+        """A method sending a request on behalf of the player.
+
+        Args:
+            method (str): The HTTP method of the request.
+            template (str): The path template of the endpoint.
+            body (Any, optional): The JSON body of the request. Defaults to None.
+            query (dict[str, Any] | None, optional): The query parameters.
+                Defaults to None.
+            expected (Iterable[int], optional): The statuses which are not
+                errors. Defaults to 200 only.
+            **params (Any): The values of the path parameters.
+
+        Returns:
+            Response: The response of the app.
+        """
+        started = perf_counter()
+        response = await self.client.request(
+            method,
+            template.format(**params),
+            body=body,
+            token=self.token,
+            query=query,
+        )
+        self.stats.record(
+            f"{method} {template}",
+            response.status,
+            perf_counter() - started,
+            response.status not in expected,
+        )
+        return response
+
+    def pick_quiz(self) -> int:
+        """A method drawing a quiz, favouring the popular ones.
+
+        Returns:
+            int: The ID of the quiz.
+        """
+        return self.rng.choices(self.quiz_ranks, cum_weights=self.quiz_weights)[0]
+
+    async def register(self) -> bool:
+        """A method registering a new player and logging in as them.
+
+        Returns:
+            bool: Whether the player got a token.
+        """
+        name = f"loadtest-{uuid.UUID(int=self.rng.getrandbits(128), version=4).hex}"
+        credentials = {"username": name, "email": f"{name}@example.com", "password": name}
+        response = await self.request("POST", "/player/register", body=credentials, expected=(201,))
+        if response.status != 201:
+            return False
+        return await self.log_in(credentials)
+
+    async def log_in(self, credentials: dict[str, str] | None = None) -> bool:
+        """A method logging in as a player.
+
+        Args:
+            credentials (dict[str, str] | None, optional): The credentials
+                of the player. Defaults to a random generated player.
+
+        Returns:
+            bool: Whether the player got a token.
+        """
+        if credentials is None:
+            username, email, password = player_credentials(self.rng.randrange(self.size.players))
+            credentials = {"username": username, "email": email, "password": password}
+        response = await self.request("POST", "/player/token", body=credentials)
+        if response.status != 200:
+            return False
+        self.token = response.json()["player_token"]
+        return True
+
+    async def play(self) -> int | None:
+        """A method reading a quiz with its questions and submitting answers.
+
+        The correct options are not shown to the players, so every answer
+        is a random choice graded by the server.
+
+        Returns:
+            int | None: The ID of the played quiz, or None if it failed.
+        """
+        quiz_id = self.pick_quiz()
+        response = await self.request("GET", "/quiz/{quiz_id}", quiz_id=quiz_id)
+        if response.status != 200:
+            return None
+        response = await self.request("GET", "/question/quiz/{quiz_id}", quiz_id=quiz_id)
+        if response.status != 200:
+            return None
+
+        submission = {
+            "quiz_id": quiz_id,
+            "answers": [
+                {
+                    "question_id": question["id"],
+                    "chosen_option": question[self.rng.choice(OPTION_FIELDS)],
+                }
+                for question in response.json()
+            ],
+        }
+        response = await self.request("POST", "/history/grade", body=submission, expected=(201,))
+        return quiz_id if response.status == 201 else None
+
+    async def collect(self, quiz_id: int) -> int | None:
+        """A method collecting the reward of a quiz.
+
+        A reward not earned or collected earlier by the player is not an error.
+
+        Args:
+            quiz_id (int): The ID of the quiz.
+
+        Returns:
+            int | None: The ID of the collected reward, or None if not collected.
+        """
+        response = await self.request(
+            "POST",
+            "/reward/collect",
+            body={"quiz_id": quiz_id},
+            expected=(201, 400),
+        )
+        return response.json()["id"] if response.status == 201 else None
+
+    async def buy(self) -> None:
+        """A method buying a random item of the first shop page.
+
+        Items sold out by other sessions and missing funds are not errors.
+        """
+        response = await self.request("GET", "/shop/all", query={"limit": 50})
+        if response.status != 200:
+            return
+        items = response.json()["items"]
+        if items:
+            await self.request(
+                "POST",
+                "/shop/buy/{shop_id}",
+                expected=(200, 400),
+                shop_id=self.rng.choice(items)["id"],
+            )
+
+
+async def newcomer(session: Session) -> None:
+    """A scenario of a new player registering and playing their first quiz.
+
+    Args:
+        session (Session): The session of the player.
+    """
+    if await session.register():
+        await session.play()
+
+
+async def player(session: Session) -> None:
+    """A scenario of a returning player playing a few quizzes.
+
+    Args:
+        session (Session): The session of the player.
+    """
+    if await session.log_in():
+        for _ in range(session.rng.randint(1, 3)):
+            await session.play()
+
+
+async def collector(session: Session) -> None:
+    """A scenario of a returning player playing a quiz and collecting its reward.
+
+    Args:
+        session (Session): The session of the player.
+    """
+    if await session.log_in():
+        if quiz_id := await session.play():
+            await session.collect(quiz_id)
+
+
+async def trader(session: Session) -> None:
+    """A scenario of a returning player selling a new reward and buying another.
+
+    Args:
+        session (Session): The session of the player.
+    """
+    if not await session.log_in():
+        return
+    if quiz_id := await session.play():
+        if reward_id := await session.collect(quiz_id):
+            await session.request("POST", "/shop/sell/{reward_id}", reward_id=reward_id)
+    await session.buy()
+
+
+async def browser(session: Session) -> None:
+    """A scenario of a visitor browsing the quizzes without logging in.
+
+    Args:
+        session (Session): The session of the visitor.
+    """
+    for _ in range(session.rng.randint(1, 3)):
+        await session.request("GET", "/quiz/all")
+
+
+async def login(session: Session) -> None:
+    """A scenario of a returning player only logging in, as at the start
+    of a tournament.
+
+    Args:
+        session (Session): The session of the player.
+    """
+    await session.log_in()
+
+
+SCENARIOS: dict[str, Callable[[Session], Awaitable[None]]] = {
+    "newcomer": newcomer,
+    "player": player,
+    "collector": collector,
+    "trader": trader,
+    "browser": browser,
+    "login": login,
+}
+
+DEFAULT_MIX = {"newcomer": 1, "player": 6, "collector": 2, "trader": 1}
+
+
+def quiz_popularity(size: DatasetSize, rng: random.Random) -> tuple[list[int], list[float]]:
+    """A function ranking the quizzes by popularity.
+
+    Args:
+        size (DatasetSize): The size of the loaded dataset.
+        rng (random.Random): The random generator of the run.
+
+    Returns:
+        tuple[list[int], list[float]]: The quiz IDs ordered by rank and
+            the cumulative weights of the ranks.
+    """
+    return (
+        rng.sample(range(1, size.quizzes + 1), size.quizzes),
+        zipf_weights(size.quizzes, QUIZ_POPULARITY_EXPONENT),
+    )
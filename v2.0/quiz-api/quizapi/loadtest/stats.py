@@ -0,0 +1,123 @@
+"""A module containing the latency and error statistics of a load test."""
+
+from math import ceil
+from typing import Any, Sequence
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: Sequence[float], rank: float) -> float:
+    """A function getting a nearest-rank percentile of sorted values.
+
+    Args:
+        values (Sequence[float]): The sorted values.
+        rank (float): The percentile between 0 and 100.
+
+    Returns:
+        float: The percentile, or 0 if there are no values.
+    """
+    if not values:
+        return 0.0
+    return values[max(0, ceil(rank / 100 * len(values)) - 1)]
+
+
+class EndpointStats:
+    """A class collecting the requests sent to a single endpoint."""
+
+    __slots__ = ("durations", "statuses", "errors")
+
+    def __init__(self):
+        """The initializer of the `endpoint stats`."""
+        self.durations: list[float] = []
+        self.statuses: dict[int, int] = {}
+        self.errors = 0
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        """A method summarizing the requests of the endpoint.
+
+        Args:
+            elapsed (float): The duration of the whole run in seconds.
+
+        Returns:
+            dict[str, Any]: The request count, throughput, error rate,
+                statuses and latency percentiles in milliseconds.
+        """
+        durations = sorted(self.durations)
+        count = len(durations)
+        return {
+            "requests": count,
+            "throughput": round(count / elapsed, 3) if elapsed else 0.0,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "statuses": {str(status): number for status, number in self.statuses.items()},
+            "latency_ms": {
+                **{
+                    f"p{rank}": round(percentile(durations, rank) * 1000, 3)
+                    for rank in PERCENTILES
+                },
+                "max": round(durations[-1] * 1000, 3) if durations else 0.0,
+            },
+        }
+
+
+class LoadStats:
+    """A class collecting the requests of a load test per endpoint.
+
+    Endpoints are keyed by the method and the path template, so requests
+    to different quizzes share the same series.
+    """
+
+    def __init__(self):
+        """The initializer of the `load stats`."""
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.sessions: dict[str, int] = {}
+
+    def record(self, endpoint: str, status: int, duration: float, error: bool) -> None:
+        """A method recording a single request.
+
+        Args:
+            endpoint (str): The method and the path template of the request.
+            status (int): The status of the response.
+            duration (float): The latency of the request in seconds.
+            error (bool): Whether the status was not expected by the scenario.
+        """
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        stats.durations.append(duration)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        stats.errors += error
+
+    def record_session(self, scenario: str) -> None:
+        """A method recording a completed session.
+
+        Args:
+            scenario (str): The name of the scenario of the session.
+        """
+        self.sessions[scenario] = self.sessions.get(scenario, 0) + 1
+
+    def summary(self, elapsed: float, settings: dict[str, Any]) -> dict[str, Any]:
+        """A method summarizing the whole load test.
+
+        Args:
+            elapsed (float): The duration of the whole run in seconds.
+            settings (dict[str, Any]): The settings of the run.
+
+        Returns:
+            dict[str, Any]: The summary ready to be dumped as JSON.
+        """
+        requests = sum(len(stats.durations) for stats in self.endpoints.values())
+        errors = sum(stats.errors for stats in self.endpoints.values())
+        return {
+            "settings": settings,
+            "elapsed_s": round(elapsed, 3),
+            "sessions": self.sessions,
+            "requests": requests,
+            "throughput": round(requests / elapsed, 3) if elapsed else 0.0,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "endpoints": {
+                endpoint: stats.summary(elapsed)
+                for endpoint, stats in self.endpoints.items()
+            },
+        }
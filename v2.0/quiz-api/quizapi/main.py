@@ -6,7 +6,10 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
 
+from quizapi.config import config
 from quizapi.container import Container
+from quizapi.api.utils.metrics import MetricsMiddleware
+from quizapi.api.routers.metrics import router as metrics_router
 from quizapi.api.routers.player import router as player_router
 from quizapi.api.routers.question import router as question_router
 from quizapi.api.routers.quiz import router as quiz_router
@@ -16,6 +19,8 @@ from quizapi.api.routers.reward import router as reward_router
 from quizapi.api.routers.shop import router as shop_router
 from quizapi.db import database
 from quizapi.db import init_db
+from quizapi.migrations import migrate
+from quizapi.infrastructure.utils.password import password_hasher
 
 container = Container()
 container.wire(modules=[
@@ -26,15 +31,20 @@ container.wire(modules=[
     "quizapi.api.routers.tournament",
     "quizapi.api.routers.reward",
     "quizapi.api.routers.shop",
+    "quizapi.api.routers.metrics",
 ])
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
-    await init_db()
-    await database.connect()
+    uses_database = config.REPOSITORY_BACKEND == "postgres"
+    if uses_database:
+        await init_db()
+        await migrate()
     yield
-    await database.disconnect()
+    if uses_database:
+        await database.disconnect()
+    password_hasher.shutdown()
 
 app = FastAPI(
     title="Quiz API",
@@ -57,6 +67,9 @@ app.include_router(history_router, prefix="/history")
 app.include_router(tournament_router, prefix="/tournament")
 app.include_router(reward_router, prefix="/reward")
 app.include_router(shop_router, prefix="/shop")
+app.include_router(metrics_router, prefix="/metrics")
+
+app.add_middleware(MetricsMiddleware)
 
 @app.exception_handler(HTTPException)
 async def http_exception_handle_logging(
@@ -0,0 +1,560 @@
+"""A module providing versioned schema migrations.
+
+Tables are created from DDL frozen at the time of their migration, so
+later changes of the table definitions in `quizapi.db` never alter what
+an old migration does. Such changes get a migration of their own.
+"""
+
+import logging
+from typing import NamedTuple, Sequence
+
+import sqlalchemy
+from sqlalchemy.sql.expression import Executable
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from quizapi.db import (
+    database,
+    best_attempt_table,
+    history_table,
+    player_session_table,
+    question_table,
+    quiz_table,
+    reward_collection_table,
+    reward_table,
+    shop_table,
+    tournament_participant_table,
+    tournament_table,
+)
+
+MIGRATION_LOCK_KEY = 2_000_001
+
+logger = logging.getLogger(__name__)
+
+schema_version_table = sqlalchemy.Table(
+    "schema_version",
+    sqlalchemy.MetaData(),
+    sqlalchemy.Column("version", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("description", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column(
+        "applied_at",
+        sqlalchemy.DateTime(timezone=True),
+        server_default=sqlalchemy.func.now(),
+    ),
+)
+
+
+class ReportedStatement(NamedTuple):
+    """A class representing a migration statement returning the rows it changed.
+
+    Every returned row is logged as a warning, so data removed or
+    rewritten by a migration stays traceable.
+    """
+    statement: Executable
+    message: str
+
+
+class Migration(NamedTuple):
+    """A class representing a single schema migration."""
+    version: int
+    description: str
+    statements: Sequence[Executable | ReportedStatement]
+
+
+baseline_tables = [
+    sqlalchemy.text(
+        """
+        CREATE TABLE IF NOT EXISTS players (
+            id UUID DEFAULT gen_random_uuid() NOT NULL,
+            username VARCHAR,
+            email VARCHAR,
+            password VARCHAR,
+            balance INTEGER,
+            PRIMARY KEY (id),
+            UNIQUE (username),
+            UNIQUE (email)
+        )
+        """
+    ),
+    sqlalchemy.text(
+        """
+        CREATE TABLE IF NOT EXISTS tournaments (
+            id SERIAL NOT NULL,
+            name VARCHAR,
+            description VARCHAR,
+            quizzes_id INTEGER[] NOT NULL,
+            participants UUID[] NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """
+    ),
+    sqlalchemy.text(
+        """
+        CREATE TABLE IF NOT EXISTS quizzes (
+            id SERIAL NOT NULL,
+            title VARCHAR,
+            player_id UUID NOT NULL,
+            description VARCHAR,
+            shared BOOLEAN,
+            reward VARCHAR NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY (player_id) REFERENCES players (id),
+            UNIQUE (reward)
+        )
+        """
+    ),
+    sqlalchemy.text(
+        """
+        CREATE TABLE IF NOT EXISTS history (
+            id SERIAL NOT NULL,
+            player_id UUID NOT NULL,
+            quiz_id INTEGER,
+            total_questions INTEGER,
+            correct_answers INTEGER,
+            effectiveness FLOAT,
+            timestamp TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (id),
+            FOREIGN KEY (player_id) REFERENCES players (id),
+            FOREIGN KEY (quiz_id) REFERENCES quizzes (id)
+        )
+        """
+    ),
+    sqlalchemy.text(
+        """
+        CREATE TABLE IF NOT EXISTS questions (
+            id SERIAL NOT NULL,
+            question_text VARCHAR,
+            option_one VARCHAR,
+            option_two VARCHAR,
+            option_three VARCHAR,
+            option_four VARCHAR,
+            correct_option VARCHAR,
+            quiz_id INTEGER NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY (quiz_id) REFERENCES quizzes (id)
+        )
+        """
+    ),
+    sqlalchemy.text(
+        """
+        CREATE TABLE IF NOT EXISTS rewards (
+            id SERIAL NOT NULL,
+            quiz_id INTEGER NOT NULL,
+            player_id UUID NOT NULL,
+            reward VARCHAR NOT NULL,
+            value INTEGER NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY (quiz_id) REFERENCES quizzes (id),
+            FOREIGN KEY (player_id) REFERENCES players (id),
+            FOREIGN KEY (reward) REFERENCES quizzes (reward)
+        )
+        """
+    ),
+    sqlalchemy.text(
+        """
+        CREATE TABLE IF NOT EXISTS shops (
+            id SERIAL NOT NULL,
+            name VARCHAR NOT NULL,
+            value INTEGER NOT NULL,
+            quiz_id INTEGER NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY (quiz_id) REFERENCES quizzes (id)
+        )
+        """
+    ),
+]
+
+create_tournament_participants = sqlalchemy.text(
+    """
+    CREATE TABLE IF NOT EXISTS tournament_participants (
+        tournament_id INTEGER NOT NULL,
+        player_id UUID NOT NULL,
+        joined_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+        PRIMARY KEY (tournament_id, player_id),
+        FOREIGN KEY (tournament_id) REFERENCES tournaments (id) ON DELETE CASCADE,
+        FOREIGN KEY (player_id) REFERENCES players (id)
+    )
+    """
+)
+
+create_player_sessions = sqlalchemy.text(
+    """
+    CREATE TABLE IF NOT EXISTS player_sessions (
+        id UUID DEFAULT gen_random_uuid() NOT NULL,
+        player_id UUID NOT NULL,
+        token_hash VARCHAR NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+        expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY (player_id) REFERENCES players (id) ON DELETE CASCADE,
+        UNIQUE (token_hash)
+    )
+    """
+)
+
+create_best_attempts = sqlalchemy.text(
+    """
+    CREATE TABLE IF NOT EXISTS best_attempts (
+        quiz_id INTEGER NOT NULL,
+        player_id UUID NOT NULL,
+        history_id INTEGER NOT NULL,
+        effectiveness FLOAT NOT NULL,
+        timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+        PRIMARY KEY (quiz_id, player_id),
+        FOREIGN KEY (quiz_id) REFERENCES quizzes (id) ON DELETE CASCADE,
+        FOREIGN KEY (player_id) REFERENCES players (id) ON DELETE CASCADE,
+        FOREIGN KEY (history_id) REFERENCES history (id) ON DELETE CASCADE
+    )
+    """
+)
+
+
+foreign_key_indexes = [
+    sqlalchemy.Index(
+        "ix_history_player_id_quiz_id",
+        history_table.c.player_id,
+        history_table.c.quiz_id,
+    ),
+    sqlalchemy.Index("ix_history_quiz_id", history_table.c.quiz_id),
+    sqlalchemy.Index("ix_questions_quiz_id", question_table.c.quiz_id),
+    sqlalchemy.Index("ix_rewards_player_id", reward_table.c.player_id),
+    sqlalchemy.Index("ix_rewards_quiz_id", reward_table.c.quiz_id),
+    sqlalchemy.Index("ix_quizzes_player_id", quiz_table.c.player_id),
+    sqlalchemy.Index("ix_shops_quiz_id", shop_table.c.quiz_id),
+]
+
+tournament_participant_player_index = sqlalchemy.Index(
+    "ix_tournament_participants_player_id",
+    tournament_participant_table.c.player_id,
+)
+
+player_session_player_index = sqlalchemy.Index(
+    "ix_player_sessions_player_id",
+    player_session_table.c.player_id,
+)
+
+best_attempt_ranking_index = sqlalchemy.Index(
+    "ix_best_attempts_quiz_id_ranking",
+    best_attempt_table.c.quiz_id,
+    best_attempt_table.c.effectiveness.desc(),
+    best_attempt_table.c.timestamp,
+    best_attempt_table.c.player_id,
+)
+
+best_attempt_history_index = sqlalchemy.Index(
+    "ix_best_attempts_history_id",
+    best_attempt_table.c.history_id,
+)
+
+best_attempt_player_index = sqlalchemy.Index(
+    "ix_best_attempts_player_id",
+    best_attempt_table.c.player_id,
+)
+
+tournament_quizzes_index = sqlalchemy.Index(
+    "ix_tournaments_quizzes_id",
+    tournament_table.c.quizzes_id,
+    postgresql_using="gin",
+)
+
+reward_collection_index = sqlalchemy.Index(
+    "uq_rewards_player_id_quiz_id",
+    reward_table.c.player_id,
+    reward_table.c.quiz_id,
+    unique=True,
+)
+
+collect_rewards_once = [
+    ReportedStatement(
+        sqlalchemy.text(
+            """
+            WITH removed AS (
+                DELETE FROM rewards
+                USING rewards AS kept
+                WHERE rewards.player_id = kept.player_id
+                AND rewards.quiz_id = kept.quiz_id
+                AND rewards.id > kept.id
+                RETURNING rewards.id, rewards.player_id, rewards.quiz_id, rewards.value
+            ),
+            credited AS (
+                UPDATE players
+                SET balance = coalesce(players.balance, 0) + refund.value
+                FROM (
+                    SELECT player_id, sum(value) AS value
+                    FROM removed
+                    GROUP BY player_id
+                ) AS refund
+                WHERE players.id = refund.player_id
+            )
+            SELECT id, player_id, quiz_id, value FROM removed ORDER BY id
+            """
+        ),
+        "Removed duplicate reward %(id)s of player %(player_id)s for quiz "
+        "%(quiz_id)s, credited %(value)s to the balance",
+    ),
+    CreateIndex(reward_collection_index, if_not_exists=True),
+    sqlalchemy.text("DROP INDEX IF EXISTS ix_rewards_player_id"),
+]
+
+create_reward_collections = sqlalchemy.text(
+    """
+    CREATE TABLE IF NOT EXISTS reward_collections (
+        player_id UUID NOT NULL,
+        quiz_id INTEGER NOT NULL,
+        collected_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+        PRIMARY KEY (player_id, quiz_id),
+        FOREIGN KEY (player_id) REFERENCES players (id) ON DELETE CASCADE,
+        FOREIGN KEY (quiz_id) REFERENCES quizzes (id) ON DELETE CASCADE
+    )
+    """
+)
+
+reward_collection_quiz_index = sqlalchemy.Index(
+    "ix_reward_collections_quiz_id",
+    reward_collection_table.c.quiz_id,
+)
+
+fill_reward_collections = sqlalchemy.text(
+    """
+    INSERT INTO reward_collections (player_id, quiz_id)
+    SELECT DISTINCT player_id, quiz_id
+    FROM rewards
+    ON CONFLICT DO NOTHING
+    """
+)
+
+fill_best_attempts = sqlalchemy.text(
+    """
+    INSERT INTO best_attempts (quiz_id, player_id, history_id, effectiveness, timestamp)
+    SELECT DISTINCT ON (quiz_id, player_id)
+        quiz_id, player_id, id, effectiveness, timestamp
+    FROM history
+    WHERE quiz_id IS NOT NULL
+    AND effectiveness IS NOT NULL
+    AND timestamp IS NOT NULL
+    ORDER BY quiz_id, player_id, effectiveness DESC, timestamp ASC, id ASC
+    ON CONFLICT DO NOTHING
+    """
+)
+
+count_quiz_questions = [
+    sqlalchemy.text(
+        """
+        ALTER TABLE quizzes
+        ADD COLUMN IF NOT EXISTS question_count integer NOT NULL DEFAULT 0
+        """
+    ),
+    sqlalchemy.text(
+        """
+        UPDATE quizzes
+        SET question_count = counted.question_count
+        FROM (
+            SELECT quiz_id, count(*) AS question_count
+            FROM questions
+            GROUP BY quiz_id
+        ) AS counted
+        WHERE quizzes.id = counted.quiz_id
+        """
+    ),
+    sqlalchemy.text(
+        """
+        CREATE OR REPLACE FUNCTION count_quiz_questions() RETURNS trigger AS $count$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE quizzes SET question_count = question_count - 1
+                WHERE id = OLD.quiz_id;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'INSERT') THEN
+                UPDATE quizzes SET question_count = question_count + 1
+                WHERE id = NEW.quiz_id;
+            END IF;
+            RETURN NULL;
+        END
+        $count$ LANGUAGE plpgsql
+        """
+    ),
+    sqlalchemy.text("DROP TRIGGER IF EXISTS questions_count_on_write ON questions"),
+    sqlalchemy.text(
+        """
+        CREATE TRIGGER questions_count_on_write
+        AFTER INSERT OR DELETE ON questions
+        FOR EACH ROW
+        EXECUTE FUNCTION count_quiz_questions()
+        """
+    ),
+    sqlalchemy.text("DROP TRIGGER IF EXISTS questions_count_on_move ON questions"),
+    sqlalchemy.text(
+        """
+        CREATE TRIGGER questions_count_on_move
+        AFTER UPDATE OF quiz_id ON questions
+        FOR EACH ROW
+        WHEN (OLD.quiz_id IS DISTINCT FROM NEW.quiz_id)
+        EXECUTE FUNCTION count_quiz_questions()
+        """
+    ),
+]
+
+move_tournament_participants = sqlalchemy.text(
+    """
+    DO $migration$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema()
+            AND table_name = 'tournaments'
+            AND column_name = 'participants'
+        ) THEN
+            INSERT INTO tournament_participants (tournament_id, player_id)
+            SELECT tournaments.id, participant.player_id
+            FROM tournaments
+            CROSS JOIN LATERAL unnest(tournaments.participants) AS participant(player_id)
+            JOIN players ON players.id = participant.player_id
+            ON CONFLICT DO NOTHING;
+
+            ALTER TABLE tournaments DROP COLUMN participants;
+        END IF;
+    END
+    $migration$
+    """
+)
+
+MIGRATIONS: list[Migration] = [
+    Migration(
+        version=1,
+        description="Create base tables",
+        statements=baseline_tables,
+    ),
+    Migration(
+        version=2,
+        description="Index foreign key lookup columns",
+        statements=[
+            CreateIndex(index, if_not_exists=True)
+            for index in foreign_key_indexes
+        ],
+    ),
+    Migration(
+        version=3,
+        description="Move tournament participants to a dedicated table",
+        statements=[
+            create_tournament_participants,
+            CreateIndex(tournament_participant_player_index, if_not_exists=True),
+            move_tournament_participants,
+        ],
+    ),
+    Migration(
+        version=4,
+        description="Store refresh token sessions",
+        statements=[
+            create_player_sessions,
+            CreateIndex(player_session_player_index, if_not_exists=True),
+        ],
+    ),
+    Migration(
+        version=5,
+        description="Count questions of quizzes with a trigger",
+        statements=count_quiz_questions,
+    ),
+    Migration(
+        version=6,
+        description="Keep the best attempt of each player per quiz",
+        statements=[
+            create_best_attempts,
+            CreateIndex(best_attempt_ranking_index, if_not_exists=True),
+            CreateIndex(best_attempt_history_index, if_not_exists=True),
+            CreateIndex(best_attempt_player_index, if_not_exists=True),
+            fill_best_attempts,
+        ],
+    ),
+    Migration(
+        version=7,
+        description="Allow collecting a reward once per player",
+        statements=collect_rewards_once,
+    ),
+    Migration(
+        version=8,
+        description="Index the quizzes of tournaments",
+        statements=[
+            CreateIndex(tournament_quizzes_index, if_not_exists=True),
+        ],
+    ),
+    Migration(
+        version=9,
+        description="Record every reward collection",
+        statements=[
+            create_reward_collections,
+            CreateIndex(reward_collection_quiz_index, if_not_exists=True),
+            fill_reward_collections,
+        ],
+    ),
+]
+
+
+async def get_schema_version() -> int:
+    """Function getting the latest applied schema version.
+
+    Returns:
+        int: The applied schema version, 0 for an empty database.
+    """
+    query = sqlalchemy.select(
+        sqlalchemy.func.coalesce(
+            sqlalchemy.func.max(schema_version_table.c.version),
+            0,
+        )
+    )
+    return await database.fetch_val(query)
+
+
+async def apply_statement(statement: Executable | ReportedStatement) -> None:
+    """Function running a single migration statement.
+
+    Args:
+        statement (Executable | ReportedStatement): The statement.
+    """
+    if isinstance(statement, ReportedStatement):
+        for row in await database.fetch_all(statement.statement):
+            logger.warning(statement.message, dict(row._mapping))
+    else:
+        await database.execute(statement)
+
+
+async def migrate(target_version: int | None = None) -> int:
+    """Function applying pending migrations in a single transaction.
+
+    Concurrent workers are serialized with an advisory lock, so only the
+    first one applies the pending migrations.
+
+    Args:
+        target_version (int | None, optional): The version to stop at.
+            Defaults to the latest one.
+
+    Returns:
+        int: The schema version after migrating.
+    """
+    async with database.transaction():
+        await database.fetch_val(
+            sqlalchemy.select(
+                sqlalchemy.func.pg_advisory_xact_lock(MIGRATION_LOCK_KEY)
+            )
+        )
+        await database.execute(
+            CreateTable(schema_version_table, if_not_exists=True)
+        )
+        current_version = await get_schema_version()
+
+        for migration in MIGRATIONS:
+            if migration.version <= current_version:
+                continue
+            if target_version is not None and migration.version > target_version:
+                break
+
+            for statement in migration.statements:
+                await apply_statement(statement)
+
+            await database.execute(
+                schema_version_table.insert().values(
+                    version=migration.version,
+                    description=migration.description,
+                )
+            )
+            current_version = migration.version
+
+    return current_version
@@ -0,0 +1,196 @@
+"""Fixtures shared by the tests of the app.
+
+The tests run against a dedicated database, `quizapi_test` unless
+`TEST_DB_NAME` says otherwise, which is recreated and migrated once per
+session and truncated before every test. The connection settings are
+read from the usual `DB_HOST`, `DB_USER` and `DB_PASSWORD` variables,
+tests needing PostgreSQL are skipped when it is not reachable.
+"""
+
+import asyncio
+import os
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, NamedTuple
+from uuid import UUID
+
+os.environ["DB_NAME"] = os.environ.get("TEST_DB_NAME", "quizapi_test")
+os.environ.setdefault("DB_POOL_MIN_SIZE", "1")
+
+import asyncpg  # type: ignore  # noqa: E402
+import pytest  # noqa: E402
+from dependency_injector.containers import DeclarativeContainer  # noqa: E402
+
+from quizapi.api.utils.auth import verified_tokens  # noqa: E402
+from quizapi.config import config  # noqa: E402
+from quizapi.db import database, metadata, player_table  # noqa: E402
+from quizapi.infrastructure.utils.token import generate_player_token  # noqa: E402
+from quizapi.loadtest.client import ASGIClient  # noqa: E402
+from quizapi.main import app, container as app_container  # noqa: E402
+from quizapi.migrations import migrate  # noqa: E402
+
+TABLES = ", ".join(table.name for table in metadata.sorted_tables)
+
+
+class TestPlayer(NamedTuple):
+    """A class representing a player created for a test."""
+    id: UUID
+    username: str
+    token: str
+
+
+async def recreate_test_database() -> None:
+    """A function creating an empty, migrated test database."""
+    connection = await asyncpg.connect(
+        host=config.DB_HOST,
+        user=config.DB_USER,
+        password=config.DB_PASSWORD,
+        database="postgres",
+    )
+    try:
+        await connection.execute(f'DROP DATABASE IF EXISTS "{config.DB_NAME}" WITH (FORCE)')
+        await connection.execute(f'CREATE DATABASE "{config.DB_NAME}"')
+    finally:
+        await connection.close()
+
+    await database.connect()
+    try:
+        await migrate()
+    finally:
+        await database.disconnect()
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """A fixture running the async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def postgres_unavailable() -> str | None:
+    """A fixture preparing the test database once per session.
+
+    Returns:
+        str | None: The reason PostgreSQL tests are skipped, if any.
+    """
+    if config.DB_HOST is None:
+        return "DB_HOST is not set"
+    try:
+        asyncio.run(recreate_test_database())
+    except (OSError, asyncpg.PostgresError) as error:
+        return f"PostgreSQL is not available: {error}"
+    return None
+
+
+@pytest.fixture
+async def db(postgres_unavailable: str | None) -> AsyncIterator[Any]:
+    """A fixture connecting the shared pool to an empty test database."""
+    if postgres_unavailable:
+        pytest.skip(postgres_unavailable)
+
+    await database.connect()
+    try:
+        await database.execute(f"TRUNCATE {TABLES} RESTART IDENTITY CASCADE")
+        yield database
+    finally:
+        await database.disconnect()
+
+
+@pytest.fixture(params=["postgres", "memory"])
+def backend(request: pytest.FixtureRequest) -> str:
+    """A fixture selecting the repository backend of the test.
+
+    Tests run against both backends by default, a single one is chosen
+    with `@pytest.mark.parametrize("backend", ["postgres"], indirect=True)`.
+    """
+    if request.param == "postgres":
+        request.getfixturevalue("db")
+    return request.param
+
+
+@pytest.fixture
+def container(backend: str) -> Iterator[DeclarativeContainer]:
+    """A fixture providing the app container with fresh repositories and caches."""
+    app_container.repository_backend.override(backend)
+    app_container.reset_singletons()
+    verified_tokens.clear()
+    try:
+        yield app_container
+    finally:
+        app_container.repository_backend.reset_override()
+        app_container.reset_singletons()
+
+
+@pytest.fixture
+def client(container: DeclarativeContainer) -> ASGIClient:
+    """A fixture providing a client calling the app in the same process."""
+    return ASGIClient(app)
+
+
+@pytest.fixture
+def create_player(
+        backend: str,
+        container: DeclarativeContainer,
+) -> Callable[..., Awaitable[TestPlayer]]:
+    """A fixture providing a factory of players with a valid token.
+
+    The players are stored directly, so the tests do not pay for hashing
+    passwords.
+    """
+    created = 0
+
+    async def factory(balance: int = 0) -> TestPlayer:
+        nonlocal created
+        created += 1
+        username = f"player{created}"
+        values = {
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": "not-a-hash",
+            "balance": balance,
+        }
+        if backend == "postgres":
+            player_id = await database.fetch_val(
+                player_table.insert().values(**values).returning(player_table.c.id)
+            )
+        else:
+            store = container.memory_store()
+            player_id = UUID(int=created, version=4)
+            store.players.insert({**values, "id": player_id})
+        token = generate_player_token(player_id)["player_token"]
+        return TestPlayer(id=player_id, username=username, token=token)
+
+    return factory
+
+
+@pytest.fixture
+def create_quiz(client: ASGIClient) -> Callable[..., Awaitable[dict]]:
+    """A fixture providing a factory of quizzes created through the API.
+
+    Question `n` of every quiz has `A{n}` as the correct option.
+    """
+    created = 0
+
+    async def factory(owner: TestPlayer, questions: int = 4, shared: bool = True) -> dict:
+        nonlocal created
+        created += 1
+        response = await client.request("POST", "/quiz/create", {
+            "title": f"Quiz {created}",
+            "description": "A quiz created by a test",
+            "shared": shared,
+            "reward": f"Reward {created}",
+        }, token=owner.token)
+        assert response.status == 201, response.content
+        quiz = response.json()
+        for number in range(questions):
+            response = await client.request("POST", "/question/create", {
+                "question_text": f"Question {number}",
+                "option_one": f"A{number}",
+                "option_two": f"B{number}",
+                "option_three": f"C{number}",
+                "option_four": f"D{number}",
+                "correct_option": f"A{number}",
+                "quiz_id": quiz["id"],
+            }, token=owner.token)
+            assert response.status == 201, response.content
+        return quiz
+
+    return factory
@@ -0,0 +1,56 @@
+"""A pytest plugin asserting the number of statements run by the app.
+
+The `query_budget` fixture wraps `quizapi.infrastructure.utils.queries.query_budget`
+and turns an exceeded budget into a test failure listing the statements,
+e.g. `with query_budget(1): await client.request("GET", "/quiz/all")`.
+
+Requests served in the same task, like the ones of the in-process
+client, record their statements in the enclosing budget as well.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator
+
+import pytest
+
+from quizapi.infrastructure.utils import queries
+
+
+@contextmanager
+def _checked_budget(limit: int, exact: bool) -> Iterator[queries.QueryAccount]:
+    """A function running a block within a budget and failing the test on excess.
+
+    Args:
+        limit (int): The maximum number of statements.
+        exact (bool): Whether running fewer statements fails as well.
+
+    Yields:
+        QueryAccount: The account of the block.
+    """
+    exceeded = None
+    try:
+        with queries.query_budget(limit) as account:
+            yield account
+    except queries.QueryBudgetExceededError as error:
+        exceeded = str(error)
+    if exceeded is not None:
+        pytest.fail(exceeded, pytrace=False)
+    if exact and account.count != limit:
+        pytest.fail(
+            f"Ran {account.count} statements, expected exactly {limit}: {account.statements}",
+            pytrace=False,
+        )
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., ContextManager[queries.QueryAccount]]:
+    """A fixture providing a context manager limiting the statements of a block.
+
+    Returns:
+        Callable[..., ContextManager[QueryAccount]]: The context manager
+            taking the limit and, optionally, `exact=True`.
+    """
+    def budget(limit: int, exact: bool = False) -> ContextManager[queries.QueryAccount]:
+        return _checked_budget(limit, exact)
+
+    return budget
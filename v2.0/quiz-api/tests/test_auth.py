@@ -0,0 +1,94 @@
+"""Tests of the authentication dependency."""
+
+from time import perf_counter, time
+from uuid import uuid4
+
+import pytest
+from jose import jwt
+
+from quizapi.api.utils import auth
+from quizapi.api.utils.auth import VerifiedTokenCache, decode_player_token, verified_tokens
+from quizapi.infrastructure.utils import consts
+from quizapi.infrastructure.utils.token import generate_player_token
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+
+def test_verified_tokens_are_bounded_and_expire() -> None:
+    cache = VerifiedTokenCache(max_entries=2)
+    first, second, third, expired = (cache.digest(token) for token in ("a", "b", "c", "d"))
+    player_uuid = uuid4()
+
+    cache.set(first, time() + 60, player_uuid)
+    cache.set(second, time() + 60, player_uuid)
+    assert cache.get(first) == player_uuid
+    cache.set(third, time() + 60, player_uuid)
+    cache.set(expired, time() - 1, player_uuid)
+
+    assert cache.get(first) is None
+    assert cache.get(second) is None
+    assert cache.get(third) == player_uuid
+    assert cache.get(expired) is None
+
+
+async def test_invalid_tokens_are_forbidden(client: ASGIClient) -> None:
+    expired = jwt.encode(
+        {"sub": str(uuid4()), "exp": int(time()) - 60},
+        key=consts.SECRET_KEY,
+        algorithm=consts.ALGORITHM,
+    )
+    subjectless = jwt.encode(
+        {"exp": int(time()) + 60},
+        key=consts.SECRET_KEY,
+        algorithm=consts.ALGORITHM,
+    )
+
+    for token in ("malformed", expired, subjectless):
+        response = await client.request("GET", "/player/balance", token=token)
+        assert response.status == 403, token
+
+
+async def test_signature_is_verified_once_per_token(
+        client: ASGIClient,
+        create_player,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    player = await create_player()
+    decoded: list[str] = []
+
+    def counting_decode(token: str):
+        decoded.append(token)
+        return decode_player_token(token)
+
+    monkeypatch.setattr(auth, "decode_player_token", counting_decode)
+    for _ in range(3):
+        response = await client.request("GET", "/player/balance", token=player.token)
+        assert response.status == 200
+
+    assert decoded == [player.token]
+
+
+@pytest.mark.benchmark
+async def test_token_verification_cost() -> None:
+    """Prints the cost of verifying a token on every request against
+    serving it from `verified_tokens`."""
+    token = generate_player_token(uuid4())["player_token"]
+    rounds = 20_000
+
+    started = perf_counter()
+    for _ in range(rounds):
+        decode_player_token(token)
+    uncached = (perf_counter() - started) / rounds
+
+    verified_tokens.clear()
+    key = verified_tokens.digest(token)
+    verified_tokens.set(key, *decode_player_token(token))
+    started = perf_counter()
+    for _ in range(rounds):
+        assert verified_tokens.get(verified_tokens.digest(token)) is not None
+    cached = (perf_counter() - started) / rounds
+    verified_tokens.clear()
+
+    print(f"token verification {uncached * 1e6:.1f}us, cached {cached * 1e6:.1f}us")
+    assert cached < uncached
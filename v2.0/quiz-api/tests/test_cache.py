@@ -0,0 +1,172 @@
+"""Tests of the cache backend and the read-through repositories."""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from quizapi.core.domain.quiz import QuizBroker
+from quizapi.infrastructure.cache.keys import quiz_key
+from quizapi.infrastructure.cache.memory import MemoryCacheBackend, approximate_size
+from quizapi.infrastructure.repositories.memory.quiz import MemoryQuizRepository
+from quizapi.infrastructure.repositories.memory.store import MemoryStore
+from quizapi.infrastructure.repositories.quizcache import CachedQuizRepository
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+VALUE = "x" * 1000
+VALUE_SIZE = approximate_size(VALUE)
+
+
+class RacingQuizRepository(MemoryQuizRepository):
+    """A repository updating the quiz while it is being read."""
+
+    cache: MemoryCacheBackend
+
+    async def get_quiz_by_id(self, quiz_id: int) -> Any | None:
+        quiz = await super().get_quiz_by_id(quiz_id)
+        await self.cache.delete(quiz_key(quiz_id))
+        return quiz
+
+
+async def test_entries_are_bounded_by_size() -> None:
+    cache = MemoryCacheBackend(max_entries=100, max_bytes=3 * VALUE_SIZE, ttl_seconds=60)
+    for key in "abcd":
+        await cache.set(key, VALUE)
+
+    assert await cache.get("a") is None
+    assert await cache.get("d") == VALUE
+    assert cache.stats().entries == 3
+    assert cache.stats().bytes == 3 * VALUE_SIZE
+    assert cache.stats().evictions == 1
+
+    await cache.delete("b", "c", "d")
+    assert cache.stats().bytes == 0
+
+
+async def test_values_larger_than_the_cache_are_not_stored() -> None:
+    cache = MemoryCacheBackend(max_entries=100, max_bytes=VALUE_SIZE - 1, ttl_seconds=60)
+    await cache.set("a", VALUE)
+
+    assert await cache.get("a") is None
+    assert cache.stats().bytes == 0
+
+
+async def test_values_loaded_before_an_invalidation_are_dropped() -> None:
+    cache = MemoryCacheBackend(max_entries=100, max_bytes=2 ** 20, ttl_seconds=60)
+    generation = await cache.generation("a")
+    await cache.delete("a")
+    await cache.set("a", VALUE, generation)
+
+    assert await cache.get("a") is None
+
+    await cache.set("a", VALUE, await cache.generation("a"))
+    assert await cache.get("a") == VALUE
+
+
+async def test_read_through_skips_values_invalidated_while_loading() -> None:
+    store = MemoryStore()
+    player_id = uuid4()
+    store.players.insert({"id": player_id, "username": "owner", "email": "owner@example.com"})
+    cache = MemoryCacheBackend(max_entries=100, max_bytes=2 ** 20, ttl_seconds=60)
+    repository = RacingQuizRepository(store)
+    repository.cache = cache
+    quiz = await repository.add_quiz(QuizBroker(
+        title="Quiz",
+        description="A quiz",
+        shared=True,
+        reward="Cup",
+        player_id=player_id,
+    ))
+
+    assert await CachedQuizRepository(repository, cache).get_quiz_by_id(quiz.id) is not None
+    assert await cache.get(quiz_key(quiz.id)) is None
+
+
+async def test_missing_quizzes_and_tournaments_are_not_cached(
+        client: ASGIClient,
+        container,
+        create_player,
+) -> None:
+    player = await create_player()
+    submission = {"quiz_id": 404, "answers": [{"question_id": 1, "chosen_option": "A"}]}
+
+    for path in ("/quiz/404", "/quiz/404/bundle", "/question/quiz/404", "/tournament/404/standings"):
+        await client.request("GET", path)
+    await client.request("POST", "/history/grade", submission, token=player.token)
+
+    assert container.cache_backend().stats().entries == 0
+
+
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+async def test_question_writes_invalidate_without_reading_first(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+        query_budget,
+) -> None:
+    owner = await create_player()
+    quiz = await create_quiz(owner, questions=2)
+    question = {
+        "question_text": "Updated",
+        "option_one": "A",
+        "option_two": "B",
+        "option_three": "C",
+        "option_four": "D",
+        "correct_option": "A",
+        "quiz_id": quiz["id"],
+    }
+    assert (await client.request("GET", f"/quiz/{quiz['id']}/bundle")).status == 200
+
+    with query_budget(2, exact=True):
+        response = await client.request("PUT", "/question/1", question, token=owner.token)
+        assert response.status == 201
+    response = await client.request("GET", f"/quiz/{quiz['id']}/bundle")
+    assert response.json()["questions"][0]["question_text"] == "Updated"
+
+    with query_budget(2, exact=True):
+        response = await client.request("DELETE", "/question/1", token=owner.token)
+        assert response.status == 204
+    response = await client.request("GET", f"/quiz/{quiz['id']}/bundle")
+    assert [item["id"] for item in response.json()["questions"]] == [2]
+
+
+async def test_history_writes_invalidate_standings_of_their_quiz(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    owner, player = await create_player(), await create_player()
+    first, second = await create_quiz(owner, questions=2), await create_quiz(owner, questions=2)
+    tournament = {"name": "Cup", "description": "A tournament", "quizzes_id": [first["id"]]}
+    tournament_id = (await client.request("POST", "/tournament/create", tournament)).json()["id"]
+    await client.request("POST", f"/tournament/{tournament_id}/join", token=player.token)
+    questions = (await client.request("GET", f"/question/quiz/{second['id']}")).json()
+
+    async def grade(method: str, path: str, correct: int) -> dict:
+        submission = {"quiz_id": second["id"], "answers": [
+            {"question_id": question["id"], "chosen_option": question["option_one"]}
+            for question in questions[:correct]
+        ]}
+        response = await client.request(method, path, submission, token=player.token)
+        assert response.status == 201
+        return response.json()
+
+    async def score() -> float:
+        response = await client.request("GET", f"/tournament/{tournament_id}/standings")
+        return response.json()["items"][0]["score"]
+
+    history = await grade("POST", "/history/grade", 0)
+    assert await score() == 0
+
+    tournament["quizzes_id"].append(second["id"])
+    await client.request("PUT", f"/tournament/{tournament_id}", tournament)
+    assert await score() == 0
+
+    await grade("PUT", f"/history/{history['id']}", 1)
+    assert await score() == 0.5
+    best = await grade("POST", "/history/grade", 2)
+    assert await score() == 1
+    await client.request("DELETE", f"/history/{best['id']}", token=player.token)
+    assert await score() == 0.5
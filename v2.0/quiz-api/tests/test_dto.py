@@ -0,0 +1,166 @@
+"""Tests of the DTOs built from records without validation."""
+
+import warnings
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from quizapi.db import database
+from quizapi.infrastructure.dto.bundledto import BundleQuestionDTO
+from quizapi.infrastructure.dto.historydto import HistoryDTO
+from quizapi.infrastructure.dto.leaderboarddto import LeaderboardEntryDTO
+from quizapi.infrastructure.dto.pagedto import PageDTO
+from quizapi.infrastructure.dto.playerdto import PlayerDTO
+from quizapi.infrastructure.dto.questiondto import QuestionDTO
+from quizapi.infrastructure.dto.quizdto import QuizDTO
+from quizapi.infrastructure.dto.tournamentdto import ParticipantDTO, StandingDTO, TournamentDTO
+from quizapi.loadtest.client import ASGIClient
+
+NOW = datetime.now(timezone.utc)
+PLAYER_ID = uuid4()
+
+NULL_QUIZ = {
+    "quiz_id": 1,
+    "title": None,
+    "player_id": PLAYER_ID,
+    "player_id_2": PLAYER_ID,
+    "description": None,
+    "shared": None,
+    "reward": "Cup",
+    "question_count": 0,
+}
+
+NULL_RECORDS: list[tuple[Any, dict[str, Any]]] = [
+    (QuizDTO.from_record, {
+        "quiz_id": 1,
+        "quiz_title": None,
+        "quiz_description": None,
+        "player_id": PLAYER_ID,
+        "quiz_shared": None,
+        "quiz_reward": "Cup",
+        "quiz_question_count": 0,
+    }),
+    (QuestionDTO.from_record, {
+        **NULL_QUIZ,
+        "id": 1,
+        "question_text": None,
+        "option_one": None,
+        "option_two": None,
+        "option_three": None,
+        "option_four": None,
+    }),
+    (BundleQuestionDTO.from_record, {
+        "question_id": 1,
+        "question_text": None,
+        "option_one": None,
+        "option_two": None,
+        "option_three": None,
+        "option_four": None,
+    }),
+    (HistoryDTO.from_record, {
+        **NULL_QUIZ,
+        "id": 1,
+        "total_questions": None,
+        "correct_answers": None,
+        "effectiveness": None,
+        "timestamp": None,
+    }),
+    (TournamentDTO.from_record, {"id": 1, "name": None, "description": None, "quizzes_id": []}),
+    (ParticipantDTO.from_record, {"id": PLAYER_ID, "username": None, "joined_at": NOW}),
+    (StandingDTO.from_record, {
+        "rank": 1,
+        "id": PLAYER_ID,
+        "username": None,
+        "score": 0.0,
+        "quizzes_played": 0,
+    }),
+    (lambda record: LeaderboardEntryDTO.from_record(record, 1), {
+        "player_id": PLAYER_ID,
+        "username": None,
+        "effectiveness": 1.0,
+        "timestamp": NOW,
+    }),
+    (PlayerDTO.from_record, {"id": PLAYER_ID, "username": None, "email": None, "balance": None}),
+]
+
+
+def history_record(number: int) -> dict[str, Any]:
+    """A function preparing a record shaped like a row of the history query."""
+    return {
+        **NULL_QUIZ,
+        "title": "Quiz",
+        "description": "A quiz",
+        "shared": True,
+        "id": number,
+        "total_questions": 10,
+        "correct_answers": number % 11,
+        "effectiveness": (number % 11) / 10,
+        "timestamp": NOW,
+    }
+
+
+@pytest.mark.parametrize(
+    ("from_record", "record"),
+    NULL_RECORDS,
+    ids=[str(record) for record in range(len(NULL_RECORDS))],
+)
+def test_null_columns_follow_the_schema(from_record, record: dict[str, Any]) -> None:
+    dto: BaseModel = from_record(record)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        serialized = dto.model_dump_json()
+
+    assert type(dto).model_validate_json(serialized) == dto
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+async def test_quiz_with_null_columns_is_served(client: ASGIClient, create_player) -> None:
+    owner = await create_player()
+    quiz_id = await database.fetch_val(
+        "INSERT INTO quizzes (player_id, reward) VALUES (:player_id, 'Cup') RETURNING id",
+        {"player_id": owner.id},
+    )
+
+    response = await client.request("GET", f"/quiz/{quiz_id}")
+
+    assert response.status == 200
+    assert response.json()["title"] is None
+
+
+@pytest.mark.benchmark
+def test_trusted_page_serialization() -> None:
+    """Prints the cost of building and serializing a page of 10k histories
+    with and without validating the records."""
+    records = [history_record(number) for number in range(1, 10_001)]
+    payloads = [
+        {**record, "quiz": {**record, "id": record["quiz_id"], "player_id": record["player_id_2"]}}
+        for record in records
+    ]
+    page_model = PageDTO[HistoryDTO]
+
+    started = perf_counter()
+    trusted_page = page_model.from_items(
+        [HistoryDTO.from_record(record) for record in records], len(records),
+    )
+    trusted = perf_counter() - started
+
+    started = perf_counter()
+    validated_page = page_model.model_validate({"items": payloads})
+    validated = perf_counter() - started
+
+    started = perf_counter()
+    serialized = trusted_page.model_dump_json()
+    serialization = perf_counter() - started
+
+    print(
+        f"10k histories: {trusted * 1e3:.1f}ms trusted, {validated * 1e3:.1f}ms validated, "
+        f"{serialization * 1e3:.1f}ms serialized"
+    )
+    assert serialized == validated_page.model_dump_json()
+    assert trusted < validated
@@ -0,0 +1,152 @@
+"""Tests of the streaming NDJSON exports."""
+
+import asyncio
+import json
+import os
+from typing import Any
+
+import pytest
+from starlette.types import Message
+
+from quizapi.db import database, get_pool_stats
+from quizapi.loadtest.client import ASGIClient
+from quizapi.main import app
+
+pytestmark = pytest.mark.anyio
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def resident_memory() -> int:
+    """A function reading the resident set size of the process in bytes."""
+    with open("/proc/self/statm", encoding="ascii") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE
+
+
+async def stream(path: str, disconnect_after: int | None = None) -> dict[str, Any]:
+    """A function consuming a streamed response chunk by chunk.
+
+    The body is never held as a whole, so the sampled memory is the one
+    of the app producing it.
+
+    Args:
+        path (str): The path of the request.
+        disconnect_after (int | None, optional): The number of body chunks
+            after which the client goes away. Defaults to reading all of them.
+
+    Returns:
+        dict[str, Any]: The status, the number of lines, the first line
+            and the peak resident memory while streaming.
+    """
+    result: dict[str, Any] = {"status": None, "lines": 0, "first": None, "peak": resident_memory()}
+    request_sent = False
+    chunks = 0
+    disconnected = asyncio.Event()
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal chunks
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+        elif body := message.get("body"):
+            if result["first"] is None:
+                result["first"] = json.loads(body.split(b"\n", 1)[0])
+            result["lines"] += body.count(b"\n")
+            result["peak"] = max(result["peak"], resident_memory())
+            chunks += 1
+            if chunks == disconnect_after:
+                disconnected.set()
+                await asyncio.sleep(0.1)
+
+    await app({
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 0),
+        "server": ("test", 80),
+    }, receive, send)
+    disconnected.set()
+    return result
+
+
+async def insert_histories(player_id: Any, quiz_id: int, count: int) -> None:
+    """A function inserting synthetic histories in a single statement."""
+    await database.execute(
+        """
+        INSERT INTO history
+            (player_id, quiz_id, total_questions, correct_answers, effectiveness, timestamp)
+        SELECT :player_id, :quiz_id, 10, number % 11, (number % 11) / 10.0, now()
+        FROM generate_series(1, :count) AS number
+        """,
+        {"player_id": player_id, "quiz_id": quiz_id, "count": count},
+    )
+
+
+async def test_history_export_streams_every_row(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    player = await create_player()
+    quiz = await create_quiz(player, questions=1)
+    submission = {"quiz_id": quiz["id"], "answers": [{"question_id": 1, "chosen_option": "A0"}]}
+    for _ in range(25):
+        response = await client.request("POST", "/history/grade", submission, token=player.token)
+        assert response.status == 201
+
+    result = await stream("/history/export")
+
+    assert result["status"] == 200
+    assert result["lines"] == 25
+    assert result["first"]["quiz"]["id"] == quiz["id"]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+async def test_history_export_memory_stays_bounded(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    rows = 1_000_000
+    player = await create_player()
+    quiz = await create_quiz(player, questions=0)
+    await insert_histories(player.id, quiz["id"], rows)
+
+    baseline = resident_memory()
+    result = await stream("/history/export")
+
+    growth = (result["peak"] - baseline) / 2 ** 20
+    print(f"streamed {result['lines']} rows, peak RSS grew by {growth:.1f} MiB")
+    assert result["lines"] == rows
+    assert growth < 64
+
+
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+async def test_history_export_releases_connection_on_disconnect(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    player = await create_player()
+    quiz = await create_quiz(player, questions=0)
+    await insert_histories(player.id, quiz["id"], 50_000)
+
+    result = await stream("/history/export", disconnect_after=1)
+
+    assert 0 < result["lines"] < 50_000
+    assert get_pool_stats().in_use == 0
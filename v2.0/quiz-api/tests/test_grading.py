@@ -0,0 +1,105 @@
+"""Tests of the server-side grading and of the public questions."""
+
+import json
+from time import perf_counter
+
+import pytest
+
+from quizapi.core.domain.history import SubmissionIn
+from quizapi.infrastructure.utils.grading import AnswerKey
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+
+async def submission(client: ASGIClient, quiz: dict, chosen_option: str) -> dict:
+    """A function answering every question of a test quiz with one option field."""
+    questions = (await client.request("GET", f"/question/quiz/{quiz['id']}")).json()
+    return {
+        "quiz_id": quiz["id"],
+        "answers": [
+            {"question_id": question["id"], "chosen_option": question[chosen_option]}
+            for question in questions
+        ],
+    }
+
+
+async def test_public_questions_hide_correct_options(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    owner, player = await create_player(), await create_player()
+    quiz = await create_quiz(owner, questions=2)
+
+    by_quiz = (await client.request("GET", f"/question/quiz/{quiz['id']}")).json()
+    by_id = (await client.request("GET", f"/question/{by_quiz[0]['id']}")).json()
+    page = (await client.request("GET", "/question/all")).json()
+    export = (await client.request("GET", "/question/export")).content.decode().splitlines()
+
+    for question in [*by_quiz, by_id, *page["items"], *map(json.loads, export)]:
+        assert "correct_option" not in question
+    assert len(by_quiz) == len(page["items"]) == len(export) == 2
+
+    path = f"/question/quiz/{quiz['id']}/full"
+    assert (await client.request("GET", path, token=player.token)).status == 403
+    assert (await client.request("GET", "/question/quiz/404/full", token=owner.token)).status == 404
+    full = (await client.request("GET", path, token=owner.token)).json()
+    assert [question["correct_option"] for question in full] == ["A0", "A1"]
+
+
+async def test_histories_are_graded_by_the_server(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    owner, player = await create_player(), await create_player()
+    quiz = await create_quiz(owner, questions=2)
+    reported = {"quiz_id": quiz["id"], "correct_answers": 2, "timestamp": "2024-01-01T00:00:00Z"}
+
+    response = await client.request("POST", "/history/create", reported, token=player.token)
+    assert response.status in (404, 405)
+
+    wrong = await submission(client, quiz, "option_two")
+    response = await client.request("POST", "/history/grade", wrong, token=player.token)
+    assert response.status == 201
+    history = response.json()
+    assert history["correct_answers"] == 0
+
+    path = f"/history/{history['id']}"
+    response = await client.request("PUT", path, {**wrong, **reported}, token=player.token)
+    assert response.status == 201
+    assert response.json()["correct_answers"] == 0
+    response = await client.request("POST", "/reward/collect", {"quiz_id": quiz["id"]}, token=player.token)
+    assert response.status == 400
+
+    right = await submission(client, quiz, "option_one")
+    response = await client.request("PUT", path, right, token=owner.token)
+    assert response.status == 403
+    response = await client.request("PUT", path, right, token=player.token)
+    assert response.status == 201
+    assert response.json()["effectiveness"] == 1
+    response = await client.request("POST", "/reward/collect", {"quiz_id": quiz["id"]}, token=player.token)
+    assert response.status == 201
+
+
+@pytest.mark.benchmark
+def test_grading_rate() -> None:
+    """Prints the rate of validating and grading 20-answer submissions."""
+    answer_key = AnswerKey({question_id: "A" for question_id in range(20)})
+    body = {
+        "quiz_id": 1,
+        "answers": [
+            {"question_id": question_id, "chosen_option": "AB"[question_id % 2]}
+            for question_id in range(20)
+        ],
+    }
+    rounds = 20_000
+
+    started = perf_counter()
+    for _ in range(rounds):
+        graded = answer_key.grade(SubmissionIn.model_validate(body).answers)
+    elapsed = perf_counter() - started
+
+    print(f"{rounds / elapsed:.0f} submissions/s, {elapsed / rounds * 1e6:.1f}us each")
+    assert graded == 10
@@ -0,0 +1,117 @@
+"""Tests of the schema migrations, run on a database of their own."""
+
+import logging
+from typing import AsyncIterator
+
+import asyncpg  # type: ignore
+import databases
+import pytest
+
+from quizapi import migrations
+from quizapi.config import config
+from quizapi.db import metadata
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def empty_database(
+        postgres_unavailable: str | None,
+        monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[databases.Database]:
+    """A fixture pointing the migrations at a new, empty database."""
+    if postgres_unavailable:
+        pytest.skip(postgres_unavailable)
+
+    name = f"{config.DB_NAME}_migrations"
+    admin = await asyncpg.connect(
+        host=config.DB_HOST,
+        user=config.DB_USER,
+        password=config.DB_PASSWORD,
+        database="postgres",
+    )
+    await admin.execute(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+    await admin.execute(f'CREATE DATABASE "{name}"')
+
+    database = databases.Database(
+        f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}@{config.DB_HOST}/{name}",
+        min_size=1,
+        max_size=1,
+    )
+    await database.connect()
+    monkeypatch.setattr(migrations, "database", database)
+    try:
+        yield database
+    finally:
+        await database.disconnect()
+        await admin.execute(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+        await admin.close()
+
+
+async def test_migrations_build_the_declared_schema(empty_database: databases.Database) -> None:
+    latest = migrations.MIGRATIONS[-1].version
+    assert await migrations.migrate() == latest
+    assert await migrations.migrate() == latest
+
+    rows = await empty_database.fetch_all(
+        """
+        SELECT table_name, column_name, is_nullable
+        FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name <> 'schema_version'
+        """
+    )
+    migrated = {(row["table_name"], row["column_name"], row["is_nullable"] == "YES") for row in rows}
+    declared = {
+        (table.name, column.name, column.nullable)
+        for table in metadata.sorted_tables
+        for column in table.columns
+    }
+    assert migrated == declared
+
+
+async def test_baseline_participants_move_to_their_table(empty_database: databases.Database) -> None:
+    await migrations.migrate(target_version=1)
+    player_id = await empty_database.fetch_val(
+        "INSERT INTO players (username) VALUES ('player') RETURNING id"
+    )
+    await empty_database.execute(
+        "INSERT INTO tournaments (name, quizzes_id, participants) VALUES ('Cup', '{}', ARRAY[:id]::uuid[])",
+        {"id": player_id},
+    )
+
+    await migrations.migrate()
+
+    participants = await empty_database.fetch_all(
+        "SELECT tournament_id, player_id FROM tournament_participants"
+    )
+    assert [(row["tournament_id"], row["player_id"]) for row in participants] == [(1, player_id)]
+
+
+async def test_duplicate_rewards_are_credited_and_logged(
+        empty_database: databases.Database,
+        caplog: pytest.LogCaptureFixture,
+) -> None:
+    await migrations.migrate(target_version=6)
+    player_id = await empty_database.fetch_val(
+        "INSERT INTO players (username, balance) VALUES ('player', 5) RETURNING id"
+    )
+    await empty_database.execute(
+        "INSERT INTO quizzes (player_id, reward) VALUES (:id, 'Cup')",
+        {"id": player_id},
+    )
+    for value in (10, 20, 30):
+        await empty_database.execute(
+            "INSERT INTO rewards (quiz_id, player_id, reward, value) VALUES (1, :id, 'Cup', :value)",
+            {"id": player_id, "value": value},
+        )
+
+    with caplog.at_level(logging.WARNING, logger=migrations.__name__):
+        await migrations.migrate()
+
+    rewards = await empty_database.fetch_all("SELECT id, value FROM rewards")
+    assert [(row["id"], row["value"]) for row in rewards] == [(1, 10)]
+    assert await empty_database.fetch_val("SELECT balance FROM players") == 55
+    assert [record.args["id"] for record in caplog.records] == [2, 3]
+
+    collections = await empty_database.fetch_all("SELECT player_id, quiz_id FROM reward_collections")
+    assert [(row["player_id"], row["quiz_id"]) for row in collections] == [(player_id, 1)]
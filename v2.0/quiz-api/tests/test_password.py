@@ -0,0 +1,149 @@
+"""Tests of the password hashing worker pool."""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from quizapi.config import config
+from quizapi.infrastructure.utils import password
+from quizapi.infrastructure.utils.password import (
+    PasswordHasher,
+    PasswordHasherSaturatedError,
+    PasswordHasherUnavailableError,
+    password_hasher,
+)
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+
+def _die(*_: object) -> None:
+    """A function killing the worker process running it."""
+    os._exit(1)
+
+
+@asynccontextmanager
+async def saturated(hasher: PasswordHasher, calls: int) -> AsyncIterator[None]:
+    """A context manager keeping the hasher busy with sleeping calls."""
+    tasks = [asyncio.create_task(hasher.run(time.sleep, 1)) for _ in range(calls)]
+    await asyncio.sleep(0)
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.fixture
+def hasher() -> Iterator[PasswordHasher]:
+    """A fixture providing a hasher with a single worker."""
+    hasher = PasswordHasher(pool_size=1, queue_depth=4)
+    try:
+        yield hasher
+    finally:
+        hasher.shutdown()
+
+
+@pytest.fixture
+def shared_hasher() -> Iterator[PasswordHasher]:
+    """A fixture stopping the workers of the shared hasher after a test."""
+    try:
+        yield password_hasher
+    finally:
+        password_hasher.shutdown()
+
+
+async def test_pool_is_replaced_after_a_worker_dies(hasher: PasswordHasher) -> None:
+    with pytest.raises(PasswordHasherUnavailableError):
+        await hasher.run(_die)
+
+    hashed = await hasher.run(password._hash, "secret")
+
+    assert await hasher.run(password._verify, "secret", hashed)
+    assert hasher.pending == 0
+
+
+async def test_registration_is_unavailable_while_a_worker_dies(
+        client: ASGIClient,
+        shared_hasher: PasswordHasher,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    player = {"username": "player", "email": "player@example.com", "password": "secret"}
+
+    with monkeypatch.context() as patch:
+        patch.setattr(password, "_hash", _die)
+        response = await client.request("POST", "/player/register", player)
+    assert response.status == 503
+    assert response.headers["retry-after"] == "1"
+
+    response = await client.request("POST", "/player/register", player)
+    assert response.status == 201
+
+
+async def test_calls_above_the_queue_depth_are_rejected(hasher: PasswordHasher) -> None:
+    async with saturated(hasher, calls=1 + 4):
+        assert hasher.pending == 5
+        with pytest.raises(PasswordHasherSaturatedError):
+            await hasher.run(password._hash, "secret")
+
+    assert hasher.pending == 0
+
+
+async def test_credentials_endpoints_are_unavailable_while_saturated(
+        client: ASGIClient,
+        create_player,
+        shared_hasher: PasswordHasher,
+) -> None:
+    player = await create_player()
+    credentials = {
+        "username": player.username,
+        "email": f"{player.username}@example.com",
+        "password": "secret",
+    }
+    newcomer = {"username": "newcomer", "email": "newcomer@example.com", "password": "secret"}
+
+    async with saturated(shared_hasher, calls=config.HASH_POOL_SIZE + config.HASH_QUEUE_DEPTH):
+        for path, body in (("/player/token", credentials), ("/player/register", newcomer)):
+            response = await client.request("POST", path, body)
+            assert response.status == 503, path
+            assert response.headers["retry-after"] == "1"
+
+
+@pytest.mark.benchmark
+async def test_hashing_latency_and_event_loop_lag() -> None:
+    """Prints the latency percentiles of 16 concurrent hashes on 4 workers
+    and the largest delay of the event loop meanwhile."""
+    hasher = PasswordHasher(pool_size=4, queue_depth=64)
+    await hasher.run(password._hash, "warm-up")
+    lag = 0.0
+    done = False
+
+    async def tick() -> None:
+        nonlocal lag
+        while not done:
+            started = perf_counter()
+            await asyncio.sleep(0.005)
+            lag = max(lag, perf_counter() - started - 0.005)
+
+    async def timed_hash() -> float:
+        started = perf_counter()
+        await hasher.run(password._hash, "secret")
+        return perf_counter() - started
+
+    ticker = asyncio.create_task(tick())
+    try:
+        latencies = sorted(await asyncio.gather(*(timed_hash() for _ in range(16))))
+    finally:
+        done = True
+        await ticker
+        hasher.shutdown()
+
+    p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+    print(f"hash p50 {p50 * 1e3:.0f}ms, p99 {p99 * 1e3:.0f}ms, event loop lag {lag * 1e3:.1f}ms")
+    assert lag < 0.05
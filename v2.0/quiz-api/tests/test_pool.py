@@ -0,0 +1,128 @@
+"""Tests of the shared connection pool."""
+
+import asyncio
+from time import perf_counter
+from typing import AsyncIterator
+
+import databases
+import pytest
+
+from quizapi.config import config
+from quizapi.db import database, get_pool_stats
+from quizapi.infrastructure.repositories import statements
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+
+class LatencyProxy:
+    """A TCP proxy delaying every chunk sent to and from the database.
+
+    A local database answers in microseconds, so the pool size barely
+    matters. The proxy adds the round trip of a remote one.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.server: asyncio.Server | None = None
+
+    async def _pipe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while chunk := await reader.read(65536):
+                await asyncio.sleep(self.delay)
+                writer.write(chunk)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        upstream_reader, upstream_writer = await asyncio.open_connection(config.DB_HOST, 5432)
+        await asyncio.gather(
+            self._pipe(reader, upstream_writer),
+            self._pipe(upstream_reader, writer),
+        )
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+
+
+@pytest.fixture
+async def proxy_port(db: databases.Database) -> AsyncIterator[int]:
+    proxy = LatencyProxy(delay=0.002)
+    port = await proxy.start()
+    yield port
+    await proxy.stop()
+
+
+def test_pool_is_configured_from_app_config() -> None:
+    assert database.options["min_size"] == config.DB_POOL_MIN_SIZE
+    assert database.options["max_size"] == config.DB_POOL_MAX_SIZE
+    assert database.options["max_queries"] == config.DB_POOL_MAX_QUERIES
+    assert database.options["max_inactive_connection_lifetime"] == config.DB_POOL_MAX_INACTIVE_LIFETIME
+    assert database.options["timeout"] == config.DB_CONNECT_TIMEOUT
+    assert database.options["statement_cache_size"] == config.DB_STATEMENT_CACHE_SIZE
+    assert database._force_rollback is config.DB_FORCE_ROLLBACK is False
+
+
+async def test_pool_stats_count_borrowed_connections(db: databases.Database) -> None:
+    idle = get_pool_stats()
+    async with database.connection() as connection:
+        await connection.raw_connection.fetchval("SELECT 1")
+        borrowed = get_pool_stats()
+
+    assert borrowed.in_use == idle.in_use + 1
+    assert borrowed.max_size == config.DB_POOL_MAX_SIZE
+
+
+def test_pool_stats_fall_back_without_a_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delattr(database._backend, "_pool", raising=False)
+
+    assert get_pool_stats() == (0, 0, config.DB_POOL_MAX_SIZE)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+async def test_quiz_list_throughput_scales_with_pool_size(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+        proxy_port: int,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    owner = await create_player()
+    for _ in range(20):
+        await create_quiz(owner, questions=0)
+
+    url = (
+        f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
+        f"@127.0.0.1:{proxy_port}/{config.DB_NAME}"
+    )
+    requests, concurrency = 400, 32
+    throughput = {}
+    for pool_size in (1, 4, 16):
+        pool = databases.Database(url, min_size=pool_size, max_size=pool_size)
+        await pool.connect()
+        monkeypatch.setattr(statements, "database", pool)
+        remaining = requests
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.request("GET", "/quiz/all")
+                assert response.status == 200
+
+        started = perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        throughput[pool_size] = requests / (perf_counter() - started)
+        await pool.disconnect()
+
+    print({f"pool {size}": f"{rate:.0f} req/s" for size, rate in throughput.items()})
+    assert throughput[4] > 2 * throughput[1]
+    assert throughput[16] > throughput[4]
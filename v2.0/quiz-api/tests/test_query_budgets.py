@@ -0,0 +1,108 @@
+"""Tests pinning the number of statements run by the hot endpoints."""
+
+import pytest
+
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.parametrize("backend", ["postgres"], indirect=True),
+]
+
+
+def correct_answers(quiz: dict, questions: int) -> dict:
+    """A function preparing a submission answering every question of a test quiz."""
+    first_question = (quiz["id"] - 1) * questions + 1
+    return {
+        "quiz_id": quiz["id"],
+        "answers": [
+            {"question_id": first_question + number, "chosen_option": f"A{number}"}
+            for number in range(questions)
+        ],
+    }
+
+
+async def test_quiz_reads(client: ASGIClient, create_player, create_quiz, query_budget) -> None:
+    owner = await create_player()
+    quiz = await create_quiz(owner)
+
+    with query_budget(1, exact=True):
+        assert (await client.request("GET", "/quiz/all")).status == 200
+    with query_budget(1, exact=True):
+        assert (await client.request("GET", f"/quiz/{quiz['id']}")).status == 200
+    with query_budget(0):
+        assert (await client.request("GET", f"/quiz/{quiz['id']}")).status == 200
+    with query_budget(1, exact=True):
+        assert (await client.request("GET", f"/quiz/{quiz['id']}/bundle")).status == 200
+    with query_budget(0):
+        assert (await client.request("GET", f"/quiz/{quiz['id']}/bundle")).status == 200
+    with query_budget(2, exact=True):
+        response = await client.request("GET", f"/quiz/{quiz['id']}/leaderboard", token=owner.token)
+        assert response.status == 200
+
+
+async def test_grading_and_rewards(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+        query_budget,
+) -> None:
+    owner, player, buyer = await create_player(), await create_player(), await create_player(1000)
+    quiz = await create_quiz(owner)
+    submission = correct_answers(quiz, 4)
+
+    with query_budget(3, exact=True):
+        response = await client.request("POST", "/history/grade", submission, token=player.token)
+        assert response.status == 201
+    with query_budget(1, exact=True):
+        response = await client.request("POST", "/history/grade", submission, token=player.token)
+        assert response.status == 201
+
+    with query_budget(1, exact=True):
+        response = await client.request(
+            "POST", "/reward/collect", {"quiz_id": quiz["id"]}, token=player.token,
+        )
+        assert response.status == 201
+    reward = response.json()
+
+    with query_budget(1, exact=True):
+        response = await client.request("POST", f"/shop/sell/{reward['id']}", token=player.token)
+        assert response.status == 200
+    with query_budget(1, exact=True):
+        response = await client.request(
+            "POST", f"/shop/buy/{response.json()['id']}", token=buyer.token,
+        )
+        assert response.status == 200
+    with query_budget(1, exact=True):
+        assert (await client.request("GET", "/player/balance", token=buyer.token)).status == 200
+
+
+async def test_tournament_endpoints(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+        query_budget,
+) -> None:
+    owner, player = await create_player(), await create_player()
+    quizzes = [await create_quiz(owner) for _ in range(3)]
+    response = await client.request("POST", "/tournament/create", {
+        "name": "Cup",
+        "description": "A tournament",
+        "quizzes_id": [quiz["id"] for quiz in quizzes],
+    })
+    tournament = response.json()
+
+    with query_budget(1, exact=True):
+        response = await client.request(
+            "POST", f"/tournament/{tournament['id']}/join", token=player.token,
+        )
+        assert response.status == 200
+    with query_budget(1, exact=True):
+        response = await client.request("GET", f"/tournament/{tournament['id']}/participants")
+        assert response.status == 200
+    with query_budget(1, exact=True):
+        response = await client.request("GET", f"/tournament/{tournament['id']}/standings")
+        assert response.status == 200
+    with query_budget(0):
+        response = await client.request("GET", f"/tournament/{tournament['id']}/standings")
+        assert response.status == 200
@@ -0,0 +1,47 @@
+"""Tests checking that every repository statement is served by an index."""
+
+import json
+
+import databases
+import pytest
+
+from quizapi.datagen.generator import load_dataset
+from quizapi.datagen.presets import PRESETS
+from quizapi.infrastructure.repositories.statements import registry
+
+pytestmark = pytest.mark.anyio
+
+
+def sequential_scans(plan: dict) -> list[str]:
+    """A function listing the tables read with a sequential scan in a plan."""
+    scans = [plan["Relation Name"]] if plan["Node Type"] == "Seq Scan" else []
+    for child in plan.get("Plans", ()):
+        scans.extend(sequential_scans(child))
+    return scans
+
+
+async def test_statements_do_not_scan_tables_sequentially(db: databases.Database) -> None:
+    """Every statement is planned generically, as the pool's prepared
+    statements are, with sequential scans priced out. A plan still holding
+    one has no index to use."""
+    offenders = {}
+    async with db.connection() as connection:
+        raw = connection.raw_connection
+        await load_dataset(raw, PRESETS["small"], seed=0)
+        await raw.execute("SET enable_seqscan = off")
+        await raw.execute("SET plan_cache_mode = force_generic_plan")
+
+        for name, statement in sorted(registry.items()):
+            sql = statement.compile().sql
+            parameters = len((await raw.prepare(sql)).get_parameters())
+            await raw.execute(f"PREPARE planned AS {sql}")
+            try:
+                arguments = f"({', '.join(['NULL'] * parameters)})" if parameters else ""
+                explained = await raw.fetchval(f"EXPLAIN (FORMAT JSON) EXECUTE planned{arguments}")
+            finally:
+                await raw.execute("DEALLOCATE planned")
+
+            if scans := sequential_scans(json.loads(explained)[0]["Plan"]):
+                offenders[name] = scans
+
+    assert offenders == {}
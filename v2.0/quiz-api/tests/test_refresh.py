@@ -0,0 +1,106 @@
+"""Tests of the refresh token sessions of the players."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from quizapi.infrastructure.utils.password import password_hasher
+from quizapi.infrastructure.utils.token import generate_refresh_token, hash_refresh_token
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+
+async def open_session(container, player, expires_in: timedelta = timedelta(days=1)) -> str:
+    """A function storing a session of a test player, as a login does."""
+    refresh_token = generate_refresh_token()["refresh_token"]
+    await container.player_repository().create_session(
+        player_id=player.id,
+        token_hash=hash_refresh_token(refresh_token),
+        expires_at=datetime.now(timezone.utc) + expires_in,
+    )
+    return refresh_token
+
+
+@pytest.fixture
+def hashed(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """A fixture recording the functions run by the password hasher."""
+    calls: list[str] = []
+
+    async def run(func, *args):
+        calls.append(func.__name__)
+        raise AssertionError("The password hasher was called")
+
+    monkeypatch.setattr(password_hasher, "run", run)
+    return calls
+
+
+async def test_refresh_rotates_the_token(
+        client: ASGIClient,
+        container,
+        create_player,
+        hashed: list[str],
+) -> None:
+    refresh_token = await open_session(container, await create_player())
+
+    response = await client.request("POST", "/player/refresh", {"refresh_token": refresh_token})
+    assert response.status == 200
+    tokens = response.json()
+    assert tokens["token_type"] == "Bearer"
+    assert tokens["refresh_token"] != refresh_token
+    response = await client.request("GET", "/player/balance", token=tokens["player_token"])
+    assert response.status == 200
+
+    response = await client.request("POST", "/player/refresh", {"refresh_token": refresh_token})
+    assert response.status == 401
+    response = await client.request("POST", "/player/refresh", {"refresh_token": tokens["refresh_token"]})
+    assert response.status == 200
+    assert hashed == []
+
+
+async def test_concurrent_refreshes_use_the_token_once(
+        client: ASGIClient,
+        container,
+        create_player,
+) -> None:
+    refresh_token = await open_session(container, await create_player())
+
+    responses = await asyncio.gather(*(
+        client.request("POST", "/player/refresh", {"refresh_token": refresh_token})
+        for _ in range(2)
+    ))
+
+    assert sorted(response.status for response in responses) == [200, 401]
+
+
+async def test_expired_sessions_are_rejected(
+        client: ASGIClient,
+        container,
+        create_player,
+) -> None:
+    player = await create_player()
+    expired = await open_session(container, player, expires_in=timedelta(seconds=-1))
+    unknown = generate_refresh_token()["refresh_token"]
+
+    for refresh_token in (expired, unknown):
+        response = await client.request("POST", "/player/refresh", {"refresh_token": refresh_token})
+        assert response.status == 401
+
+
+async def test_logout_revokes_the_token(
+        client: ASGIClient,
+        container,
+        create_player,
+        hashed: list[str],
+) -> None:
+    refresh_token = await open_session(container, await create_player())
+
+    response = await client.request("POST", "/player/logout", {"refresh_token": refresh_token})
+    assert response.status == 204
+
+    response = await client.request("POST", "/player/refresh", {"refresh_token": refresh_token})
+    assert response.status == 401
+    response = await client.request("POST", "/player/logout", {"refresh_token": refresh_token})
+    assert response.status == 401
+    assert hashed == []
@@ -0,0 +1,66 @@
+"""Tests of collecting the rewards of quizzes."""
+
+import asyncio
+
+import pytest
+
+from quizapi.core.domain.reward import RewardBroker
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+
+async def ace(client: ASGIClient, player, quiz: dict) -> None:
+    """A function submitting the correct answers of a test quiz."""
+    questions = (await client.request("GET", f"/question/quiz/{quiz['id']}")).json()
+    response = await client.request("POST", "/history/grade", {
+        "quiz_id": quiz["id"],
+        "answers": [
+            {"question_id": question["id"], "chosen_option": question["option_one"]}
+            for question in questions
+        ],
+    }, token=player.token)
+    assert response.status == 201
+
+
+async def test_parallel_collects_give_a_single_reward(
+        client: ASGIClient,
+        container,
+        create_player,
+        create_quiz,
+) -> None:
+    owner, player = await create_player(), await create_player()
+    quiz = await create_quiz(owner, questions=2)
+    await ace(client, player, quiz)
+    rewards = container.reward_service()
+
+    collected = await asyncio.gather(*(
+        rewards.collect_reward(RewardBroker(quiz_id=quiz["id"], player_id=player.id))
+        for _ in range(100)
+    ))
+
+    assert len([reward for reward in collected if reward is not None]) == 1
+    assert len(list(await rewards.get_rewards_by_player(player.id))) == 1
+
+
+async def test_sold_rewards_are_not_collected_again(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    owner, player = await create_player(), await create_player()
+    quiz = await create_quiz(owner, questions=2)
+    await ace(client, player, quiz)
+    collect = {"quiz_id": quiz["id"]}
+
+    response = await client.request("POST", "/reward/collect", collect, token=player.token)
+    assert response.status == 201
+    reward = response.json()
+    response = await client.request("POST", f"/shop/sell/{reward['id']}", token=player.token)
+    assert response.status == 200
+    balance = (await client.request("GET", "/player/balance", token=player.token)).json()
+
+    await ace(client, player, quiz)
+    response = await client.request("POST", "/reward/collect", collect, token=player.token)
+    assert response.status == 400
+    assert (await client.request("GET", "/player/balance", token=player.token)).json() == balance
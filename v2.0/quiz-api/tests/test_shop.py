@@ -0,0 +1,133 @@
+"""Tests of the shop trades under contention."""
+
+import asyncio
+import random
+from time import perf_counter
+from typing import Any
+
+import pytest
+
+from quizapi.db import database
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+PRICE = 10
+
+
+async def list_items(backend: str, container, quizzes: list[dict]) -> None:
+    """A function listing the reward of every quiz in the shop."""
+    if backend == "postgres":
+        await database.execute_many(
+            "INSERT INTO shops (name, value, quiz_id) VALUES (:name, :value, :quiz_id)",
+            [{"name": quiz["reward"], "value": PRICE, "quiz_id": quiz["id"]} for quiz in quizzes],
+        )
+        return
+
+    shops = container.memory_store().shops
+    for quiz in quizzes:
+        shops.insert({
+            "id": shops.next_id(),
+            "name": quiz["reward"],
+            "value": PRICE,
+            "quiz_id": quiz["id"],
+        })
+
+
+async def balances(container, players: list[Any]) -> list[int]:
+    """A function reading the balances of players."""
+    repository = container.player_repository()
+    return [await repository.show_balance(player.id) for player in players]
+
+
+async def trade(
+        container,
+        sellers: list[Any],
+        buyers: list[Any],
+        rounds: int,
+) -> tuple[int, int]:
+    """A function running concurrent sellers of their rewards and buyers of
+    random listings, returning the numbers of completed purchases and sales."""
+    shop = container.shop_repository()
+    rewards = container.reward_repository()
+    purchases = sales = 0
+
+    async def sell(player) -> None:
+        nonlocal sales
+        for reward in await rewards.get_rewards_by_player(player.id):
+            if await shop.sell_item(reward.id, player.id):
+                sales += 1
+
+    async def buy(player) -> None:
+        nonlocal purchases
+        for _ in range(rounds):
+            items = list(await shop.get_all_items(limit=10_000))
+            if items and await shop.buy_item(random.choice(items).id, player.id):
+                purchases += 1
+                return
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*map(sell, sellers), *map(buy, buyers))
+    return purchases, sales
+
+
+async def test_concurrent_trades_conserve_value(
+        backend: str,
+        container,
+        create_player,
+        create_quiz,
+) -> None:
+    owner = await create_player()
+    quizzes = [await create_quiz(owner, questions=0) for _ in range(50)]
+    await list_items(backend, container, quizzes)
+    buyers = [await create_player(balance=PRICE) for _ in range(200)]
+
+    first_purchases, _ = await trade(container, [], buyers, rounds=1)
+    winners = [
+        buyer for buyer, balance in zip(buyers, await balances(container, buyers))
+        if balance == 0
+    ]
+    losers = [buyer for buyer in buyers if buyer not in winners]
+    purchases, sales = await trade(container, winners, losers, rounds=20)
+    purchases += first_purchases
+
+    rewards = list(await container.reward_repository().get_all_rewards(limit=10_000))
+    items = list(await container.shop_repository().get_all_items(limit=10_000))
+    final_balances = await balances(container, buyers)
+    assert 0 < len(winners) == first_purchases <= len(quizzes)
+    assert sales == len(winners)
+    assert min(final_balances) >= 0
+    assert sum(final_balances) == PRICE * (len(buyers) - purchases + sales)
+    assert sorted(
+        [reward.quiz_id for reward in rewards] + [item.quiz_id for item in items]
+    ) == [quiz["id"] for quiz in quizzes]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+async def test_contended_purchase_throughput(
+        backend: str,
+        client: ASGIClient,
+        container,
+        create_player,
+        create_quiz,
+) -> None:
+    """Prints the rate of purchases of 200 buyers competing for 50 listings
+    through the API."""
+    owner = await create_player()
+    quizzes = [await create_quiz(owner, questions=0) for _ in range(50)]
+    await list_items(backend, container, quizzes)
+    buyers = [await create_player(balance=PRICE) for _ in range(200)]
+    listings = [item.id for item in await container.shop_repository().get_all_items(limit=50)]
+
+    async def buy(player) -> int:
+        response = await client.request("POST", f"/shop/buy/{random.choice(listings)}", token=player.token)
+        return response.status
+
+    started = perf_counter()
+    statuses = await asyncio.gather(*map(buy, buyers))
+    elapsed = perf_counter() - started
+
+    sold = statuses.count(200)
+    print(f"{len(buyers)} contended purchases in {elapsed * 1e3:.0f}ms, {sold} sold")
+    assert 0 < sold <= len(listings)
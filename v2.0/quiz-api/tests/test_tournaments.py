@@ -0,0 +1,198 @@
+"""Tests of the tournament participants."""
+
+import asyncio
+from statistics import median
+from time import perf_counter
+
+import pytest
+
+from quizapi.db import database
+from quizapi.loadtest.client import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+
+def tournament_of(*quizzes: dict) -> dict:
+    """A function preparing the attributes of a tournament of test quizzes."""
+    return {
+        "name": "Cup",
+        "description": "A tournament",
+        "quizzes_id": [quiz["id"] for quiz in quizzes],
+    }
+
+
+async def create_tournament(client: ASGIClient, *quizzes: dict) -> dict:
+    """A function creating a tournament of test quizzes through the API."""
+    response = await client.request("POST", "/tournament/create", tournament_of(*quizzes))
+    assert response.status == 201, response.content
+    return response.json()
+
+
+async def test_participants_are_paged_with_a_cursor(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    owner = await create_player()
+    tournament = await create_tournament(client, await create_quiz(owner, questions=0))
+    players = [await create_player() for _ in range(120)]
+    for player in players:
+        response = await client.request("POST", f"/tournament/{tournament['id']}/join", token=player.token)
+        assert response.status == 200
+
+    path = f"/tournament/{tournament['id']}/participants"
+    seen = []
+    query = {"limit": 50}
+    pages = 0
+    while query:
+        page = (await client.request("GET", path, query=query)).json()
+        seen.extend(participant["id"] for participant in page["items"])
+        pages += 1
+        query = page["next_cursor"] and {"limit": 50, "after": page["next_cursor"]}
+
+    assert pages == 3
+    assert seen == sorted(str(player.id) for player in players)
+
+
+async def test_concurrent_joins_are_all_kept(
+        client: ASGIClient,
+        container,
+        create_player,
+        create_quiz,
+) -> None:
+    owner = await create_player()
+    tournament = await create_tournament(client, await create_quiz(owner, questions=0))
+    players = [await create_player() for _ in range(300)]
+    repository = container.tournament_repository()
+
+    joined = await asyncio.gather(*(
+        repository.join_tournament(tournament["id"], player.id) for player in players
+    ))
+    rejoined = await repository.join_tournament(tournament["id"], players[0].id)
+    participants = await repository.get_participants(tournament["id"], limit=1000)
+
+    assert None not in joined
+    assert rejoined is None
+    assert len(list(participants)) == len(players)
+
+
+async def test_missing_quizzes_are_listed(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    quiz = await create_quiz(await create_player(), questions=0)
+    body = {**tournament_of(quiz), "quizzes_id": [404, quiz["id"], 405, 404]}
+
+    response = await client.request("POST", "/tournament/create", body)
+    assert response.status == 404
+    assert response.json()["detail"]["quiz_ids"] == [404, 405]
+
+    tournament = await create_tournament(client, quiz)
+    response = await client.request("PUT", f"/tournament/{tournament['id']}", body)
+    assert response.status == 404
+    assert response.json()["detail"]["quiz_ids"] == [404, 405]
+    assert (await client.request("GET", f"/tournament/{tournament['id']}")).json() == tournament
+
+
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+@pytest.mark.parametrize("quizzes", [1, 50])
+async def test_quizzes_are_validated_with_one_statement(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+        query_budget,
+        quizzes: int,
+) -> None:
+    owner = await create_player()
+    body = tournament_of(*[await create_quiz(owner, questions=0) for _ in range(quizzes)])
+
+    with query_budget(2, exact=True):
+        response = await client.request("POST", "/tournament/create", body)
+    assert response.status == 201
+    assert response.json()["quizzes_id"] == body["quizzes_id"]
+
+    path = f"/tournament/{response.json()['id']}"
+    with query_budget(3, exact=True):
+        assert (await client.request("PUT", path, {**body, "name": "Final"})).status == 201
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+async def test_create_latency_by_number_of_quizzes(
+        client: ASGIClient,
+        create_player,
+        create_quiz,
+) -> None:
+    """Prints the median latency of creating tournaments of 1, 10 and 50
+    quizzes, which is alike with the quizzes validated in one statement."""
+    owner = await create_player()
+    quizzes = [await create_quiz(owner, questions=0) for _ in range(50)]
+    rounds = 200
+    latencies = {}
+    for count in (1, 10, 50):
+        body = tournament_of(*quizzes[:count])
+        samples = []
+        for _ in range(rounds):
+            started = perf_counter()
+            response = await client.request("POST", "/tournament/create", body)
+            samples.append(perf_counter() - started)
+            assert response.status == 201
+        latencies[count] = median(samples)
+
+    print({f"{count} quizzes": f"{latency * 1e3:.2f}ms" for count, latency in latencies.items()})
+    assert latencies[50] < 2 * latencies[1]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+async def test_joins_of_a_large_tournament(
+        client: ASGIClient,
+        container,
+        create_player,
+        create_quiz,
+) -> None:
+    """Prints the rate of 100k joins and the latencies of the first and
+    the last participants page, which are alike with a keyset cursor."""
+    joins = 100_000
+    owner = await create_player()
+    tournament = await create_tournament(client, await create_quiz(owner, questions=0))
+    player_ids = [
+        row["id"] for row in await database.fetch_all(
+            """
+            INSERT INTO players (username, email)
+            SELECT 'bulk' || number, 'bulk' || number || '@example.com'
+            FROM generate_series(1, :count) AS number
+            RETURNING id
+            """,
+            {"count": joins},
+        )
+    ]
+    repository = container.tournament_repository()
+    semaphore = asyncio.Semaphore(16)
+
+    async def join(player_id) -> None:
+        async with semaphore:
+            assert await repository.join_tournament(tournament["id"], player_id) is not None
+
+    started = perf_counter()
+    await asyncio.gather(*map(join, player_ids))
+    elapsed = perf_counter() - started
+
+    path = f"/tournament/{tournament['id']}/participants"
+    await client.request("GET", path, query={"limit": 50})
+    latencies = {}
+    for name, query in (
+            ("first", {"limit": 50}),
+            ("last", {"limit": 50, "after": sorted(player_ids)[-51]}),
+    ):
+        started = perf_counter()
+        response = await client.request("GET", path, query=query)
+        latencies[name] = perf_counter() - started
+
+    print(
+        f"{joins} joins in {elapsed:.1f}s ({joins / elapsed:.0f}/s), "
+        f"first page in {latencies['first'] * 1e3:.1f}ms, last page in {latencies['last'] * 1e3:.1f}ms"
+    )
+    assert len(response.json()["items"]) == 50
+    assert response.json()["next_cursor"] is None
@@ -0,0 +1,108 @@
+"""Tests pinning the round trips of the repository writes."""
+
+import pytest
+
+from quizapi.core.domain.player import PlayerIn
+from quizapi.core.domain.question import QuestionIn
+from quizapi.core.domain.quiz import QuizBroker
+from quizapi.core.domain.tournament import TournamentIn
+from quizapi.infrastructure.repositories import playerdb
+from quizapi.infrastructure.repositories.memory import player as memory_player
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def hashed(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """A fixture recording the passwords hashed by the player repositories."""
+    passwords: list[str] = []
+
+    async def hash_password(password: str) -> str:
+        passwords.append(password)
+        return f"hashed-{password}"
+
+    monkeypatch.setattr(playerdb, "hash_password", hash_password)
+    monkeypatch.setattr(memory_player, "hash_password", hash_password)
+    return passwords
+
+
+async def test_duplicate_registrations_are_rejected(
+        container,
+        hashed: list[str],
+) -> None:
+    repository = container.player_repository()
+
+    player = await repository.register_player(
+        PlayerIn(username="player", email="player@example.com", password="first"),
+    )
+    taken_email = await repository.register_player(
+        PlayerIn(username="other", email="player@example.com", password="second"),
+    )
+    taken_username = await repository.register_player(
+        PlayerIn(username="player", email="other@example.com", password="third"),
+    )
+
+    assert player["password"] == "hashed-first"
+    assert taken_email is None and taken_username is None
+
+
+@pytest.mark.parametrize("backend", ["postgres"], indirect=True)
+async def test_write_round_trips(
+        container,
+        create_player,
+        hashed: list[str],
+        query_budget,
+) -> None:
+    owner = await create_player()
+    players = container.player_repository()
+    quizzes = container.quiz_repository()
+    questions = container.question_repository()
+    tournaments = container.tournament_repository()
+    quiz_data = QuizBroker(
+        title="Quiz",
+        description="A quiz",
+        shared=False,
+        reward="Cup",
+        player_id=owner.id,
+    )
+    question_data = QuestionIn(
+        question_text="Question",
+        option_one="A",
+        option_two="B",
+        option_three="C",
+        option_four="D",
+        correct_option="A",
+        quiz_id=1,
+    )
+
+    with query_budget(1, exact=True):
+        await players.register_player(
+            PlayerIn(username="player", email="player@example.com", password="secret"),
+        )
+    with query_budget(1, exact=True):
+        await players.register_player(
+            PlayerIn(username="player", email="player@example.com", password="secret"),
+        )
+
+    with query_budget(1, exact=True):
+        quiz = await quizzes.add_quiz(quiz_data)
+    with query_budget(1, exact=True):
+        await quizzes.update_quiz(quiz.id, quiz_data)
+    with query_budget(1, exact=True):
+        await quizzes.share_quiz(quiz.id)
+
+    with query_budget(1, exact=True):
+        question = await questions.add_question(question_data)
+    with query_budget(1, exact=True):
+        await questions.update_question(question.id, question_data)
+    with query_budget(1, exact=True):
+        await questions.delete_question(question.id)
+
+    with query_budget(2, exact=True):
+        tournament = await tournaments.add_tournament(
+            TournamentIn(name="Cup", description="A tournament", quizzes_id=[quiz.id]),
+        )
+    with query_budget(1, exact=True):
+        assert await tournaments.join_tournament(tournament.id, owner.id) is not None
+    with query_budget(1, exact=True):
+        assert await tournaments.leave_tournament(tournament.id, owner.id) is not None